@@ -175,6 +175,44 @@ class LoggingConfigurer:
         manager.add_rules_from_dict(levels, source="api", priority=10)
         return self
 
+    def with_topic_sampling(
+        self,
+        pattern: str,
+        rate: float = 1.0,
+        per_second: float | None = None,
+        burst: float | None = None,
+    ) -> Self:
+        """
+        Sample or rate-limit records for a topic pattern.
+
+        Suppressed records are dropped before they are created, and a
+        "log records suppressed" summary with their counts is logged to the
+        topic periodically. Rules added via API have highest priority (10).
+
+        Args:
+            pattern: Topic pattern (must start with '/')
+            rate: Fraction of records kept (0.0-1.0)
+            per_second: Average records/sec allowed (None for no limit)
+            burst: Records allowed at once after an idle period
+
+        Returns:
+            Self for method chaining
+
+        Example:
+            app = (AppBuilder("myapp")
+                .logging
+                    .with_topic_level("/infra/db/**", "debug")
+                    .with_topic_sampling("/infra/db/**", rate=0.1, per_second=50)
+                    .done()
+                .build())
+        """
+        from ....log.sampling import LogSamplingManager
+
+        LogSamplingManager.get_instance().add_rule(
+            pattern, rate=rate, per_second=per_second, burst=burst
+        )
+        return self
+
     def with_runtime_updates(self, enabled: bool = True) -> Self:
         """
         Enable or disable runtime updates to existing loggers.
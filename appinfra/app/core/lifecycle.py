@@ -13,6 +13,8 @@ from typing import TYPE_CHECKING, Any
 
 from ... import time
 from ...log import LoggerFactory
+from ...log.async_handler import AsyncDispatchHandler
+from ...log.callback import CallbackWorkerPool
 from ...log.handler_factory import HandlerRegistry
 from ..errors import LifecycleError
 from ..tools.base import Tool
@@ -447,14 +449,20 @@ class LifecycleManager:
             )
 
     def _shutdown_log_handlers(self) -> None:
-        """Flush all registered database logging handlers."""
-        if not self._db_handlers:
-            return
-
+        """Flush async log dispatchers and callbacks, and database logging handlers."""
         assert (
             self._lifecycle_logger is not None
         )  # Only called from shutdown after init check
 
+        timeout = self._shutdown_timeouts.get("logging", 5.0)
+        if not AsyncDispatchHandler.flush_all(timeout):
+            self._lifecycle_logger.warning("async log queue not drained")
+        if not CallbackWorkerPool.flush_all(timeout):
+            self._lifecycle_logger.warning("async log callbacks not drained")
+
+        if not self._db_handlers:
+            return
+
         self._lifecycle_logger.debug("flushing log handlers...")
         for handler in self._db_handlers:
             try:
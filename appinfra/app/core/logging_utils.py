@@ -277,6 +277,23 @@ def _load_topic_levels(config: Any, args_dict: dict | None) -> None:
         manager.set_default_level(config.logging.level)
 
 
+def _load_topic_sampling(config: Any) -> None:
+    """
+    Load per-topic sampling and rate-limit rules from YAML config (priority=1).
+
+    Args:
+        config: Configuration object
+    """
+    from ...log.sampling import LogSamplingManager
+
+    if hasattr(config, "logging") and hasattr(config.logging, "sampling"):
+        sampling_dict = _extract_topics_dict(config.logging.sampling)
+        if sampling_dict:
+            LogSamplingManager.get_instance().add_rules_from_dict(
+                sampling_dict, source="yaml", priority=1
+            )
+
+
 def _resolve_log_level(level: str | int) -> int:
     """Resolve log level to integer, handling both string and int inputs."""
     if isinstance(level, int):
@@ -363,8 +380,9 @@ def setup_logging_from_config(
     # Build configuration overrides
     config_overrides = _build_config_overrides(args_dict, config, **kwargs)
 
-    # Load topic-based level rules BEFORE creating loggers
+    # Load topic-based level and sampling rules BEFORE creating loggers
     _load_topic_levels(config, args_dict)
+    _load_topic_sampling(config)
 
     # Create handler registry and load handlers from config
     global_level = _resolve_log_level(config_overrides["level"])
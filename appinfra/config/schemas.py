@@ -144,9 +144,10 @@ try:
         @classmethod
         def validate_url(cls, v: Any) -> Any:
             """Validate database URL format."""
-            if not v.startswith(("postgresql://", "postgres://")):
+            if not v.startswith(("postgresql://", "postgresql+", "postgres://")):
                 raise ValueError(
-                    "Database URL must start with 'postgresql://' or 'postgres://'"
+                    "Database URL must start with 'postgresql://', "
+                    "'postgresql+<driver>://' or 'postgres://'"
                 )
             return v
 
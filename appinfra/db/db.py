@@ -175,7 +175,13 @@ class Manager:
             raise ValueError(f"Database '{name}' URL must be a string")
 
         # Validate URL format - accept PostgreSQL or SQLite
-        valid_prefixes = ("postgresql://", "postgres://", "sqlite://", "sqlite:///")
+        valid_prefixes = (
+            "postgresql://",
+            "postgresql+",
+            "postgres://",
+            "sqlite://",
+            "sqlite:///",
+        )
         if not cfg.url.startswith(valid_prefixes):
             raise ValueError(
                 f"Database '{name}' URL must start with a supported prefix: "
@@ -283,7 +289,8 @@ class Manager:
         Get statistics about database connections.
 
         Returns:
-            dict: Statistics including connection counts and setup errors
+            dict: Statistics including connection counts, setup errors and
+                per-database statement statistics (see PG.get_query_stats)
         """
         return {
             "total_configured": len(self._cfg.dbs) if hasattr(self._cfg, "dbs") else 0,
@@ -291,4 +298,9 @@ class Manager:
             "failed_setups": len(self._setup_errors),
             "available_databases": list(self._dbs.keys()),
             "failed_databases": list(self._setup_errors.keys()),
+            "query_stats": {
+                name: db.get_query_stats()
+                for name, db in self._dbs.items()
+                if hasattr(db, "get_query_stats")
+            },
         }
@@ -0,0 +1,395 @@
+"""
+COPY-based bulk loading for PostgreSQL.
+
+Rows are encoded into COPY text format in chunks and streamed to
+``COPY ... FROM STDIN`` through the raw DBAPI connection, so memory use is
+bounded by one chunk regardless of the number of rows. Upserts COPY into a
+temporary staging table and then run a single ``INSERT ... SELECT ... ON
+CONFLICT`` into the target. For ``on_conflict="update"`` the staged rows are
+deduplicated on the conflict columns first (the last loaded row per key
+wins), since PostgreSQL rejects a statement that updates one row twice.
+
+Values are encoded the way psycopg adapts query parameters: lists and tuples
+become PostgreSQL arrays (``{1,2}``) and dicts become JSON, so list values
+need an array column and JSON arrays should be passed pre-serialized.
+
+Both psycopg2 (``cursor.copy_expert``) and psycopg 3 (``cursor.copy``) are
+supported.
+
+Example:
+    >>> rows = ({"id": i, "name": f"user{i}"} for i in range(1_000_000))
+    >>> pg.bulk_insert("users", rows)
+    1000000
+    >>> pg.bulk_insert(
+    ...     "users", {"id": [1, 2], "name": ["a", "b"]},
+    ...     on_conflict="update", conflict_columns=["id"],
+    ... )
+    2
+"""
+
+from __future__ import annotations
+
+import datetime
+import json
+import uuid
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from itertools import chain
+from typing import Any
+
+from ...errors import DatabaseError
+
+# Supported on_conflict actions
+ON_CONFLICT_ACTIONS = ("nothing", "update")
+
+# Characters read per file read() by psycopg2's copy_expert
+COPY_READ_SIZE = 65536
+
+_STAGE_TABLE = "_appinfra_bulk_stage"
+_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def _text(value: Any) -> str:
+    """Get the unescaped PostgreSQL text input form of a non-None value."""
+    if value is True:
+        return "t"
+    if value is False:
+        return "f"
+    if isinstance(value, str):
+        return value
+    if isinstance(value, int | float):
+        return str(value)
+    if isinstance(value, bytes | bytearray | memoryview):
+        return "\\x" + bytes(value).hex()
+    if isinstance(value, datetime.date | datetime.time):
+        return value.isoformat()
+    if isinstance(value, dict):
+        return json.dumps(value)
+    if isinstance(value, list | tuple):
+        return _array_literal(value)
+    return str(value)
+
+
+def _array_literal(values: Sequence[Any]) -> str:
+    """Render a (possibly nested) sequence as a PostgreSQL array literal."""
+    elements = []
+    for value in values:
+        if value is None:
+            elements.append("NULL")
+        elif isinstance(value, list | tuple):
+            elements.append(_array_literal(value))
+        else:
+            text = _text(value).replace("\\", "\\\\").replace('"', '\\"')
+            elements.append(f'"{text}"')
+    return "{" + ",".join(elements) + "}"
+
+
+def encode_value(value: Any) -> str:
+    """
+    Encode a Python value as a COPY text format field.
+
+    Lists and tuples are encoded as PostgreSQL arrays and dicts as JSON.
+
+    Args:
+        value: Value to encode (None becomes NULL)
+
+    Returns:
+        Escaped field text
+    """
+    if value is None:
+        return "\\N"
+    if value is True:
+        return "t"
+    if value is False:
+        return "f"
+    if isinstance(value, int | float):
+        return str(value)
+    return _text(value).translate(_ESCAPES)
+
+
+def iter_copy_chunks(rows: Iterable[Sequence[Any]], chunk_rows: int) -> Iterator[str]:
+    """
+    Encode rows into COPY text format, chunk_rows rows per string.
+
+    Args:
+        rows: Row tuples in column order
+        chunk_rows: Rows per yielded chunk
+
+    Yields:
+        Encoded chunks (newline-terminated lines)
+    """
+    lines: list[str] = []
+    for row in rows:
+        lines.append("\t".join([encode_value(v) for v in row]) + "\n")
+        if len(lines) >= chunk_rows:
+            yield "".join(lines)
+            lines = []
+    if lines:
+        yield "".join(lines)
+
+
+class _ChunkReader:
+    """File-like reader over encoded chunks, for psycopg2's copy_expert()."""
+
+    def __init__(self, chunks: Iterator[str]) -> None:
+        self._chunks = chunks
+        self._buf = ""
+        self._pos = 0
+
+    def read(self, size: int = -1) -> str:
+        if self._pos >= len(self._buf):
+            self._buf = next(self._chunks, "")
+            self._pos = 0
+        if size < 0:
+            size = len(self._buf)
+        data = self._buf[self._pos : self._pos + size]
+        self._pos += len(data)
+        return data
+
+    def readline(self, size: int = -1) -> str:
+        return self.read(size)
+
+
+def normalize_rows(
+    rows: Any,
+    columns: Sequence[str] | None,
+    default_columns: Sequence[str] | None = None,
+) -> tuple[list[str], Iterator[tuple[Any, ...]]]:
+    """
+    Resolve column names and a tuple iterator from supported row shapes.
+
+    Accepts an iterable of dicts (columns default to the first row's keys), an
+    iterable of tuples/lists (columns default to default_columns), or a
+    column-oriented mapping of name to sequence (columns default to the
+    mapping's keys). Objects with ``to_pydict()`` (e.g. pyarrow Tables and
+    RecordBatches) are treated as column-oriented.
+
+    Args:
+        rows: Rows in one of the supported shapes
+        columns: Column names (order of the tuples produced)
+        default_columns: Columns of tuple rows when columns is None
+
+    Returns:
+        Tuple of (column names, iterator of row tuples); the iterator is lazy
+        for row iterables
+
+    Raises:
+        ValueError: If columns cannot be determined or columns have
+            different lengths
+    """
+    if not isinstance(rows, Mapping) and hasattr(rows, "to_pydict"):
+        rows = rows.to_pydict()
+
+    if isinstance(rows, Mapping):
+        names = list(columns) if columns is not None else list(rows.keys())
+        data = [rows[name] for name in names]
+        if len({len(values) for values in data}) > 1:
+            raise ValueError("Column-oriented rows must have equal-length columns")
+        return names, zip(*data, strict=True)
+
+    it = iter(rows)
+    first = next(it, None)
+    if first is None:
+        return list(columns or []), iter(())
+
+    if isinstance(first, Mapping):
+        names = list(columns) if columns is not None else list(first.keys())
+        return names, (tuple(row[name] for name in names) for row in chain([first], it))
+
+    if columns is None:
+        columns = default_columns
+    if not columns:
+        raise ValueError("columns are required for tuple rows")
+    return list(columns), chain([tuple(first)], (tuple(row) for row in it))
+
+
+def quote_table(table: Any, preparer: Any) -> str:
+    """
+    Get the quoted name of a table.
+
+    Args:
+        table: SQLAlchemy Table, ORM model class, or table name (optionally
+            schema-qualified as "schema.table")
+        preparer: Dialect identifier preparer
+
+    Returns:
+        Quoted table name
+    """
+    table = getattr(table, "__table__", table)
+    if isinstance(table, str):
+        return ".".join(preparer.quote(part) for part in table.split("."))
+    return str(preparer.format_table(table))
+
+
+def table_columns(table: Any) -> list[str]:
+    """Get column names of a SQLAlchemy Table or model (empty for names)."""
+    table = getattr(table, "__table__", table)
+    return [column.name for column in getattr(table, "columns", ())]
+
+
+def primary_key_columns(table: Any) -> list[str]:
+    """Get primary key column names of a SQLAlchemy Table or model (empty for names)."""
+    table = getattr(table, "__table__", table)
+    primary_key = getattr(table, "primary_key", None)
+    if primary_key is None:
+        return []
+    return [column.name for column in primary_key.columns]
+
+
+def build_upsert(
+    target: str,
+    stage: str,
+    columns: list[str],
+    on_conflict: str,
+    conflict_columns: list[str],
+) -> str:
+    """
+    Build the INSERT ... SELECT ... ON CONFLICT statement for a staged load.
+
+    For updates, the stage is reduced to one row per conflict key with
+    ``DISTINCT ON``, keeping the row loaded last (highest ctid).
+
+    Args:
+        target: Quoted target table
+        stage: Quoted staging table
+        columns: Quoted column names
+        on_conflict: "nothing" or "update"
+        conflict_columns: Quoted conflict target columns (required for update)
+
+    Returns:
+        SQL statement
+    """
+    cols = ", ".join(columns)
+    keys = ", ".join(conflict_columns)
+    target_cols = f"INSERT INTO {target} ({cols})"
+    conflict = f"ON CONFLICT ({keys})" if conflict_columns else "ON CONFLICT"
+    updates = [c for c in columns if c not in conflict_columns]
+    if on_conflict == "update" and updates:
+        assignments = ", ".join(f"{c} = EXCLUDED.{c}" for c in updates)
+        return (
+            f"{target_cols} SELECT DISTINCT ON ({keys}) {cols} FROM {stage} "
+            f"ORDER BY {keys}, ctid DESC {conflict} DO UPDATE SET {assignments}"
+        )
+    return f"{target_cols} SELECT {cols} FROM {stage} {conflict} DO NOTHING"
+
+
+def copy_from_chunks(cursor: Any, sql: str, chunks: Iterator[str]) -> None:
+    """
+    Run a COPY ... FROM STDIN statement fed from encoded chunks.
+
+    Args:
+        cursor: Raw DBAPI cursor (psycopg2 or psycopg 3)
+        sql: COPY statement
+        chunks: Encoded COPY text chunks
+
+    Raises:
+        DatabaseError: If the driver does not support COPY
+    """
+    if hasattr(cursor, "copy_expert"):  # psycopg2
+        cursor.copy_expert(sql, _ChunkReader(chunks), size=COPY_READ_SIZE)
+    elif hasattr(cursor, "copy"):  # psycopg 3
+        with cursor.copy(sql) as copy:
+            for chunk in chunks:
+                copy.write(chunk)
+    else:
+        raise DatabaseError(
+            "DBAPI driver does not support COPY",
+            driver=type(cursor).__module__,
+        )
+
+
+class _CountedRows:
+    """Iterator over row tuples that counts the rows it yields."""
+
+    def __init__(self, rows: Iterator[tuple[Any, ...]]) -> None:
+        self._rows = rows
+        self.count = 0
+
+    def __iter__(self) -> Iterator[tuple[Any, ...]]:
+        for row in self._rows:
+            self.count += 1
+            yield row
+
+
+def _check_options(chunk_rows: int, on_conflict: str | None) -> None:
+    """Validate bulk_insert() options before any rows are read."""
+    if chunk_rows < 1:
+        raise ValueError("chunk_rows must be positive")
+    if on_conflict is not None and on_conflict not in ON_CONFLICT_ACTIONS:
+        raise ValueError(
+            f"Unknown on_conflict: {on_conflict} "
+            f"(expected one of {ON_CONFLICT_ACTIONS})"
+        )
+
+
+def _conflict_keys(
+    table: Any, conflict_columns: Sequence[str] | None, on_conflict: str | None
+) -> list[str]:
+    """Resolve the conflict target, defaulting to the table's primary key."""
+    keys = list(conflict_columns or primary_key_columns(table))
+    if on_conflict == "update" and not keys:
+        raise ValueError("conflict_columns are required for on_conflict='update'")
+    return keys
+
+
+def _copy_upsert(
+    cursor: Any,
+    preparer: Any,
+    target: str,
+    cols: list[str],
+    chunks: Iterator[str],
+    on_conflict: str,
+    keys: list[str],
+) -> None:
+    """COPY chunks into a temporary staging table and merge it into target."""
+    stage = preparer.quote(f"{_STAGE_TABLE}_{uuid.uuid4().hex[:8]}")
+    cursor.execute(
+        f"CREATE TEMP TABLE {stage} (LIKE {target} INCLUDING DEFAULTS) ON COMMIT DROP"
+    )
+    copy_from_chunks(cursor, f"COPY {stage} ({', '.join(cols)}) FROM STDIN", chunks)
+    quoted_keys = [preparer.quote(key) for key in keys]
+    cursor.execute(build_upsert(target, stage, cols, on_conflict, quoted_keys))
+
+
+def bulk_insert(
+    engine: Any,
+    table: Any,
+    rows: Any,
+    columns: Sequence[str] | None = None,
+    chunk_rows: int = 10_000,
+    on_conflict: str | None = None,
+    conflict_columns: Sequence[str] | None = None,
+) -> int:
+    """
+    Load rows into a table with COPY in a single transaction.
+
+    See PG.bulk_insert() for argument details.
+
+    Returns:
+        Number of rows sent (for upserts, including rows skipped or updated)
+
+    Raises:
+        ValueError: If arguments are invalid
+        DatabaseError: If the driver does not support COPY
+    """
+    _check_options(chunk_rows, on_conflict)
+    names, tuples = normalize_rows(rows, columns, table_columns(table))
+    if not names:
+        return 0
+    keys = _conflict_keys(table, conflict_columns, on_conflict)
+
+    preparer = engine.dialect.identifier_preparer
+    target = quote_table(table, preparer)
+    cols = [preparer.quote(name) for name in names]
+    counted = _CountedRows(tuples)
+    chunks = iter_copy_chunks(counted, chunk_rows)
+    with engine.begin() as conn:
+        cursor = conn.connection.cursor()
+        try:
+            if on_conflict is None:
+                sql = f"COPY {target} ({', '.join(cols)}) FROM STDIN"
+                copy_from_chunks(cursor, sql, chunks)
+            else:
+                _copy_upsert(cursor, preparer, target, cols, chunks, on_conflict, keys)
+        finally:
+            cursor.close()
+    return counted.count
@@ -14,6 +14,7 @@ import sqlalchemy
 import sqlalchemy.dialects.postgresql
 
 from ...log import resolve_level
+from ...log.lazy import LazyValue, lazy
 
 
 def validate_init_params(lg: Any, cfg: Any) -> None:
@@ -85,9 +86,12 @@ def initialize_performance_optimizations(pg_instance: Any) -> None:
 
 
 def log_query_with_timing(
-    lg: Any, query_lg_level: int, secs: float, qstr: str, url: Any
+    lg: Any, query_lg_level: int, secs: float, qstr: str | LazyValue, url: Any
 ) -> None:
-    """Log query execution with timing information."""
+    """Log query execution with timing information.
+
+    qstr may be a lazy() value, rendered only if a handler formats the record.
+    """
     try:
         extra = {"after": secs, "query": qstr, "url": url}
         if lg.isEnabledFor(query_lg_level):
@@ -148,8 +152,38 @@ class QueryLogger:
         )
         return cast(str, formatted.strip())
 
+    def render_query(self, clauseelement: Any, params: Any = None) -> str:
+        """
+        Render an executed statement as SQL with literal parameter values.
+
+        Called lazily when a query log record is formatted. Single-row
+        parameters are bound into the statement first; statements that cannot
+        be rendered with literals (e.g. executemany) keep their placeholders.
+
+        Args:
+            clauseelement: Executed SQLAlchemy statement
+            params: Parameters passed to execute (optional)
+
+        Returns:
+            Formatted query string with normalized whitespace
+        """
+        if params and isinstance(params, dict) and hasattr(clauseelement, "params"):
+            clauseelement = clauseelement.params(params)
+        try:
+            comp = clauseelement.compile(
+                dialect=self._dialect, compile_kwargs={"literal_binds": True}
+            )
+        except Exception:
+            comp = clauseelement.compile(dialect=self._dialect)
+        return self.format_query_string(str(comp))
+
     def create_after_execute_hook(self) -> Any:
-        """Create and return the after_execute event listener."""
+        """Create and return the after_execute event listener.
+
+        The query log level is checked before anything else, so statements
+        are only captured when the query topic is enabled, and literal SQL is
+        rendered only when a handler formats the record.
+        """
 
         def _after_execute(
             conn: Any,
@@ -161,16 +195,12 @@ class QueryLogger:
         ) -> None:
             """Log query execution details after completion."""
             secs = time.monotonic() - conn.info["query_start_time"].pop(-1)
-            if self._query_lg_level is None:
+            level = self._query_lg_level
+            if level is None or not self._lg.isEnabledFor(level):
                 return
 
-            comp = clauseelement.compile(
-                dialect=self._dialect, compile_kwargs={"literal_binds": True}
-            )
-            qstr = self.format_query_string(str(comp))
-            log_query_with_timing(
-                self._lg, self._query_lg_level, secs, qstr, self._engine.url
-            )
+            qstr = lazy(self.render_query, clauseelement, params)
+            log_query_with_timing(self._lg, level, secs, qstr, self._engine.url)
 
         # Store the listener so it can be removed later
         self._after_execute_listener = _after_execute
@@ -235,9 +265,11 @@ class ConfigValidator:
         if not isinstance(cfg.url, str):
             raise ValueError("Database URL must be a string")
 
-        if not cfg.url.startswith(("postgresql://", "postgres://")):
+        # postgresql+<driver>:// selects a DBAPI driver (e.g. psycopg)
+        if not cfg.url.startswith(("postgresql://", "postgresql+", "postgres://")):
             raise ValueError(
-                "Database URL must start with 'postgresql://' or 'postgres://'"
+                "Database URL must start with 'postgresql://', "
+                "'postgresql+<driver>://' or 'postgres://'"
             )
 
     @staticmethod
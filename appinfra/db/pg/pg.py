@@ -6,7 +6,7 @@ using composition pattern for clean separation of concerns.
 """
 
 import re
-from collections.abc import Callable
+from collections.abc import Callable, Generator, Mapping, Sequence
 from typing import TYPE_CHECKING, Any
 
 import sqlalchemy
@@ -16,8 +16,12 @@ from sqlalchemy import text
 if TYPE_CHECKING:  # pragma: no cover
     from .scoped import ScopedPG
 
+from ... import time as infratime
 from ...dot_dict import DotDict
+from ...errors import DatabaseError
 from ...log import Logger, LoggerFactory
+from ..query_stats import QueryStats
+from . import bulk
 from .connection import ConnectionManager
 from .core import (
     ConfigValidator,
@@ -31,6 +35,8 @@ from .core import (
 from .interface import Interface
 from .reconnection import ReconnectionStrategy
 from .session import SessionManager
+from .statement_cache import StatementCache
+from .stream import stream_query
 
 
 class PG(Interface):
@@ -82,6 +88,10 @@ class PG(Interface):
     _after_migrate_hooks: list[Callable[[Any], None]]
     # Schema isolation (optional)
     _schema_mgr: Any  # SchemaManager | None
+    # Statement statistics (optional)
+    _query_stats: QueryStats | None
+    # Compiled statement cache (optional)
+    _statement_cache: StatementCache | None
 
     # Extension name validation pattern (defense-in-depth)
     _EXTENSION_NAME_PATTERN = re.compile(r"^[a-z][a-z0-9_-]*$")
@@ -127,6 +137,7 @@ class PG(Interface):
         # Create and connect managers
         self._create_managers()
         self._setup_query_logging(query_lg_level)
+        self._setup_query_stats(cfg)
 
         # Schema isolation (after engine creation)
         self._initialize_schema_isolation(schema, cfg)
@@ -134,7 +145,14 @@ class PG(Interface):
     def _create_engine_and_session(self, cfg: Any) -> None:
         """Create SQLAlchemy engine and session maker."""
         engine_kwargs = ConfigValidator.get_engine_kwargs(cfg)
+        self._statement_cache = StatementCache.from_config(
+            getattr(cfg, "statement_cache", None)
+        )
+        if self._statement_cache is not None:
+            engine_kwargs.update(self._statement_cache.engine_kwargs(self._cfg.url))
         self._engine = sqlalchemy.create_engine(self._cfg.url, **engine_kwargs)
+        if self._statement_cache is not None:
+            self._statement_cache.install(self._engine)
         self._SessionCls = sqlalchemy.orm.sessionmaker(bind=self._engine)
 
     def _initialize_subsystems(self, query_lg_level: Any) -> None:
@@ -166,6 +184,14 @@ class PG(Interface):
         if query_lg_level is not None:
             self._query_logger.setup_callbacks(self._lg_extra)
 
+    def _setup_query_stats(self, cfg: Any) -> None:
+        """Attach statement statistics if enabled via cfg.query_stats."""
+        self._query_stats = QueryStats.from_config(
+            getattr(cfg, "query_stats", None), self._lg
+        )
+        if self._query_stats is not None:
+            self._query_stats.attach(self._engine)
+
     def _initialize_schema_isolation(self, schema: str | None, cfg: Any) -> None:
         """Initialize schema isolation if configured."""
         self._schema_mgr = None
@@ -359,6 +385,105 @@ class PG(Interface):
         self._session_mgr.set_connection_health(self._reconnect_strategy.is_healthy())
         return self._session_mgr.session()
 
+    def bulk_insert(
+        self,
+        table: Any,
+        rows: Any,
+        columns: Sequence[str] | None = None,
+        chunk_rows: int = 10_000,
+        on_conflict: str | None = None,
+        conflict_columns: Sequence[str] | None = None,
+    ) -> int:
+        """
+        Load rows into a table with COPY ... FROM STDIN.
+
+        Rows are encoded and streamed chunk_rows at a time, so memory stays
+        constant for any number of rows; the load runs in one transaction.
+        With on_conflict, rows are copied into a temporary staging table and
+        merged with INSERT ... ON CONFLICT. List and tuple values load into
+        array columns and dicts into JSON columns.
+
+        Args:
+            table: SQLAlchemy Table, ORM model class, or table name (optionally
+                "schema.table")
+            rows: Iterable of dicts, iterable of tuples/lists, or a
+                column-oriented mapping of column name to sequence (objects
+                with to_pydict(), such as pyarrow Tables, are accepted)
+            columns: Column names; default to the dict keys of the first row,
+                the mapping keys, or (for tuple rows) the Table's columns
+            chunk_rows: Rows encoded per chunk sent to the server
+            on_conflict: None (conflicts raise), "nothing" (skip conflicting
+                rows) or "update" (overwrite non-key columns; when a key
+                repeats within the load, its last row wins)
+            conflict_columns: Conflict target; defaults to the Table's primary
+                key (required for "update" when table is a name)
+
+        Returns:
+            Number of rows sent
+
+        Raises:
+            DatabaseError: If PG is readonly or the driver does not support COPY
+            ValueError: If arguments are invalid
+
+        Example:
+            >>> pg.bulk_insert("events", ((i, f"e{i}") for i in range(10**6)),
+            ...                columns=["id", "name"])
+            1000000
+        """
+        if self.readonly:
+            raise DatabaseError("Cannot bulk insert: PG is readonly", table=str(table))
+        start = infratime.start()
+        count = bulk.bulk_insert(
+            self._engine,
+            table,
+            rows,
+            columns=columns,
+            chunk_rows=chunk_rows,
+            on_conflict=on_conflict,
+            conflict_columns=conflict_columns,
+        )
+        self._lg.debug(
+            "bulk insert",
+            extra=self._lg_extra
+            | {"table": str(table), "rows": count, "after": infratime.since(start)},
+        )
+        return count
+
+    def stream(
+        self,
+        query: Any,
+        params: Mapping[str, Any] | None = None,
+        batch_size: int = 10_000,
+        as_columns: str | None = None,
+    ) -> Generator[Any, None, None]:
+        """
+        Stream a large result set in batches from a server-side cursor.
+
+        Unlike session().execute(...).fetchall(), only one batch is held in
+        memory. The generator holds one connection until it is exhausted or
+        closed (breaking out of the loop closes it).
+
+        Args:
+            query: SQL string or SQLAlchemy executable (yields Core rows)
+            params: Bind parameters
+            batch_size: Rows fetched and yielded per batch
+            as_columns: None for lists of rows; "list" for {column: list} or
+                "numpy" for {column: ndarray} batches
+
+        Returns:
+            Generator of row batches
+
+        Raises:
+            ValueError: If batch_size or as_columns is invalid
+            DependencyError: If as_columns is "numpy" and numpy is not installed
+
+        Example:
+            >>> for rows in pg.stream("SELECT * FROM events", batch_size=50_000):
+            ...     for row in rows:
+            ...         handle(row)
+        """
+        return stream_query(self._engine, query, params, batch_size, as_columns)
+
     def health_check(self) -> dict[str, Any]:
         """
         Perform a health check on the database connection.
@@ -373,9 +498,31 @@ class PG(Interface):
         Get connection pool status information.
 
         Returns:
-            Dictionary with pool status
+            Dictionary with pool status, plus "statement_cache" hit/miss
+            statistics when cfg.statement_cache is enabled
+        """
+        status = self._connection_mgr.get_pool_status()
+        if self._statement_cache is not None:
+            status["statement_cache"] = self._statement_cache.stats()
+        return status
+
+    @property
+    def query_stats(self) -> QueryStats | None:
+        """Get the statement statistics table (None unless cfg.query_stats is set)."""
+        return self._query_stats
+
+    def get_query_stats(self) -> dict[str, dict[str, Any]]:
+        """
+        Get per-statement statistics keyed by query fingerprint.
+
+        Returns:
+            Dictionary mapping fingerprint to count, errors, rows and latency
+            (total, mean, max, p50, p95, p99 in seconds); empty if statistics
+            are not enabled
         """
-        return self._connection_mgr.get_pool_status()
+        if self._query_stats is None:
+            return {}
+        return self._query_stats.snapshot()
 
     def reconnect(
         self, max_retries: int | None = None, initial_delay: float | None = None
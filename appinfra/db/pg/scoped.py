@@ -7,15 +7,16 @@ allowing a single PG instance to serve multiple schemas.
 
 from __future__ import annotations
 
-from collections.abc import Generator
+from collections.abc import Generator, Mapping
 from contextlib import contextmanager
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy import text
 from sqlalchemy.engine import Engine
 
 from ...errors import DatabaseError
 from .schema import validate_schema_name
+from .stream import stream_query
 
 if TYPE_CHECKING:  # pragma: no cover
     from sqlalchemy.orm import Session
@@ -115,6 +116,42 @@ class ScopedPG:
         finally:
             session.close()
 
+    def stream(
+        self,
+        query: Any,
+        params: Mapping[str, Any] | None = None,
+        batch_size: int = 10_000,
+        as_columns: str | None = None,
+    ) -> Generator[Any, None, None]:
+        """
+        Stream a large result set from this schema in batches.
+
+        Same as PG.stream(), with search_path set to this schema for the
+        duration of the query.
+
+        Args:
+            query: SQL string or SQLAlchemy executable (yields Core rows)
+            params: Bind parameters
+            batch_size: Rows fetched and yielded per batch
+            as_columns: None for lists of rows; "list" or "numpy" for
+                column-oriented batches
+
+        Returns:
+            Generator of row batches
+
+        Example:
+            >>> for rows in scoped.stream("SELECT * FROM events"):
+            ...     process(rows)
+        """
+        return stream_query(
+            self._pg.engine,
+            query,
+            params,
+            batch_size,
+            as_columns,
+            schema=self._schema_name,
+        )
+
     def ensure_schema(self) -> None:
         """
         Create the PostgreSQL schema if it doesn't exist.
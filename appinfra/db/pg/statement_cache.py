@@ -0,0 +1,172 @@
+"""
+Compiled statement cache for PostgreSQL engines.
+
+SQLAlchemy compiles each statement into SQL text before execution and keeps
+the result in a per-engine compiled cache. StatementCache replaces that cache
+with a sized one that counts hits and misses, so repeated queries issued
+through PG.session() skip compilation and the hit rate can be monitored via
+PG.get_pool_status().
+
+With the psycopg (v3) driver (``postgresql+psycopg://`` URLs), the cache also
+enables server-side prepared statements: psycopg prepares a query on the
+server once it has run ``prepare_threshold`` times on a connection, keeping up
+to ``size`` prepared statements per connection. ``prepare_threshold`` is a
+connect() argument; ``prepared_max`` is not (libpq would reject it as a
+connection option), so it is set on each new connection by install(). psycopg2 has no prepared
+statement support, so only the compiled cache applies there.
+
+Enable in the database configuration:
+    dbs:
+      main:
+        url: postgresql://...
+        statement_cache: true        # or a mapping of StatementCache options:
+        # statement_cache:
+        #   size: 1000               # compiled statements (and psycopg prepared
+        #                            # statements per connection)
+        #   prepare_threshold: 2     # executions before server-side prepare
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any
+
+import sqlalchemy
+from sqlalchemy.util import LRUCache
+
+# Drivers that support server-side prepared statements via connect_args
+_PREPARE_DRIVERS = frozenset({"psycopg"})
+
+
+class _CountingLRUCache(LRUCache):  # type: ignore[type-arg]
+    """LRU cache that counts lookups made by SQLAlchemy's statement compiler."""
+
+    __slots__ = ("hits", "misses")
+
+    def __init__(self, capacity: int) -> None:
+        super().__init__(capacity)
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        value = super().get(key, default)
+        # Counters are approximate under concurrent access (no lock on the hot path)
+        if value is default:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+
+class StatementCache:
+    """
+    Sized compiled statement cache with hit/miss counters.
+
+    The cache is installed through the engine's ``compiled_cache`` execution
+    option, so it applies to every connection and session of the engine.
+    """
+
+    def __init__(self, size: int = 500, prepare_threshold: int = 2) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            size: Maximum number of compiled statements (and psycopg prepared
+                statements per connection)
+            prepare_threshold: Executions of a query on a connection before
+                psycopg prepares it server-side (0 prepares immediately)
+
+        Raises:
+            ValueError: If size is less than 1 or prepare_threshold is negative
+        """
+        if size < 1:
+            raise ValueError("Statement cache size must be positive")
+        if prepare_threshold < 0:
+            raise ValueError("prepare_threshold cannot be negative")
+        self.size = size
+        self.prepare_threshold = prepare_threshold
+        self.server_prepare = False
+        self._cache = _CountingLRUCache(size)
+
+    @classmethod
+    def from_config(cls, value: Any) -> StatementCache | None:
+        """
+        Create a cache from a database config's ``statement_cache`` value.
+
+        Args:
+            value: True, or a mapping of constructor options; anything else
+                (None, False, missing) disables the cache
+
+        Returns:
+            StatementCache instance, or None if disabled
+        """
+        if value is True:
+            return cls()
+        if isinstance(value, Mapping):
+            options = dict(value)
+            if not options.pop("enabled", True):
+                return None
+            return cls(**options)
+        return None
+
+    def engine_kwargs(self, url: str) -> dict[str, Any]:
+        """
+        Get create_engine() arguments that install the cache.
+
+        Args:
+            url: Database URL (selects server-side prepare for psycopg)
+
+        Returns:
+            Keyword arguments to merge into the engine configuration
+        """
+        kwargs: dict[str, Any] = {
+            "execution_options": {"compiled_cache": self._cache},
+        }
+        driver = sqlalchemy.engine.make_url(url).get_driver_name()
+        self.server_prepare = driver in _PREPARE_DRIVERS
+        if self.server_prepare:
+            kwargs["connect_args"] = {"prepare_threshold": self.prepare_threshold}
+        return kwargs
+
+    def install(self, engine: sqlalchemy.engine.Engine) -> None:
+        """
+        Apply per-connection settings to an engine created with engine_kwargs().
+
+        With server-side prepare enabled, sets ``prepared_max`` on every new
+        DBAPI connection of the engine.
+
+        Args:
+            engine: Engine created with this cache's engine_kwargs()
+        """
+        if self.server_prepare:
+            sqlalchemy.event.listen(engine, "connect", self._on_connect)
+
+    def _on_connect(self, dbapi_conn: Any, connection_record: Any) -> None:
+        """Limit prepared statements kept on a new psycopg connection."""
+        dbapi_conn.prepared_max = self.size
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with size, entries, hits, misses, hit_rate and whether
+            server-side prepared statements are enabled
+        """
+        hits = self._cache.hits
+        misses = self._cache.misses
+        lookups = hits + misses
+        return {
+            "size": self.size,
+            "entries": len(self._cache),
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "server_prepare": self.server_prepare,
+        }
+
+    def clear(self) -> None:
+        """Discard cached statements and reset counters."""
+        self._cache.clear()
+        self._cache.hits = 0
+        self._cache.misses = 0
@@ -0,0 +1,129 @@
+"""
+Server-side cursor streaming for large result sets.
+
+stream_query() executes a query with ``stream_results=True`` and
+``yield_per``, which makes the PostgreSQL drivers use a named (server-side)
+cursor, and yields the rows in batches. Only one batch is held in memory at a
+time, so scans of any size run in flat memory.
+
+The generator holds one pooled connection from the first batch until it is
+exhausted or closed; breaking out of a ``for`` loop (or garbage collecting
+the generator) closes the cursor and returns the connection.
+
+Batches are lists of rows by default, or column-oriented dicts for array
+consumers:
+
+- ``as_columns="list"``: ``{column: [values...]}``
+- ``as_columns="numpy"``: ``{column: numpy.ndarray}`` (pip install appinfra[numpy])
+
+Example:
+    >>> for batch in pg.stream("SELECT id, score FROM events", batch_size=50_000):
+    ...     process(batch)
+    >>> for cols in pg.stream(select(Event.id, Event.score), as_columns="numpy"):
+    ...     total += cols["score"].sum()
+"""
+
+from __future__ import annotations
+
+from collections.abc import Generator, Mapping, Sequence
+from typing import Any
+
+import sqlalchemy
+
+from ...errors import DependencyError
+
+# Supported as_columns values
+COLUMN_FORMATS = ("list", "numpy")
+
+
+def _to_columns(keys: Sequence[str], rows: Sequence[Any], fmt: str) -> dict[str, Any]:
+    """Transpose a batch of rows into a column-oriented dict."""
+    columns = [list(values) for values in zip(*rows, strict=True)]
+    if fmt == "numpy":
+        import numpy
+
+        return {key: numpy.asarray(values) for key, values in zip(keys, columns)}
+    return dict(zip(keys, columns))
+
+
+def _check_format(as_columns: str | None) -> None:
+    """Validate as_columns before any connection is taken."""
+    if as_columns is None:
+        return
+    if as_columns not in COLUMN_FORMATS:
+        raise ValueError(
+            f"Unknown as_columns: {as_columns} (expected one of {COLUMN_FORMATS})"
+        )
+    if as_columns == "numpy":
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            raise DependencyError("numpy", "numpy", "NumPy result streaming") from None
+
+
+def stream_query(
+    engine: sqlalchemy.engine.Engine,
+    query: Any,
+    params: Mapping[str, Any] | None = None,
+    batch_size: int = 10_000,
+    as_columns: str | None = None,
+    schema: str | None = None,
+) -> Generator[Any, None, None]:
+    """
+    Execute a query on a server-side cursor and yield row batches.
+
+    Arguments are validated when this function is called; the connection is
+    taken when the first batch is requested.
+
+    Args:
+        engine: SQLAlchemy engine
+        query: SQL string or SQLAlchemy executable (Core rows are returned;
+            ORM entities are not constructed)
+        params: Bind parameters
+        batch_size: Rows fetched from the server and yielded per batch
+        as_columns: None for lists of rows, "list" or "numpy" for
+            column-oriented dicts
+        schema: Schema to put first on the search_path for this query
+            (must already be validated)
+
+    Returns:
+        Generator of batches
+
+    Raises:
+        ValueError: If batch_size or as_columns is invalid
+        DependencyError: If as_columns is "numpy" and numpy is not installed
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be positive")
+    _check_format(as_columns)
+    if isinstance(query, str):
+        query = sqlalchemy.text(query)
+    return _stream(engine, query, params or {}, batch_size, as_columns, schema)
+
+
+def _stream(
+    engine: sqlalchemy.engine.Engine,
+    query: Any,
+    params: Mapping[str, Any],
+    batch_size: int,
+    as_columns: str | None,
+    schema: str | None,
+) -> Generator[Any, None, None]:
+    """Generator body of stream_query()."""
+    with engine.connect() as conn:
+        if schema is not None:
+            conn.execute(
+                sqlalchemy.text(f'SET LOCAL search_path TO "{schema}", public')
+            )
+        result = conn.execution_options(
+            stream_results=True, yield_per=batch_size
+        ).execute(query, params)
+        try:
+            keys = list(result.keys())
+            for partition in result.partitions(batch_size):
+                if as_columns is None:
+                    yield partition
+                else:
+                    yield _to_columns(keys, partition, as_columns)
+        finally:
+            result.close()
@@ -0,0 +1,324 @@
+"""
+Client-side statement statistics, keyed by normalized query fingerprint.
+
+Like pg_stat_statements, but collected in-process from SQLAlchemy cursor
+events, so it works for any engine (PostgreSQL and SQLite) and needs no
+database privileges. For each fingerprint it tracks execution count,
+latency (total, mean, p50/p95/p99 via a streaming histogram), rows and
+errors. A summary of the top statements by total time can be logged
+periodically.
+
+Fingerprints strip literals and placeholders and collapse IN lists and
+multi-row VALUES, so ``WHERE id IN (1, 2, 3)`` and ``WHERE id IN (%(id_1)s)``
+share one entry.
+
+Enable per database in the configuration:
+    dbs:
+      main:
+        url: postgresql://...
+        query_stats: true          # or a mapping of QueryStats options:
+        # query_stats:
+        #   summary_interval: 300  # seconds between top-N log summaries
+        #   top_n: 10
+        #   max_statements: 1000
+
+Example:
+    >>> stats = QueryStats(lg)
+    >>> stats.attach(engine)
+    >>> stats.top(5)[0]["query"]
+    'SELECT users.id FROM users WHERE users.id = ?'
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+import time
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Any
+
+import sqlalchemy
+
+from ..observability.histogram import LatencyHistogram
+
+# Fingerprint used once max_statements distinct fingerprints are tracked
+OTHER_FINGERPRINT = "<other>"
+
+# Message of the periodic summary record
+SUMMARY_MESSAGE = "top queries"
+
+# Orderings accepted by QueryStats.top()
+ORDER_KEYS = ("total", "mean", "p95", "p99", "max", "count", "errors", "rows")
+
+_COMMENTS = re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL)
+_STRINGS = re.compile(r"'(?:[^']|'')*'")
+_PLACEHOLDERS = re.compile(r"%\(\w+\)s|%s|\$\d+|(?<![:\w]):\w+")
+_NUMBERS = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?\b")
+_IN_LISTS = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+_ROW = r"\(\s*\?(?:\s*,\s*\?)*\s*\)"
+_ROWS = re.compile(rf"({_ROW})(?:\s*,\s*{_ROW})+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=4096)
+def fingerprint(statement: str) -> str:
+    """
+    Normalize a SQL statement for grouping.
+
+    Comments are removed, string and numeric literals and bind placeholders
+    (``%(name)s``, ``%s``, ``$1``, ``:name``) become ``?``, IN lists collapse
+    to ``IN (...)``, repeated VALUES rows collapse to one, and whitespace is
+    normalized. Results are cached, since applications run a bounded set of
+    statement strings.
+
+    Args:
+        statement: SQL statement as sent to the driver
+
+    Returns:
+        Normalized statement text
+    """
+    sql = _COMMENTS.sub(" ", statement)
+    sql = _STRINGS.sub("?", sql)
+    sql = _PLACEHOLDERS.sub("?", sql)
+    sql = _NUMBERS.sub("?", sql)
+    sql = _IN_LISTS.sub("IN (...)", sql)
+    sql = _ROWS.sub(r"\1", sql)
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+class _StatementStats:
+    """Counters and latency histogram for one fingerprint."""
+
+    __slots__ = ("count", "errors", "rows", "latency")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.errors = 0
+        self.rows = 0
+        self.latency = LatencyHistogram()
+
+    def to_dict(self, query: str) -> dict[str, Any]:
+        """Summarize the statement (latencies in seconds)."""
+        latency = self.latency.snapshot()
+        return {
+            "query": query,
+            "count": self.count,
+            "errors": self.errors,
+            "rows": self.rows,
+            "total": latency["total"],
+            "mean": latency["avg"],
+            "max": latency["max"],
+            "p50": latency["p50"],
+            "p95": latency["p95"],
+            "p99": latency["p99"],
+        }
+
+
+class QueryStats:
+    """
+    Per-fingerprint statement statistics for one or more engines.
+
+    Timing covers cursor execution (before_cursor_execute to
+    after_cursor_execute). Rows are the driver's rowcount (rows affected, or
+    rows returned where the driver reports it; SQLite reports -1 for
+    SELECT, which is not counted). Failed executions count as errors.
+
+    Thread Safety:
+        Listeners may fire from any thread; the table is guarded by a lock
+        and each histogram has its own.
+    """
+
+    def __init__(
+        self,
+        lg: Any = None,
+        summary_interval: float = 0.0,
+        top_n: int = 10,
+        max_statements: int = 1000,
+    ) -> None:
+        """
+        Initialize the statistics table.
+
+        Args:
+            lg: Logger for periodic summaries (optional)
+            summary_interval: Seconds between top-N summary records logged at
+                INFO (0 disables)
+            top_n: Statements per summary
+            max_statements: Distinct fingerprints tracked; further statements
+                are grouped under OTHER_FINGERPRINT
+
+        Raises:
+            ValueError: If top_n or max_statements is less than 1
+        """
+        if top_n < 1 or max_statements < 1:
+            raise ValueError("top_n and max_statements must be positive")
+        self._lg = lg
+        self.summary_interval = summary_interval
+        self.top_n = top_n
+        self.max_statements = max_statements
+        self._lock = threading.Lock()
+        self._stats: dict[str, _StatementStats] = {}
+        self._last_summary = time.monotonic()
+        self._engines: list[Any] = []
+
+    @classmethod
+    def from_config(cls, value: Any, lg: Any = None) -> QueryStats | None:
+        """
+        Create statistics from a database config's ``query_stats`` value.
+
+        Args:
+            value: True, or a mapping of constructor options; anything else
+                (None, False, missing) disables statistics
+            lg: Logger for periodic summaries
+
+        Returns:
+            QueryStats instance, or None if disabled
+        """
+        if value is True:
+            return cls(lg)
+        if isinstance(value, Mapping):
+            options = dict(value)
+            if not options.pop("enabled", True):
+                return None
+            return cls(lg, **options)
+        return None
+
+    def attach(self, engine: Any) -> None:
+        """
+        Start collecting statistics for an engine.
+
+        Args:
+            engine: SQLAlchemy engine
+        """
+        sqlalchemy.event.listen(engine, "before_cursor_execute", self._before)
+        sqlalchemy.event.listen(engine, "after_cursor_execute", self._after)
+        sqlalchemy.event.listen(engine, "handle_error", self._error)
+        self._engines.append(engine)
+
+    def detach(self) -> None:
+        """Remove listeners from all attached engines."""
+        for engine in self._engines:
+            sqlalchemy.event.remove(engine, "before_cursor_execute", self._before)
+            sqlalchemy.event.remove(engine, "after_cursor_execute", self._after)
+            sqlalchemy.event.remove(engine, "handle_error", self._error)
+        self._engines = []
+
+    def _before(
+        self,
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        """Record the cursor execution start time on the execution context."""
+        if context is not None:
+            context._query_stats_start = time.perf_counter()
+
+    def _after(
+        self,
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        """Record a completed execution."""
+        start = getattr(context, "_query_stats_start", None)
+        if start is None:
+            return
+        rowcount = getattr(cursor, "rowcount", -1)
+        self.record(
+            statement,
+            time.perf_counter() - start,
+            rowcount if isinstance(rowcount, int) and rowcount > 0 else 0,
+        )
+
+    def _error(self, exception_context: Any) -> None:
+        """Record a failed execution (only failures after cursor execution began)."""
+        statement = exception_context.statement
+        start = getattr(exception_context.execution_context, "_query_stats_start", None)
+        if statement is None or start is None:
+            return
+        self.record(statement, time.perf_counter() - start, error=True)
+
+    def record(
+        self, statement: str, seconds: float, rows: int = 0, error: bool = False
+    ) -> None:
+        """
+        Add one execution to the statement's statistics.
+
+        Args:
+            statement: SQL statement (fingerprinted here)
+            seconds: Execution time
+            rows: Rows returned or affected
+            error: Whether the execution failed
+        """
+        key = fingerprint(statement)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                if len(self._stats) >= self.max_statements:
+                    key = OTHER_FINGERPRINT
+                stats = self._stats.setdefault(key, _StatementStats())
+            stats.count += 1
+            stats.rows += rows
+            if error:
+                stats.errors += 1
+        stats.latency.observe(seconds)
+
+        if self.summary_interval > 0 and self._lg is not None:
+            self._maybe_log_summary()
+
+    def _maybe_log_summary(self) -> None:
+        """Log the top statements once per summary_interval."""
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last_summary < self.summary_interval:
+                return
+            self._last_summary = now
+        self._lg.info(
+            SUMMARY_MESSAGE,
+            extra={"interval": self.summary_interval, "top": self.top(self.top_n)},
+        )
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """
+        Get statistics for every tracked fingerprint.
+
+        Returns:
+            Dictionary mapping fingerprint to count, errors, rows, and total,
+            mean, max, p50, p95 and p99 latency in seconds
+        """
+        with self._lock:
+            items = list(self._stats.items())
+        return {key: stats.to_dict(key) for key, stats in items}
+
+    def top(self, n: int = 10, by: str = "total") -> list[dict[str, Any]]:
+        """
+        Get the top statements.
+
+        Args:
+            n: Number of statements
+            by: Ordering key (see ORDER_KEYS); default is total time
+
+        Returns:
+            Statement summaries (as in snapshot(), with a "query" key),
+            highest first
+
+        Raises:
+            ValueError: If by is not an ordering key
+        """
+        if by not in ORDER_KEYS:
+            raise ValueError(f"Unknown ordering: {by} (expected one of {ORDER_KEYS})")
+        entries = list(self.snapshot().values())
+        entries.sort(key=lambda entry: entry[by], reverse=True)
+        return entries[:n]
+
+    def reset(self) -> None:
+        """Discard all statistics."""
+        with self._lock:
+            self._stats = {}
+            self._last_summary = time.monotonic()
@@ -15,6 +15,7 @@ import sqlalchemy.orm
 
 from ...log import Logger, LoggerFactory
 from ..pg.interface import Interface
+from ..query_stats import QueryStats
 
 if TYPE_CHECKING:
     from sqlalchemy.engine import Engine
@@ -95,6 +96,13 @@ class SQLite(Interface):
         self._engine: Engine = sqlalchemy.create_engine(cfg.url, **engine_kwargs)
         self._SessionCls = sqlalchemy.orm.sessionmaker(bind=self._engine)
 
+        # Statement statistics (opt-in via cfg.query_stats)
+        self._query_stats = QueryStats.from_config(
+            getattr(cfg, "query_stats", None), self._lg
+        )
+        if self._query_stats is not None:
+            self._query_stats.attach(self._engine)
+
         self._lg.debug("initialized", extra={"url": self._safe_url})
 
     @property
@@ -117,6 +125,24 @@ class SQLite(Interface):
         """Get the SQLAlchemy engine."""
         return self._engine
 
+    @property
+    def query_stats(self) -> QueryStats | None:
+        """Get the statement statistics table (None unless cfg.query_stats is set)."""
+        return self._query_stats
+
+    def get_query_stats(self) -> dict[str, dict[str, Any]]:
+        """
+        Get per-statement statistics keyed by query fingerprint.
+
+        Returns:
+            Dictionary mapping fingerprint to count, errors, rows and latency
+            (total, mean, max, p50, p95, p99 in seconds); empty if statistics
+            are not enabled
+        """
+        if self._query_stats is None:
+            return {}
+        return self._query_stats.snapshot()
+
     def connect(self) -> Any:
         """
         Establish a connection to the SQLite database.
@@ -6,7 +6,7 @@ This module extends Python's standard logging with:
 - Colored console output with ANSI escape sequences
 - Microsecond precision timestamps
 - File location tracking in log messages
-- Structured logging with extra fields
+- Structured logging with extra fields (deferred values via lazy())
 - Callback system for log event handling
 - Fluent LoggingBuilder API for easy configuration
 - JSON logging support for structured output
@@ -27,6 +27,8 @@ import sys
 import warnings
 from typing import Optional, Union
 
+from .async_handler import AsyncDispatchHandler
+
 # Import LoggingBuilder components
 from .builder import (
     ConsoleLoggingBuilder,
@@ -49,7 +51,7 @@ from .builder import (
     quick_json_console,
     quick_json_file,
 )
-from .callback import CallbackRegistry, listens_for
+from .callback import CallbackRegistry, CallbackWorkerPool, listens_for
 from .config import ChildLogConfig, LogConfig
 
 # Import new architecture components
@@ -63,12 +65,15 @@ from .errors import (
     ReservedKeyError,
 )
 from .factory import LoggerFactory
+from .lazy import LazyValue, lazy
 from .level_manager import LevelRule, LogLevelManager
 from .logger import Logger
+from .metrics import LogMetrics
 
 # Multiprocessing support
-from .mp import LogQueueListener, MPQueueHandler
+from .mp import LogQueueListener, MPQueueHandler, SharedMemoryRing
 from .reloader import LogConfigReloader
+from .sampling import LogSamplingManager, SamplingRule
 
 # Define custom log levels for more granular debugging
 logging.TRACE = LogConstants.CUSTOM_LEVELS["TRACE"]  # type: ignore[attr-defined]
@@ -309,15 +314,22 @@ __all__ = [
     "Logger",
     "LoggerFactory",
     "CallbackRegistry",
+    "CallbackWorkerPool",
     "LogConfig",
     "ChildLogConfig",
     "LogConstants",
     "LogLevelManager",
     "LevelRule",
+    "LogSamplingManager",
+    "SamplingRule",
     "LogConfigReloader",
+    "LogMetrics",
     # Multiprocessing support
     "MPQueueHandler",
     "LogQueueListener",
+    "SharedMemoryRing",
+    # Async dispatch
+    "AsyncDispatchHandler",
     # Exception classes
     "LogError",
     "InvalidLogLevelError",
@@ -353,6 +365,8 @@ __all__ = [
     "capture_all_loggers",
     "capture_logger",
     "listens_for",
+    "lazy",
+    "LazyValue",
     # Backward compatibility functions
     "create_root_lg",
     "create_lg",
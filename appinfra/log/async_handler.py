@@ -0,0 +1,298 @@
+"""
+Asynchronous handler dispatch for appinfra logging.
+
+This module provides a handler wrapper that moves formatting and I/O off the
+caller thread. Records are placed on a bounded in-process queue and a single
+writer thread drains them in batches to the wrapped handlers, so a slow disk
+or a blocked stderr pipe no longer stalls the threads that log.
+
+Usage:
+    from appinfra.log import LoggingBuilder
+
+    logger = (
+        LoggingBuilder("app")
+        .with_file_handler("app.log")
+        .with_async_dispatch(max_queue=10_000, overflow="drop_oldest")
+        .build()
+    )
+"""
+
+from __future__ import annotations
+
+import logging
+import sys
+import threading
+import time
+import traceback
+import weakref
+from collections import deque
+from collections.abc import Iterable
+from typing import Any, ClassVar
+
+from .errors import LogConfigError
+from .metrics import LogMetrics
+
+OVERFLOW_POLICIES = ("drop_oldest", "block", "drop_new")
+
+
+class AsyncDispatchHandler(logging.Handler):
+    """
+    Dispatches records to wrapped handlers from a background writer thread.
+
+    The caller thread only freezes the message and appends the record to a
+    bounded queue. When the queue is full the overflow policy decides what
+    happens:
+
+    - drop_oldest: discard the oldest queued record (never blocks)
+    - drop_new: discard the incoming record (never blocks)
+    - block: wait until the writer thread frees a slot
+
+    Counters for queued, dispatched and dropped records and for queue latency
+    are available via stats().
+
+    Thread Safety:
+        emit() may be called from any thread. A single daemon writer thread
+        calls the wrapped handlers, so they never see concurrent records.
+    """
+
+    _instances: ClassVar[weakref.WeakSet[AsyncDispatchHandler]] = weakref.WeakSet()
+
+    def __init__(
+        self,
+        handlers: Iterable[logging.Handler],
+        max_queue: int = 10_000,
+        overflow: str = "drop_oldest",
+        batch_size: int = 256,
+    ) -> None:
+        """
+        Initialize the dispatcher and start its writer thread.
+
+        Args:
+            handlers: Handlers that receive records on the writer thread
+            max_queue: Maximum number of queued records
+            overflow: Policy when the queue is full (see OVERFLOW_POLICIES)
+            batch_size: Maximum records taken from the queue per drain
+
+        Raises:
+            LogConfigError: If overflow, max_queue or batch_size is invalid
+        """
+        _validate_dispatch_options(max_queue, overflow, batch_size)
+        self.handlers = list(handlers)
+        super().__init__(min((h.level for h in self.handlers), default=0))
+
+        self.max_queue = max_queue
+        self.overflow = overflow
+        self.batch_size = batch_size
+
+        self._queue: deque[tuple[float, logging.LogRecord]] = deque()
+        self._cond = threading.Condition()
+        self._in_flight = 0
+        self._closed = False
+
+        self._queued = 0
+        self._dispatched = 0
+        self._dropped = 0
+        self._latency_total = 0.0
+        self._latency_max = 0.0
+
+        self._thread = threading.Thread(
+            target=self._run, name="log-async-dispatch", daemon=True
+        )
+        self._thread.start()
+        AsyncDispatchHandler._instances.add(self)
+        LogMetrics.register_source("async_dispatch", self)
+
+    @property
+    def needs_caller(self) -> bool:
+        """Check if any wrapped handler's formatter may render caller info."""
+        return any(
+            getattr(h, "needs_caller", getattr(h.formatter, "needs_caller", True))
+            for h in self.handlers
+        )
+
+    def setLevel(self, level: int | str) -> None:
+        """Set the level on this dispatcher and every wrapped handler."""
+        super().setLevel(level)
+        for handler in self.handlers:
+            handler.setLevel(level)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Queue a record for the writer thread.
+
+        The message is rendered here so that mutable arguments cannot change
+        before the writer thread formats the record.
+        """
+        try:
+            if record.args:
+                record.msg = record.getMessage()
+                record.args = None
+            self._enqueue(record)
+        except Exception:
+            self.handleError(record)
+
+    def _enqueue(self, record: logging.LogRecord) -> None:
+        """Append a record to the queue, applying the overflow policy."""
+        with self._cond:
+            if self.overflow == "block" and not self._on_writer_thread():
+                self._cond.wait_for(
+                    lambda: len(self._queue) < self.max_queue or self._closed
+                )
+            if self._closed:
+                self._dropped += 1
+                return
+            if len(self._queue) >= self.max_queue:
+                self._dropped += 1
+                if self.overflow == "drop_new":
+                    return
+                # drop_oldest, or block re-entered from the writer thread
+                self._queue.popleft()
+            self._queue.append((time.monotonic(), record))
+            self._queued += 1
+            self._cond.notify_all()
+
+    def _on_writer_thread(self) -> bool:
+        """Check if the caller is the writer thread (e.g. a handler logging)."""
+        return threading.current_thread() is self._thread
+
+    def _run(self) -> None:
+        """Writer loop - drains batches until closed and empty."""
+        while True:
+            with self._cond:
+                while not self._queue and not self._closed:
+                    self._cond.wait()
+                if not self._queue:
+                    return
+                count = min(len(self._queue), self.batch_size)
+                batch = [self._queue.popleft() for _ in range(count)]
+                self._in_flight = count
+                # Wake producers blocked on a full queue
+                self._cond.notify_all()
+
+            self._dispatch(batch)
+
+            with self._cond:
+                self._in_flight = 0
+                self._dispatched += count
+                self._cond.notify_all()
+
+    def _dispatch(self, batch: list[tuple[float, logging.LogRecord]]) -> None:
+        """Pass a batch of records to the wrapped handlers."""
+        now = time.monotonic()
+        metrics = LogMetrics.get_instance() if LogMetrics.enabled else None
+        for enqueued_at, record in batch:
+            latency = now - enqueued_at
+            self._latency_total += latency
+            if latency > self._latency_max:
+                self._latency_max = latency
+            for handler in self.handlers:
+                if record.levelno < handler.level:
+                    continue
+                try:
+                    if metrics is None:
+                        handler.handle(record)
+                    else:
+                        metrics.handle(handler, record)
+                except Exception:
+                    sys.stderr.write("AsyncDispatchHandler: error handling record:\n")
+                    traceback.print_exc(file=sys.stderr)
+
+    def flush(self) -> None:
+        """Wait up to 5 seconds for queued records to be dispatched, then flush."""
+        self.drain()
+
+    def drain(self, timeout: float | None = 5.0) -> bool:
+        """
+        Wait until every queued record has been dispatched, then flush handlers.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if the queue was fully drained within the timeout
+        """
+        with self._cond:
+            if not self._on_writer_thread():
+                self._cond.wait_for(self._is_idle, timeout)
+            drained = not self._queue and not self._in_flight
+        for handler in self.handlers:
+            handler.flush()
+        return drained
+
+    def _is_idle(self) -> bool:
+        """Check if nothing is pending or the writer thread has exited."""
+        return (not self._queue and not self._in_flight) or not self._thread.is_alive()
+
+    def close(self, timeout: float = 5.0) -> None:
+        """
+        Drain the queue, stop the writer thread and close wrapped handlers.
+
+        If the writer thread is still running after the timeout, the wrapped
+        handlers are left open so it can finish emitting into them.
+
+        Args:
+            timeout: Maximum seconds to wait for the writer thread
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        stopped = True
+        if not self._on_writer_thread():
+            self._thread.join(timeout)
+            stopped = not self._thread.is_alive()
+        if stopped:
+            for handler in self.handlers:
+                handler.close()
+        else:
+            # Closing handlers under a running writer would break its emits
+            sys.stderr.write(
+                "AsyncDispatchHandler: writer thread did not stop within "
+                f"{timeout}s; wrapped handlers left open\n"
+            )
+        AsyncDispatchHandler._instances.discard(self)
+        super().close()
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get dispatch counters.
+
+        Returns:
+            Dictionary with queued, dispatched, dropped and pending record
+            counts and average/maximum queue latency in seconds
+        """
+        with self._cond:
+            dispatched = self._dispatched
+            return {
+                "queued": self._queued,
+                "dispatched": dispatched,
+                "dropped": self._dropped,
+                "pending": len(self._queue) + self._in_flight,
+                "latency_avg": self._latency_total / dispatched if dispatched else 0.0,
+                "latency_max": self._latency_max,
+            }
+
+    @classmethod
+    def flush_all(cls, timeout: float = 5.0) -> bool:
+        """
+        Flush every live dispatcher (used on application shutdown).
+
+        Args:
+            timeout: Maximum seconds to wait per dispatcher
+
+        Returns:
+            True if all dispatchers drained within the timeout
+        """
+        return all([handler.drain(timeout) for handler in list(cls._instances)])
+
+
+def _validate_dispatch_options(max_queue: int, overflow: str, batch_size: int) -> None:
+    """Validate async dispatch options, raising LogConfigError if invalid."""
+    if overflow not in OVERFLOW_POLICIES:
+        raise LogConfigError(
+            f"Invalid overflow policy: {overflow!r} "
+            f"(expected one of {', '.join(OVERFLOW_POLICIES)})"
+        )
+    if max_queue < 1:
+        raise LogConfigError(f"max_queue must be positive, got {max_queue}")
+    if batch_size < 1:
+        raise LogConfigError(f"batch_size must be positive, got {batch_size}")
@@ -0,0 +1,256 @@
+"""
+Buffered file handlers for high-volume logging.
+
+The stdlib file handlers write and flush every record, so a batch job logging
+thousands of records per second spends most of its logging time in write
+syscalls. The handlers in this module keep formatted records in the file's
+write buffer and flush when:
+
+- the buffered data reaches ``buffer_bytes`` (counted in characters written)
+- the oldest buffered record is ``flush_interval`` seconds old
+- a record at ERROR or above is written (flushed immediately)
+- the handler is flushed, rolled over or closed
+
+The ``fsync`` policy controls durability of flushed data:
+
+- "never": leave write-back to the OS (default)
+- "error": fsync on flushes forced by ERROR+ records and on close
+- "always": fsync on every flush
+"""
+
+from __future__ import annotations
+
+import logging
+import logging.handlers
+import os
+import stat
+from collections.abc import Sequence
+from io import TextIOWrapper
+from typing import TYPE_CHECKING, cast
+
+from .errors import LogConfigError
+from .flush_timer import schedule_flush
+
+FSYNC_POLICIES = ("never", "error", "always")
+
+
+if TYPE_CHECKING:
+    # Lets the mixin type-check against the FileHandler attributes it uses
+    _FileHandlerBase = logging.FileHandler
+else:
+    _FileHandlerBase = object
+
+
+class _BufferedFileMixin(_FileHandlerBase):
+    """Buffered write path shared by the file handler variants."""
+
+    _closed: bool
+
+    def _init_buffer(
+        self, buffer_bytes: int, flush_interval: float, fsync: str
+    ) -> None:
+        """Set buffering options; must run before the stream is opened."""
+        if fsync not in FSYNC_POLICIES:
+            raise LogConfigError(
+                f"Invalid fsync policy: {fsync!r} "
+                f"(expected one of {', '.join(FSYNC_POLICIES)})"
+            )
+        if buffer_bytes < 0:
+            raise LogConfigError(f"buffer_bytes must be >= 0, got {buffer_bytes}")
+        self.buffer_bytes = buffer_bytes
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+        self._pending = 0
+        self._size = 0
+        self._regular_file = True
+
+    def _open(self) -> TextIOWrapper:
+        """Open the log file with a write buffer sized to buffer_bytes."""
+        stream = open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.buffer_bytes or -1,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+        st = os.fstat(stream.fileno())
+        self._size = st.st_size
+        # Never roll over anything other than regular files (bpo-45401)
+        self._regular_file = stat.S_ISREG(st.st_mode)
+        self._pending = 0
+        return cast(TextIOWrapper, stream)  # Text mode always opens a TextIOWrapper
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write a record into the buffer, flushing when a trigger is hit."""
+        try:
+            length = self._write(record)
+            if length:
+                self._after_write(record.levelno, length)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)  # type: ignore[attr-defined]
+
+    def handle_batch(self, records: Sequence[logging.LogRecord]) -> None:
+        """
+        Write records under one lock acquisition (LogQueueListener drain mode).
+
+        Filters are applied per record; the flush triggers are checked once
+        for the whole batch, using its highest level.
+        """
+        assert self.lock is not None
+        written = 0
+        levelno = 0
+        with self.lock:
+            for record in records:
+                if not self.filter(record):  # type: ignore[attr-defined]
+                    continue
+                try:
+                    written += self._write(record)
+                except RecursionError:
+                    raise
+                except Exception:
+                    self.handleError(record)  # type: ignore[attr-defined]
+                    continue
+                levelno = max(levelno, record.levelno)
+            if written:
+                self._after_write(levelno, written)
+
+    def _write(self, record: logging.LogRecord) -> int:
+        """Format and write a record to the stream, returning characters written."""
+        msg = self.format(record) + self.terminator
+        self._before_write(record, msg)
+        if self.stream is None:
+            if self.mode == "w" and self._closed:
+                return 0
+            self.stream = self._open()
+        self.stream.write(msg)
+        self._size += len(msg)
+        return len(msg)
+
+    def _before_write(self, record: logging.LogRecord, msg: str) -> None:
+        """Hook for rotation checks before a record is written."""
+
+    def _after_write(self, levelno: int, length: int) -> None:
+        """Account for written records and apply the flush triggers."""
+        pending = self._pending
+        self._pending = pending + length
+        if levelno >= logging.ERROR:
+            self._flush_buffer(durable=self.fsync != "never")
+        elif pending + length >= self.buffer_bytes:
+            self._flush_buffer(durable=self.fsync == "always")
+        elif not pending and self.flush_interval > 0:
+            schedule_flush(self, self.flush_interval)
+
+    def _flush_buffer(self, durable: bool) -> None:
+        """Flush buffered data to the OS, optionally fsyncing it to disk."""
+        assert self.lock is not None
+        with self.lock:
+            stream = self.stream
+            if stream is not None and not stream.closed and self._pending:
+                stream.flush()
+                if durable:
+                    os.fsync(stream.fileno())
+            self._pending = 0
+
+    def flush(self) -> None:
+        """Flush buffered records (called by logging.shutdown and the timer)."""
+        self._flush_buffer(durable=self.fsync == "always")
+
+    def close(self) -> None:
+        """Flush buffered records and close the file."""
+        self._flush_buffer(durable=self.fsync != "never")
+        super().close()  # type: ignore[misc]
+
+
+class BufferedFileHandler(_BufferedFileMixin, logging.FileHandler):
+    """FileHandler that buffers writes (see module docstring)."""
+
+    def __init__(
+        self,
+        filename: str | os.PathLike[str],
+        mode: str = "a",
+        encoding: str | None = None,
+        delay: bool = False,
+        buffer_bytes: int = 65536,
+        flush_interval: float = 1.0,
+        fsync: str = "never",
+    ) -> None:
+        self._init_buffer(buffer_bytes, flush_interval, fsync)
+        super().__init__(filename, mode=mode, encoding=encoding, delay=delay)
+
+
+class BufferedRotatingFileHandler(
+    _BufferedFileMixin, logging.handlers.RotatingFileHandler
+):
+    """
+    RotatingFileHandler that buffers writes.
+
+    The file size is tracked as records are written, so checking for rollover
+    does not seek (which would flush the buffer on every record). Buffered
+    data is flushed into the old file before it is rotated.
+    """
+
+    def __init__(
+        self,
+        filename: str | os.PathLike[str],
+        max_bytes: int = 0,
+        backup_count: int = 0,
+        encoding: str | None = None,
+        delay: bool = False,
+        buffer_bytes: int = 65536,
+        flush_interval: float = 1.0,
+        fsync: str = "never",
+    ) -> None:
+        self._init_buffer(buffer_bytes, flush_interval, fsync)
+        super().__init__(
+            filename,
+            maxBytes=max_bytes,
+            backupCount=backup_count,
+            encoding=encoding,
+            delay=delay,
+        )
+
+    def _before_write(self, record: logging.LogRecord, msg: str) -> None:
+        """Roll over if this record would push the file past max_bytes."""
+        if self.stream is None:
+            self.stream = self._open()
+        if self.maxBytes <= 0 or not self._regular_file or not self._size:
+            return
+        if self._size + len(msg) >= self.maxBytes:
+            self.doRollover()
+
+
+class BufferedTimedRotatingFileHandler(
+    _BufferedFileMixin, logging.handlers.TimedRotatingFileHandler
+):
+    """TimedRotatingFileHandler that buffers writes."""
+
+    def __init__(
+        self,
+        filename: str | os.PathLike[str],
+        when: str = "h",
+        interval: int = 1,
+        backup_count: int = 0,
+        encoding: str | None = None,
+        delay: bool = False,
+        utc: bool = False,
+        buffer_bytes: int = 65536,
+        flush_interval: float = 1.0,
+        fsync: str = "never",
+    ) -> None:
+        self._init_buffer(buffer_bytes, flush_interval, fsync)
+        super().__init__(
+            filename,
+            when=when,
+            interval=interval,
+            backupCount=backup_count,
+            encoding=encoding,
+            delay=delay,
+            utc=utc,
+        )
+
+    def _before_write(self, record: logging.LogRecord, msg: str) -> None:
+        """Roll over when the rotation time has passed."""
+        if self.shouldRollover(record):
+            self.doRollover()
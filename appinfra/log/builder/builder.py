@@ -56,6 +56,12 @@ def _deserialize_handler(handler_dict: dict[str, Any]) -> HandlerConfig | None:
     return None
 
 
+def _buffer_kwargs(kwargs: dict[str, Any]) -> dict[str, Any]:
+    """Pick file buffering options (buffer_bytes, flush_interval, fsync)."""
+    keys = ("buffer_bytes", "flush_interval", "fsync")
+    return {k: kwargs[k] for k in keys if k in kwargs}
+
+
 class LoggingBuilder(LoggingBuilderInterface):
     """
     Base fluent builder for configuring loggers.
@@ -87,6 +93,9 @@ class LoggingBuilder(LoggingBuilderInterface):
         # Extra fields to pre-populate in log records
         self._extra: dict[str, Any] | collections.OrderedDict = {}
 
+        # Async dispatch options (None = handlers run on the caller thread)
+        self._async_dispatch: dict[str, Any] | None = None
+
     def with_level(self, level: str | int) -> Self:
         """
         Set the log level.
@@ -204,6 +213,41 @@ class LoggingBuilder(LoggingBuilderInterface):
         self._extra.update(kwargs)
         return self
 
+    def with_async_dispatch(
+        self,
+        max_queue: int = 10_000,
+        overflow: str = "drop_oldest",
+        batch_size: int = 256,
+    ) -> Self:
+        """
+        Dispatch records to handlers from a background writer thread.
+
+        All configured handlers are wrapped in a single AsyncDispatchHandler,
+        so formatting and I/O no longer run on the thread that logs. Queued
+        records are drained on shutdown.
+
+        Args:
+            max_queue: Maximum number of queued records
+            overflow: Policy when the queue is full: "drop_oldest" (default),
+                      "drop_new", or "block"
+            batch_size: Maximum records written per queue drain
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            LogConfigError: If an option is invalid
+        """
+        from ..async_handler import _validate_dispatch_options
+
+        _validate_dispatch_options(max_queue, overflow, batch_size)
+        self._async_dispatch = {
+            "max_queue": max_queue,
+            "overflow": overflow,
+            "batch_size": batch_size,
+        }
+        return self
+
     def with_handler(self, handler_config: HandlerConfig) -> Self:
         """
         Add a handler configuration.
@@ -247,7 +291,8 @@ class LoggingBuilder(LoggingBuilderInterface):
         Args:
             filename: Path to log file
             level: Handler level (defaults to logger level)
-            **kwargs: Additional file handler arguments
+            **kwargs: Additional file handler arguments (mode, encoding, delay,
+                      buffer_bytes, flush_interval, fsync)
 
         Returns:
             Self for method chaining
@@ -260,6 +305,7 @@ class LoggingBuilder(LoggingBuilderInterface):
             mode=kwargs.get("mode", "a"),
             encoding=kwargs.get("encoding"),
             delay=kwargs.get("delay", False),
+            **_buffer_kwargs(kwargs),
         )
         return self.with_handler(handler_config)
 
@@ -293,6 +339,7 @@ class LoggingBuilder(LoggingBuilderInterface):
             level=level,
             encoding=kwargs.get("encoding"),
             delay=kwargs.get("delay", False),
+            **_buffer_kwargs(kwargs),
         )
         return self.with_handler(handler_config)
 
@@ -330,6 +377,7 @@ class LoggingBuilder(LoggingBuilderInterface):
             encoding=kwargs.get("encoding"),
             delay=kwargs.get("delay", False),
             utc=kwargs.get("utc", False),
+            **_buffer_kwargs(kwargs),
         )
         return self.with_handler(handler_config)
 
@@ -370,6 +418,7 @@ class LoggingBuilder(LoggingBuilderInterface):
             "location_color": self._location_color,
             "handlers": handlers,
             "extra": dict(self._extra) if self._extra else {},
+            "async_dispatch": self._async_dispatch,
         }
 
     @classmethod
@@ -398,6 +447,7 @@ class LoggingBuilder(LoggingBuilderInterface):
         builder._colors = config.get("colors", True)
         builder._location_color = config.get("location_color")
         builder._extra = config.get("extra", {})
+        builder._async_dispatch = config.get("async_dispatch")
 
         # Reconstruct handlers from serialized config
         for handler_dict in config.get("handlers", []):
@@ -436,6 +486,7 @@ class LoggingBuilder(LoggingBuilderInterface):
 
         # Add configured handlers
         self._add_handlers(logger, config)
+        self._apply_async_dispatch(logger)
 
         return logger
 
@@ -454,6 +505,22 @@ class LoggingBuilder(LoggingBuilderInterface):
             except Exception as e:
                 raise LogConfigError(f"Failed to create handler: {e}")
 
+    def _apply_async_dispatch(self, logger: Logger) -> None:
+        """
+        Move the logger's handlers behind an async dispatcher if configured.
+
+        Args:
+            logger: Logger instance with its handlers already added
+        """
+        if self._async_dispatch is None or not logger.handlers:
+            return
+
+        from ..async_handler import AsyncDispatchHandler
+
+        dispatcher = AsyncDispatchHandler(logger.handlers, **self._async_dispatch)
+        logger.handlers.clear()
+        logger.addHandler(dispatcher)
+
 
 def create_logger(name: str) -> LoggingBuilder:
     """
@@ -86,6 +86,7 @@ class ConsoleHandlerConfig(HandlerConfig):
                 "pretty_print": self.format_options.get("pretty_print", False),
                 "custom_fields": self.format_options.get("custom_fields", {}),
                 "exclude_fields": self.format_options.get("exclude_fields", []),
+                "encoder": self.format_options.get("encoder", "auto"),
             }
             formatter = JSONFormatter(**json_config)
         else:
@@ -9,10 +9,11 @@ from collections.abc import Callable
 from typing import Any, Self
 
 from ...config import LogConfig
+from ...errors import LogConfigError
 from ...factory import LoggerFactory
 from ...logger import Logger
 from ..builder import LoggingBuilder
-from .config import DatabaseHandlerConfig
+from .config import CRITICAL_FLUSH_MODES, DatabaseHandlerConfig
 
 
 class DatabaseLoggingBuilder(LoggingBuilder):
@@ -46,6 +47,7 @@ class DatabaseLoggingBuilder(LoggingBuilder):
         critical_trigger_fields: list[str] | None = None,
         critical_flush_timeout: float = 5.0,
         fallback_to_console: bool = True,
+        critical_flush_mode: str = "writer",
     ) -> Self:
         """
         Add database table output.
@@ -62,6 +64,7 @@ class DatabaseLoggingBuilder(LoggingBuilder):
             critical_trigger_fields: Fields in 'extra' that trigger immediate flush
             critical_flush_timeout: Max time to wait for critical flush in seconds
             fallback_to_console: If DB flush fails, log to console
+            critical_flush_mode: "writer" (background writer) or "signal" (SIGALRM)
 
         Returns:
             Self for method chaining
@@ -78,6 +81,7 @@ class DatabaseLoggingBuilder(LoggingBuilder):
             critical_trigger_fields=critical_trigger_fields,
             critical_flush_timeout=critical_flush_timeout,
             fallback_to_console=fallback_to_console,
+            critical_flush_mode=critical_flush_mode,
         )
         self.with_handler(handler_config)
         return self
@@ -204,6 +208,7 @@ class DatabaseLoggingBuilder(LoggingBuilder):
         trigger_fields: list[str] | None = None,
         timeout: float = 5.0,
         fallback_to_console: bool = True,
+        mode: str = "writer",
     ) -> Self:
         """
         Configure critical error immediate flush behavior.
@@ -213,10 +218,19 @@ class DatabaseLoggingBuilder(LoggingBuilder):
             trigger_fields: Fields in 'extra' that trigger immediate flush
             timeout: Max time to wait for critical flush in seconds
             fallback_to_console: If DB flush fails, log to console
+            mode: "writer" (background writer) or "signal" (SIGALRM)
 
         Returns:
             Self for method chaining
+
+        Raises:
+            LogConfigError: If mode is unknown
         """
+        if mode not in CRITICAL_FLUSH_MODES:
+            raise LogConfigError(
+                f"Invalid critical flush mode: {mode!r} "
+                f"(expected one of {', '.join(CRITICAL_FLUSH_MODES)})"
+            )
         # Apply to all database handlers in this builder
         for handler_config in self._handlers:
             if isinstance(handler_config, DatabaseHandlerConfig):
@@ -224,6 +238,7 @@ class DatabaseLoggingBuilder(LoggingBuilder):
                 handler_config.critical_trigger_fields = trigger_fields or ["exception"]
                 handler_config.critical_flush_timeout = timeout
                 handler_config.fallback_to_console = fallback_to_console
+                handler_config.critical_flush_mode = mode
         return self
 
     def build(self) -> Logger:
@@ -289,6 +304,7 @@ def _load_config_from_handler(handler_config: dict) -> dict:
             "fallback_to_console": critical_flush_config.get(
                 "fallback_to_console", True
             ),
+            "mode": critical_flush_config.get("mode", "writer"),
         },
     }
 
@@ -305,6 +321,7 @@ def _load_config_from_top_level(config_dict: dict) -> dict:
             "trigger_fields": critical_flush.get("trigger_fields", ["exception"]),
             "timeout": critical_flush.get("timeout", 5.0),
             "fallback_to_console": critical_flush.get("fallback_to_console", True),
+            "mode": critical_flush.get("mode", "writer"),
         },
     }
 
@@ -370,6 +387,7 @@ def create_database_logger_from_config(
         critical_trigger_fields=db_config["critical_flush"]["trigger_fields"],
         critical_flush_timeout=db_config["critical_flush"]["timeout"],
         fallback_to_console=db_config["critical_flush"]["fallback_to_console"],
+        critical_flush_mode=db_config["critical_flush"]["mode"],
     )
 
     return builder
@@ -14,11 +14,16 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
 from ...config import LogConfig
+from ...errors import LogConfigError
+from ...lazy import resolve_extra
 from ..interface import HandlerConfig
 
 if TYPE_CHECKING:
     from .handler import DatabaseHandler
 
+# How critical records are written (see DatabaseHandlerConfig)
+CRITICAL_FLUSH_MODES = ("writer", "signal")
+
 
 class DatabaseHandlerConfig(HandlerConfig):
     """
@@ -42,6 +47,7 @@ class DatabaseHandlerConfig(HandlerConfig):
         critical_trigger_fields: list[str] | None = None,
         critical_flush_timeout: float = 5.0,
         fallback_to_console: bool = True,
+        critical_flush_mode: str = "writer",
     ) -> None:
         """
         Initialize database handler configuration.
@@ -58,7 +64,19 @@ class DatabaseHandlerConfig(HandlerConfig):
             critical_trigger_fields: Fields in 'extra' that trigger immediate flush
             critical_flush_timeout: Max time to wait for critical flush in seconds
             fallback_to_console: If DB flush fails, log to console
+            critical_flush_mode: "writer" hands critical rows to the background
+                writer and waits for the commit (any thread, sub-second timeouts);
+                "signal" writes inline under a SIGALRM timeout (main thread only,
+                whole seconds)
+
+        Raises:
+            LogConfigError: If critical_flush_mode is unknown
         """
+        if critical_flush_mode not in CRITICAL_FLUSH_MODES:
+            raise LogConfigError(
+                f"Invalid critical_flush_mode: {critical_flush_mode!r} "
+                f"(expected one of {', '.join(CRITICAL_FLUSH_MODES)})"
+            )
         super().__init__(level)
         self.table_name = table_name
         self.db_interface = db_interface
@@ -70,6 +88,7 @@ class DatabaseHandlerConfig(HandlerConfig):
         self.critical_trigger_fields = critical_trigger_fields or ["exception"]
         self.critical_flush_timeout = critical_flush_timeout
         self.fallback_to_console = fallback_to_console
+        self.critical_flush_mode = critical_flush_mode
 
     def _default_columns(self) -> dict[str, str]:
         """Get default column mapping for log data."""
@@ -127,7 +146,7 @@ class DatabaseHandlerConfig(HandlerConfig):
         self._map_optional_fields(record, data)
 
         # Extra fields
-        extra = getattr(record, "__infra__extra", None)
+        extra = resolve_extra(record)
         if extra:
             data[self.columns["extra"]] = json.dumps(extra)
 
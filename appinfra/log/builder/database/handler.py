@@ -4,16 +4,30 @@ Database logging handler implementation.
 Handles logging to database tables with batching, performance optimization,
 and critical error flush mechanism.
 
+Records are mapped to rows on the logging thread and appended to the active
+batch. A background flusher thread swaps the batch out (double buffering) and
+writes it while new rows accumulate, so logging threads never wait on the
+database. Batches are written with PostgreSQL ``COPY FROM STDIN`` when the
+session is backed by psycopg, and with multi-row ``INSERT ... VALUES`` otherwise.
+
+Critical records (see critical_flush_mode) go to a priority lane of the same
+flusher. The logging thread waits for its row to be committed; critical rows
+queued concurrently are committed together in one transaction.
+
 Requires: pip install appinfra[sql]
 """
 
+import io
 import logging
 import signal
-from datetime import datetime
+import threading
+import time
+from collections.abc import Sequence
 from typing import Any
 
 from ....errors import DependencyError
 from ...config import LogConfig
+from ...metrics import LogMetrics
 from .config import DatabaseHandlerConfig
 
 # Lazy import sqlalchemy - it's an optional dependency
@@ -32,11 +46,47 @@ def _require_sqlalchemy() -> None:
         raise DependencyError("sqlalchemy", "sql", "Database logging")
 
 
+# Bind parameter budget per multi-row INSERT (SQLite before 3.32 allows 999)
+_MAX_BIND_PARAMS = 999
+
+
+def _copy_data(columns: tuple[str, ...], rows: list[dict[str, Any]]) -> str:
+    """Render rows as COPY text-format lines (same encoding as PG.bulk_insert)."""
+    # Imported here: appinfra.db needs the [sql] extra, checked at handler init
+    from ....db.pg.bulk import encode_value
+
+    return "".join(
+        "\t".join([encode_value(row[col]) for col in columns]) + "\n" for row in rows
+    )
+
+
+class _CriticalRow:
+    """Critical row queued on the flusher's priority lane."""
+
+    __slots__ = ("row", "done", "error")
+
+    def __init__(self, row: dict[str, Any]) -> None:
+        self.row = row
+        self.done = threading.Event()
+        self.error: Exception | None = None
+
+
 class DatabaseHandler(logging.Handler):
     """
     Database logging handler.
 
     Handles logging to database tables with batching and custom data mapping.
+
+    Rows are written by a background flusher thread once batch_size rows are
+    queued or flush_interval seconds have passed since the last write.
+    flush(), close() and the lifecycle shutdown write pending rows
+    synchronously.
+
+    Thread Safety:
+        emit() may be called from any thread; the active batch is guarded by
+        the handler lock and batch writes are serialized. handle() does not
+        hold the handler lock around emit(), so a thread waiting on a
+        critical flush does not block other logging threads.
     """
 
     def __init__(
@@ -64,11 +114,10 @@ class DatabaseHandler(logging.Handler):
         self.handler_config = handler_config
         self.log_config = log_config
         self.batch: list[dict[str, Any]] = []
-        self.last_flush = datetime.now()
-
-        # Performance optimizations: cache SQL statements and metadata
-        self._sql_cache: dict[tuple, str] = {}  # Cache prepared statements
-        self._table_metadata: Any = None  # Cache table metadata for bulk operations
+        self.last_flush = time.monotonic()
+        self._init_caches()
+        self._init_flusher()
+        self._init_metrics()
 
         # Set handler level with proper resolution
         level = handler_config.level or log_config.level
@@ -80,6 +129,37 @@ class DatabaseHandler(logging.Handler):
         if lifecycle_manager and hasattr(lifecycle_manager, "register_db_handler"):
             lifecycle_manager.register_db_handler(self)
 
+    def _init_caches(self) -> None:
+        """Set up the SQL statement caches."""
+        self._sql_cache: dict[tuple, str] = {}  # Cache prepared statements
+        # Multi-row INSERT statements and parameter names by (columns, rows)
+        self._multi_insert_cache: dict[tuple[tuple[str, ...], int], Any] = {}
+        self._copy_supported: bool | None = None  # Learned on first batch write
+
+    def _init_flusher(self) -> None:
+        """Set up background flusher state; the condition shares the handler lock."""
+        self._cond = threading.Condition(self.lock)  # type: ignore[arg-type]
+        self._write_lock = threading.Lock()  # One batch write at a time
+        self._flusher: threading.Thread | None = None
+        self._closed = False
+        self._critical: list[_CriticalRow] = []  # Priority lane
+
+    def _init_metrics(self) -> None:
+        """Set up write counters and register them with LogMetrics."""
+        self._rows_written = 0
+        self._batches_written = 0
+        self._write_errors = 0
+        LogMetrics.register_source("database_handler", self)
+
+    def handle(self, record: logging.LogRecord) -> Any:
+        """Filter and emit a record; emit() does its own locking."""
+        rv = self.filter(record)
+        if isinstance(rv, logging.LogRecord):
+            record = rv
+        if rv:
+            self.emit(record)
+        return rv
+
     def emit(self, record: logging.LogRecord) -> None:
         """Emit a log record to the database."""
         try:
@@ -91,21 +171,120 @@ class DatabaseHandler(logging.Handler):
                 self._critical_flush(row_data)
             else:
                 # Normal batching behavior
-                self.batch.append(row_data)
-                if self._should_flush_batch():
-                    self._flush_batch()
+                with self._cond:
+                    self.batch.append(row_data)
+                    self._notify_if_due()
 
         except Exception:
             self.handleError(record)
 
+    def handle_batch(self, records: Sequence[logging.LogRecord]) -> None:
+        """
+        Queue a batch of records, checking the flush triggers once.
+
+        Used by LogQueueListener in drain mode. Filters are applied per
+        record and critical errors still take the immediate flush path.
+        Records are mapped and critical rows written without holding the
+        handler lock, so emit() and the flusher are never blocked by them.
+        """
+        rows, critical = self._map_batch(records)
+        if rows:
+            with self._cond:
+                self.batch.extend(rows)
+                self._notify_if_due(len(rows))
+        if not critical:
+            return
+
+        if self.handler_config.critical_flush_mode != "writer":
+            for row_data, record in critical:
+                try:
+                    self._critical_flush(row_data)
+                except Exception:
+                    self.handleError(record)
+            return
+        # Queue every critical row before waiting, so they share a write
+        queued = self._queue_criticals([row for row, _ in critical])
+        for pending, (_, record) in zip(queued, critical):
+            try:
+                self._wait_critical(pending)
+            except Exception:
+                self.handleError(record)
+
+    def _map_batch(
+        self, records: Sequence[logging.LogRecord]
+    ) -> tuple[list[dict[str, Any]], list[tuple[dict[str, Any], logging.LogRecord]]]:
+        """Filter and map records into batch rows and critical (row, record) pairs."""
+        rows: list[dict[str, Any]] = []
+        critical: list[tuple[dict[str, Any], logging.LogRecord]] = []
+        for record in records:
+            if not self.filter(record):
+                continue
+            try:
+                row_data = self.handler_config.data_mapper(record)
+                if self._is_critical_error(record):
+                    critical.append((row_data, record))
+                else:
+                    rows.append(row_data)
+            except Exception:
+                self.handleError(record)
+        return rows, critical
+
+    def _notify_if_due(self, added: int = 1) -> None:
+        """Wake the flusher when the batch fills up or its first rows arrive."""
+        size = len(self.batch)
+        if size >= self.handler_config.batch_size or (
+            0 < size == added and self.handler_config.flush_interval > 0
+        ):
+            if self._start_flusher():
+                self._cond.notify()
+
+    def _start_flusher(self) -> bool:
+        """
+        Start the flusher thread if needed (also restarts it in a forked child).
+
+        Returns:
+            False if the handler is closed
+        """
+        if self._closed:
+            return False
+        if self._flusher is None or not self._flusher.is_alive():
+            self._flusher = threading.Thread(
+                target=self._run_flusher, name="log-db-flush", daemon=True
+            )
+            self._flusher.start()
+        return True
+
     def _should_flush_batch(self) -> bool:
         """Check if the batch should be flushed based on size or time."""
         return len(self.batch) >= self.handler_config.batch_size or (
             self.handler_config.flush_interval > 0
-            and (datetime.now() - self.last_flush).total_seconds()
-            >= self.handler_config.flush_interval
+            and bool(self.batch)
+            and time.monotonic() - self.last_flush >= self.handler_config.flush_interval
         )
 
+    def _run_flusher(self) -> None:
+        """Flusher loop - writes the batch whenever a flush trigger is hit."""
+        while True:
+            with self._cond:
+                while not (
+                    self._closed or self._critical or self._should_flush_batch()
+                ):
+                    self._cond.wait(self._flush_wait())
+                if self._closed:
+                    return
+                critical = bool(self._critical)
+            if critical:
+                self._flush_critical()
+            else:
+                self._flush_batch()
+
+    def _flush_wait(self) -> float | None:
+        """Seconds until the flush interval elapses (None waits for a notify)."""
+        interval = self.handler_config.flush_interval
+        if not self.batch or interval <= 0:
+            return None
+        return max(0.0, self.last_flush + interval - time.monotonic())
+
     def _is_critical_error(self, record: logging.LogRecord) -> bool:
         """Check if this log record contains critical error information."""
         if not self.handler_config.critical_flush_enabled:
@@ -125,6 +304,74 @@ class DatabaseHandler(logging.Handler):
 
     def _critical_flush(self, row_data: dict[str, Any]) -> None:
         """Immediately flush critical error to database."""
+        if self.handler_config.critical_flush_mode == "signal":
+            self._critical_flush_signal(row_data)
+        else:
+            self._wait_critical(self._queue_critical(row_data))
+
+    def _queue_critical(self, row_data: dict[str, Any]) -> _CriticalRow:
+        """Put a row on the priority lane and wake the flusher."""
+        return self._queue_criticals([row_data])[0]
+
+    def _queue_criticals(self, rows: list[dict[str, Any]]) -> list[_CriticalRow]:
+        """Put rows on the priority lane together, so one write commits them."""
+        pending = [_CriticalRow(row_data) for row_data in rows]
+        with self._cond:
+            on_flusher = self._flusher is threading.current_thread()
+            if not on_flusher and self._start_flusher():
+                self._critical.extend(pending)
+                self._cond.notify()
+                return pending
+        # No flusher to hand off to - write from this thread
+        self._write_critical(pending)
+        return pending
+
+    def _wait_critical(self, pending: _CriticalRow) -> None:
+        """
+        Wait until a critical row is committed.
+
+        Raises:
+            TimeoutError: If the row was not written within critical_flush_timeout
+            Exception: The database error if the write failed
+        """
+        timeout = self.handler_config.critical_flush_timeout
+        if pending.done.wait(timeout):
+            error = pending.error
+        else:
+            with self._cond:
+                if pending in self._critical:  # Not taken yet - withdraw it
+                    self._critical.remove(pending)
+            error = TimeoutError(f"Critical flush timed out after {timeout}s")
+
+        if error is not None:
+            # Fallback to console if database flush fails
+            if self.handler_config.fallback_to_console:
+                self._lg.critical(f"CRITICAL ERROR (DB flush failed): {pending.row}")
+            raise error
+
+    def _flush_critical(self) -> None:
+        """Write every queued critical row in one transaction."""
+        with self._cond:
+            pending, self._critical = self._critical, []
+        if pending:
+            self._write_critical(pending)
+
+    def _write_critical(self, pending: list[_CriticalRow]) -> None:
+        """Commit critical rows and release their waiting threads."""
+        try:
+            with self._write_lock:
+                with self.handler_config.db_interface.session() as session:
+                    self._insert_batch(session, [p.row for p in pending])
+                    session.commit()
+        except Exception as e:
+            for p in pending:
+                p.error = e
+        finally:
+            for p in pending:
+                p.done.set()
+
+    def _critical_flush_signal(self, row_data: dict[str, Any]) -> None:
+        """Write a critical row under a SIGALRM timeout (main thread only)."""
         try:
             # Use a timeout to prevent hanging during app crash
 
@@ -175,62 +422,128 @@ class DatabaseHandler(logging.Handler):
         session.execute(sqlalchemy.text(insert_sql), row_data)
 
     def _flush_batch(self) -> None:
-        """Flush the current batch to the database."""
-        if not self.batch:
-            return
-
-        try:
-            # Get database session
-            with self.handler_config.db_interface.session() as session:
-                # Insert batch data
-                self._insert_batch(session, self.batch)
-                session.commit()
-
-        except Exception as e:
-            # Log error but don't raise to avoid infinite recursion
-            self._lg.error("database logging error", extra={"exception": e})
-        finally:
-            self.batch.clear()
-            self.last_flush = datetime.now()
+        """Swap out the active batch and write it to the database."""
+        with self._write_lock:
+            with self._cond:
+                batch, self.batch = self.batch, []
+            if not batch:
+                return
 
-    def _get_table_metadata(self, session: Any) -> Any:
-        """Get cached table metadata for bulk operations."""
-        if self._table_metadata is None:
             try:
-                metadata = sqlalchemy.MetaData()
-                self._table_metadata = sqlalchemy.Table(
-                    self.handler_config.table_name, metadata, autoload_with=session.bind
-                )
-            except Exception:
-                # If we can't get metadata, we'll fall back to executemany
-                self._table_metadata = False
-        return self._table_metadata
+                # Get database session
+                with self.handler_config.db_interface.session() as session:
+                    # Insert batch data
+                    self._insert_batch(session, batch)
+                    session.commit()
+                self._rows_written += len(batch)
+                self._batches_written += 1
+
+            except Exception as e:
+                self._write_errors += 1
+                # Log error but don't raise to avoid infinite recursion
+                self._lg.error("database logging error", extra={"exception": e})
+            finally:
+                self.last_flush = time.monotonic()
 
     def _insert_batch(self, session: Any, batch_data: list[dict[str, Any]]) -> None:
-        """Insert batch data using optimized bulk operations."""
-        if not batch_data:
-            return
+        """Insert batch rows, grouped by column set, via COPY or multi-row INSERT."""
+        groups: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+        for row in batch_data:
+            if row:
+                groups.setdefault(tuple(row), []).append(row)
+
+        for columns, rows in groups.items():
+            if not self._copy_rows(session, columns, rows):
+                self._insert_rows(session, columns, rows)
+
+    def _copy_rows(
+        self, session: Any, columns: tuple[str, ...], rows: list[dict[str, Any]]
+    ) -> bool:
+        """
+        Write rows with PostgreSQL COPY FROM STDIN on the session's connection.
 
+        Returns:
+            False if the session is not backed by a psycopg connection
+        """
+        if self._copy_supported is None:
+            self._copy_supported = session.get_bind().dialect.name == "postgresql"
+        if not self._copy_supported:
+            return False
+
+        dbapi_conn = session.connection().connection.dbapi_connection
+        sql = f"COPY {self.handler_config.table_name} ({', '.join(columns)}) FROM STDIN"
+        cursor = dbapi_conn.cursor()
         try:
-            # Try to use SQLAlchemy bulk operations for best performance
-            table = self._get_table_metadata(session)
-            if table is not False:
-                # Use bulk_insert_mappings for maximum performance
-                session.bulk_insert_mappings(table.__class__, batch_data)
-                return
-        except Exception:
-            # Fall back to executemany if bulk operations fail
-            pass
+            if hasattr(cursor, "copy_expert"):  # psycopg2
+                cursor.copy_expert(sql, io.StringIO(_copy_data(columns, rows)))
+            elif hasattr(cursor, "copy"):  # psycopg 3
+                with cursor.copy(sql) as copy:
+                    copy.write(_copy_data(columns, rows))
+            else:
+                self._copy_supported = False
+                return False
+        finally:
+            cursor.close()
+        return True
 
-        # Fallback: Use executemany which is still much faster than individual executes
-        if batch_data:
-            columns_tuple = tuple(sorted(batch_data[0].keys()))
-            insert_sql = self._get_insert_sql(columns_tuple)
+    def _insert_rows(
+        self, session: Any, columns: tuple[str, ...], rows: list[dict[str, Any]]
+    ) -> None:
+        """Write rows with multi-row INSERT statements within the bind budget."""
+        chunk_size = max(1, _MAX_BIND_PARAMS // len(columns))
+        for start in range(0, len(rows), chunk_size):
+            chunk = rows[start : start + chunk_size]
+            statement, names = self._get_multi_insert(columns, len(chunk))
+            values = [row[col] for row in chunk for col in columns]
+            session.execute(statement, dict(zip(names, values)))
+
+    def _get_multi_insert(
+        self, columns: tuple[str, ...], row_count: int
+    ) -> tuple[Any, list[str]]:
+        """Get a cached multi-row INSERT statement and its parameter names."""
+        key = (columns, row_count)
+        cached = self._multi_insert_cache.get(key)
+        if cached is None:
+            names = [f"p{i}_{j}" for i in range(row_count) for j in range(len(columns))]
+            width = len(columns)
+            groups = ", ".join(
+                "(" + ", ".join(f":{n}" for n in names[i : i + width]) + ")"
+                for i in range(0, len(names), width)
+            )
+            table_name = self.handler_config.table_name
+            sql = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES {groups}"
+            cached = self._multi_insert_cache[key] = (sqlalchemy.text(sql), names)
+        return cached
 
-            # Use executemany for better performance than individual execute calls
-            session.execute(sqlalchemy.text(insert_sql), batch_data)
+    def stats(self) -> dict[str, Any]:
+        """
+        Get batching metrics.
+
+        Returns:
+            Dictionary with rows waiting in the batch and in the critical
+            lane, rows and batches written, and failed batch writes
+        """
+        with self._cond:
+            return {
+                "pending": len(self.batch),
+                "critical_pending": len(self._critical),
+                "rows_written": self._rows_written,
+                "batches_written": self._batches_written,
+                "write_errors": self._write_errors,
+            }
+
+    def flush(self) -> None:
+        """Write pending rows synchronously (called by logging.shutdown)."""
+        self._flush_batch()
 
     def close(self) -> None:
-        """Close the handler and flush any remaining data."""
+        """Stop the flusher thread and write any remaining rows."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        flusher = self._flusher
+        if flusher is not None and flusher is not threading.current_thread():
+            flusher.join(self.handler_config.critical_flush_timeout)
+        self._flush_critical()
         self._flush_batch()
         super().close()
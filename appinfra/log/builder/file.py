@@ -12,6 +12,11 @@ import logging.handlers
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from ..buffered_file import (
+    BufferedFileHandler,
+    BufferedRotatingFileHandler,
+    BufferedTimedRotatingFileHandler,
+)
 from ..config import LogConfig
 from ..formatters import LogFormatter
 from .builder import LoggingBuilder
@@ -25,6 +30,49 @@ def _create_formatter(config: LogConfig, logger: Any = None) -> LogFormatter:
     return LogFormatter(config)
 
 
+def _is_buffered(handler_config: Any) -> bool:
+    """Check if a file handler config requests the buffered write path."""
+    return bool(handler_config.buffer_bytes) or handler_config.fsync != "never"
+
+
+def _buffer_options(handler_config: Any) -> dict[str, Any]:
+    """Get buffering options of a file handler config as keyword arguments."""
+    return {
+        "buffer_bytes": handler_config.buffer_bytes,
+        "flush_interval": handler_config.flush_interval,
+        "fsync": handler_config.fsync,
+    }
+
+
+# Buffered handler argument names for the stdlib ones that differ
+_BUFFERED_ARG_NAMES = {"maxBytes": "max_bytes", "backupCount": "backup_count"}
+
+
+def _make_handler(
+    handler_config: Any,
+    buffered_cls: type[logging.FileHandler],
+    stdlib_cls: type[logging.FileHandler],
+    **kwargs: Any,
+) -> logging.FileHandler:
+    """
+    Create the buffered or stdlib file handler selected by a handler config.
+
+    Args:
+        handler_config: File handler config (filename and buffering options)
+        buffered_cls: Handler class used when buffering is requested
+        stdlib_cls: logging handler class used otherwise
+        **kwargs: Handler arguments, using the stdlib argument names
+
+    Returns:
+        File handler
+    """
+    if _is_buffered(handler_config):
+        options = {_BUFFERED_ARG_NAMES.get(k, k): v for k, v in kwargs.items()}
+        options.update(_buffer_options(handler_config))
+        return buffered_cls(handler_config.filename, **options)
+    return stdlib_cls(handler_config.filename, **kwargs)
+
+
 if TYPE_CHECKING:
     from typing import Self
 
@@ -39,12 +87,18 @@ class FileHandlerConfig(HandlerConfig):
         encoding: str | None = None,
         delay: bool = False,
         level: str | int | None = None,
+        buffer_bytes: int = 0,
+        flush_interval: float = 1.0,
+        fsync: str = "never",
     ):
         super().__init__(level)
         self.filename = filename
         self.mode = mode
         self.encoding = encoding
         self.delay = delay
+        self.buffer_bytes = buffer_bytes
+        self.flush_interval = flush_interval
+        self.fsync = fsync
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize to picklable dictionary."""
@@ -58,6 +112,8 @@ class FileHandlerConfig(HandlerConfig):
             d["level"] = self.level
         if self.encoding is not None:
             d["encoding"] = self.encoding
+        if _is_buffered(self):
+            d.update(_buffer_options(self))
         return d
 
     def create_handler(self, config: LogConfig, logger: Any = None) -> logging.Handler:
@@ -67,8 +123,13 @@ class FileHandlerConfig(HandlerConfig):
         if path.parent != path:  # Not just a filename
             path.parent.mkdir(parents=True, exist_ok=True)
 
-        handler = logging.FileHandler(
-            self.filename, mode=self.mode, encoding=self.encoding, delay=self.delay
+        handler = _make_handler(
+            self,
+            BufferedFileHandler,
+            logging.FileHandler,
+            mode=self.mode,
+            encoding=self.encoding,
+            delay=self.delay,
         )
         # Set handler level with proper resolution
         level = self.level or config.level
@@ -92,6 +153,9 @@ class RotatingFileHandlerConfig(HandlerConfig):
         encoding: str | None = None,
         delay: bool = False,
         level: str | int | None = None,
+        buffer_bytes: int = 0,
+        flush_interval: float = 1.0,
+        fsync: str = "never",
     ):
         super().__init__(level)
         self.filename = filename
@@ -99,6 +163,9 @@ class RotatingFileHandlerConfig(HandlerConfig):
         self.backup_count = backup_count
         self.encoding = encoding
         self.delay = delay
+        self.buffer_bytes = buffer_bytes
+        self.flush_interval = flush_interval
+        self.fsync = fsync
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize to picklable dictionary."""
@@ -113,6 +180,8 @@ class RotatingFileHandlerConfig(HandlerConfig):
             d["level"] = self.level
         if self.encoding is not None:
             d["encoding"] = self.encoding
+        if _is_buffered(self):
+            d.update(_buffer_options(self))
         return d
 
     def create_handler(self, config: LogConfig, logger: Any = None) -> logging.Handler:
@@ -122,8 +191,10 @@ class RotatingFileHandlerConfig(HandlerConfig):
         if path.parent != path:  # Not just a filename
             path.parent.mkdir(parents=True, exist_ok=True)
 
-        handler = logging.handlers.RotatingFileHandler(
-            self.filename,
+        handler = _make_handler(
+            self,
+            BufferedRotatingFileHandler,
+            logging.handlers.RotatingFileHandler,
             maxBytes=self.max_bytes,
             backupCount=self.backup_count,
             encoding=self.encoding,
@@ -153,6 +224,9 @@ class TimedRotatingFileHandlerConfig(HandlerConfig):
         delay: bool = False,
         utc: bool = False,
         level: str | int | None = None,
+        buffer_bytes: int = 0,
+        flush_interval: float = 1.0,
+        fsync: str = "never",
     ):
         super().__init__(level)
         self.filename = filename
@@ -162,6 +236,9 @@ class TimedRotatingFileHandlerConfig(HandlerConfig):
         self.encoding = encoding
         self.delay = delay
         self.utc = utc
+        self.buffer_bytes = buffer_bytes
+        self.flush_interval = flush_interval
+        self.fsync = fsync
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize to picklable dictionary."""
@@ -178,6 +255,8 @@ class TimedRotatingFileHandlerConfig(HandlerConfig):
             d["level"] = self.level
         if self.encoding is not None:
             d["encoding"] = self.encoding
+        if _is_buffered(self):
+            d.update(_buffer_options(self))
         return d
 
     def create_handler(self, config: LogConfig, logger: Any = None) -> logging.Handler:
@@ -187,8 +266,10 @@ class TimedRotatingFileHandlerConfig(HandlerConfig):
         if path.parent != path:  # Not just a filename
             path.parent.mkdir(parents=True, exist_ok=True)
 
-        handler = logging.handlers.TimedRotatingFileHandler(
-            self.filename,
+        handler = _make_handler(
+            self,
+            BufferedTimedRotatingFileHandler,
+            logging.handlers.TimedRotatingFileHandler,
             when=self.when,
             interval=self.interval,
             backupCount=self.backup_count,
@@ -207,6 +288,13 @@ class TimedRotatingFileHandlerConfig(HandlerConfig):
         return handler
 
 
+_FILE_HANDLER_CONFIGS = (
+    FileHandlerConfig,
+    RotatingFileHandlerConfig,
+    TimedRotatingFileHandlerConfig,
+)
+
+
 class FileLoggingBuilder(LoggingBuilder):
     """
     Specialized builder for file-only logging.
@@ -225,6 +313,7 @@ class FileLoggingBuilder(LoggingBuilder):
         """
         super().__init__(name)
         self._file_path = file_path
+        self._buffering: dict[str, Any] | None = None
         # Default to file handler
         self.with_file_handler(file_path)
 
@@ -241,18 +330,10 @@ class FileLoggingBuilder(LoggingBuilder):
         """
         # Remove existing file handler and add rotating one
         self._handlers = [
-            h
-            for h in self._handlers
-            if not isinstance(
-                h,
-                (
-                    FileHandlerConfig,
-                    RotatingFileHandlerConfig,
-                    TimedRotatingFileHandlerConfig,
-                ),
-            )
+            h for h in self._handlers if not isinstance(h, _FILE_HANDLER_CONFIGS)
         ]
         self.with_rotating_file_handler(self._file_path, max_bytes, backup_count)
+        self._apply_buffering()
         return self
 
     def with_timed_rotation(
@@ -271,22 +352,55 @@ class FileLoggingBuilder(LoggingBuilder):
         """
         # Remove existing file handler and add timed rotating one
         self._handlers = [
-            h
-            for h in self._handlers
-            if not isinstance(
-                h,
-                (
-                    FileHandlerConfig,
-                    RotatingFileHandlerConfig,
-                    TimedRotatingFileHandlerConfig,
-                ),
-            )
+            h for h in self._handlers if not isinstance(h, _FILE_HANDLER_CONFIGS)
         ]
         self.with_timed_rotating_file_handler(
             self._file_path, when, interval, backup_count
         )
+        self._apply_buffering()
+        return self
+
+    def with_buffering(
+        self,
+        buffer_bytes: int = 65536,
+        flush_interval: float = 1.0,
+        fsync: str = "never",
+    ) -> Self:
+        """
+        Buffer file writes instead of flushing every record.
+
+        Records are flushed when buffer_bytes accumulate, after flush_interval
+        seconds, immediately for ERROR and above, and on rotation or close.
+        Applies to the file handler whether added before or after rotation
+        is enabled.
+
+        Args:
+            buffer_bytes: Buffered characters that trigger a flush
+            flush_interval: Maximum seconds a record stays buffered
+            fsync: Durability policy: "never", "error" (fsync on ERROR+
+                   flushes and close), or "always" (fsync every flush)
+
+        Returns:
+            Self for method chaining
+        """
+        self._buffering = {
+            "buffer_bytes": buffer_bytes,
+            "flush_interval": flush_interval,
+            "fsync": fsync,
+        }
+        self._apply_buffering()
         return self
 
+    def _apply_buffering(self) -> None:
+        """Apply buffering options to the builder's file handler configs."""
+        if self._buffering is None:
+            return
+        for handler_config in self._handlers:
+            if isinstance(handler_config, _FILE_HANDLER_CONFIGS):
+                handler_config.buffer_bytes = self._buffering["buffer_bytes"]
+                handler_config.flush_interval = self._buffering["flush_interval"]
+                handler_config.fsync = self._buffering["fsync"]
+
     def daily_rotation(self, backup_count: int = 7) -> Self:
         """
         Enable daily file rotation.
@@ -8,95 +8,37 @@ extending the base LoggingBuilder with JSON-specific functionality.
 import json
 import logging
 import sys
+import time
+from datetime import datetime
 from pathlib import Path
 from typing import Any, Self
 
+from ..cache import SecondCache
 from ..config import LogConfig
 from ..factory import LoggerFactory
+from ..lazy import resolve_extra
 from ..logger import Logger
+from ..metrics import LogMetrics
 from .builder import LoggingBuilder
-
-# Helper functions for JSONFormatter._record_to_dict()
-
-
-def _add_timestamp(
-    data: dict[str, Any], formatter: Any, record: logging.LogRecord
-) -> None:
-    """Add timestamp field if configured."""
-    if formatter.should_include_field("timestamp"):
-        data["timestamp"] = formatter._format_timestamp(record)
-
-
-def _add_basic_fields(
-    data: dict[str, Any], formatter: Any, record: logging.LogRecord
-) -> None:
-    """Add basic log fields (level, logger, message)."""
-    if formatter.should_include_field("level"):
-        data["level"] = record.levelname
-    if formatter.should_include_field("logger"):
-        data["logger"] = record.name
-    if formatter.should_include_field("message"):
-        data["message"] = record.getMessage()
-
-
-def _add_module_fields(
-    data: dict[str, Any], formatter: Any, record: logging.LogRecord
-) -> None:
-    """Add module information fields."""
-    if formatter.should_include_field("module") and record.module:
-        data["module"] = record.module
-    if formatter.should_include_field("function") and record.funcName:
-        data["function"] = record.funcName
-    if formatter.should_include_field("line") and record.lineno:
-        data["line"] = record.lineno
-
-
-def _add_process_fields(
-    data: dict[str, Any], formatter: Any, record: logging.LogRecord
-) -> None:
-    """Add process and thread information."""
-    if formatter.include_process_info and formatter.should_include_field("process_id"):
-        data["process_id"] = record.process
-    if formatter.include_process_info and formatter.should_include_field("thread_id"):
-        data["thread_id"] = record.thread
-
-
-def _add_extra_fields(
-    data: dict[str, Any], formatter: Any, record: logging.LogRecord
-) -> None:
-    """Add extra fields if present."""
-    extra = getattr(record, "__infra__extra", None)
-    if formatter.include_extra and formatter.should_include_field("extra") and extra:
-        data["extra"] = formatter._sanitize_extra_fields(extra)
-
-
-def _add_location_fields(
-    data: dict[str, Any], formatter: Any, record: logging.LogRecord
-) -> None:
-    """Add location information."""
-    if formatter.include_location and formatter.should_include_field("location"):
-        location = formatter._extract_location(record)
-        if location:
-            data["location"] = location
-
-
-def _add_exception_fields(
-    data: dict[str, Any], formatter: Any, record: logging.LogRecord
-) -> None:
-    """Add exception information if present."""
-    if (
-        formatter.include_exception
-        and formatter.should_include_field("exception")
-        and record.exc_info
-    ):
-        data["exception"] = formatter._format_exception(record.exc_info)
-
-
-def _add_custom_fields(data: dict[str, Any], formatter: Any) -> None:
-    """Add custom fields defined in formatter configuration."""
-    for key, value in formatter.custom_fields.items():
-        if formatter.should_include_field(key):
-            data[key] = value
+from .json_encoders import get_encoder, resolve_encoder_name
+
+# Standard fields that are always included unless explicitly excluded
+_STANDARD_FIELDS = frozenset(
+    {
+        "timestamp",
+        "level",
+        "logger",
+        "message",
+        "module",
+        "function",
+        "line",
+        "process_id",
+        "thread_id",
+        "extra",
+        "exception",
+        "location",
+    }
+)
 
 
 class JSONFormatter(logging.Formatter):
@@ -118,10 +60,14 @@ class JSONFormatter(logging.Formatter):
         pretty_print: bool = False,
         timestamp_format: str = "iso",
         custom_fields: dict[str, Any] | None = None,
+        encoder: str = "auto",
     ):
         """
         Initialize JSON formatter.
 
+        The set of emitted fields is fixed at construction; changing the
+        include/exclude options or custom_fields afterwards has no effect.
+
         Args:
             include_extra: Whether to include extra fields from record._extra
             include_location: Whether to include file location information
@@ -132,6 +78,8 @@ class JSONFormatter(logging.Formatter):
             pretty_print: Whether to format JSON with indentation
             timestamp_format: Format for timestamps ("iso", "unix", "epoch")
             custom_fields: Additional custom fields to include
+            encoder: JSON encoder ("auto", "orjson", "msgspec", "json");
+                     "auto" uses the fastest installed encoder
         """
         super().__init__()
         self.include_extra = include_extra
@@ -143,22 +91,54 @@ class JSONFormatter(logging.Formatter):
         self.pretty_print = pretty_print
         self.timestamp_format = timestamp_format
         self.custom_fields = custom_fields or {}
+        self._time_cache = SecondCache()
+
+        self._standard_fields = _STANDARD_FIELDS
+
+        self.encoder = resolve_encoder_name(encoder)
+        self._encode = get_encoder(self.encoder, pretty_print)
+        self._compile_plan()
+
+    def _compile_plan(self) -> None:
+        """Precompute the fields emitted per record from the configuration."""
+        include = self.should_include_field
+        self._with_timestamp = include("timestamp")
+
+        # (output key, record attribute, emit only if truthy)
+        attr_fields = [
+            ("level", "levelname", False),
+            ("logger", "name", False),
+            ("message", "message", False),
+            ("module", "module", True),
+            ("function", "funcName", True),
+            ("line", "lineno", True),
+        ]
+        if self.include_process_info:
+            attr_fields.append(("process_id", "process", False))
+            attr_fields.append(("thread_id", "thread", False))
+        self._attr_fields = tuple(f for f in attr_fields if include(f[0]))
+
+        self._with_extra = self.include_extra and include("extra")
+        self._with_location = self.include_location and include("location")
+        self._with_exception = self.include_exception and include("exception")
+
+        # stdlib json separates members with ", ", the fast encoders with ","
+        self._item_separator = ", " if self.encoder == "json" else ","
+        custom = {k: v for k, v in self.custom_fields.items() if include(k)}
+        self._custom_suffix = self._encode_custom_suffix(custom)
+        self._custom_merge = custom if self._custom_suffix is None else {}
+
+    def _encode_custom_suffix(self, custom: dict[str, Any]) -> str | None:
+        """
+        Pre-serialize custom fields as a suffix appended to each record.
 
-        # Standard fields that are always included unless explicitly excluded
-        self._standard_fields = {
-            "timestamp",
-            "level",
-            "logger",
-            "message",
-            "module",
-            "function",
-            "line",
-            "process_id",
-            "thread_id",
-            "extra",
-            "exception",
-            "location",
-        }
+        Returns None when the fields must be merged per record instead:
+        pretty-printed output, or keys that collide with standard fields.
+        """
+        if not custom or self.pretty_print or custom.keys() & self._standard_fields:
+            return None
+        # '{"app": "x"}' -> '"app": "x"}', spliced in place of the closing brace
+        return self._encode(custom)[1:]
 
     def should_include_field(self, field_name: str) -> bool:
         """Check if a field should be included in JSON output."""
@@ -182,9 +162,26 @@ class JSONFormatter(logging.Formatter):
         Returns:
             JSON string representation of the log record
         """
+        if LogMetrics.enabled:
+            start = time.perf_counter()
+            try:
+                return self._format_record(record)
+            finally:
+                LogMetrics.get_instance().observe_format(
+                    self, time.perf_counter() - start
+                )
+        return self._format_record(record)
+
+    def _format_record(self, record: logging.LogRecord) -> str:
+        """Format a log record as JSON, falling back to basic fields on error."""
         try:
             json_data = self._record_to_dict(record)
-            return self._dict_to_json(json_data)
+            try:
+                body = self._encode(json_data)
+            except (TypeError, ValueError, OverflowError):
+                # Values a fast encoder rejects (e.g. integers beyond 64 bits)
+                body = self._dict_to_json(json_data)
+            return self._append_custom_suffix(body)
         except Exception as e:
             # Fallback to basic JSON if formatting fails
             fallback_data = {
@@ -196,47 +193,71 @@ class JSONFormatter(logging.Formatter):
             }
             return self._dict_to_json(fallback_data)
 
+    def _append_custom_suffix(self, body: str) -> str:
+        """Splice pre-serialized custom fields into an encoded record."""
+        suffix = self._custom_suffix
+        if suffix is None:
+            return body
+        if body == "{}":
+            return "{" + suffix
+        return body[:-1] + self._item_separator + suffix
+
     def _record_to_dict(self, record: logging.LogRecord) -> dict[str, Any]:
-        """Convert LogRecord to dictionary."""
+        """Convert LogRecord to dictionary using the precomputed field plan."""
+        record.message = record.getMessage()
         data: dict[str, Any] = {}
 
-        _add_timestamp(data, self, record)
-        _add_basic_fields(data, self, record)
-        _add_module_fields(data, self, record)
-        _add_process_fields(data, self, record)
-        _add_extra_fields(data, self, record)
-        _add_location_fields(data, self, record)
-        _add_exception_fields(data, self, record)
-        _add_custom_fields(data, self)
+        if self._with_timestamp:
+            data["timestamp"] = self._format_timestamp(record)
+        for key, attr, only_if_set in self._attr_fields:
+            value = getattr(record, attr)
+            if value or not only_if_set:
+                data[key] = value
+        if self._with_extra:
+            # Non-serializable values are converted by the encoder
+            extra = resolve_extra(record)
+            if extra:
+                data["extra"] = extra
+        if self._with_location:
+            location = self._extract_location(record)
+            if location:
+                data["location"] = location
+        if self._with_exception and record.exc_info:
+            data["exception"] = self._format_exception(record.exc_info)
+        if self._custom_merge:
+            data.update(self._custom_merge)
 
         return data
 
     def _format_timestamp(self, record: logging.LogRecord) -> str:
         """Format timestamp according to configuration."""
-        from datetime import datetime
-
-        if self.timestamp_format == "iso":
-            return datetime.fromtimestamp(record.created).isoformat()
-        elif self.timestamp_format == "unix":
+        if self.timestamp_format == "unix":
             return str(record.created)
         elif self.timestamp_format == "epoch":
             return str(int(record.created))
         else:
-            # Default to ISO format
-            return datetime.fromtimestamp(record.created).isoformat()
+            # "iso" and the default
+            return self._format_iso(record.created)
 
-    def _sanitize_extra_fields(self, extra: dict[str, Any]) -> dict[str, Any]:
-        """Sanitize extra fields to ensure JSON serializability."""
-        sanitized = {}
-        for key, value in extra.items():
-            try:
-                # Test if the value is JSON serializable
-                json.dumps(value)
-                sanitized[key] = value
-            except (TypeError, ValueError):
-                # Convert non-serializable values to strings
-                sanitized[key] = str(value)
-        return sanitized
+    def _format_iso(self, created: float) -> str:
+        """
+        Render datetime.fromtimestamp(created).isoformat() from a per-second cache.
+
+        Microseconds are rounded half-to-even like datetime.fromtimestamp,
+        carrying into the next second, and omitted when zero like isoformat.
+        """
+        second = int(created)
+        micros = round((created - second) * 1e6)
+        if micros >= 1_000_000:
+            second += 1
+            micros -= 1_000_000
+        cache = self._time_cache
+        if cache.second != second:
+            cache.prefix = datetime.fromtimestamp(second).isoformat()
+            cache.second = second
+        if micros:
+            return f"{cache.prefix}.{micros:06d}"
+        return cache.prefix
 
     def _extract_location(self, record: logging.LogRecord) -> list[str] | None:
         """Extract location information from the record."""
@@ -271,9 +292,9 @@ class JSONFormatter(logging.Formatter):
     def _dict_to_json(self, data: dict[str, Any]) -> str:
         """Convert dictionary to JSON string."""
         if self.pretty_print:
-            return json.dumps(data, indent=2, ensure_ascii=False)
+            return json.dumps(data, indent=2, ensure_ascii=False, default=str)
         else:
-            return json.dumps(data, ensure_ascii=False)
+            return json.dumps(data, ensure_ascii=False, default=str)
 
 
 class JSONLoggingBuilder(LoggingBuilder):
@@ -304,6 +325,7 @@ class JSONLoggingBuilder(LoggingBuilder):
             "pretty_print": False,
             "timestamp_format": "iso",
             "custom_fields": {},
+            "encoder": "auto",
         }
 
         # Output configuration
@@ -383,6 +405,23 @@ class JSONLoggingBuilder(LoggingBuilder):
         self._json_config["timestamp_format"] = format_type
         return self
 
+    def with_encoder(self, encoder: str) -> Self:
+        """
+        Select the JSON encoder.
+
+        Args:
+            encoder: "auto" (fastest installed), "orjson", "msgspec", or "json"
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            LogConfigError: If the encoder name is unknown
+            DependencyError: If the requested encoder is not installed
+        """
+        self._json_config["encoder"] = resolve_encoder_name(encoder)
+        return self
+
     def with_custom_fields(self, fields: dict[str, Any]) -> Self:
         """
         Add custom fields to JSON output.
@@ -457,6 +496,7 @@ class JSONLoggingBuilder(LoggingBuilder):
 
         # Add configured handlers
         self._add_json_handlers(logger, config)
+        self._apply_async_dispatch(logger)
 
         return logger
 
@@ -0,0 +1,136 @@
+"""
+Pluggable JSON encoders for structured log output.
+
+JSONFormatter serializes one dict per record, which dominates the cost of
+JSON logging. This module selects the fastest available encoder:
+
+- orjson (pip install appinfra[json])
+- msgspec
+- stdlib json (always available)
+
+All encoders return str, keep non-ASCII characters unescaped, and convert
+values they cannot serialize with str(). orjson is configured to pass
+datetimes and dataclasses to that fallback too, so its output matches stdlib
+json. msgspec has no such option: it writes datetimes in RFC 3339 form
+("2024-01-01T12:00:00") where the others write str() ("2024-01-01 12:00:00"),
+and serializes dataclasses as objects.
+"""
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+from ...errors import DependencyError
+from ..errors import LogConfigError
+
+# Optional fast encoders
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgspec
+
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    msgspec = None  # type: ignore[assignment]
+    MSGSPEC_AVAILABLE = False
+
+ENCODER_NAMES = ("auto", "orjson", "msgspec", "json")
+
+Encoder = Callable[[Any], str]
+
+
+def _orjson_encoder(pretty: bool) -> Encoder:
+    """Create an orjson-backed encoder."""
+    # Passthrough sends these types to default=str, matching stdlib json
+    option = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+    if pretty:
+        option |= orjson.OPT_INDENT_2
+    dumps = orjson.dumps
+
+    def encode(data: Any) -> str:
+        encoded: bytes = dumps(data, default=str, option=option)
+        return encoded.decode()
+
+    return encode
+
+
+def _msgspec_encoder(pretty: bool) -> Encoder:
+    """Create a msgspec-backed encoder."""
+    encode_bytes = msgspec.json.Encoder(enc_hook=str).encode
+    fmt = msgspec.json.format
+
+    def encode(data: Any) -> str:
+        encoded: bytes = encode_bytes(data)
+        if pretty:
+            encoded = fmt(encoded, indent=2)
+        return encoded.decode()
+
+    return encode
+
+
+def _stdlib_encoder(pretty: bool) -> Encoder:
+    """Create a stdlib json encoder."""
+    if pretty:
+        encoder = json.JSONEncoder(ensure_ascii=False, indent=2, default=str)
+    else:
+        encoder = json.JSONEncoder(ensure_ascii=False, default=str)
+    return encoder.encode
+
+
+def resolve_encoder_name(name: str) -> str:
+    """
+    Resolve an encoder name to a concrete, installed encoder.
+
+    Args:
+        name: One of ENCODER_NAMES; "auto" picks orjson, then msgspec, then json
+
+    Returns:
+        Concrete encoder name ("orjson", "msgspec" or "json")
+
+    Raises:
+        LogConfigError: If the name is unknown
+        DependencyError: If an explicitly requested encoder is not installed
+    """
+    if name not in ENCODER_NAMES:
+        raise LogConfigError(
+            f"Unknown JSON encoder: {name!r} "
+            f"(expected one of {', '.join(ENCODER_NAMES)})"
+        )
+    if name == "auto":
+        if ORJSON_AVAILABLE:
+            return "orjson"
+        return "msgspec" if MSGSPEC_AVAILABLE else "json"
+    if name == "orjson" and not ORJSON_AVAILABLE:
+        raise DependencyError("orjson", "json", "orjson JSON log encoding")
+    if name == "msgspec" and not MSGSPEC_AVAILABLE:
+        raise DependencyError("msgspec", "json", "msgspec JSON log encoding")
+    return name
+
+
+def get_encoder(name: str = "auto", pretty: bool = False) -> Encoder:
+    """
+    Get a function that serializes a value to a JSON string.
+
+    Args:
+        name: Encoder name (see resolve_encoder_name)
+        pretty: Whether to indent output by two spaces
+
+    Returns:
+        Encoder function
+    """
+    factories = {
+        "orjson": _orjson_encoder,
+        "msgspec": _msgspec_encoder,
+        "json": _stdlib_encoder,
+    }
+    return factories[resolve_encoder_name(name)](pretty)
@@ -0,0 +1,141 @@
+"""
+Small caches for logging hot paths.
+
+ClockCache is a bounded cache with CLOCK (second-chance) eviction.
+
+An OrderedDict LRU has to reorder its linked list on every hit
+(``move_to_end``). CLOCK approximates LRU without that: a hit only marks the
+entry as referenced, and eviction sweeps a ring of keys, clearing marks until
+it finds an unreferenced entry. Hits stay a dict lookup plus a set add, which
+matters for caches consulted several times per log record.
+
+SecondCache remembers one rendered timestamp prefix per thread, since
+consecutive records usually fall within the same second.
+
+Example:
+    >>> from appinfra.log.cache import ClockCache
+    >>> cache = ClockCache(maxsize=2)
+    >>> cache.put("a", 1)
+    >>> cache.get("a")
+    1
+    >>> cache.get("missing") is None
+    True
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Hashable
+from typing import Generic, TypeVar
+
+V = TypeVar("V")
+
+
+class ClockCache(Generic[V]):
+    """
+    Fixed-size key/value cache with CLOCK eviction.
+
+    Lookups are lock-free; insertions take a lock so concurrent misses cannot
+    corrupt the eviction ring. None cannot be cached (get() uses it to signal
+    a miss).
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of entries
+
+        Raises:
+            ValueError: If maxsize is not positive
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self._values: dict[Hashable, V] = {}
+        self._referenced: set[Hashable] = set()
+        self._ring: list[Hashable] = []
+        self._hand = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> V | None:
+        """
+        Look up a key and mark it as recently used.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None on a miss
+        """
+        value = self._values.get(key)
+        if value is not None:
+            self._referenced.add(key)
+        return value
+
+    def put(self, key: Hashable, value: V) -> None:
+        """
+        Insert a value, evicting an unreferenced entry if the cache is full.
+
+        Args:
+            key: Cache key
+            value: Value to store (not None)
+        """
+        with self._lock:
+            if key in self._values:
+                self._values[key] = value
+                return
+            if len(self._ring) < self.maxsize:
+                self._ring.append(key)
+            else:
+                self._evict_into(key)
+            self._values[key] = value
+
+    def _evict_into(self, key: Hashable) -> None:
+        """Advance the hand to an unreferenced slot and give it to key."""
+        ring, referenced = self._ring, self._referenced
+        hand = self._hand
+        while ring[hand] in referenced:
+            referenced.discard(ring[hand])
+            hand = (hand + 1) % len(ring)
+        del self._values[ring[hand]]
+        # A lock-free get() may have re-marked the victim mid-sweep
+        referenced.discard(ring[hand])
+        ring[hand] = key
+        self._hand = (hand + 1) % len(ring)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._values.clear()
+            self._referenced.clear()
+            self._ring.clear()
+            self._hand = 0
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._values
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+
+class SecondCache(threading.local):
+    """
+    Per-thread memo of a timestamp prefix rendered for one whole second.
+
+    Formatters render the date and time once per second and append only the
+    sub-second part for each record. Being thread-local, the check-and-update
+    needs no lock.
+
+    Example:
+        cache = self._time_cache
+        second = int(record.created)
+        if cache.second != second:
+            cache.prefix = render(second)
+            cache.second = second
+        return cache.prefix + fraction
+    """
+
+    second: int = -1
+    prefix: str = ""
@@ -3,26 +3,220 @@ Callback system for the logging system.
 
 This module provides a registry system for managing log event callbacks,
 allowing external code to react to logging events.
+
+Registrations are flattened into a per-level dispatch table whenever they
+change, so triggering a level costs one dict lookup (and nothing at all when
+a registry is empty). Slow callbacks (alerting, paging) can opt into
+``run_async=True`` and run on a small shared worker pool instead of the
+logging thread.
 """
 
 from __future__ import annotations
 
 import logging
+import sys
+import threading
+import traceback
+import weakref
+from collections import deque
 from collections.abc import Callable
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, ClassVar
 
-from .errors import CallbackError
+from .errors import CallbackError, LogConfigError
 
 if TYPE_CHECKING:
     from .logger import Logger
 
 
+class CallbackWorkerPool:
+    """
+    Small thread pool that runs asynchronous log callbacks.
+
+    Jobs wait in a bounded queue; when it is full new jobs are dropped (and
+    counted) so a callback storm can never block or grow the logging thread's
+    memory. Worker threads start on the first submitted job.
+
+    Thread Safety:
+        submit() may be called from any thread.
+    """
+
+    _instances: ClassVar[weakref.WeakSet[CallbackWorkerPool]] = weakref.WeakSet()
+    _default: ClassVar[CallbackWorkerPool | None] = None
+    _default_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, workers: int = 2, max_queue: int = 1000) -> None:
+        """
+        Initialize the pool (threads are started lazily).
+
+        Args:
+            workers: Number of worker threads
+            max_queue: Maximum number of queued callback invocations
+
+        Raises:
+            LogConfigError: If workers or max_queue is not positive
+        """
+        if workers < 1:
+            raise LogConfigError(f"workers must be positive, got {workers}")
+        if max_queue < 1:
+            raise LogConfigError(f"max_queue must be positive, got {max_queue}")
+        self.workers = workers
+        self.max_queue = max_queue
+
+        self._queue: deque[tuple[Callable, tuple, dict[str, Any]]] = deque()
+        self._cond = threading.Condition()
+        self._threads: list[threading.Thread] = []
+        self._in_flight = 0
+        self._closed = False
+
+        self._submitted = 0
+        self._completed = 0
+        self._dropped = 0
+        self._errors = 0
+        CallbackWorkerPool._instances.add(self)
+
+    @classmethod
+    def default(cls) -> CallbackWorkerPool:
+        """Get the pool shared by registries created without one."""
+        if cls._default is None:
+            with cls._default_lock:
+                if cls._default is None:
+                    cls._default = cls()
+        return cls._default
+
+    def submit(self, callback: Callable, args: tuple, kwargs: dict[str, Any]) -> bool:
+        """
+        Queue a callback invocation.
+
+        Args:
+            callback: Callback to run on a worker thread
+            args: Positional arguments
+            kwargs: Keyword arguments
+
+        Returns:
+            True if queued, False if dropped (queue full or pool closed)
+        """
+        with self._cond:
+            if self._closed or len(self._queue) >= self.max_queue:
+                self._dropped += 1
+                return False
+            if len(self._threads) < self.workers:
+                self._start_worker()
+            self._queue.append((callback, args, kwargs))
+            self._submitted += 1
+            self._cond.notify()
+            return True
+
+    def _start_worker(self) -> None:
+        """Start one worker thread (called with the condition held)."""
+        thread = threading.Thread(
+            target=self._run,
+            name=f"log-callback-{len(self._threads)}",
+            daemon=True,
+        )
+        self._threads.append(thread)
+        thread.start()
+
+    def _run(self) -> None:
+        """Worker loop - runs jobs until closed and empty."""
+        while True:
+            with self._cond:
+                while not self._queue and not self._closed:
+                    self._cond.wait()
+                if not self._queue:
+                    return
+                callback, args, kwargs = self._queue.popleft()
+                self._in_flight += 1
+
+            failed = False
+            try:
+                callback(*args, **kwargs)
+            except Exception:
+                failed = True
+                # Logging here could re-trigger the failing callback
+                sys.stderr.write("CallbackWorkerPool: error in log callback:\n")
+                traceback.print_exc(file=sys.stderr)
+
+            with self._cond:
+                self._in_flight -= 1
+                self._completed += 1
+                self._errors += failed
+                self._cond.notify_all()
+
+    def flush(self, timeout: float | None = 5.0) -> bool:
+        """
+        Wait until every queued callback has run.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if the queue drained within the timeout
+        """
+        with self._cond:
+            if threading.current_thread() in self._threads:
+                return not self._queue
+            return self._cond.wait_for(
+                lambda: not self._queue and not self._in_flight, timeout
+            )
+
+    def close(self, timeout: float = 5.0) -> None:
+        """
+        Run the remaining queued callbacks and stop the workers.
+
+        Args:
+            timeout: Maximum seconds to wait per worker thread
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            threads = list(self._threads)
+        for thread in threads:
+            if thread is not threading.current_thread():
+                thread.join(timeout)
+        CallbackWorkerPool._instances.discard(self)
+
+    def stats(self) -> dict[str, int]:
+        """
+        Get pool counters.
+
+        Returns:
+            Dictionary with submitted, completed, dropped, errors and pending
+            callback counts
+        """
+        with self._cond:
+            return {
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "dropped": self._dropped,
+                "errors": self._errors,
+                "pending": len(self._queue) + self._in_flight,
+            }
+
+    @classmethod
+    def flush_all(cls, timeout: float = 5.0) -> bool:
+        """
+        Flush every live pool (used on application shutdown).
+
+        Args:
+            timeout: Maximum seconds to wait per pool
+
+        Returns:
+            True if all pools drained within the timeout
+        """
+        return all([pool.flush(timeout) for pool in list(cls._instances)])
+
+
 class CallbackRegistry:
     """
     Manages log event callbacks.
 
     This class provides a registry system for callbacks that can be triggered
-    when specific log levels are used. Callbacks can be inherited by child loggers.
+    when specific log levels are used. Callbacks can be inherited by child
+    loggers, and can run asynchronously on a CallbackWorkerPool.
+
+    Registrations are kept per level and flattened into an immutable dispatch
+    table (level -> tuple of callables) on every register/remove/inherit, so
+    trigger() does a single lookup and never sees a half-updated list.
 
     Example:
         >>> import logging
@@ -39,11 +233,27 @@ class CallbackRegistry:
         True
     """
 
-    def __init__(self) -> None:
-        """Initialize the callback registry."""
-        self._callbacks: dict[int, list[tuple[Callable, bool]]] = {}
+    def __init__(self, pool: CallbackWorkerPool | None = None) -> None:
+        """
+        Initialize the callback registry.
 
-    def register(self, level: int, callback: Callable, inherit: bool = False) -> None:
+        Args:
+            pool: Worker pool for run_async callbacks (default: shared pool)
+        """
+        # level -> [(callback, inherit, run_async)] in registration order
+        self._callbacks: dict[int, list[tuple[Callable, bool, bool]]] = {}
+        self._table: dict[int, tuple[Callable, ...]] = {}
+        self._pool = pool
+        # True when any callback is registered; lets loggers skip trigger()
+        self.active = False
+
+    def register(
+        self,
+        level: int,
+        callback: Callable,
+        inherit: bool = False,
+        run_async: bool = False,
+    ) -> None:
         """
         Register a callback for a specific level.
 
@@ -51,6 +261,9 @@ class CallbackRegistry:
             level: Log level to register callback for
             callback: Callback function to register
             inherit: Whether this callback should be inherited by child loggers
+            run_async: Run the callback on a worker pool instead of the
+                logging thread (for slow callbacks such as alerting). Queued
+                calls are dropped if the pool falls behind.
 
         Raises:
             CallbackError: If callback is not callable
@@ -61,15 +274,37 @@ class CallbackRegistry:
             >>> def alert_on_critical(logger, level, msg, args, **kwargs):
             ...     send_alert(f"CRITICAL: {msg}")
             >>>
-            >>> registry.register(logging.CRITICAL, alert_on_critical, inherit=True)
+            >>> registry.register(
+            ...     logging.CRITICAL, alert_on_critical, inherit=True, run_async=True
+            ... )
         """
         if not callable(callback):
             raise CallbackError(f"Callback must be callable, got {type(callback)}")
 
-        if level not in self._callbacks:
-            self._callbacks[level] = []
+        self._callbacks.setdefault(level, []).append((callback, inherit, run_async))
+        self._rebuild()
+
+    def _rebuild(self) -> None:
+        """Flatten registrations into the dispatch table."""
+        self._table = {
+            level: tuple(
+                self._async_wrapper(cb) if run_async else cb
+                for cb, _, run_async in callbacks
+            )
+            for level, callbacks in self._callbacks.items()
+            if callbacks
+        }
+        self.active = bool(self._table)
 
-        self._callbacks[level].append((callback, inherit))
+    def _async_wrapper(self, callback: Callable) -> Callable:
+        """Wrap a callback so calling it queues it on the worker pool."""
+        registry = self
+
+        def submit(*args: Any, **kwargs: Any) -> None:
+            pool = registry._pool or CallbackWorkerPool.default()
+            pool.submit(callback, args, kwargs)
+
+        return submit
 
     def trigger(
         self, level: int, logger: Logger, msg: str, args: tuple, kwargs: dict
@@ -92,10 +327,11 @@ class CallbackRegistry:
             >>> logger.error("Connection failed", extra={"host": "db.example.com"})
             >>> # All callbacks registered for ERROR level will be invoked
         """
-        if level not in self._callbacks:
+        callbacks = self._table.get(level)
+        if callbacks is None:
             return
 
-        for callback, _ in self._callbacks[level]:
+        for callback in callbacks:
             try:
                 callback(logger, level, msg, args, **kwargs)
             except Exception as e:
@@ -113,9 +349,12 @@ class CallbackRegistry:
             other: Target callback registry
         """
         for level, callbacks in self._callbacks.items():
-            for callback, inherit in callbacks:
+            for callback, inherit, run_async in callbacks:
                 if inherit:
-                    other.register(level, callback, inherit=True)
+                    other._callbacks.setdefault(level, []).append(
+                        (callback, True, run_async)
+                    )
+        other._rebuild()
 
     def has_callbacks(self, level: int) -> bool:
         """
@@ -127,7 +366,7 @@ class CallbackRegistry:
         Returns:
             True if callbacks are registered for this level
         """
-        return level in self._callbacks and len(self._callbacks[level]) > 0
+        return level in self._table
 
     def get_callback_count(self, level: int) -> int:
         """
@@ -139,11 +378,12 @@ class CallbackRegistry:
         Returns:
             Number of callbacks registered for this level
         """
-        return len(self._callbacks.get(level, []))
+        return len(self._table.get(level, ()))
 
     def clear(self) -> None:
         """Clear all registered callbacks."""
         self._callbacks.clear()
+        self._rebuild()
 
     def remove_callback(self, level: int, callback: Callable) -> bool:
         """
@@ -160,17 +400,20 @@ class CallbackRegistry:
             return False
 
         callbacks = self._callbacks[level]
-        for i, (cb, inherit) in enumerate(callbacks):
+        for i, (cb, _, _) in enumerate(callbacks):
             if cb == callback:
                 callbacks.pop(i)
                 if not callbacks:
                     del self._callbacks[level]
+                self._rebuild()
                 return True
 
         return False
 
 
-def listens_for(logger: Logger, level: int, inherit: bool = False) -> Callable:
+def listens_for(
+    logger: Logger, level: int, inherit: bool = False, run_async: bool = False
+) -> Callable:
     """
     Decorator for registering callbacks with a logger.
 
@@ -178,6 +421,7 @@ def listens_for(logger: Logger, level: int, inherit: bool = False) -> Callable:
         logger: Logger instance to register callback with
         level: Log level to listen for
         inherit: Whether callback should be inherited by child loggers
+        run_async: Whether callback runs on the callback worker pool
 
     Returns:
         Decorator function
@@ -190,7 +434,7 @@ def listens_for(logger: Logger, level: int, inherit: bool = False) -> Callable:
                 f"Decorated function must be callable, got {type(func)}"
             )
 
-        logger._callbacks.register(level, func, inherit)
+        logger._callbacks.register(level, func, inherit, run_async)
         return func
 
     return decorator
@@ -12,6 +12,8 @@ import threading
 from collections.abc import Callable
 from typing import TYPE_CHECKING
 
+from .level_manager import LevelGeneration
+
 if TYPE_CHECKING:
     from .config import LogConfig
 
@@ -101,6 +103,8 @@ class LogConfigHolder:
         """
         # Atomic reference swap (GIL ensures atomicity)
         self._config = new_config
+        # Level may have changed - invalidate cached effective levels
+        LevelGeneration.bump()
 
         # Get callback list snapshot under lock
         with self._lock:
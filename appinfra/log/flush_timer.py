@@ -0,0 +1,74 @@
+"""
+Deferred flushing for buffering log handlers.
+
+Handlers that hold records back (buffered file handlers, batched
+MPQueueHandler) must still emit them within ``flush_interval`` seconds when
+logging goes quiet. Rather than each handler running its own timer thread,
+they call schedule_flush() when their buffer goes from empty to non-empty and
+a single shared daemon thread calls ``handler.flush()`` once the delay passes.
+"""
+
+from __future__ import annotations
+
+import heapq
+import logging
+import threading
+import time
+import weakref
+from typing import Any
+
+
+class FlushTimer:
+    """Single daemon thread that flushes handlers after a delay."""
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self._heap: list[tuple[float, int, weakref.ref[Any]]] = []
+        self._thread: threading.Thread | None = None
+
+    def schedule(self, handler: logging.Handler, delay: float) -> None:
+        """Flush handler after delay seconds (a no-op if already flushed)."""
+        with self._cond:
+            deadline = time.monotonic() + delay
+            heapq.heappush(self._heap, (deadline, id(handler), weakref.ref(handler)))
+            # Restart after fork - threads do not survive into the child
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="log-buffer-flush", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify()
+
+    def _run(self) -> None:
+        """Timer loop - flushes handlers whose deadline has passed."""
+        while True:
+            with self._cond:
+                while not self._heap:
+                    self._cond.wait()
+                deadline, _, ref = self._heap[0]
+                remaining = deadline - time.monotonic()
+                if remaining > 0:
+                    self._cond.wait(remaining)
+                    continue
+                heapq.heappop(self._heap)
+
+            handler = ref()
+            if handler is not None:
+                handler.flush()
+
+
+_timer = FlushTimer()
+
+
+def schedule_flush(handler: logging.Handler, delay: float) -> None:
+    """
+    Flush a handler after a delay on the shared timer thread.
+
+    The handler is held by weak reference, so a pending flush does not keep a
+    closed handler alive.
+
+    Args:
+        handler: Handler to flush
+        delay: Seconds to wait before flushing
+    """
+    _timer.schedule(handler, delay)
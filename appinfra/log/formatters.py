@@ -10,14 +10,18 @@ import logging
 import os
 import re
 import sys
+import time
 import traceback
 from typing import Any, cast
 
+from .cache import ClockCache, SecondCache
 from .colors import ColorManager
 from .config import LogConfig
 from .config_holder import LogConfigHolder
 from .constants import LogConstants
 from .errors import FormatterError
+from .lazy import resolve_extra
+from .metrics import LogMetrics
 
 # Type alias for config parameter that can be either LogConfig or LogConfigHolder
 ConfigLike = LogConfig | LogConfigHolder
@@ -25,6 +29,9 @@ ConfigLike = LogConfig | LogConfigHolder
 # Pattern to match ANSI escape sequences
 _ANSI_PATTERN = re.compile(r"\x1b\[[0-9;]*m")
 
+# Extra keys that get special handling at top level only
+_SPECIAL_KEYS = frozenset({"after", "exception", "exception_formatted"})
+
 
 def _visual_len(text: str) -> int:
     """Calculate visual width of text, excluding ANSI escape codes."""
@@ -94,19 +101,10 @@ def _format_value(
 def _cache_result(
     formatter: Any, cache_key: tuple[Any, str, str, str, bool, bool] | None, result: str
 ) -> None:
-    """Cache result with LRU eviction when cache is full."""
+    """Cache result (the bounded cache evicts when full)."""
     if cache_key is None:
         return
-
-    cache = formatter._format_cache
-    if cache_key in cache:
-        # Move existing key to end (most recently used)
-        cache.move_to_end(cache_key)
-    else:
-        # Evict oldest entry if cache is full
-        if len(cache) >= formatter._max_cache_size:
-            cache.popitem(last=False)  # Remove oldest (first) item
-        cache[cache_key] = result
+    formatter._format_cache.put(cache_key, result)
 
 
 # Helper functions for LogFormatter._format_with_colors()
@@ -139,7 +137,7 @@ def _format_value_without_colors(value: Any) -> str:
 
 def _format_extra_without_colors(record: logging.LogRecord) -> str:
     """Format extra fields without colors."""
-    extra = getattr(record, "__infra__extra", None)
+    extra = resolve_extra(record)
     if extra is None:
         return ""
 
@@ -147,12 +145,9 @@ def _format_extra_without_colors(record: logging.LogRecord) -> str:
     if not isinstance(extra, collections.OrderedDict):
         keys = sorted(keys)
 
-    # Keys that get special handling at top level only
-    special_keys = {"after", "exception", "exception_formatted"}
-
     extra_parts = []
     for key in keys:
-        if key in special_keys:
+        if key in _SPECIAL_KEYS:
             continue
         value = extra[key]
         formatted = _format_value_without_colors(value)
@@ -172,49 +167,27 @@ def _format_extra_without_colors(record: logging.LogRecord) -> str:
 
 
 def _format_without_colors(
-    formatter: Any, record: logging.LogRecord, width: int
+    formatter: "LogFormatter", record: logging.LogRecord, width: int
 ) -> str:
     """Format log record without colors."""
-    fmt = LogConstants.DEFAULT_FORMAT
-    rule = (
-        LogConstants.MICRO_RULE_WIDTH
-        if formatter._config.micros
-        else LogConstants.DEFAULT_RULE_WIDTH
+    plan = formatter._plan
+    return (
+        LogConstants.DEFAULT_FORMAT
+        + " " * max(1, plan.rule - width)
+        + _format_extra_without_colors(record)
+        + plan.metadata
+        + cast(str, formatter._location_renderer.render_location(record))
     )
-    fmt += " " * (max(1, rule - width))
-
-    # Handle extra fields
-    fmt += _format_extra_without_colors(record)
-
-    # Add process and logger name
-    fmt += " [%(process)d] [%(name)s]"
-
-    # Add location information
-    fmt += cast(str, formatter._location_renderer.render_location(record))
-
-    return fmt
-
-
-def _setup_level_colors(record: logging.LogRecord) -> tuple[str, str]:
-    """Setup colors for the log level."""
-    col = ColorManager.get_color_for_level(record.levelno) or ColorManager.DEFAULT
-    bold = ColorManager.create_bold_color(col)
-    col += "m"
-    return col, bold
 
 
 def _format_extra_fields(
-    formatter: Any, record: logging.LogRecord, col: str, bold: str
+    formatter: "LogFormatter", record: logging.LogRecord, col: str, bold: str
 ) -> tuple[str, bool]:
     """Format extra fields if present. Returns (formatted_string, had_content)."""
-    extra = getattr(record, "__infra__extra", None)
+    extra = resolve_extra(record)
     if extra is None:
         return "", False
 
-    keys = extra.keys()
-    if not isinstance(extra, collections.OrderedDict):
-        keys = sorted(keys)
-
     add = formatter._field_formatter._format_fields_dict(extra, col, bold)
     return add, len(add) > 0
 
@@ -232,35 +205,86 @@ def _add_metadata_section(formatter: Any, fmt: str, content: bool) -> str:
     return fmt
 
 
-def _format_colored(formatter: Any, record: logging.LogRecord, width: int) -> str:
+def _format_colored(
+    formatter: "LogFormatter", record: logging.LogRecord, width: int
+) -> str:
     """Format log record with colors and styling."""
-    col, bold = _setup_level_colors(record)
-
-    # Format main fields
-    fmt = formatter._field_formatter.format_field("%(asctime)s", col, "")
-    fmt += " " + formatter._field_formatter.format_field("%(levelname).1s", col, bold)
-    fmt += " " + bold + "%(message)s"
-
-    # Add rule spacing
-    rule = (
-        LogConstants.MICRO_RULE_WIDTH
-        if formatter._config.micros
-        else LogConstants.DEFAULT_RULE_WIDTH
+    plan = formatter._plan
+    col, bold, head = plan.level_head(record.levelno)
+    add, content = _format_extra_fields(formatter, record, col, bold)
+    return (
+        head
+        + " " * max(1, plan.rule - width)
+        + add
+        + (" " if content else "")
+        + plan.metadata
+        + cast(str, formatter._location_renderer.render_location(record))
+        + ColorManager.RESET
     )
-    fmt += " " * (max(1, rule - width))
 
-    # Handle extra fields
-    add, content = _format_extra_fields(formatter, record, col, bold)
-    fmt += add
 
-    # Add process and logger metadata
-    fmt = _add_metadata_section(formatter, fmt, content)
+class _FormatPlan:
+    """
+    Parts of the format string that depend only on the config.
 
-    # Add location information
-    fmt += cast(str, formatter._location_renderer.render_location(record))
+    Built once per LogConfig (see LogFormatter._get_plan), so formatting a
+    record only adds the record-specific pieces: padding, extra fields and
+    location.
+    """
 
-    fmt += ColorManager.RESET
-    return col + fmt
+    def __init__(self, formatter: Any, config: LogConfig) -> None:
+        """
+        Precompute the format pieces for a config.
+
+        Args:
+            formatter: LogFormatter the plan belongs to
+            config: Config the plan is built for
+        """
+        self.config = config
+        self.colors = config.colors
+        self.rule = (
+            LogConstants.MICRO_RULE_WIDTH
+            if config.micros
+            else LogConstants.DEFAULT_RULE_WIDTH
+        )
+        # Visible width before the message: "[" + timestamp + "] [" + level + "] "
+        self.header_width = 1 + (16 if config.micros else 12) + 4 + 1 + 2
+        self.pre_formatter = PreFormatter(LogConstants.DEFAULT_FORMAT, config.micros)
+        if config.colors:
+            self.metadata = _add_metadata_section(formatter, "", False)
+        else:
+            self.metadata = " [%(process)d] [%(name)s]"
+        self._field_formatter = formatter._field_formatter
+        self._heads: dict[int, tuple[str, str, str]] = {}
+
+    def level_head(self, levelno: int) -> tuple[str, str, str]:
+        """
+        Get the colors and colored header (timestamp, level, message) for a level.
+
+        Returns:
+            Tuple of (color, bold color, header format string)
+        """
+        entry = self._heads.get(levelno)
+        if entry is None:
+            entry = self._heads[levelno] = self._build_head(levelno)
+        return entry
+
+    def _build_head(self, levelno: int) -> tuple[str, str, str]:
+        """Render the colored header for a level."""
+        col = ColorManager.get_color_for_level(levelno) or ColorManager.DEFAULT
+        bold = ColorManager.create_bold_color(col)
+        col += "m"
+        fields = self._field_formatter
+        head = (
+            col
+            + fields.format_field("%(asctime)s", col, "")
+            + " "
+            + fields.format_field("%(levelname).1s", col, bold)
+            + " "
+            + bold
+            + "%(message)s"
+        )
+        return col, bold, head
 
 
 class PreFormatter(logging.Formatter):
@@ -280,12 +304,16 @@ class PreFormatter(logging.Formatter):
             micros: Whether to include microsecond precision
         """
         self._micros = micros
+        self._time_cache = SecondCache()
         super().__init__(fmt)
 
     def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
         """
         Format timestamp with optional microsecond precision.
 
+        The date and time are rendered once per second per thread; only the
+        milliseconds (and microseconds) are formatted for every record.
+
         Args:
             record: Log record object
             datefmt: Date format string (unused)
@@ -293,7 +321,17 @@ class PreFormatter(logging.Formatter):
         Returns:
             Formatted timestamp string
         """
-        s = super().formatTime(record)
+        cache = self._time_cache
+        second = int(record.created)
+        if cache.second != second:
+            cache.prefix = time.strftime(
+                self.default_time_format, self.converter(record.created)
+            )
+            cache.second = second
+        s = cache.prefix
+        msec_format = self.default_msec_format
+        if msec_format:  # logging.Formatter skips milliseconds when unset
+            s = msec_format % (s, record.msecs)
         if self._micros:
             # Add millisecond precision to timestamp
             micros = int((record.created % 1) * 1000000) % 1000
@@ -315,12 +353,9 @@ class FieldFormatter:
             self._holder = config
         else:
             self._holder = LogConfigHolder(config)
-        # LRU cache: OrderedDict maintains insertion order for eviction
-        # Most recently used items are moved to end, oldest are at front
-        self._format_cache: collections.OrderedDict[Any, str] = (
-            collections.OrderedDict()
-        )
-        self._max_cache_size = 1000  # LRU eviction threshold
+        # CLOCK eviction: hits only set a reference mark, unlike an LRU
+        # OrderedDict that reorders on every hit
+        self._format_cache: ClockCache[str] = ClockCache(maxsize=1000)
 
     @property
     def _config(self) -> LogConfig:
@@ -353,10 +388,10 @@ class FieldFormatter:
         """
         # Check cache for simple, frequently repeated values
         cache_key = _get_cache_key(value, col, bold, name, quote, is_timing)
-        if cache_key and cache_key in self._format_cache:
-            # Move to end to mark as recently used (LRU)
-            self._format_cache.move_to_end(cache_key)
-            return self._format_cache[cache_key]
+        if cache_key is not None:
+            cached = self._format_cache.get(cache_key)
+            if cached is not None:
+                return cached
 
         # Format the field
         head = _format_header(col, name, is_timing=is_timing)
@@ -384,9 +419,7 @@ class FieldFormatter:
         get special handling. When False (nested dicts), all keys are normal.
         """
         # Keys that get special handling only at top level
-        special_keys = (
-            {"after", "exception", "exception_formatted"} if top_level else set()
-        )
+        special_keys = _SPECIAL_KEYS if top_level else frozenset()
 
         seq = []
         if top_level and "after" in fields:
@@ -542,17 +575,24 @@ class LogFormatter(logging.Formatter):
         self._field_formatter = FieldFormatter(self._holder)
         self._location_renderer = LocationRenderer(self._holder)
 
-        # Cache PreFormatter and track micros setting to detect config changes
-        self._cached_micros = self._config.micros
-        self._pre_formatter = PreFormatter(
-            LogConstants.DEFAULT_FORMAT, self._cached_micros
-        )
+        # Config-dependent format pieces, rebuilt when the holder's config
+        # is replaced (hot-reload)
+        self._plan = _FormatPlan(self, self._holder.config)
 
     @property
     def _config(self) -> LogConfig:
         """Get current config (supports hot-reload via holder)."""
         return self._holder.config
 
+    @property
+    def needs_caller(self) -> bool:
+        """Whether records need caller info (only rendered when location > 0).
+
+        Checked by Logger.findCaller to skip the frame walk when no handler
+        displays locations.
+        """
+        return bool(self._holder.location)
+
     def format(self, record: logging.LogRecord) -> str:
         """
         Format a log record.
@@ -563,21 +603,35 @@ class LogFormatter(logging.Formatter):
         Returns:
             Formatted log message
         """
-        width = self._calculate_width(record)
-        fmt = self._format_with_colors(record, width)
-
-        # Check if micros config changed (hot-reload support)
-        current_micros = self._config.micros
-        if current_micros != self._cached_micros:
-            self._cached_micros = current_micros
-            self._pre_formatter = PreFormatter(
-                LogConstants.DEFAULT_FORMAT, current_micros
-            )
-
-        # Update the format string and use cached PreFormatter
-        self._pre_formatter._fmt = fmt
-        self._pre_formatter._style._fmt = fmt
-        return self._pre_formatter.format(record)
+        if LogMetrics.enabled:
+            start = time.perf_counter()
+            try:
+                return self._format_record(record)
+            finally:
+                LogMetrics.get_instance().observe_format(
+                    self, time.perf_counter() - start
+                )
+        return self._format_record(record)
+
+    def _format_record(self, record: logging.LogRecord) -> str:
+        """Format a log record with the current format plan."""
+        # Refresh once per record; the helpers below read self._plan
+        plan = self._get_plan()
+        fmt = self._format_with_colors(record, self._calculate_width(record))
+
+        # Update the format string and use the plan's PreFormatter
+        pre_formatter = plan.pre_formatter
+        pre_formatter._fmt = fmt
+        pre_formatter._style._fmt = fmt
+        return pre_formatter.format(record)
+
+    def _get_plan(self) -> _FormatPlan:
+        """Get the format plan, rebuilding it if the config was replaced."""
+        plan = self._plan
+        config = self._holder.config
+        if plan.config is not config:
+            plan = self._plan = _FormatPlan(self, config)
+        return plan
 
     def _calculate_width(self, record: logging.LogRecord) -> int:
         """Calculate display width without full formatting.
@@ -586,13 +640,10 @@ class LogFormatter(logging.Formatter):
         Example: "[12:34:56,789] [I] Hello world"
         """
         # Timestamp: "HH:MM:SS,mmm" = 12 chars, or "HH:MM:SS,mmm.uuu" = 16 with micros
-        timestamp_len = 16 if self._config.micros else 12
-        # "[" + timestamp + "] [" + level(1) + "] " + message
-        #  1  +    12/16   +  4  +     1     +  2  + msg_len
-        return 1 + timestamp_len + 4 + 1 + 2 + _visual_len(record.getMessage())
+        return self._plan.header_width + _visual_len(record.getMessage())
 
     def _format_with_colors(self, record: logging.LogRecord, width: int) -> str:
         """Format record with colors and styling."""
-        if not self._config.colors:
+        if not self._plan.colors:
             return _format_without_colors(self, record, width)
         return _format_colored(self, record, width)
@@ -104,7 +104,13 @@ def _extract_json_format_options(filtered_config: dict[str, Any]) -> None:
         return
 
     # Extract JSON-specific configuration options
-    json_keys = ["timestamp_format", "pretty_print", "custom_fields", "exclude_fields"]
+    json_keys = [
+        "timestamp_format",
+        "pretty_print",
+        "custom_fields",
+        "exclude_fields",
+        "encoder",
+    ]
     format_options = {}
     for key in json_keys:
         if key in filtered_config:
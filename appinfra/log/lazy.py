@@ -0,0 +1,148 @@
+"""
+Deferred evaluation of extra field values.
+
+Extra values such as ``len(big_list)`` or ``json.dumps(obj)`` are computed by
+the caller even when the record is later dropped by a handler level, a filter
+or sampling. Passing a zero-argument function (or wrapping any callable in
+``lazy()``) defers the work until a formatter actually renders the record:
+
+    lg.debug("batch loaded", extra={"rows": lambda: len(rows)})
+    lg.debug("payload", extra={"body": lazy(json.dumps, payload)})
+
+Deferred values are evaluated at most once per record, and the results are
+cached on the record, so every handler (and every thread formatting it) sees
+the same values. Plain functions, lambdas, bound methods and LazyValue are
+deferred; other callables (classes, builtins such as ``time.time``) are logged
+as-is unless wrapped in ``lazy()``.
+
+Evaluation happens where the record is formatted, which may be a background
+thread (AsyncHandler) or the moment MPQueueHandler prepares it for another
+process. Deferred functions should therefore not depend on caller state that
+changes right after the logging call.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Callable, Mapping
+from types import FunctionType, MethodType
+from typing import Any
+
+# Record attribute set when __infra__extra holds unevaluated values
+LAZY_ATTR = "__infra__lazy"
+
+
+class LazyValue:
+    """
+    Extra value computed on first use.
+
+    Created by lazy(); evaluated by resolve_extra() when a record is
+    formatted.
+    """
+
+    __slots__ = ("func", "args", "kwargs")
+
+    def __init__(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        """
+        Initialize the deferred value.
+
+        Args:
+            func: Callable producing the value
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+        """
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+
+    def __call__(self) -> Any:
+        return self.func(*self.args, **self.kwargs)
+
+    def __repr__(self) -> str:
+        return f"lazy({self.func!r})"
+
+
+def lazy(func: Callable[..., Any], *args: Any, **kwargs: Any) -> LazyValue:
+    """
+    Defer an extra field value until the record is formatted.
+
+    Args:
+        func: Callable producing the value
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        LazyValue to pass as an extra value
+
+    Example:
+        lg.debug("query done", extra={"plan": lazy(explain, query)})
+    """
+    return LazyValue(func, *args, **kwargs)
+
+
+# Exact types treated as deferred (type() lookup keeps the check cheap)
+_LAZY_TYPES = frozenset({LazyValue, FunctionType, MethodType})
+
+# Per-record lock created (via dict.setdefault) by the first thread to resolve
+# a record; removed once the resolved mapping is installed
+_LOCK_ATTR = "__infra__lazy_lock"
+
+
+def has_lazy(extra: Mapping[str, Any]) -> bool:
+    """
+    Check whether any extra value is deferred.
+
+    Args:
+        extra: Extra fields mapping
+
+    Returns:
+        True if at least one value would be evaluated by resolve_extra()
+    """
+    lazy_types = _LAZY_TYPES
+    return any(type(value) in lazy_types for value in extra.values())
+
+
+def _evaluate(value: Callable[[], Any]) -> Any:
+    """Call a deferred value, rendering failures instead of raising."""
+    try:
+        return value()
+    except Exception as e:
+        return f"<lazy value failed: {e.__class__.__name__}: {e}>"
+
+
+def resolve_extra(record: logging.LogRecord) -> Any:
+    """
+    Get a record's extra fields with deferred values evaluated.
+
+    The first call evaluates deferred values into a copy of the mapping (the
+    original may be shared with the logger's pre-populated extra) and stores
+    it back on the record; later calls return it directly. Concurrent first
+    calls serialize on a per-record lock, so deferred values run only once.
+
+    Args:
+        record: Log record
+
+    Returns:
+        The record's ``__infra__extra`` mapping, or None if it has none
+    """
+    d = record.__dict__
+    if LAZY_ATTR not in d:
+        return d.get("__infra__extra")
+
+    # dict.setdefault is atomic: every thread gets the same lock
+    with d.setdefault(_LOCK_ATTR, threading.Lock()):
+        if LAZY_ATTR in d:  # Not resolved by a thread that held the lock first
+            extra = d["__infra__extra"].copy()  # Preserves OrderedDict
+            lazy_types = _LAZY_TYPES
+            evaluated = {
+                key: _evaluate(value)
+                for key, value in extra.items()
+                if type(value) in lazy_types
+            }
+            extra.update(evaluated)
+            d.update(evaluated)
+            d["__infra__extra"] = extra
+            del d[LAZY_ATTR]
+            d.pop(_LOCK_ATTR, None)  # Keeps the record picklable
+    return d["__infra__extra"]
@@ -12,11 +12,36 @@ based on topic patterns (e.g., '/infra/db/*', '/infra/**'). It supports:
 
 from __future__ import annotations
 
-import fnmatch
+import itertools
 import logging
 import threading
 from dataclasses import dataclass
 
+from .topic_trie import TopicTrie, match_segments, pattern_specificity, split_topic
+
+# Sentinel distinguishing "not cached" from a cached None (no matching rule)
+_MISSING = object()
+
+
+class LevelGeneration:
+    """
+    Process-wide counter bumped whenever any logger level may have changed.
+
+    Loggers cache their effective enabled/disabled decision per level and
+    tag the cache with the generation it was computed at. Any level change
+    (Logger.setLevel, LogConfigHolder.update, LogLevelManager rule changes)
+    bumps the counter, so a stale cache is detected with a single integer
+    comparison and hot-reloaded levels still propagate immediately.
+    """
+
+    current: int = 0
+    _counter = itertools.count(1)
+
+    @classmethod
+    def bump(cls) -> None:
+        """Invalidate all cached effective levels (atomic under the GIL)."""
+        cls.current = next(cls._counter)
+
 
 @dataclass
 class LevelRule:
@@ -57,12 +82,18 @@ class LogLevelManager:
     _instance: LogLevelManager | None = None
     _lock_class = threading.Lock()  # Class-level lock for singleton
 
+    # Resolved levels are cached per logger name; the cache is dropped when full
+    MAX_CACHED_NAMES = 10_000
+
     def __init__(self) -> None:
         """Initialize the LogLevelManager (private - use get_instance())."""
         self._rules: list[LevelRule] = []
         self._lock = threading.RLock()
         self._runtime_updates_enabled: bool = False
         self._default_level: int | str = logging.INFO
+        # Compiled from _rules on first lookup after a change (None = stale)
+        self._trie: TopicTrie[int | str] | None = None
+        self._level_cache: dict[str, int | str | None] = {}
 
     @classmethod
     def get_instance(cls) -> LogLevelManager:
@@ -122,6 +153,7 @@ class LogLevelManager:
 
             # Sort rules by priority desc, then specificity desc
             self._rules.sort(key=lambda r: (r.priority, r.specificity), reverse=True)
+            self._invalidate()
 
             # Update existing loggers if runtime updates enabled
             if self._runtime_updates_enabled:
@@ -156,6 +188,10 @@ class LogLevelManager:
         2. First matching pattern wins
         3. If no match, returns None (use default level)
 
+        Rules are compiled into a segment trie, so a lookup costs O(depth)
+        regardless of the number of rules. Results are cached per name until
+        the rules change.
+
         Args:
             logger_name: Logger name to match (e.g., "/infra/db/queries")
 
@@ -167,13 +203,34 @@ class LogLevelManager:
             >>> manager.get_effective_level("/infra/db/queries")
             'debug'
         """
+        # Lock-free fast path - cache dicts are replaced, never mutated, on change
+        cached = self._level_cache.get(logger_name, _MISSING)
+        if cached is not _MISSING:
+            return cached  # type: ignore[return-value]
+
         with self._lock:
-            for rule in self._rules:  # Already sorted by priority, specificity
-                if self._matches_pattern(logger_name, rule.pattern):
-                    return rule.level
+            if self._trie is None:
+                self._trie = self._compile_rules()
+            level = self._trie.best_match(logger_name)
+
+            if len(self._level_cache) >= self.MAX_CACHED_NAMES:
+                self._level_cache = {}
+            self._level_cache[logger_name] = level
 
-        # No match, will use default level
-        return None
+        return level
+
+    def _compile_rules(self) -> TopicTrie[int | str]:
+        """Compile sorted rules into a trie; a rule's rank is its sort position."""
+        trie: TopicTrie[int | str] = TopicTrie()
+        for rank, rule in enumerate(self._rules):
+            trie.insert(rule.pattern, rule.level, rank)
+        return trie
+
+    def _invalidate(self) -> None:
+        """Drop compiled rules and cached lookups after a rule change."""
+        self._trie = None
+        self._level_cache = {}
+        LevelGeneration.bump()
 
     def set_default_level(self, level: int | str) -> None:
         """
@@ -184,6 +241,7 @@ class LogLevelManager:
         """
         with self._lock:
             self._default_level = level
+            LevelGeneration.bump()
 
     def get_default_level(self) -> int | str:
         """Get the default log level."""
@@ -233,6 +291,7 @@ class LogLevelManager:
                 self._rules.clear()
             else:
                 self._rules = [r for r in self._rules if r.source != source]
+            self._invalidate()
 
     def get_rules(self, source: str | None = None) -> list[LevelRule]:
         """
@@ -256,9 +315,12 @@ class LogLevelManager:
 
         Supports:
         - * (single segment wildcard)
-        - ** (recursive wildcard matching any depth)
+        - ** (recursive wildcard matching zero or more segments)
         - Exact paths (no wildcards)
 
+        Matching is segment-based and agrees with the compiled trie used by
+        get_effective_level().
+
         Args:
             logger_name: Logger name to test
             pattern: Glob pattern
@@ -274,74 +336,7 @@ class LogLevelManager:
             >>> self._matches_pattern("/infra/db/pg/queries", "/infra/**")
             True
         """
-        # Handle recursive wildcard **
-        if "**" in pattern:
-            return self._matches_recursive_pattern(logger_name, pattern)
-
-        # Handle single-segment wildcards - match segment by segment
-        if "*" in pattern:
-            return self._matches_single_wildcard_pattern(logger_name, pattern)
-
-        # Exact match
-        return logger_name == pattern
-
-    def _matches_single_wildcard_pattern(self, logger_name: str, pattern: str) -> bool:
-        """
-        Match pattern with * wildcards (single segment only).
-
-        Args:
-            logger_name: Logger name to test
-            pattern: Pattern with * wildcards
-
-        Returns:
-            True if matches
-        """
-        # Split into segments
-        name_parts = logger_name.strip("/").split("/")
-        pattern_parts = pattern.strip("/").split("/")
-
-        # Must have same number of segments
-        if len(name_parts) != len(pattern_parts):
-            return False
-
-        # Match each segment
-        for name_part, pattern_part in zip(name_parts, pattern_parts):
-            if not fnmatch.fnmatch(name_part, pattern_part):
-                return False
-
-        return True
-
-    def _matches_recursive_pattern(self, logger_name: str, pattern: str) -> bool:
-        """
-        Match logger name against pattern containing ** (recursive wildcard).
-
-        Args:
-            logger_name: Logger name to test
-            pattern: Pattern containing **
-
-        Returns:
-            True if matches
-        """
-        # Split pattern into prefix, **, and suffix
-        parts = pattern.split("/**/")
-
-        if len(parts) == 1:
-            # Pattern ends with /** or starts with **/
-            if pattern.endswith("/**"):
-                prefix = pattern[:-3]
-                return logger_name.startswith(prefix)
-            elif pattern.startswith("**/"):
-                suffix = pattern[3:]
-                return logger_name.endswith(suffix)
-            else:
-                # No /** in pattern, shouldn't happen
-                return fnmatch.fnmatch(logger_name, pattern)
-
-        # Pattern has prefix/**/.../suffix structure
-        prefix = parts[0]
-        suffix = "/" + "/".join(parts[1:])
-
-        return logger_name.startswith(prefix) and logger_name.endswith(suffix)
+        return match_segments(split_topic(logger_name), split_topic(pattern))
 
     def _calculate_specificity(self, pattern: str) -> int:
         """
@@ -366,25 +361,7 @@ class LogLevelManager:
             >>> self._calculate_specificity("/infra/**")
             10  # 1 segment + recursive wildcard
         """
-        # Remove leading/trailing slashes for consistent splitting
-        pattern = pattern.strip("/")
-
-        # Split into segments
-        segments = pattern.split("/")
-
-        score = 0
-        for segment in segments:
-            if segment == "**":
-                # Recursive wildcard: 0 points
-                score += 0
-            elif "*" in segment:
-                # Contains wildcard: +1 point
-                score += 1
-            else:
-                # Exact segment: +10 points
-                score += 10
-
-        return score
+        return pattern_specificity(pattern)
 
     def _validate_pattern(self, pattern: str) -> None:
         """
@@ -504,3 +481,4 @@ class LogLevelManager:
             # Restore default level
             if "default_level" in config:
                 self._default_level = config["default_level"]
+            self._invalidate()
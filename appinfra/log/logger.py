@@ -6,9 +6,12 @@ including custom log levels, callback support, and multiprocessing features.
 """
 
 import collections
+import copy
 import logging
 import sys
 import threading
+from collections.abc import Iterable
+from types import CodeType, FrameType, ModuleType
 from typing import Any, Self
 
 from .callback import CallbackRegistry
@@ -16,17 +19,115 @@ from .config import ChildLogConfig, LogConfig
 from .config_holder import LogConfigHolder
 from .constants import LogConstants
 from .errors import ReservedKeyError
+from .lazy import LAZY_ATTR, has_lazy
+from .level_manager import LevelGeneration
+from .metrics import LogMetrics
+from .sampling import SUMMARY_MESSAGE, LogSamplingManager, TopicSampler
 
 # Type alias for config parameter that can be either type
 ConfigLike = LogConfig | ChildLogConfig
 
+# findCaller result when caller info is not needed or not available
+_UNKNOWN_CALLER = ("(unknown file)", 0, "(unknown function)", None)
+
+
+class _ReadOnlyExtra:
+    """
+    Mixin making a dict read-only.
+
+    The logger's pre-populated extra fields are shared by every record logged
+    without per-call extra, so handlers and formatters must not modify them in
+    place. copy(), pickling and copy.copy() produce a plain (mutable) mapping
+    of the underlying type.
+    """
+
+    __slots__ = ()
+    _base: type[dict] = dict
+
+    @classmethod
+    def freeze(cls, extra: dict[str, Any]) -> Any:
+        """Create a read-only copy of extra."""
+        frozen: Any = cls.__new__(cls)
+        setitem = cls._base.__setitem__
+        for key, value in extra.items():
+            setitem(frozen, key, value)
+        return frozen
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> Any:
+        raise TypeError("Logger extra fields shared by records are read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def copy(self: Any) -> Any:
+        return self._base(self)
+
+    __copy__ = copy
+
+    def __deepcopy__(self: Any, memo: dict[int, Any]) -> Any:
+        return copy.deepcopy(self._base(self), memo)
+
+    def __reduce__(self: Any) -> Any:
+        return (self._base, (list(self.items()),))
+
+
+class _ReadOnlyDict(_ReadOnlyExtra, dict):  # type: ignore[type-arg]
+    """Read-only dict of shared extra fields."""
+
+    __slots__ = ()
+
+
+class _ReadOnlyOrderedDict(  # type: ignore[type-arg]
+    _ReadOnlyExtra, collections.OrderedDict
+):
+    """Read-only OrderedDict of shared extra fields."""
+
+    __slots__ = ()
+    _base = collections.OrderedDict
+    move_to_end = _ReadOnlyExtra._readonly
+
+
+def _freeze_extra(extra: dict[str, Any]) -> Any:
+    """Create the read-only mapping shared by records without per-call extra."""
+    if isinstance(extra, collections.OrderedDict):
+        return _ReadOnlyOrderedDict.freeze(extra)
+    return _ReadOnlyDict.freeze(extra)
+
+
+def _collect_codes(*modules: ModuleType) -> frozenset[CodeType]:
+    """Collect code objects of all functions and methods defined in modules."""
+    codes: set[CodeType] = set()
+    for module in modules:
+        for obj in vars(module).values():
+            members = vars(obj).values() if isinstance(obj, type) else [obj]
+            for member in members:
+                func = getattr(member, "__func__", member)
+                code = getattr(func, "__code__", None)
+                if isinstance(code, CodeType):
+                    codes.add(code)
+    return frozenset(codes)
+
+
+def _handlers_need_caller(handlers: Iterable[logging.Handler]) -> bool:
+    """Check if any handler's formatter may render caller info.
+
+    Handlers wrapping other handlers answer via their own ``needs_caller``.
+    Formatters opt out by exposing a false ``needs_caller`` attribute;
+    anything else (JSON, stdlib, queue handlers) is assumed to need it.
+    """
+    return any(
+        getattr(h, "needs_caller", getattr(h.formatter, "needs_caller", True))
+        for h in handlers
+    )
+
 
 class Logger(logging.Logger):
     """
     Enhanced logger with custom record creation and callback support.
 
     Extends the standard Python logger with:
-    - Custom record creation for extra field handling
+    - Custom record creation for extra field handling (including deferred
+      values, see appinfra.log.lazy)
     - Callback system for log event processing
     - Location tracking configuration
     - Microsecond timestamp support
@@ -77,13 +178,38 @@ class Logger(logging.Logger):
         # Validate pre-populated extra keys at init time
         self._validate_extra_keys(self._extra)
         self._suppress_format_errors = suppress_format_errors
-        # Thread-safe storage for caller traces, keyed by thread ID
-        self._pending_traces: dict[int, tuple[list[str], list[int]]] = {}
+        self._init_hot_path_state()
 
         # Override makeRecord to handle extra fields
         self._original_makeRecord = self.makeRecord
         self.makeRecord = self._makeRecord  # type: ignore[assignment,method-assign]
 
+    def _init_hot_path_state(self) -> None:
+        """Set up the caches and generation counters used when logging."""
+        # Thread-safe storage for caller traces, keyed by thread ID
+        self._pending_traces: dict[int, tuple[list[str], list[int]]] = {}
+        self._extra_lazy = has_lazy(self._extra)
+        # Read-only view attached to records logged without per-call extra
+        self._shared_extra = _freeze_extra(self._extra)
+        # LevelGeneration value that _cache entries were computed at
+        self._level_generation = -1
+        # Bumped on handler add/remove so consumers can cache handler lists
+        self._handler_generation = 0
+        # Sampling rule for this logger's topic, refreshed when the
+        # LogSamplingManager generation changes
+        self._sampler: TopicSampler | None = None
+        self._sampler_generation = -1
+
+    def addHandler(self, hdlr: logging.Handler) -> None:
+        """Add a handler, invalidating handler lists cached by listeners."""
+        super().addHandler(hdlr)
+        self._handler_generation += 1
+
+    def removeHandler(self, hdlr: logging.Handler) -> None:
+        """Remove a handler, invalidating handler lists cached by listeners."""
+        super().removeHandler(hdlr)
+        self._handler_generation += 1
+
     @property
     def config(self) -> ConfigLike:
         """Get logger configuration (LogConfig for root, ChildLogConfig for children)."""
@@ -119,7 +245,25 @@ class Logger(logging.Logger):
     @disabled.setter
     def disabled(self, value: bool) -> None:
         """Set the disabled state."""
+        if getattr(self, "_logging_disabled", None) == value:
+            return
         self._logging_disabled = value
+        # Descendants cache decisions that depend on this logger
+        LevelGeneration.bump()
+
+    @property  # type: ignore[override]
+    def parent(self) -> logging.Logger | None:
+        """Get parent logger."""
+        return self._parent
+
+    @parent.setter
+    def parent(self, value: logging.Logger | None) -> None:
+        """Set parent logger, invalidating cached effective levels."""
+        # _parent is unset while logging.Logger.__init__ assigns the first parent
+        if "_parent" in self.__dict__ and self.__dict__["_parent"] is value:
+            return
+        self._parent: logging.Logger | None = value
+        LevelGeneration.bump()
 
     def get_level(self) -> int | bool:
         """Get current log level."""
@@ -132,18 +276,38 @@ class Logger(logging.Logger):
         logging at this level. This enables hot-reload of log levels - when
         a parent's level changes, all descendants immediately respect it.
 
+        The combined result is cached per level in ``_cache`` and tagged with
+        the LevelGeneration it was computed at. Every level change bumps the
+        generation, so repeated (typically disabled) calls cost one integer
+        comparison and a dict lookup instead of a walk up the hierarchy.
+
         Only walks up the parent chain for loggers created by our factory
         (those with _root_logger attribute set), not for plain Python loggers.
         """
-        if not super().isEnabledFor(level):
+        if self._logging_disabled:
             return False
 
+        generation = LevelGeneration.current
+        if self._level_generation != generation:
+            self._cache.clear()  # type: ignore[attr-defined]
+            self._level_generation = generation
+
+        try:
+            return self._cache[level]  # type: ignore[attr-defined,no-any-return]
+        except KeyError:
+            pass
+
+        enabled = super().isEnabledFor(level)
+
         # Only check parent if it's one of our loggers (has _root_logger attribute)
         # This avoids interference when Logger class is used by plain logging.getLogger()
-        if self.parent and hasattr(self.parent, "_root_logger"):
-            return self.parent.isEnabledFor(level)
+        if enabled and self.parent and hasattr(self.parent, "_root_logger"):
+            enabled = self.parent.isEnabledFor(level)
 
-        return True
+        # Don't publish a result computed across a concurrent level change
+        if LevelGeneration.current == generation:
+            self._cache[level] = enabled  # type: ignore[attr-defined]
+        return enabled
 
     def setLevel(self, level: int | str) -> None:
         """Set level and clear this logger's cache.
@@ -153,8 +317,10 @@ class Logger(logging.Logger):
         custom logger hierarchy may not be registered there.
         """
         super().setLevel(level)
-        # Explicitly clear our own cache since we may not be in loggerDict
+        # Explicitly clear our own cache since we may not be in loggerDict,
+        # and invalidate descendants that cached a decision based on us
         self._cache.clear()  # type: ignore[attr-defined]
+        LevelGeneration.bump()
 
     def _validate_extra_keys(self, extra: dict[str, Any] | None) -> None:
         """Validate that extra dict doesn't contain reserved LogRecord keys.
@@ -186,14 +352,19 @@ class Logger(logging.Logger):
         return merged
 
     def _attach_infra_attrs(
-        self, record: logging.LogRecord, merged_extra: dict[str, Any]
+        self, record: logging.LogRecord, merged_extra: dict[str, Any], lazy: bool
     ) -> None:
         """Attach __infra__ prefixed attributes to record."""
         # Use setattr to avoid Python name mangling with __ prefix
         setattr(record, "__infra__extra", merged_extra)
+        if lazy:
+            # Deferred values are evaluated by the first formatter (resolve_extra)
+            setattr(record, LAZY_ATTR, True)
 
         # Read and remove trace from instance storage (set by findCaller)
         # Keyed by thread ID for thread safety
+        if not self._pending_traces:
+            return
         pending_trace = self._pending_traces.pop(threading.get_ident(), None)
         if pending_trace is not None:
             pathnames, linenos = pending_trace
@@ -213,10 +384,22 @@ class Logger(logging.Logger):
         extra: dict[str, Any] | collections.OrderedDict | None = None,
         sinfo: str | None = None,
     ) -> logging.LogRecord:
-        """Create log record with extra field handling."""
-        # Validate per-call extra keys before merging
-        self._validate_extra_keys(extra)
-        merged_extra = self._merge_extra(extra)
+        """Create log record with extra field handling.
+
+        Calls without per-call extra fields share the logger's pre-populated
+        extra mapping (validated once at init) instead of copying it, so the
+        common ``lg.info("msg")`` path allocates no extra dict. The shared
+        mapping is read-only; consumers needing changes must copy() it.
+        """
+        merged_extra: dict[str, Any] | collections.OrderedDict
+        if extra:
+            # Validate per-call extra keys before merging
+            self._validate_extra_keys(extra)
+            merged_extra = self._merge_extra(extra)
+            lazy = self._extra_lazy or has_lazy(extra)
+        else:
+            merged_extra = self._shared_extra
+            lazy = self._extra_lazy
         record = self._original_makeRecord(
             name,
             level,
@@ -229,7 +412,7 @@ class Logger(logging.Logger):
             extra=merged_extra,
             sinfo=sinfo,
         )
-        self._attach_infra_attrs(record, merged_extra)
+        self._attach_infra_attrs(record, merged_extra, lazy)
         return record
 
     def trace(self, msg: str, *args: Any, **kwargs: Any) -> None:
@@ -263,10 +446,38 @@ class Logger(logging.Logger):
             self._log(trace2_level, msg, args, **kwargs)
 
     def _log(self, level: int, msg: str, args: tuple, **kwargs: Any) -> None:  # type: ignore[override]
-        """Enhanced logging with callback support."""
+        """Enhanced logging with sampling and callback support.
+
+        Sampling rules for this logger's topic are applied first, so a
+        suppressed record never reaches findCaller or makeRecord.
+        """
         if self._logging_disabled:
             return
 
+        if self._sampler_generation != LogSamplingManager.generation:
+            self._refresh_sampler()
+        sampler = self._sampler
+        if sampler is not None:
+            summary = sampler.take_summary()
+            if summary is not None:
+                # Fixed level, so the summary does not depend on which call
+                # happened to trigger it
+                self._dispatch(logging.INFO, SUMMARY_MESSAGE, (), extra=summary)
+            if not sampler.admit():
+                return
+
+        self._dispatch(level, msg, args, **kwargs)
+
+    def _refresh_sampler(self) -> None:
+        """Look up the sampling rule for this logger's topic."""
+        generation = LogSamplingManager.generation
+        self._sampler = LogSamplingManager.get_instance().get_sampler(self.name)
+        self._sampler_generation = generation
+
+    def _dispatch(self, level: int, msg: str, args: tuple, **kwargs: Any) -> None:
+        """Create and handle a record, then trigger callbacks."""
+        if LogMetrics.enabled:
+            LogMetrics.get_instance().count_record(self.name)
         try:
             super()._log(level, msg, args, **kwargs)
         except ReservedKeyError:
@@ -288,7 +499,8 @@ class Logger(logging.Logger):
             # Only report unexpected errors
             sys.stderr.write(f"CRITICAL: Logger failed - unable to log {msg}: {e}\n")
 
-        self._callbacks.trigger(level, self, msg, args, kwargs)
+        if self._callbacks.active:
+            self._callbacks.trigger(level, self, msg, args, kwargs)
 
     def is_logged(self, level: int) -> bool:
         """Check if a level would be logged."""
@@ -303,8 +515,12 @@ class Logger(logging.Logger):
         For derived "view" loggers (those with _root_logger set), delegate to
         the root logger's handlers instead of using our own. This allows derived
         loggers to share handlers with the root without duplicating them.
+
+        While LogMetrics is enabled, each handler call is timed.
         """
-        if self._root_logger is not None:
+        if LogMetrics.enabled:
+            self._call_handlers_timed(record)
+        elif self._root_logger is not None:
             # Derived logger - use root's handlers
             for handler in self._root_logger.handlers:
                 if record.levelno >= handler.level:
@@ -313,6 +529,29 @@ class Logger(logging.Logger):
             # Root logger - standard behavior
             super().callHandlers(record)
 
+    def _call_handlers_timed(self, record: logging.LogRecord) -> None:
+        """Pass a record to all relevant handlers, recording emit latency."""
+        metrics = LogMetrics.get_instance()
+        if self._root_logger is not None:
+            for handler in self._root_logger.handlers:
+                if record.levelno >= handler.level:
+                    metrics.handle(handler, record)
+            return
+
+        # Mirrors logging.Logger.callHandlers
+        found = 0
+        logger: logging.Logger | None = self
+        while logger is not None:
+            for handler in logger.handlers:
+                found += 1
+                if record.levelno >= handler.level:
+                    metrics.handle(handler, record)
+            logger = logger.parent if logger.propagate else None
+        if found == 0:
+            last_resort = logging.lastResort
+            if last_resort is not None and record.levelno >= last_resort.level:
+                metrics.handle(last_resort, record)
+
     def findCaller(
         self, stack_info: bool = False, stacklevel: int = 1
     ) -> tuple[str, int, str, str | None]:
@@ -320,27 +559,51 @@ class Logger(logging.Logger):
         Override to support multiple caller tracking while returning standard types.
 
         Returns standard (pathname, lineno, funcname, sinfo) for compatibility with
-        external formatters. Full trace is stored in _pending_traces (keyed by thread ID)
-        and attached to the record in _makeRecord as __infra__pathnames and __infra__linenos.
-        """
-        from types import FrameType
+        external formatters. With location > 1 the full trace is stored in
+        _pending_traces (keyed by thread ID) and attached to the record in
+        _makeRecord as __infra__pathnames and __infra__linenos.
 
-        f: FrameType | None = logging.currentframe()
-        while f is not None and f.f_code is not None:
-            fname = f.f_code.co_filename
-            if fname == logging.__file__ or fname == __file__:
-                f = f.f_back
-            else:
-                break
+        Skips the frame walk entirely when location is 0 and no handler that
+        would receive the record renders caller info.
+        """
+        if not self._needs_caller():
+            return _UNKNOWN_CALLER
 
+        f = self._caller_frame()
         if f is None:
-            return "(unknown file)", 0, "(unknown function)", None
+            return _UNKNOWN_CALLER
+
+        code = f.f_code
+        if self.location > 1:
+            files, linenos = self._trace_callers(f)
+            # Store full trace keyed by thread ID for thread-safe access in _makeRecord
+            self._pending_traces[threading.get_ident()] = (files, linenos)
+        # Single location is rendered from the record's pathname/lineno
+        return code.co_filename, f.f_lineno, code.co_name, None
+
+    def _needs_caller(self) -> bool:
+        """Check if caller info is displayed or may be rendered by a handler."""
+        if self.location:
+            return True
+        if self._root_logger is not None:
+            # Derived logger - records only go to root's handlers
+            return _handlers_need_caller(self._root_logger.handlers)
+
+        logger: logging.Logger | None = self
+        while logger is not None:
+            if _handlers_need_caller(logger.handlers):
+                return True
+            if not logger.propagate:
+                break
+            logger = logger.parent
+        return False
 
-        files, linenos = self._trace_callers(f)
-        # Store full trace keyed by thread ID for thread-safe access in _makeRecord
-        self._pending_traces[threading.get_ident()] = (files, linenos)
-        # Return standard types (first element) for external formatter compatibility
-        return files[0], linenos[0], f.f_code.co_name, None
+    def _caller_frame(self) -> FrameType | None:
+        """Find the first frame outside logging and this module."""
+        f: FrameType | None = sys._getframe(2)
+        while f is not None and f.f_code in _INTERNAL_CODES:
+            f = f.f_back
+        return f
 
     def _trace_callers(self, f: Any) -> tuple[list[str], list[int]]:
         """Trace multiple callers for location display."""
@@ -371,6 +634,8 @@ class Logger(logging.Logger):
         queue: Any,
         name: str,
         level: int | str = logging.INFO,
+        batch_size: int = 1,
+        flush_interval: float = 0.05,
     ) -> Self:
         """
         Create a logger that sends records to a queue for cross-process logging.
@@ -382,6 +647,8 @@ class Logger(logging.Logger):
             queue: multiprocessing.Queue to send records to
             name: Logger name
             level: Log level (default INFO)
+            batch_size: Records per queue message (1 disables batching)
+            flush_interval: Maximum seconds a record waits in a partial batch
 
         Returns:
             Logger configured with MPQueueHandler
@@ -404,14 +671,18 @@ class Logger(logging.Logger):
         logger.setLevel(level)
 
         # Add queue handler
-        handler = MPQueueHandler(queue)
+        handler = MPQueueHandler(
+            queue, batch_size=batch_size, flush_interval=flush_interval
+        )
         handler.setLevel(level)
         logger.addHandler(handler)
 
         logger.propagate = False
         return logger
 
-    def queue_config(self, queue: Any) -> dict[str, Any]:
+    def queue_config(
+        self, queue: Any, batch_size: int = 1, flush_interval: float = 0.05
+    ) -> dict[str, Any]:
         """
         Create configuration dict for subprocess loggers.
 
@@ -420,9 +691,13 @@ class Logger(logging.Logger):
         - The queue for sending records
         - The base log level
         - LogLevelManager rules for pattern-based level filtering
+        - LogSamplingManager rules for per-topic sampling and rate limits
+        - Batching options for the worker's MPQueueHandler
 
         Args:
             queue: multiprocessing.Queue for sending records to parent
+            batch_size: Records per queue message (1 disables batching)
+            flush_interval: Maximum seconds a record waits in a partial batch
 
         Returns:
             Dict suitable for Logger.from_queue_config()
@@ -449,6 +724,9 @@ class Logger(logging.Logger):
             "queue": queue,
             "level": self.level,
             "level_rules": level_manager.to_dict(),
+            "sampling_rules": LogSamplingManager.get_instance().to_dict(),
+            "batch_size": batch_size,
+            "flush_interval": flush_interval,
         }
 
     @classmethod
@@ -481,6 +759,8 @@ class Logger(logging.Logger):
         level_manager = LogLevelManager.get_instance()
         if "level_rules" in config:
             level_manager.from_dict(config["level_rules"])
+        if "sampling_rules" in config:
+            LogSamplingManager.get_instance().from_dict(config["sampling_rules"])
 
         # Determine effective level: pattern match or fallback to base level
         effective_level = level_manager.get_effective_level(name)
@@ -491,4 +771,10 @@ class Logger(logging.Logger):
             queue=config["queue"],
             name=name,
             level=effective_level,
+            batch_size=config.get("batch_size", 1),
+            flush_interval=config.get("flush_interval", 0.05),
         )
+
+
+# Code objects of stdlib logging and this module, skipped when finding the caller
+_INTERNAL_CODES = _collect_codes(logging, sys.modules[__name__])
@@ -38,6 +38,13 @@ Queue Mode Usage:
 
         logger.info("Hello from subprocess")  # Sent to parent via queue
 
+Shared-Memory Transport:
+    # Pass a SharedMemoryRing anywhere a log queue is accepted
+    from . import SharedMemoryRing
+
+    log_queue = SharedMemoryRing(capacity=4 * 1024 * 1024, overflow="block")
+    listener = LogQueueListener(log_queue, parent_logger)
+
 Independent Mode Usage:
     # Parent process
     from .. import LoggingBuilder
@@ -52,8 +59,10 @@ Independent Mode Usage:
 
 from .queue_handler import MPQueueHandler
 from .queue_listener import LogQueueListener
+from .ring import SharedMemoryRing
 
 __all__ = [
     "MPQueueHandler",
     "LogQueueListener",
+    "SharedMemoryRing",
 ]
@@ -0,0 +1,123 @@
+"""
+Compact record encoding for cross-process logging.
+
+Pickling a full LogRecord sends its whole ``__dict__`` (args, exc_info,
+filename, module, msecs, relativeCreated, ...) for every record. In batched
+mode MPQueueHandler sends plain tuples carrying only the fields formatters
+need; the listener rebuilds LogRecords from them. Within a pickled batch,
+repeated strings such as logger names and pathnames are sent once.
+
+Record attributes outside RECORD_FIELDS (for example stdlib ``extra=`` keys
+set directly on the record) are not carried. appinfra loggers keep extra
+fields in ``__infra__extra``, which is.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from functools import lru_cache
+from typing import Any
+
+# Wire order of encoded fields
+RECORD_FIELDS = (
+    "name",
+    "levelno",
+    "msg",
+    "created",
+    "pathname",
+    "lineno",
+    "funcName",
+    "process",
+    "processName",
+    "thread",
+    "threadName",
+    "exc_text",
+    "stack_info",
+    "__infra__extra",
+    "__infra__pathnames",
+    "__infra__linenos",
+)
+
+# Reference for relativeCreated of decoded records (logging's own start time is
+# private and changed units in Python 3.13)
+_START_TIME = time.time()
+
+# Fields only present on a LogRecord when set
+_OPTIONAL_FIELDS = ("__infra__extra", "__infra__pathnames", "__infra__linenos")
+
+EncodedRecord = tuple[Any, ...]
+
+
+def encode_record(record: logging.LogRecord) -> EncodedRecord:
+    """
+    Encode a prepared record (see MPQueueHandler._prepare) as a tuple.
+
+    Args:
+        record: Log record with message rendered and exc_info formatted
+
+    Returns:
+        Tuple of field values in RECORD_FIELDS order
+    """
+    d = record.__dict__
+    return (
+        record.name,
+        record.levelno,
+        record.msg,
+        record.created,
+        record.pathname,
+        record.lineno,
+        record.funcName,
+        record.process,
+        record.processName,
+        record.thread,
+        record.threadName,
+        record.exc_text,
+        record.stack_info,
+        d.get("__infra__extra"),
+        d.get("__infra__pathnames"),
+        d.get("__infra__linenos"),
+    )
+
+
+@lru_cache(maxsize=1024)
+def _path_parts(pathname: str) -> tuple[str, str]:
+    """Derive (filename, module) from a pathname as LogRecord does."""
+    try:
+        filename = os.path.basename(pathname)
+        return filename, os.path.splitext(filename)[0]
+    except (TypeError, ValueError, AttributeError):
+        return pathname, "Unknown module"
+
+
+def decode_record(fields: EncodedRecord) -> logging.LogRecord:
+    """
+    Rebuild a LogRecord from an encoded tuple.
+
+    Derived attributes (levelname, filename, module, msecs, relativeCreated)
+    are recomputed; relativeCreated is measured from when this module was
+    imported in the listener process. args and exc_info are None as on a
+    prepared record.
+
+    Args:
+        fields: Tuple produced by encode_record()
+
+    Returns:
+        LogRecord equivalent to the prepared record that was encoded
+    """
+    record = logging.LogRecord.__new__(logging.LogRecord)
+    d = record.__dict__
+    d.update(zip(RECORD_FIELDS, fields))
+    for key in _OPTIONAL_FIELDS:
+        if d[key] is None:
+            del d[key]
+
+    created = d["created"]
+    d["args"] = None
+    d["exc_info"] = None
+    d["levelname"] = logging.getLevelName(d["levelno"])
+    d["filename"], d["module"] = _path_parts(d["pathname"])
+    d["msecs"] = int((created - int(created)) * 1000) + 0.0
+    d["relativeCreated"] = (created - _START_TIME) * 1000
+    return record
@@ -4,15 +4,31 @@ Multiprocessing-safe queue handler for appinfra logging.
 This module provides a QueueHandler that properly serializes log records
 for cross-process communication, handling exceptions and custom attributes
 that are not picklable.
+
+With batch_size > 1 records are sent in the compact encoding from codec.py,
+as lists of up to batch_size records, cutting per-record pickling and queue
+overhead when many workers log concurrently.
 """
 
 from __future__ import annotations
 
 import logging
+import multiprocessing.util
+import queue as queue_module
 import sys
 import traceback
+import weakref
 from typing import TYPE_CHECKING, Any
 
+from ..errors import LogConfigError
+from ..flush_timer import schedule_flush
+from ..lazy import resolve_extra
+from ..metrics import LogMetrics
+from .codec import EncodedRecord, encode_record
+
+# Extra values that never need sanitizing before pickling
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
 if TYPE_CHECKING:
     from multiprocessing import Queue as QueueType
 
@@ -34,17 +50,48 @@ class MPQueueHandler(logging.Handler):
         queue = Queue()
         handler = MPQueueHandler(queue)
         logger.addHandler(handler)
+
+    Batching:
+        With batch_size > 1, encoded records are collected and sent as one
+        list when the batch is full, when flush_interval seconds have passed
+        since the first record of the batch, when an ERROR+ record is logged,
+        or on flush()/close(). Pending records are also sent when a
+        multiprocessing worker exits.
     """
 
-    def __init__(self, queue: QueueType[logging.LogRecord | None]) -> None:
+    def __init__(
+        self,
+        queue: QueueType[Any],
+        batch_size: int = 1,
+        flush_interval: float = 0.05,
+    ) -> None:
         """
         Initialize the queue handler.
 
         Args:
             queue: multiprocessing.Queue to send records to
+            batch_size: Records per queue message; 1 sends each LogRecord
+                        as-is (default), larger values send encoded batches
+            flush_interval: Maximum seconds a record waits in a partial batch
+
+        Raises:
+            LogConfigError: If batch_size is less than 1
         """
+        if batch_size < 1:
+            raise LogConfigError(f"batch_size must be positive, got {batch_size}")
         super().__init__()
         self.queue = queue
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._batch: list[EncodedRecord] = []
+        self._dropped = 0  # Records lost to a full queue
+        LogMetrics.register_source("mp_queue_handler", self)
+        if batch_size > 1:
+            # Worker processes exit via os._exit, which skips logging.shutdown;
+            # run before the queue's own finalizer (priority 10) closes it
+            multiprocessing.util.Finalize(
+                self, _flush_if_alive, args=(weakref.ref(self),), exitpriority=20
+            )
 
     def emit(self, record: logging.LogRecord) -> None:
         """
@@ -55,17 +102,73 @@ class MPQueueHandler(logging.Handler):
         """
         try:
             prepared = self._prepare(record)
-            self.queue.put_nowait(prepared)
+            if self.batch_size == 1:
+                self._put(prepared, 1)
+            else:
+                self._add_to_batch(prepared)
         except Exception:
             self.handleError(record)
 
+    def _add_to_batch(self, record: logging.LogRecord) -> None:
+        """Append an encoded record, sending the batch when a trigger is hit."""
+        batch = self._batch
+        batch.append(encode_record(record))
+        if len(batch) >= self.batch_size or record.levelno >= logging.ERROR:
+            self._send_batch()
+        elif len(batch) == 1 and self.flush_interval > 0:
+            schedule_flush(self, self.flush_interval)
+
+    def _send_batch(self) -> None:
+        """Put the pending batch on the queue (caller holds the lock)."""
+        if self._batch:
+            batch, self._batch = self._batch, []
+            self._put(batch, len(batch))
+
+    def _put(self, item: Any, records: int) -> None:
+        """Put an item on the queue, counting its records as dropped if full."""
+        try:
+            self.queue.put_nowait(item)
+        except queue_module.Full:
+            self._dropped += records
+            raise
+
+    def flush(self) -> None:
+        """Send any partially filled batch."""
+        self.acquire()
+        try:
+            self._send_batch()
+        except Exception:
+            pass  # Queue closed or full; nothing left to deliver to
+        finally:
+            self.release()
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get handler metrics.
+
+        Returns:
+            Dictionary with records waiting in the partial batch, records
+            dropped because the queue was full, and the queue depth (None if
+            the queue cannot report it)
+        """
+        try:
+            depth: int | None = self.queue.qsize()
+        except (NotImplementedError, AttributeError):
+            depth = None  # qsize() is unavailable on macOS
+        return {
+            "pending": len(self._batch),
+            "dropped": self._dropped,
+            "queue_depth": depth,
+        }
+
     def _prepare(self, record: logging.LogRecord) -> logging.LogRecord:
         """
         Prepare a record for cross-process pickling.
 
         This method:
         1. Formats exception tracebacks to strings (tracebacks aren't picklable)
-        2. Handles exception objects in __infra__extra
+        2. Evaluates deferred values and handles exception objects in
+           __infra__extra
         3. Formats message arguments into the message string
 
         Args:
@@ -96,7 +199,8 @@ class MPQueueHandler(logging.Handler):
         """
         Prepare __infra__extra dict for pickling.
 
-        Converts exception objects to formatted strings. Handles:
+        Evaluates deferred (lazy) values, then converts exception objects to
+        formatted strings. Handles:
         - The standard "exception" key (renamed to "exception_formatted")
         - Any other keys containing exceptions (converted in-place)
         - Nested dicts, lists, tuples, and sets containing exceptions
@@ -105,9 +209,13 @@ class MPQueueHandler(logging.Handler):
         Args:
             record: Log record to modify in place
         """
-        extra = getattr(record, "__infra__extra", None)
+        extra = resolve_extra(record)
         if extra is None:
             return
+        if isinstance(extra, dict) and all(
+            type(value) in _SCALAR_TYPES for value in extra.values()
+        ):
+            return
 
         # Recursively sanitize to handle exceptions anywhere in the structure
         extra = self._sanitize_for_pickle(extra, set())
@@ -202,9 +310,17 @@ class MPQueueHandler(logging.Handler):
         return f"{exc.__class__.__name__}: {exc}"
 
     def close(self) -> None:
-        """Close the handler."""
+        """Send any pending batch and close the handler."""
         self.acquire()
         try:
+            self.flush()
             super().close()
         finally:
             self.release()
+
+
+def _flush_if_alive(ref: weakref.ref[MPQueueHandler]) -> None:
+    """Flush a handler at process exit if it has not been collected."""
+    handler = ref()
+    if handler is not None:
+        handler.flush()
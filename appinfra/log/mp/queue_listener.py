@@ -3,15 +3,23 @@ Queue listener for receiving log records from subprocesses.
 
 This module provides a listener that runs in the parent process, receiving
 log records from subprocess queue handlers and dispatching them to the
-parent's logging handlers.
+parent's logging handlers. Both single LogRecords and encoded batches (see
+MPQueueHandler batch_size) are accepted on the same queue.
 """
 
 from __future__ import annotations
 
 import logging
 import queue
+import sys
 import threading
-from typing import TYPE_CHECKING
+import time
+import traceback
+from typing import TYPE_CHECKING, Any
+
+from ..metrics import LogMetrics
+from .codec import decode_record
+from .ring import SharedMemoryRing
 
 if TYPE_CHECKING:
     from multiprocessing import Queue as QueueType
@@ -38,6 +46,12 @@ class LogQueueListener:
 
         listener.stop()
 
+    Drain Mode:
+        By default each wakeup pulls every available item (up to max_batch
+        records) before dispatching. Handlers with a ``handle_batch(records)``
+        method receive the whole batch in one call; others get one handle()
+        call per record. stats() reports throughput and lag.
+
     Thread Safety:
         The listener runs in its own daemon thread. It's safe to call
         start() and stop() from any thread.
@@ -45,9 +59,11 @@ class LogQueueListener:
 
     def __init__(
         self,
-        log_queue: QueueType[logging.LogRecord | None],
+        log_queue: QueueType[Any],
         logger: Logger,
         respect_handler_level: bool = True,
+        drain: bool = True,
+        max_batch: int = 1000,
     ) -> None:
         """
         Initialize the queue listener.
@@ -57,13 +73,29 @@ class LogQueueListener:
             logger: Logger whose handlers will process the records
             respect_handler_level: If True, only dispatch to handlers whose
                                    level is <= record level (default True)
+            drain: Pull all available items per wakeup (default True)
+            max_batch: Maximum records dispatched per wakeup in drain mode
         """
         self._queue = log_queue
         self._logger = logger
         self._respect_handler_level = respect_handler_level
+        self._drain = drain
+        self._max_batch = max_batch
         self._thread: threading.Thread | None = None
         self._stop_event = threading.Event()
 
+        # Handler list cache, keyed by the owner's handler generation and count
+        self._handlers: tuple[logging.Handler, ...] = ()
+        self._handlers_key: tuple[Any, int] | None = None
+        self._batch_capable = False
+
+        # Metrics
+        self._records = 0
+        self._batches = 0
+        self._lag_last = 0.0
+        self._lag_max = 0.0
+        LogMetrics.register_source("queue_listener", self)
+
     def start(self) -> None:
         """
         Start the listener thread.
@@ -83,7 +115,9 @@ class LogQueueListener:
         Stop the listener thread gracefully.
 
         Sends a sentinel value to unblock the queue.get() and waits for
-        the thread to finish.
+        the thread to finish. A SharedMemoryRing transport is released once
+        the thread has exited; if it is still running after the timeout the
+        ring is left mapped (call stop() again to retry).
 
         Args:
             timeout: Maximum seconds to wait for thread to finish
@@ -98,35 +132,128 @@ class LogQueueListener:
 
         if self._thread is not None:
             self._thread.join(timeout)
+            if self._thread.is_alive():
+                # Unmapping the ring under a running consumer would crash it
+                sys.stderr.write(
+                    "LogQueueListener: thread did not stop within "
+                    f"{timeout}s; shared memory ring not released\n"
+                )
+                return
             self._thread = None
 
+        # The listener is the ring's only consumer; free the shared memory
+        if isinstance(self._queue, SharedMemoryRing):
+            self._queue.release()
+
     def _listen(self) -> None:
         """
         Main listener loop - runs in background thread.
 
         Continuously reads from the queue and dispatches records to handlers.
-        Exits when stop_event is set and sentinel is received.
+        Exits on the sentinel, or once stop_event is set and the queue is
+        empty.
         """
-        while not self._stop_event.is_set():
+        while True:
             try:
-                record = self._queue.get(timeout=0.5)
-
-                # None is the sentinel for shutdown
-                if record is None:
+                records, done = self._receive()
+                if records:
+                    self._dispatch(records)
+                if done:
                     break
 
-                self._handle_record(record)
-
             except queue.Empty:
-                continue
+                if self._stop_event.is_set():
+                    break
             except Exception:
                 # Don't let listener thread die from unexpected errors
-                import sys
-                import traceback
-
                 sys.stderr.write("LogQueueListener: error handling record:\n")
                 traceback.print_exc(file=sys.stderr)
 
+    def _receive(self) -> tuple[list[logging.LogRecord], bool]:
+        """
+        Wait for the next item, then drain available items in drain mode.
+
+        Returns:
+            Received records (encoded batches decoded) and whether the
+            shutdown sentinel was seen
+
+        Raises:
+            queue.Empty: If nothing arrived within the poll timeout
+        """
+        records: list[logging.LogRecord] = []
+        item = self._queue.get(timeout=0.5)
+        while True:
+            # None is the sentinel for shutdown
+            if item is None:
+                return records, True
+            if type(item) is list:
+                records.extend(map(decode_record, item))
+            else:
+                records.append(item)
+            if not self._drain or len(records) >= self._max_batch:
+                return records, False
+            try:
+                item = self._queue.get(False)
+            except queue.Empty:
+                return records, False
+
+    def _dispatch(self, records: list[logging.LogRecord]) -> None:
+        """
+        Dispatch received records and update lag metrics.
+
+        Args:
+            records: Records from one wakeup, in queue order
+        """
+        lag = time.time() - min(record.created for record in records)
+        self._lag_last = lag
+        self._lag_max = max(self._lag_max, lag)
+        self._records += len(records)
+        self._batches += 1
+
+        handlers = self._get_handlers()
+        if not self._batch_capable or len(records) == 1:
+            for record in records:
+                self._handle_record(record)
+            return
+        for handler in handlers:
+            self._handle_batch(handler, records)
+
+    def _handle_batch(
+        self, handler: logging.Handler, records: list[logging.LogRecord]
+    ) -> None:
+        """
+        Pass records to one handler, as a batch if it supports handle_batch.
+
+        Args:
+            handler: Target handler
+            records: Records to dispatch, in queue order
+        """
+        if self._respect_handler_level:
+            records = [r for r in records if r.levelno >= handler.level]
+        metrics = LogMetrics.get_instance() if LogMetrics.enabled else None
+        handle_batch = getattr(handler, "handle_batch", None)
+        if handle_batch is None:
+            for record in records:
+                try:
+                    if metrics is None:
+                        handler.handle(record)
+                    else:
+                        metrics.handle(handler, record)
+                except Exception:
+                    handler.handleError(record)
+        elif records:
+            start = time.perf_counter()
+            try:
+                handle_batch(records)
+            except Exception:
+                sys.stderr.write("LogQueueListener: error in handle_batch:\n")
+                traceback.print_exc(file=sys.stderr)
+            finally:
+                if metrics is not None:
+                    count = len(records)
+                    elapsed = time.perf_counter() - start
+                    metrics.observe_emit(handler, elapsed / count, count)
+
     def _handle_record(self, record: logging.LogRecord) -> None:
         """
         Dispatch a record to the logger's handlers.
@@ -137,28 +264,64 @@ class LogQueueListener:
         # Use logger.handle() which respects the logger's level and calls handlers
         # But we want to use the logger's handlers directly to avoid level filtering
         # since the record was already filtered in the subprocess
+        metrics = LogMetrics.get_instance() if LogMetrics.enabled else None
         for handler in self._get_handlers():
             if self._respect_handler_level:
                 if record.levelno < handler.level:
                     continue
             try:
-                handler.handle(record)
+                if metrics is None:
+                    handler.handle(record)
+                else:
+                    metrics.handle(handler, record)
             except Exception:
                 handler.handleError(record)
 
-    def _get_handlers(self) -> list[logging.Handler]:
+    def _get_handlers(self) -> tuple[logging.Handler, ...]:
         """
         Get handlers to dispatch to.
 
         For view loggers (those with _root_logger), uses the root's handlers.
+        The handler tuple is cached until the owning Logger's handlers are
+        added or removed (or the list length changes).
 
         Returns:
-            List of handlers to use
+            Handlers to use
+        """
+        owner = getattr(self._logger, "_root_logger", None)
+        if owner is None:
+            owner = self._logger
+        handlers = owner.handlers
+        generation = getattr(owner, "_handler_generation", None)
+        key = (generation, len(handlers))
+        if key != self._handlers_key or type(generation) is not int:
+            self._handlers = tuple(handlers)
+            self._batch_capable = any(
+                hasattr(h, "handle_batch") for h in self._handlers
+            )
+            self._handlers_key = key
+        return self._handlers
+
+    def stats(self) -> dict[str, Any]:
         """
-        root = getattr(self._logger, "_root_logger", None)
-        if root is not None:
-            return list(root.handlers)
-        return list(self._logger.handlers)
+        Get listener metrics.
+
+        Returns:
+            Dictionary with records and batches dispatched, current queue
+            depth (None if the queue cannot report it), and the age in
+            seconds of the oldest record in the last and slowest batch
+        """
+        try:
+            depth: int | None = self._queue.qsize()
+        except (NotImplementedError, AttributeError):
+            depth = None  # qsize() is unavailable on macOS
+        return {
+            "records": self._records,
+            "batches": self._batches,
+            "queue_depth": depth,
+            "lag_last": self._lag_last,
+            "lag_max": self._lag_max,
+        }
 
     @property
     def is_alive(self) -> bool:
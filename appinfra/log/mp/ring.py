@@ -0,0 +1,305 @@
+"""
+Shared-memory ring buffer transport for cross-process logging.
+
+multiprocessing.Queue pickles each item on a feeder thread and copies it
+through a pipe, waking the reader with a syscall per message. This module
+provides a queue-compatible transport that writes pickled items straight into
+a ``multiprocessing.shared_memory`` block shared by all processes:
+
+- Any number of producer processes append length-prefixed messages under a
+  process-shared lock (MPSC; a single producer is the SPSC case)
+- The single consumer (LogQueueListener) drains every available message per
+  wakeup and is woken by a semaphore only when it is waiting on an empty ring
+- Messages wrap around the end of the buffer transparently
+- When the ring is full, ``overflow="drop_new"`` counts and discards the
+  message and ``overflow="block"`` waits for the consumer to free space
+
+Usage:
+    ring = SharedMemoryRing(capacity=4 * 1024 * 1024)
+    listener = LogQueueListener(ring, parent_logger)
+    listener.start()
+
+    worker_config = parent_logger.queue_config(ring, batch_size=256)
+    # ... workers call Logger.from_queue_config(worker_config, name=...) ...
+
+    listener.stop()  # also releases the shared memory
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import pickle
+import queue
+import struct
+import time
+from collections import deque
+from multiprocessing import shared_memory
+from multiprocessing.context import BaseContext
+from typing import Any
+
+from ..errors import LogConfigError
+
+RING_OVERFLOW_POLICIES = ("drop_new", "block")
+
+# Header slots (unsigned 64-bit): write position, read position, dropped
+# message count, consumer-waiting flag, closed flag, messages written and
+# read. Positions only grow; the buffer offset is position % capacity.
+_U64 = struct.Struct("Q")
+_HEAD, _TAIL, _DROPPED, _WAITING, _CLOSED, _WRITTEN, _READ = range(0, 56, 8)
+_DATA = 64
+
+_LEN = struct.Struct("I")
+
+# Producer poll interval while blocked on a full ring
+_BLOCK_POLL = 0.0005
+
+
+class SharedMemoryRing:
+    """
+    Multi-producer, single-consumer ring buffer in shared memory.
+
+    Implements the subset of the multiprocessing.Queue API used by
+    MPQueueHandler (put_nowait) and LogQueueListener (get), so it can be
+    passed anywhere a log queue is accepted, including Logger.with_queue()
+    and Logger.queue_config().
+
+    Like multiprocessing.Queue, a ring is shared with child processes by
+    passing it as a Process argument (or inheriting it on fork).
+    """
+
+    def __init__(
+        self,
+        capacity: int = 4 * 1024 * 1024,
+        overflow: str = "drop_new",
+        ctx: BaseContext | None = None,
+    ) -> None:
+        """
+        Create the shared memory block and synchronization primitives.
+
+        Args:
+            capacity: Size of the message area in bytes
+            overflow: Policy when the ring is full (see RING_OVERFLOW_POLICIES)
+            ctx: multiprocessing context for the lock and semaphore
+
+        Raises:
+            LogConfigError: If capacity or overflow is invalid
+        """
+        if overflow not in RING_OVERFLOW_POLICIES:
+            raise LogConfigError(
+                f"Invalid overflow policy: {overflow!r} "
+                f"(expected one of {', '.join(RING_OVERFLOW_POLICIES)})"
+            )
+        if capacity < 1024:
+            raise LogConfigError(f"capacity must be at least 1024, got {capacity}")
+        ctx = ctx or multiprocessing.get_context()
+        self.capacity = capacity
+        self.overflow = overflow
+        self._shm = shared_memory.SharedMemory(create=True, size=_DATA + capacity)
+        self._owner_pid: int | None = os.getpid()
+        self._lock = ctx.Lock()
+        self._doorbell = ctx.Semaphore(0)
+        self._attach()
+        self._buf[:_DATA] = bytes(_DATA)
+
+    def _attach(self) -> None:
+        """Initialize per-process state for the mapped block."""
+        buf = self._shm.buf
+        assert buf is not None  # Only None after close()
+        # Invalid once released; every accessor checks _released first
+        self._buf: memoryview = buf
+        self._pending: deque[Any] = deque()
+        self._released = False
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Pickle for a child process (only allowed while spawning)."""
+        multiprocessing.context.assert_spawning(self)
+        return {
+            "name": self._shm.name,
+            "capacity": self.capacity,
+            "overflow": self.overflow,
+            "lock": self._lock,
+            "doorbell": self._doorbell,
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Attach to the parent's shared memory block by name."""
+        self.capacity = state["capacity"]
+        self.overflow = state["overflow"]
+        self._lock = state["lock"]
+        self._doorbell = state["doorbell"]
+        self._shm = shared_memory.SharedMemory(name=state["name"])
+        self._owner_pid = None
+        self._attach()
+
+    # -------------------------------------------------------------------------
+    # Producer side
+    # -------------------------------------------------------------------------
+
+    def put_nowait(self, obj: Any) -> None:
+        """
+        Append an item, applying the overflow policy if the ring is full.
+
+        Never raises on a full ring: dropped items are counted in stats().
+        Items larger than the ring are always dropped.
+
+        Args:
+            obj: Picklable item
+        """
+        if self._released:
+            return
+        record = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+        size = _LEN.size + len(record)
+        while not self._try_write(record, size):
+            if self._released:
+                return
+            if self.overflow != "block" or size > self.capacity or self._closed():
+                self._count_drop()
+                return
+            time.sleep(_BLOCK_POLL)
+
+    def _try_write(self, record: bytes, size: int) -> bool:
+        """Write a length-prefixed record if it fits; wake a waiting consumer."""
+        buf = self._buf
+        with self._lock:
+            head = _U64.unpack_from(buf, _HEAD)[0]
+            tail = _U64.unpack_from(buf, _TAIL)[0]
+            if head - tail + size > self.capacity:
+                return False
+            self._copy_in(head, _LEN.pack(len(record)))
+            self._copy_in(head + _LEN.size, record)
+            _U64.pack_into(buf, _HEAD, head + size)
+            _U64.pack_into(buf, _WRITTEN, _U64.unpack_from(buf, _WRITTEN)[0] + 1)
+            if _U64.unpack_from(buf, _WAITING)[0]:
+                _U64.pack_into(buf, _WAITING, 0)
+                self._doorbell.release()
+        return True
+
+    def _copy_in(self, pos: int, data: bytes) -> None:
+        """Copy data into the ring at a position, wrapping at the end."""
+        offset = pos % self.capacity
+        first = min(len(data), self.capacity - offset)
+        self._buf[_DATA + offset : _DATA + offset + first] = data[:first]
+        if first < len(data):
+            self._buf[_DATA : _DATA + len(data) - first] = data[first:]
+
+    def _count_drop(self) -> None:
+        """Increment the shared dropped-message counter."""
+        with self._lock:
+            dropped = _U64.unpack_from(self._buf, _DROPPED)[0]
+            _U64.pack_into(self._buf, _DROPPED, dropped + 1)
+
+    def _closed(self) -> bool:
+        """Check if the consumer has released the ring."""
+        return bool(_U64.unpack_from(self._buf, _CLOSED)[0])
+
+    # -------------------------------------------------------------------------
+    # Consumer side
+    # -------------------------------------------------------------------------
+
+    def get(self, block: bool = True, timeout: float | None = None) -> Any:
+        """
+        Remove and return the next item.
+
+        Args:
+            block: Wait for an item if the ring is empty
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            Next item in write order
+
+        Raises:
+            queue.Empty: If no item arrived in time
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self._pending:
+            if self._released:
+                raise queue.Empty
+            if self._drain():
+                continue
+            if not block:
+                raise queue.Empty
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                raise queue.Empty
+            self._doorbell.acquire(timeout=remaining)
+        return self._pending.popleft()
+
+    def _drain(self) -> bool:
+        """
+        Decode every available message into the local pending queue.
+
+        Returns:
+            True if any messages were read; False after flagging the consumer
+            as waiting for the next write
+        """
+        buf = self._buf
+        with self._lock:
+            head, pos = struct.unpack_from("QQ", buf, _HEAD)
+            written = _U64.unpack_from(buf, _WRITTEN)[0]
+            if head == pos:
+                _U64.pack_into(buf, _WAITING, 1)
+                return False
+        try:
+            while pos < head:
+                length = _LEN.unpack(self._copy_out(pos, _LEN.size))[0]
+                pos += _LEN.size
+                self._pending.append(pickle.loads(self._copy_out(pos, length)))
+                pos += length
+        finally:
+            with self._lock:
+                _U64.pack_into(buf, _TAIL, head)
+                _U64.pack_into(buf, _READ, written)
+        return True
+
+    def _copy_out(self, pos: int, length: int) -> bytes | memoryview:
+        """Read length bytes at a position, wrapping at the end."""
+        offset = pos % self.capacity
+        end = offset + length
+        if end <= self.capacity:
+            return self._buf[_DATA + offset : _DATA + end]
+        first = self.capacity - offset
+        return bytes(self._buf[_DATA + offset : _DATA + self.capacity]) + bytes(
+            self._buf[_DATA : _DATA + length - first]
+        )
+
+    # -------------------------------------------------------------------------
+    # Lifecycle and stats
+    # -------------------------------------------------------------------------
+
+    def qsize(self) -> int:
+        """Get the number of items written but not yet returned by get()."""
+        if self._released:
+            return 0
+        with self._lock:
+            counts: tuple[int, int] = struct.unpack_from("QQ", self._buf, _WRITTEN)
+        return counts[0] - counts[1] + len(self._pending)
+
+    def stats(self) -> dict[str, int]:
+        """
+        Get ring usage counters.
+
+        Returns:
+            Dictionary with capacity, used bytes and dropped message count
+        """
+        if self._released:
+            return {"capacity": self.capacity, "used": 0, "dropped": 0}
+        with self._lock:
+            head, tail, dropped = struct.unpack_from("QQQ", self._buf, _HEAD)
+        return {"capacity": self.capacity, "used": head - tail, "dropped": dropped}
+
+    def release(self) -> None:
+        """
+        Mark the ring closed and release this process's mapping.
+
+        Producers still attached drop further items instead of blocking. In
+        the creating process the shared memory block is also unlinked.
+        LogQueueListener.stop() calls this once the consumer has stopped.
+        """
+        if self._released:
+            return
+        _U64.pack_into(self._buf, _CLOSED, 1)
+        self._released = True
+        self._shm.close()
+        if self._owner_pid == os.getpid():
+            self._shm.unlink()
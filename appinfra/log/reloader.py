@@ -114,3 +114,20 @@ class LogConfigReloader:
             # Clear old yaml rules and add new ones
             manager.clear_rules(source="yaml")
             manager.add_rules_from_dict(topics, source="yaml", priority=1)
+
+        self._update_sampling(current.get("sampling"))
+
+    def _update_sampling(self, sampling: Any) -> None:
+        """
+        Replace yaml sampling rules (a removed section clears them).
+
+        Rules equal to the ones already loaded (at startup or by an earlier
+        reload) are kept, so token buckets and suppressed counts are not reset.
+        """
+        from .sampling import LogSamplingManager
+
+        if not isinstance(sampling, dict):
+            sampling = {}
+        LogSamplingManager.get_instance().replace_rules(
+            sampling, source="yaml", priority=1
+        )
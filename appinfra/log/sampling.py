@@ -0,0 +1,510 @@
+"""
+Per-topic sampling and rate limiting for log records.
+
+Keeps chatty topics (e.g. '/infra/db/**' query logs) enabled in production
+without flooding sinks. Rules match topic patterns exactly like
+LogLevelManager rules and combine:
+- Probabilistic sampling: keep a fraction ``rate`` of records
+- Token-bucket rate limiting: at most ``per_second`` records on average,
+  with bursts up to ``burst``
+
+The decision is made in Logger._log before the caller lookup and
+makeRecord, so a suppressed record costs a random draw or a bucket check.
+Suppressed counts are reported periodically as an INFO summary record logged
+through the same logger ("log records suppressed") once per
+``summary_interval`` seconds while suppression is happening.
+
+Configuration (YAML, hot-reloadable via LogConfigReloader):
+    logging:
+      sampling:
+        /infra/db/**:
+          rate: 0.1            # keep 10%
+          per_second: 50       # then at most 50 records/sec
+          burst: 100
+          summary_interval: 60
+        /myapp/poller: 0.01    # shorthand for rate
+
+Example:
+    >>> manager = LogSamplingManager.get_instance()
+    >>> manager.add_rule("/infra/db/**", rate=0.1, per_second=50)
+"""
+
+from __future__ import annotations
+
+import itertools
+import threading
+import time
+from dataclasses import dataclass
+from random import random
+from typing import Any
+
+from .topic_trie import TopicTrie, pattern_specificity
+
+# Default seconds between suppressed-count summaries
+DEFAULT_SUMMARY_INTERVAL = 60.0
+
+# Message of the summary record logged for suppressed records
+SUMMARY_MESSAGE = "log records suppressed"
+
+
+@dataclass
+class SamplingRule:
+    """
+    Sampling and rate-limit policy for a topic pattern.
+
+    Attributes:
+        pattern: Glob pattern (e.g., "/infra/db/**")
+        rate: Fraction of records kept (0.0-1.0)
+        per_second: Token refill rate (None disables rate limiting)
+        burst: Token bucket capacity (defaults to per_second, at least 1)
+        summary_interval: Seconds between suppressed-count summaries (0
+            disables summaries)
+        source: Rule source ("yaml", "cli", "api")
+        priority: Rule priority (higher wins)
+        specificity: Pattern specificity score (higher is more specific)
+    """
+
+    pattern: str
+    rate: float = 1.0
+    per_second: float | None = None
+    burst: float | None = None
+    summary_interval: float = DEFAULT_SUMMARY_INTERVAL
+    source: str = "api"
+    priority: int = 10
+    specificity: int = 0
+
+
+class TopicSampler:
+    """
+    Runtime state of one sampling rule, shared by every matching logger.
+
+    Thread-safe: the token bucket and counters are updated under a lock;
+    pure sampling draws need no lock until a record is suppressed.
+    """
+
+    def __init__(self, rule: SamplingRule) -> None:
+        """
+        Initialize sampler state for a rule.
+
+        Args:
+            rule: Validated sampling rule
+        """
+        self.rule = rule
+        self._rate = rule.rate
+        self._per_second = rule.per_second
+        if rule.burst is not None:
+            self._burst = rule.burst
+        else:
+            self._burst = max(1.0, rule.per_second or 0.0)
+        self._tokens = self._burst
+        self._refilled = time.monotonic()
+        self._lock = threading.Lock()
+        # Suppressed since the last summary, and totals
+        self._sampled = 0
+        self._limited = 0
+        self._total_sampled = 0
+        self._total_limited = 0
+        self._next_summary = time.monotonic() + rule.summary_interval
+
+    def admit(self) -> bool:
+        """
+        Decide whether the next record is kept.
+
+        Returns:
+            True to log the record, False if it is suppressed
+        """
+        if self._rate < 1.0 and random() >= self._rate:
+            with self._lock:
+                self._sampled += 1
+                self._total_sampled += 1
+            return False
+        if self._per_second is None:
+            return True
+        with self._lock:
+            now = time.monotonic()
+            tokens = min(
+                self._burst, self._tokens + (now - self._refilled) * self._per_second
+            )
+            self._refilled = now
+            if tokens < 1.0:
+                self._tokens = tokens
+                self._limited += 1
+                self._total_limited += 1
+                return False
+            self._tokens = tokens - 1.0
+            return True
+
+    def take_summary(self) -> dict[str, Any] | None:
+        """
+        Collect suppressed counts if a summary is due.
+
+        Returns:
+            Summary fields (topic, sampled, rate_limited), or None if nothing
+            was suppressed or the interval has not elapsed
+        """
+        if not (self._sampled or self._limited) or not self.rule.summary_interval:
+            return None
+        now = time.monotonic()
+        if now < self._next_summary:
+            return None
+        with self._lock:
+            if now < self._next_summary:
+                return None
+            summary = {
+                "topic": self.rule.pattern,
+                "sampled": self._sampled,
+                "rate_limited": self._limited,
+            }
+            self._sampled = self._limited = 0
+            self._next_summary = now + self.rule.summary_interval
+        return summary
+
+    def stats(self) -> dict[str, int]:
+        """
+        Get suppressed record totals since the rule was added.
+
+        Returns:
+            Dictionary with sampled and rate_limited counts
+        """
+        with self._lock:
+            sampled, limited = self._total_sampled, self._total_limited
+        return {"sampled": sampled, "rate_limited": limited}
+
+
+class LogSamplingManager:
+    """
+    Thread-safe singleton holding per-topic sampling rules.
+
+    Mirrors LogLevelManager: rules have a source and priority, the most
+    specific pattern wins among equal priorities, and patterns are compiled
+    into a TopicTrie. Loggers cache the sampler for their name and refresh it
+    when ``generation`` changes, so a logger without a matching rule pays one
+    integer comparison per call.
+
+    Example:
+        >>> manager = LogSamplingManager.get_instance()
+        >>> manager.add_rule("/infra/db/**", rate=0.1, source="yaml", priority=1)
+        >>> manager.get_sampler("/infra/db/queries").rule.rate
+        0.1
+    """
+
+    _instance: LogSamplingManager | None = None
+    _lock_class = threading.Lock()
+
+    # Bumped on every rule change; compared by loggers on each call
+    generation: int = 0
+    _counter = itertools.count(1)
+
+    def __init__(self) -> None:
+        """Initialize the manager (private - use get_instance())."""
+        self._rules: list[SamplingRule] = []
+        self._samplers: dict[tuple[str, str, int], TopicSampler] = {}
+        self._lock = threading.RLock()
+        # Compiled from _rules on first lookup after a change (None = stale)
+        self._trie: TopicTrie[TopicSampler] | None = None
+
+    @classmethod
+    def get_instance(cls) -> LogSamplingManager:
+        """
+        Get the singleton instance.
+
+        Returns:
+            The singleton LogSamplingManager instance
+        """
+        if cls._instance is None:
+            with cls._lock_class:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def reset_instance(cls) -> None:
+        """
+        Reset the singleton instance (for testing only).
+
+        Warning:
+            This should only be used in test cleanup to reset state.
+        """
+        with cls._lock_class:
+            cls._instance = None
+            cls._bump()
+
+    @classmethod
+    def _bump(cls) -> None:
+        """Invalidate samplers cached by loggers (atomic under the GIL)."""
+        cls.generation = next(cls._counter)
+
+    def add_rule(
+        self,
+        pattern: str,
+        rate: float = 1.0,
+        per_second: float | None = None,
+        burst: float | None = None,
+        summary_interval: float = DEFAULT_SUMMARY_INTERVAL,
+        source: str = "api",
+        priority: int = 10,
+    ) -> None:
+        """
+        Add a sampling rule for a topic pattern.
+
+        A rule with the same pattern, source and priority is replaced, and
+        its bucket and counters are reset.
+
+        Args:
+            pattern: Glob pattern (e.g., "/infra/db/*", "/infra/**")
+            rate: Fraction of records kept (0.0-1.0)
+            per_second: Average records/sec allowed (None for no limit)
+            burst: Records allowed at once after an idle period (default:
+                per_second, at least 1)
+            summary_interval: Seconds between suppressed-count summaries
+                (0 disables summaries)
+            source: Rule source ("yaml", "cli", "api")
+            priority: Rule priority (higher wins)
+
+        Raises:
+            ValueError: If the pattern or a limit is invalid
+        """
+        rule = _make_rule(
+            pattern,
+            rate=rate,
+            per_second=per_second,
+            burst=burst,
+            summary_interval=summary_interval,
+            source=source,
+            priority=priority,
+        )
+        with self._lock:
+            self._store([rule])
+
+    def add_rules_from_dict(
+        self, rules_dict: dict[str, Any], source: str, priority: int
+    ) -> None:
+        """
+        Add rules from a dictionary mapping patterns to policies.
+
+        A policy is a mapping with rate, per_second, burst and
+        summary_interval keys, or a number used as the rate. Every policy is
+        validated before any rule is added.
+
+        Args:
+            rules_dict: Dictionary mapping patterns to policies
+            source: Rule source ("yaml", "cli", "api")
+            priority: Rule priority for all rules
+
+        Raises:
+            ValueError: If a policy is invalid
+
+        Example:
+            >>> manager.add_rules_from_dict({
+            ...     "/infra/db/**": {"rate": 0.1, "per_second": 50},
+            ...     "/myapp/poller": 0.01,
+            ... }, source="yaml", priority=1)
+        """
+        rules = _rules_from_dict(rules_dict, source, priority)
+        with self._lock:
+            self._store(rules)
+
+    def replace_rules(
+        self, rules_dict: dict[str, Any], source: str, priority: int
+    ) -> bool:
+        """
+        Atomically replace all rules from a source (used for hot-reload).
+
+        If the new rules equal the source's current rules (e.g. a reload
+        that leaves the sampling section unchanged, including the first
+        reload after startup loaded it), nothing is replaced, so token
+        buckets and suppressed counts are kept.
+
+        Args:
+            rules_dict: Dictionary mapping patterns to policies (see
+                add_rules_from_dict())
+            source: Rule source whose rules are replaced
+            priority: Rule priority for the new rules
+
+        Returns:
+            True if the rules changed
+
+        Raises:
+            ValueError: If a policy is invalid (existing rules are kept)
+        """
+        rules = _rules_from_dict(rules_dict, source, priority)
+        with self._lock:
+            current = [r for r in self._rules if r.source == source]
+            if sorted(current, key=_rule_key) == sorted(rules, key=_rule_key):
+                return False
+            self._rules = [r for r in self._rules if r.source != source]
+            self._store(rules)
+            return True
+
+    def _store(self, rules: list[SamplingRule]) -> None:
+        """Add rules, replacing ones with the same key (caller holds lock)."""
+        keys = {_rule_key(r) for r in rules}
+        self._rules = [r for r in self._rules if _rule_key(r) not in keys] + rules
+        self._rules.sort(key=lambda r: (r.priority, r.specificity), reverse=True)
+        self._invalidate()
+
+    def clear_rules(self, source: str | None = None) -> None:
+        """
+        Clear all rules or rules from a specific source.
+
+        Args:
+            source: If specified, only clear rules from this source
+        """
+        with self._lock:
+            if source is None:
+                self._rules = []
+            else:
+                self._rules = [r for r in self._rules if r.source != source]
+            self._invalidate()
+
+    def get_rules(self, source: str | None = None) -> list[SamplingRule]:
+        """
+        Get all rules or rules from a specific source.
+
+        Args:
+            source: If specified, only return rules from this source
+
+        Returns:
+            List of SamplingRule objects (sorted by priority/specificity)
+        """
+        with self._lock:
+            return [r for r in self._rules if source is None or r.source == source]
+
+    def get_sampler(self, logger_name: str) -> TopicSampler | None:
+        """
+        Get the sampler of the best rule matching a logger name.
+
+        Args:
+            logger_name: Logger name (topic) to match
+
+        Returns:
+            Shared TopicSampler, or None if no rule matches
+        """
+        with self._lock:
+            if not self._rules:
+                return None
+            if self._trie is None:
+                self._trie = self._compile_rules()
+            return self._trie.best_match(logger_name)
+
+    def get_stats(self) -> dict[str, dict[str, int]]:
+        """
+        Get suppressed record totals per rule pattern.
+
+        Returns:
+            Dictionary mapping each pattern to its sampled and rate_limited
+            counts
+        """
+        with self._lock:
+            samplers = list(self._samplers.values())
+        return {s.rule.pattern: s.stats() for s in samplers}
+
+    def _compile_rules(self) -> TopicTrie[TopicSampler]:
+        """Compile sorted rules into a trie of samplers."""
+        trie: TopicTrie[TopicSampler] = TopicTrie()
+        for rank, rule in enumerate(self._rules):
+            sampler = self._samplers.get(_rule_key(rule))
+            if sampler is None or sampler.rule is not rule:
+                sampler = TopicSampler(rule)
+            self._samplers[_rule_key(rule)] = sampler
+            trie.insert(rule.pattern, sampler, rank)
+        return trie
+
+    def _invalidate(self) -> None:
+        """Drop compiled rules and stale samplers after a rule change."""
+        live = {_rule_key(r) for r in self._rules}
+        self._samplers = {k: s for k, s in self._samplers.items() if k in live}
+        self._trie = None
+        self._bump()
+
+    # -------------------------------------------------------------------------
+    # Serialization for multiprocessing
+    # -------------------------------------------------------------------------
+
+    def to_dict(self) -> dict:
+        """
+        Serialize rules to a picklable dictionary (see from_dict()).
+
+        Bucket and counter state is not included; each process samples
+        independently.
+        """
+        with self._lock:
+            return {
+                "rules": [
+                    {
+                        "pattern": r.pattern,
+                        "rate": r.rate,
+                        "per_second": r.per_second,
+                        "burst": r.burst,
+                        "summary_interval": r.summary_interval,
+                        "source": r.source,
+                        "priority": r.priority,
+                    }
+                    for r in self._rules
+                ]
+            }
+
+    def from_dict(self, config: dict) -> None:
+        """
+        Replace all rules with ones serialized by to_dict().
+
+        Args:
+            config: Dict from to_dict()
+        """
+        rules = [_make_rule(**rule_dict) for rule_dict in config.get("rules", [])]
+        with self._lock:
+            self._rules = []
+            self._store(rules)
+
+
+def _make_rule(pattern: str, **options: Any) -> SamplingRule:
+    """Create a rule and check its pattern and limits."""
+    rule = SamplingRule(pattern, specificity=pattern_specificity(pattern), **options)
+    if not pattern or not pattern.startswith("/"):
+        raise ValueError(f"Pattern must start with '/': {pattern!r}")
+    if not 0.0 <= rule.rate <= 1.0:
+        raise ValueError(f"rate must be between 0 and 1, got {rule.rate}")
+    if rule.per_second is not None and rule.per_second <= 0:
+        raise ValueError(f"per_second must be positive, got {rule.per_second}")
+    if rule.burst is not None and rule.burst < 1:
+        raise ValueError(f"burst must be at least 1, got {rule.burst}")
+    if rule.summary_interval < 0:
+        raise ValueError("summary_interval must be non-negative")
+    return rule
+
+
+def _rules_from_dict(
+    rules_dict: dict[str, Any], source: str, priority: int
+) -> list[SamplingRule]:
+    """Create validated rules from a pattern -> policy mapping."""
+    return [
+        _make_rule(
+            pattern, source=source, priority=priority, **_policy_kwargs(pattern, policy)
+        )
+        for pattern, policy in rules_dict.items()
+    ]
+
+
+def _rule_key(rule: SamplingRule) -> tuple[str, str, int]:
+    """Identify a rule for reusing its sampler across recompiles."""
+    return rule.pattern, rule.source, rule.priority
+
+
+def _policy_kwargs(pattern: str, policy: Any) -> dict[str, Any]:
+    """Convert a YAML/dict policy into add_rule() keyword arguments."""
+    if isinstance(policy, (int, float)) and not isinstance(policy, bool):
+        return {"rate": float(policy)}
+    if not hasattr(policy, "get"):
+        raise ValueError(f"Invalid sampling policy for {pattern!r}: {policy!r}")
+    unknown = set(policy) - {"rate", "per_second", "burst", "summary_interval"}
+    if unknown:
+        raise ValueError(
+            f"Unknown sampling options for {pattern!r}: {', '.join(sorted(unknown))}"
+        )
+    kwargs: dict[str, Any] = {"rate": float(policy.get("rate", 1.0))}
+    for key in ("per_second", "burst"):
+        if policy.get(key) is not None:
+            kwargs[key] = float(policy[key])
+    if "summary_interval" in policy:
+        kwargs["summary_interval"] = float(policy["summary_interval"])
+    return kwargs
@@ -0,0 +1,194 @@
+"""
+Compiled segment trie for topic pattern matching.
+
+Topic patterns ('/infra/db/queries', '/infra/db/*', '/infra/**/queries') are
+compiled into a trie keyed by path segment. A logger name is matched against
+every rule in a single walk proportional to its depth, instead of testing each
+pattern in turn. Supports:
+- Exact segments (dict lookup per segment)
+- Glob segments such as * or q* (match exactly one segment)
+- ** (matches zero or more segments)
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import re
+from collections.abc import Callable
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+RECURSIVE_WILDCARD = "**"
+
+
+def split_topic(name: str) -> list[str]:
+    """
+    Split a topic name or pattern into path segments.
+
+    Leading and trailing slashes are ignored, so "/infra/db" and "/infra/db/"
+    both yield ["infra", "db"]. The root topic "/" yields [""].
+    """
+    return name.strip("/").split("/")
+
+
+def is_glob_segment(segment: str) -> bool:
+    """Check if a pattern segment contains glob characters."""
+    return any(char in segment for char in "*?[")
+
+
+def pattern_specificity(pattern: str) -> int:
+    """
+    Score how specific a topic pattern is (higher is more specific).
+
+    Each exact segment scores 10, each glob segment 1 and ** nothing, so
+    "/infra/db/queries" (30) outranks "/infra/db/*" (21) and "/infra/**" (10).
+    """
+    score = 0
+    for segment in split_topic(pattern):
+        if segment == RECURSIVE_WILDCARD:
+            continue
+        score += 1 if "*" in segment else 10
+    return score
+
+
+def match_segments(name_parts: list[str], pattern_parts: list[str]) -> bool:
+    """
+    Match topic name segments against pattern segments.
+
+    Args:
+        name_parts: Segments of the topic name (from split_topic)
+        pattern_parts: Segments of the pattern (from split_topic)
+
+    Returns:
+        True if the name matches the pattern
+    """
+    if not pattern_parts:
+        return not name_parts
+
+    head, rest = pattern_parts[0], pattern_parts[1:]
+    if head == RECURSIVE_WILDCARD:
+        return any(
+            match_segments(name_parts[i:], rest) for i in range(len(name_parts) + 1)
+        )
+
+    if not name_parts:
+        return False
+    if not fnmatch.fnmatchcase(name_parts[0], head):
+        return False
+    return match_segments(name_parts[1:], rest)
+
+
+class _Node(Generic[T]):
+    """Single trie node; children are split by segment kind."""
+
+    __slots__ = ("literal", "glob", "recursive", "best")
+
+    def __init__(self) -> None:
+        self.literal: dict[str, _Node[T]] = {}
+        self.glob: dict[str, tuple[Callable[[str], object], _Node[T]]] = {}
+        self.recursive: _Node[T] | None = None
+        # (rank, value) of the best rule terminating at this node
+        self.best: tuple[int, T] | None = None
+
+
+class TopicTrie(Generic[T]):
+    """
+    Segment trie mapping topic patterns to values with rank-based resolution.
+
+    Each pattern is inserted with a rank; when several patterns match a name,
+    the value with the lowest rank wins. Callers assign ranks from their own
+    precedence order (e.g. priority, then specificity, then insertion order).
+
+    Example:
+        >>> trie = TopicTrie()
+        >>> trie.insert("/infra/**", "info", rank=1)
+        >>> trie.insert("/infra/db/*", "debug", rank=0)
+        >>> trie.best_match("/infra/db/queries")
+        'debug'
+        >>> trie.best_match("/infra/api")
+        'info'
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty trie."""
+        self._root: _Node[T] = _Node()
+
+    def insert(self, pattern: str, value: T, rank: int) -> None:
+        """
+        Insert a pattern.
+
+        Args:
+            pattern: Topic pattern (e.g., "/infra/db/*")
+            value: Value returned when this pattern is the best match
+            rank: Precedence of this pattern (lower wins)
+        """
+        node = self._root
+        for segment in split_topic(pattern):
+            node = self._child(node, segment)
+
+        if node.best is None or rank < node.best[0]:
+            node.best = (rank, value)
+
+    def _child(self, node: _Node[T], segment: str) -> _Node[T]:
+        """Get or create the child of node for a pattern segment."""
+        if segment == RECURSIVE_WILDCARD:
+            if node.recursive is None:
+                node.recursive = _Node()
+            return node.recursive
+
+        if is_glob_segment(segment):
+            if segment not in node.glob:
+                matcher = re.compile(fnmatch.translate(segment)).match
+                node.glob[segment] = (matcher, _Node())
+            return node.glob[segment][1]
+
+        return node.literal.setdefault(segment, _Node())
+
+    def best_match(self, name: str) -> T | None:
+        """
+        Find the value of the lowest-ranked pattern matching a topic name.
+
+        Args:
+            name: Topic name (e.g., "/infra/db/queries")
+
+        Returns:
+            Matching value, or None if no pattern matches
+        """
+        parts = split_topic(name)
+        end = len(parts)
+        best: tuple[int, T] | None = None
+        stack: list[tuple[_Node[T], int]] = [(self._root, 0)]
+        seen: set[tuple[int, int]] = set()
+
+        while stack:
+            node, index = stack.pop()
+            if node.recursive is not None:
+                # ** consumes zero or more segments
+                for next_index in range(index, end + 1):
+                    key = (id(node.recursive), next_index)
+                    if key not in seen:
+                        seen.add(key)
+                        stack.append((node.recursive, next_index))
+
+            if index == end:
+                if node.best is not None and (best is None or node.best[0] < best[0]):
+                    best = node.best
+                continue
+
+            stack.extend(self._advance(node, parts[index], index + 1))
+
+        return best[1] if best is not None else None
+
+    def _advance(
+        self, node: _Node[T], segment: str, next_index: int
+    ) -> list[tuple[_Node[T], int]]:
+        """Get the child nodes that consume one name segment."""
+        children = []
+        literal = node.literal.get(segment)
+        if literal is not None:
+            children.append((literal, next_index))
+        for matcher, child in node.glob.values():
+            if matcher(segment):
+                children.append((child, next_index))
+        return children
@@ -5,6 +5,7 @@ This module provides simple callback-based hooks for monitoring framework
 operations without requiring external dependencies like OpenTelemetry.
 """
 
+from .histogram import LatencyHistogram
 from .hooks import HookContext, HookEvent, ObservabilityHooks
 
-__all__ = ["ObservabilityHooks", "HookEvent", "HookContext"]
+__all__ = ["ObservabilityHooks", "HookEvent", "HookContext", "LatencyHistogram"]
@@ -0,0 +1,122 @@
+"""
+Streaming latency histogram.
+
+Keeps counts in fixed log-spaced buckets (1-2-5 steps from 1 microsecond to
+10 seconds) instead of storing samples, so memory is constant no matter how
+many durations are observed. Percentiles are estimated as the upper bound of
+the bucket holding the requested rank, capped at the largest value seen.
+
+Example:
+    >>> from appinfra.observability import LatencyHistogram
+    >>> hist = LatencyHistogram()
+    >>> for ms in (1, 2, 3, 40):
+    ...     hist.observe(ms / 1000)
+    >>> hist.snapshot()["count"]
+    4
+"""
+
+from __future__ import annotations
+
+import threading
+from bisect import bisect_left
+
+# Bucket upper bounds in seconds: 1us, 2us, 5us, 10us, ... 5s, 10s
+BUCKET_BOUNDS: tuple[float, ...] = tuple(
+    mantissa * 10.0**exponent
+    for exponent in range(-6, 2)
+    for mantissa in (1, 2, 5)
+    if mantissa * 10.0**exponent <= 10.0
+)
+
+
+class LatencyHistogram:
+    """
+    Thread-safe bucketed histogram of durations in seconds.
+
+    Values above the last bound land in an overflow bucket; their
+    percentile estimate is the maximum observed value.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        self._lock = threading.Lock()
+        self._counts = [0] * (len(BUCKET_BOUNDS) + 1)
+        self._count = 0
+        self._total = 0.0
+        self._max = 0.0
+
+    def observe(self, seconds: float, count: int = 1) -> None:
+        """
+        Record one duration, or count equal durations.
+
+        Args:
+            seconds: Duration in seconds
+            count: Number of observations of this duration (e.g. the
+                per-item average of a batch)
+        """
+        index = bisect_left(BUCKET_BOUNDS, seconds)
+        with self._lock:
+            self._counts[index] += count
+            self._count += count
+            self._total += seconds * count
+            if seconds > self._max:
+                self._max = seconds
+
+    @property
+    def count(self) -> int:
+        """Number of observed durations."""
+        return self._count
+
+    def percentile(self, fraction: float) -> float:
+        """
+        Estimate a percentile.
+
+        Args:
+            fraction: Percentile as a fraction (0.99 for p99)
+
+        Returns:
+            Upper bound of the bucket containing the rank (0.0 if empty)
+        """
+        with self._lock:
+            return self._percentile(fraction)
+
+    def _percentile(self, fraction: float) -> float:
+        """Estimate a percentile (caller holds the lock)."""
+        if not self._count:
+            return 0.0
+        rank = max(1, round(fraction * self._count))
+        seen = 0
+        for index, bucket_count in enumerate(self._counts):
+            seen += bucket_count
+            if seen >= rank:
+                if index < len(BUCKET_BOUNDS):
+                    return min(BUCKET_BOUNDS[index], self._max)
+                break
+        return self._max
+
+    def snapshot(self) -> dict[str, float]:
+        """
+        Summarize the histogram.
+
+        Returns:
+            Dictionary with count, total, avg, max, p50, p95 and p99 (seconds)
+        """
+        with self._lock:
+            count = self._count
+            return {
+                "count": count,
+                "total": self._total,
+                "avg": self._total / count if count else 0.0,
+                "max": self._max,
+                "p50": self._percentile(0.50),
+                "p95": self._percentile(0.95),
+                "p99": self._percentile(0.99),
+            }
+
+    def reset(self) -> None:
+        """Discard all observations."""
+        with self._lock:
+            self._counts = [0] * (len(BUCKET_BOUNDS) + 1)
+            self._count = 0
+            self._total = 0.0
+            self._max = 0.0
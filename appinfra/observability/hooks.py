@@ -35,6 +35,9 @@ class HookEvent(Enum):
     STARTUP = "startup"
     SHUTDOWN = "shutdown"
 
+    # Logging subsystem metrics (appinfra.log.metrics.LogMetrics.publish)
+    LOG_METRICS = "log_metrics"
+
 
 @dataclass
 class HookContext:
@@ -65,6 +68,12 @@ class HookContext:
         self.duration = time.monotonic() - self.start_time
 
 
+# trigger() keyword arguments that map onto HookContext fields
+_CONTEXT_FIELDS = frozenset(
+    {"query", "duration", "error", "tool_name", "request_path", "response_code"}
+)
+
+
 class ObservabilityHooks:
     """
     Simple callback-based observability system.
@@ -188,7 +197,9 @@ class ObservabilityHooks:
 
         Args:
             event: Event type to trigger
-            **kwargs: Event-specific data to include in HookContext
+            **kwargs: Event-specific data to include in HookContext. All of
+                it is available as context.data; keys matching HookContext
+                fields (query, duration, ...) also set those fields.
 
         Example:
             hooks.trigger(
@@ -201,7 +212,8 @@ class ObservabilityHooks:
             return
 
         # Create context
-        context = HookContext(event=event, data=kwargs, **kwargs)
+        fields = {k: v for k, v in kwargs.items() if k in _CONTEXT_FIELDS}
+        context = HookContext(event=event, data=kwargs, **fields)
 
         # Call event-specific hooks
         if event in self._hooks:
@@ -23,7 +23,7 @@ Example:
 
 from .filter import SecretMaskingFilter
 from .masking import SecretMasker, get_masker, reset_masker
-from .patterns import DEFAULT_PATTERNS, PATTERN_NAMES
+from .patterns import DEFAULT_PATTERNS, PATTERN_LITERALS, PATTERN_NAMES
 
 __all__ = [
     "SecretMasker",
@@ -32,4 +32,5 @@ __all__ = [
     "reset_masker",
     "DEFAULT_PATTERNS",
     "PATTERN_NAMES",
+    "PATTERN_LITERALS",
 ]
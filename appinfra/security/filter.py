@@ -8,11 +8,15 @@ log messages before they are emitted.
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from .masking import SecretMasker
 
+# Strings longer than this (typically tracebacks) are masked but not cached
+_MAX_CACHED_LENGTH = 1024
+
 
 class SecretMaskingFilter(logging.Filter):
     """
@@ -37,6 +41,7 @@ class SecretMaskingFilter(logging.Filter):
         self,
         masker: SecretMasker | None = None,
         name: str = "",
+        cache_size: int = 1024,
     ):
         """
         Initialize the filter.
@@ -44,9 +49,23 @@ class SecretMaskingFilter(logging.Filter):
         Args:
             masker: SecretMasker instance (default: global masker)
             name: Filter name for logging hierarchy
+            cache_size: Maximum number of masked strings to remember (0 disables
+                the cache). The cache is cleared automatically when the
+                masker's patterns or known secrets change.
         """
         super().__init__(name)
         self._masker = masker
+        # Memo of masked strings keyed by (text, masker generation), so
+        # results computed before a pattern change can never be returned
+        self._cached_mask = (
+            lru_cache(maxsize=cache_size)(self._mask_uncached)
+            if cache_size > 0
+            else None
+        )
+        self._generation = -1
+        # Identity fast path: last masked string object and its result
+        self._last: tuple[str | None, int, str] = (None, -1, "")
+        self._identity_hits = 0
 
     @property
     def masker(self) -> SecretMasker:
@@ -57,6 +76,55 @@ class SecretMaskingFilter(logging.Filter):
             self._masker = get_masker()
         return self._masker
 
+    def cache_stats(self) -> dict[str, int]:
+        """
+        Get masking cache counters.
+
+        Identity fast-path hits are counted without a lock and may undercount
+        slightly when several threads log at once.
+
+        Returns:
+            Dictionary with hits, misses, size and maxsize (all 0 if disabled)
+        """
+        if self._cached_mask is None:
+            return {"hits": 0, "misses": 0, "size": 0, "maxsize": 0}
+        info = self._cached_mask.cache_info()
+        return {
+            "hits": info.hits + self._identity_hits,
+            "misses": info.misses,
+            "size": info.currsize,
+            "maxsize": info.maxsize or 0,
+        }
+
+    def _mask_uncached(self, text: str, generation: int) -> str:
+        """Mask a string (generation only keys the cache)."""
+        return self.masker.mask(text)
+
+    def _mask(self, text: str) -> str:
+        """Mask a string, using the cache when enabled."""
+        masker = self._masker or self.masker
+        cached_mask = self._cached_mask
+        if cached_mask is None or len(text) > _MAX_CACHED_LENGTH:
+            return masker.mask(text)
+
+        generation = masker.generation
+        last_text, last_generation, last_result = self._last
+        if last_text is text and last_generation == generation:
+            self._identity_hits += 1
+            return last_result
+        if generation != self._generation:
+            # Patterns or known secrets changed - old entries can never hit
+            self._generation = generation
+            cached_mask.cache_clear()
+
+        result: str = cached_mask(text, generation)
+        self._last = (text, generation, result)
+        return result
+
+    def _mask_arg(self, value: Any) -> Any:
+        """Mask a string argument; other values are returned unchanged."""
+        return self._mask(str(value)) if isinstance(value, str) else value
+
     def filter(self, record: logging.LogRecord) -> bool:
         """
         Filter and mask secrets in the log record.
@@ -69,24 +137,18 @@ class SecretMaskingFilter(logging.Filter):
         """
         # Mask the message
         if record.msg:
-            record.msg = self.masker.mask(str(record.msg))
+            record.msg = self._mask(str(record.msg))
 
         # Mask arguments
         if record.args:
             if isinstance(record.args, dict):
-                record.args = {
-                    k: self.masker.mask(str(v)) if isinstance(v, str) else v
-                    for k, v in record.args.items()
-                }
+                record.args = {k: self._mask_arg(v) for k, v in record.args.items()}
             else:
-                record.args = tuple(
-                    self.masker.mask(str(arg)) if isinstance(arg, str) else arg
-                    for arg in record.args
-                )
+                record.args = tuple(self._mask_arg(arg) for arg in record.args)
 
         # Mask exception info if present
         if record.exc_text:
-            record.exc_text = self.masker.mask(record.exc_text)
+            record.exc_text = self._mask(record.exc_text)
 
         return True
 
@@ -6,9 +6,12 @@ in strings using regex patterns.
 """
 
 import re
+import threading
+from collections.abc import Collection
 from re import Pattern
 
-from .patterns import DEFAULT_PATTERNS
+from .patterns import DEFAULT_PATTERNS, PATTERN_LITERALS
+from .scanner import PatternScanner, compile_literals, mask_match
 
 
 class SecretMasker:
@@ -17,6 +20,8 @@ class SecretMasker:
 
     Uses regex patterns to find and replace secrets with a masked value.
     Supports both pattern-based detection and explicit known secrets.
+    Patterns are compiled into a single-pass PatternScanner (see
+    appinfra.security.scanner) that is rebuilt when patterns change.
 
     Example:
         masker = SecretMasker()
@@ -53,7 +58,15 @@ class SecretMasker:
         self._mask = mask
         self._enabled = enabled
         self._patterns: list[Pattern[str]] = []
+        self._sources: list[tuple[str, Collection[str] | None]] = []
+        self._scanner: PatternScanner | None = None
         self._known_secrets: set[str] = set()
+        self._known_regex: Pattern[str] | None = None
+        self._known_dirty = False
+        self._generation = 0  # Bumped whenever mask() results may change
+        # Serializes changes with matcher rebuilds, so a rebuild from an old
+        # snapshot can never be installed over a newer change
+        self._lock = threading.Lock()
 
         # Compile default patterns
         pattern_list = patterns if patterns is not None else DEFAULT_PATTERNS
@@ -69,13 +82,26 @@ class SecretMasker:
     def enabled(self, value: bool) -> None:
         """Enable or disable masking."""
         self._enabled = value
+        self._generation += 1
+
+    @property
+    def generation(self) -> int:
+        """
+        Get a counter that changes whenever mask() results may change.
+
+        Caches of masked strings (see SecretMaskingFilter) compare it to
+        detect added patterns, changed known secrets or toggled masking.
+        """
+        return self._generation
 
     @property
     def mask_string(self) -> str:
         """Get the mask replacement string."""
         return self._mask
 
-    def add_pattern(self, pattern: str) -> None:
+    def add_pattern(
+        self, pattern: str, *, literals: Collection[str] | None = None
+    ) -> None:
         """
         Add a regex pattern for secret detection.
 
@@ -85,12 +111,24 @@ class SecretMasker:
 
         Args:
             pattern: Regex pattern string
+            literals: Strings, one of which occurs (case-insensitively) in every
+                match; lets mask() skip text containing none of them. Looked up
+                in PATTERN_LITERALS when omitted; without any, every string is
+                scanned.
 
         Raises:
             re.error: If the pattern is invalid
         """
         compiled = re.compile(pattern)
-        self._patterns.append(compiled)
+        if literals is None:
+            literals = PATTERN_LITERALS.get(pattern)
+        else:
+            literals = tuple(literal.lower() for literal in literals)
+        with self._lock:
+            self._patterns.append(compiled)
+            self._sources.append((pattern, literals))
+            self._scanner = None
+            self._generation += 1
 
     def add_known_secret(self, secret: str | None) -> None:
         """
@@ -103,7 +141,10 @@ class SecretMasker:
             secret: The secret value to mask (None values are ignored)
         """
         if secret and len(secret) >= 4:  # Avoid masking very short strings
-            self._known_secrets.add(secret)
+            with self._lock:
+                self._known_secrets.add(secret)
+                self._known_dirty = True
+                self._generation += 1
 
     def remove_known_secret(self, secret: str) -> None:
         """
@@ -112,11 +153,40 @@ class SecretMasker:
         Args:
             secret: The secret value to remove
         """
-        self._known_secrets.discard(secret)
+        with self._lock:
+            self._known_secrets.discard(secret)
+            self._known_dirty = True
+            self._generation += 1
 
     def clear_known_secrets(self) -> None:
         """Clear all known secrets."""
-        self._known_secrets.clear()
+        with self._lock:
+            self._known_secrets.clear()
+            self._known_dirty = True
+            self._generation += 1
+
+    def _get_scanner(self) -> PatternScanner:
+        """Get the compiled pattern scanner, rebuilding it after changes."""
+        scanner = self._scanner
+        if scanner is None:
+            with self._lock:
+                scanner = self._scanner
+                if scanner is None:
+                    scanner = PatternScanner(self._sources, self._mask)
+                    self._scanner = scanner
+        return scanner
+
+    def _get_known_regex(self) -> Pattern[str] | None:
+        """Get the known-secret matcher, rebuilding it after changes."""
+        if self._known_dirty:
+            with self._lock:
+                if self._known_dirty:
+                    # Publish the new matcher before clearing the flag, so
+                    # concurrent callers wait here instead of using the old one
+                    regex = compile_literals(list(self._known_secrets))
+                    self._known_regex = regex
+                    self._known_dirty = False
+        return self._known_regex
 
     def mask(self, text: str) -> str:
         """
@@ -133,16 +203,14 @@ class SecretMasker:
         if not self._enabled or not text:
             return text
 
-        result = text
-
         # Apply pattern-based masking
-        for pattern in self._patterns:
-            result = self._mask_pattern(result, pattern)
+        result = self._get_scanner().mask(text)
 
         # Apply known secret masking
-        for secret in self._known_secrets:
-            if secret in result:
-                result = result.replace(secret, self._mask)
+        known = self._get_known_regex()
+        if known is not None:
+            mask = self._mask
+            result = known.sub(lambda _: mask, result)
 
         return result
 
@@ -157,28 +225,7 @@ class SecretMasker:
         Returns:
             Text with matched secrets masked
         """
-
-        def replacer(match: re.Match[str]) -> str:
-            # Get all groups
-            groups = match.groups()
-            if not groups:
-                return match.group(0)
-
-            # Find the secret value (last non-empty group)
-            secret_value = None
-            for group in reversed(groups):
-                if group:
-                    secret_value = group
-                    break
-
-            if not secret_value:
-                return match.group(0)
-
-            # Replace the secret in the matched text
-            full_match = match.group(0)
-            return full_match.replace(secret_value, self._mask)
-
-        return pattern.sub(replacer, text)
+        return pattern.sub(lambda m: mask_match(m, m.groups(), self._mask), text)
 
     def is_secret(self, text: str) -> bool:
         """
@@ -198,11 +245,7 @@ class SecretMasker:
             return True
 
         # Check patterns
-        for pattern in self._patterns:
-            if pattern.search(text):
-                return True
-
-        return False
+        return self._get_scanner().search(text)
 
 
 # Global masker instance
@@ -67,6 +67,31 @@ DEFAULT_PATTERNS: list[str] = [
     r"(?i)(?:postgresql|mysql|mongodb|redis)://[^:]+:([^@\s]{8,})@",
 ]
 
+# Lowercase literals, one of which must occur (case-insensitively) in any
+# text a pattern matches. SecretMasker uses them to skip clean text without
+# running the regexes; patterns missing from this table disable the skip.
+PATTERN_LITERALS: dict[str, tuple[str, ...]] = dict(
+    zip(
+        DEFAULT_PATTERNS,
+        [
+            ("api_key", "api-key", "apikey"),  # api_key
+            ("password", "passwd", "pwd"),  # password_assignment
+            ("secret", "token"),  # secret_assignment
+            ("bearer",),  # bearer_token
+            ("basic",),  # basic_auth
+            ("akia",),  # aws_access_key
+            ("secret",),  # aws_secret_key
+            ("ghp_", "gho_", "ghu_", "ghs_", "ghr_"),  # github_token
+            ("xox",),  # slack_token
+            ("k_live_", "k_test_"),  # stripe_key
+            ("-----begin",),  # private_key
+            ("eyj",),  # jwt_token
+            ("postgresql://", "mysql://", "mongodb://", "redis://"),  # database_url
+        ],
+        strict=True,
+    )
+)
+
 # Patterns that are more aggressive (higher false positive rate)
 # These can be enabled via configuration
 AGGRESSIVE_PATTERNS: list[str] = [
@@ -92,3 +117,13 @@ SERVICE_PATTERNS: dict[str, list[str]] = {
         r"\b(SK[a-f0-9]{32})\b",  # Twilio API key
     ],
 }
+
+PATTERN_LITERALS.update(
+    {
+        SERVICE_PATTERNS["google"][0]: ("aiza",),
+        SERVICE_PATTERNS["google"][1]: (".apps.googleusercontent.com",),
+        SERVICE_PATTERNS["azure"][0]: ("azure",),
+        SERVICE_PATTERNS["sendgrid"][0]: ("sg.",),
+        SERVICE_PATTERNS["twilio"][0]: ("sk",),
+    }
+)
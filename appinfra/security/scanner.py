@@ -0,0 +1,192 @@
+"""
+Compiled secret scanning.
+
+SecretMasker used to run every pattern as its own ``re.sub`` and then call
+``str.replace`` once per known secret, so each string was scanned once per
+pattern even when it held no secret at all. This module compiles a pattern
+set into a scanner that does the cheap checks first:
+
+- A literal prefilter: if none of the patterns' required literals (see
+  PATTERN_LITERALS) occur in the text, no regex runs at all
+- Masking applies only the patterns whose own literals occur, in order.
+  Order is kept because a single alternation pass masks less when matches
+  of different patterns overlap.
+- One alternation regex with a named group per pattern answers "does any
+  pattern match" (is_secret()) in a single search
+- Known secrets are matched by one longest-first alternation of escaped
+  literals in a single pass
+
+Patterns that cannot be combined (named groups, backreferences or inline
+global flags after the start) are searched separately.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Collection, Iterable, Sequence
+from re import Match, Pattern
+
+# Leading global inline flags, e.g. "(?i)"
+_GLOBAL_FLAGS = re.compile(r"\(\?([aiLmsux]+)\)")
+
+# Numbered or named backreferences (group numbers shift when combined)
+_BACKREF = re.compile(r"\\[1-9]|\(\?P=")
+
+# Characters that IGNORECASE matches to an ASCII letter but str.lower() maps
+# elsewhere: dotless i and long s
+_FOLD = str.maketrans({"\u0131": "i", "\u017f": "s"})
+
+
+def fold(text: str) -> str:
+    """Lowercase text for literal prefiltering of case-insensitive patterns."""
+    if text.isascii():
+        return text.lower()
+    return text.lower().translate(_FOLD)
+
+
+def mask_match(match: Match[str], groups: Sequence[str | None], mask: str) -> str:
+    """
+    Mask the secret captured by a pattern match.
+
+    The secret is the last non-empty group; matches without one are kept.
+
+    Args:
+        match: Match of the pattern
+        groups: The pattern's own groups within the match
+        mask: Replacement string for the secret
+
+    Returns:
+        Matched text with the secret replaced by mask
+    """
+    for value in reversed(groups):
+        if value:
+            return match.group(0).replace(value, mask)
+    return match.group(0)
+
+
+def _scoped(pattern: str) -> str | None:
+    """
+    Rewrite a pattern so it can be one branch of an alternation.
+
+    Returns:
+        Non-capturing group with the pattern's leading inline flags scoped to
+        it, or None if the pattern cannot be combined
+    """
+    if _BACKREF.search(pattern) or re.compile(pattern).groupindex:
+        return None
+    flags = _GLOBAL_FLAGS.match(pattern)
+    if flags:
+        scoped = f"(?{flags.group(1)}:{pattern[flags.end() :]})"
+    else:
+        scoped = f"(?:{pattern})"
+    try:
+        re.compile(scoped)
+    except re.error:
+        return None
+    return scoped
+
+
+class PatternScanner:
+    """
+    Masks matches of a pattern set, skipping work for clean text.
+
+    Built by SecretMasker whenever its patterns change and immutable once
+    constructed, so it can be used from any thread.
+    """
+
+    def __init__(
+        self, patterns: Sequence[tuple[str, Collection[str] | None]], mask: str
+    ) -> None:
+        """
+        Compile the pattern set.
+
+        Args:
+            patterns: (regex, literals) pairs; literals are lowercase strings,
+                one of which occurs in any match (None if unknown)
+            mask: Replacement string for secrets
+
+        Raises:
+            re.error: If a pattern is invalid
+        """
+        self._mask = mask
+        self._patterns = [
+            (re.compile(pattern), tuple(literals) if literals else None)
+            for pattern, literals in patterns
+        ]
+        branches: list[str] = []
+        self._standalone: list[Pattern[str]] = []
+        for i, (pattern, _) in enumerate(patterns):
+            scoped = _scoped(pattern)
+            if scoped is None:
+                self._standalone.append(self._patterns[i][0])
+            else:
+                branches.append(f"(?P<p{i}>{scoped})")
+        self._regex = re.compile("|".join(branches)) if branches else None
+        self._literals = self._collect_literals(self._patterns)
+
+    @staticmethod
+    def _collect_literals(
+        patterns: list[tuple[Pattern[str], tuple[str, ...] | None]],
+    ) -> tuple[str, ...] | None:
+        """Merge prefilter literals, or None if any pattern has none."""
+        literals: set[str] = set()
+        for _, pattern_literals in patterns:
+            if pattern_literals is None:
+                return None
+            literals.update(pattern_literals)
+        return tuple(sorted(literals))
+
+    def _may_match(self, folded: str) -> bool:
+        """Check the literal prefilter (False means no pattern can match)."""
+        if self._literals is None:
+            return True
+        for literal in self._literals:
+            if literal in folded:
+                return True
+        return False
+
+    def search(self, text: str) -> bool:
+        """Check whether any pattern matches text, with one combined search."""
+        if not self._may_match(fold(text)):
+            return False
+        if self._regex is not None and self._regex.search(text):
+            return True
+        return any(pattern.search(text) for pattern in self._standalone)
+
+    def mask(self, text: str) -> str:
+        """Mask every pattern match in text, applying patterns in order."""
+        folded = fold(text)
+        if not self._may_match(folded):
+            return text
+        for pattern, literals in self._patterns:
+            if literals is not None:
+                for literal in literals:
+                    if literal in folded:
+                        break
+                else:
+                    continue
+            masked = pattern.sub(self._replace, text)
+            if masked is not text:
+                text = masked
+                folded = fold(text)
+        return text
+
+    def _replace(self, match: Match[str]) -> str:
+        """Mask one match of a single pattern."""
+        return mask_match(match, match.groups(), self._mask)
+
+
+def compile_literals(values: Iterable[str]) -> Pattern[str] | None:
+    """
+    Compile strings into one regex matching any of them, longest first.
+
+    Args:
+        values: Literal strings (for example known secrets)
+
+    Returns:
+        Compiled alternation, or None if values is empty
+    """
+    ordered = sorted(values, key=len, reverse=True)
+    if not ordered:
+        return None
+    return re.compile("|".join(map(re.escape, ordered)))
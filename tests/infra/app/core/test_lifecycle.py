@@ -649,6 +649,36 @@ class TestShutdownPhases:
         # Error should be logged
         manager._lifecycle_logger.error.assert_called()
 
+    def test_shutdown_log_handlers_flushes_async_dispatchers(self):
+        """Test shutdown drains async log dispatchers without db handlers."""
+        app = Mock()
+        manager = LifecycleManager(app)
+        config = DotDict(logging=DotDict(level="info", location=0, micros=False))
+        manager.initialize(config)
+
+        with patch(
+            "appinfra.app.core.lifecycle.AsyncDispatchHandler.flush_all",
+            return_value=True,
+        ) as flush_all:
+            manager._shutdown_log_handlers()
+
+        flush_all.assert_called_once_with(5.0)
+
+    def test_shutdown_log_handlers_flushes_callback_pools(self):
+        """Test shutdown waits for asynchronous log callbacks."""
+        app = Mock()
+        manager = LifecycleManager(app)
+        config = DotDict(logging=DotDict(level="info", location=0, micros=False))
+        manager.initialize(config)
+
+        with patch(
+            "appinfra.app.core.lifecycle.CallbackWorkerPool.flush_all",
+            return_value=False,
+        ) as flush_all:
+            manager._shutdown_log_handlers()
+
+        flush_all.assert_called_once_with(5.0)
+
 
 @pytest.mark.unit
 class TestExecutePhase:
@@ -10,16 +10,23 @@ import logging
 import pytest
 
 from appinfra.app.builder import AppBuilder
-from appinfra.log import LogConfig, LoggerFactory, LogLevelManager
+from appinfra.log import (
+    LogConfig,
+    LoggerFactory,
+    LogLevelManager,
+    LogSamplingManager,
+)
 
 
 @pytest.fixture(autouse=True)
 def reset_manager():
     """Reset LogLevelManager and clear loggers before each test."""
     LogLevelManager.reset_instance()
+    LogSamplingManager.reset_instance()
     logging.root.manager.loggerDict.clear()
     yield
     LogLevelManager.reset_instance()
+    LogSamplingManager.reset_instance()
     logging.root.manager.loggerDict.clear()
 
 
@@ -61,6 +68,16 @@ class TestAppBuilderTopicLogging:
         assert manager.get_effective_level("/infra/api/rest") == "warning"
         assert manager.get_effective_level("/myapp/service/auth") == "info"
 
+    def test_with_topic_sampling(self):
+        """Test with_topic_sampling() adds an API sampling rule."""
+        AppBuilder("test-app").logging.with_topic_sampling(
+            "/infra/db/**", rate=0.1, per_second=50
+        ).done().build()
+
+        rule = LogSamplingManager.get_instance().get_sampler("/infra/db/pg").rule
+
+        assert (rule.rate, rule.per_second, rule.source) == (0.1, 50, "api")
+
     def test_with_runtime_updates_enabled(self):
         """Test with_runtime_updates(True) enables runtime updates."""
         # Build app with runtime updates enabled
@@ -0,0 +1,374 @@
+"""
+Tests for COPY-based bulk loading.
+
+The DBAPI cursor is faked (psycopg2 copy_expert and psycopg 3 copy styles);
+loads against a real server are covered in tests/integration/test_pg_class.py.
+"""
+
+import datetime
+import tracemalloc
+from contextlib import contextmanager
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+import sqlalchemy
+import sqlalchemy.dialects.postgresql
+
+from appinfra.db.pg import bulk
+from appinfra.db.pg.pg import PG
+from appinfra.errors import DatabaseError
+
+
+class _Psycopg2Cursor:
+    """Fake psycopg2 cursor recording COPY input and executed SQL."""
+
+    def __init__(self):
+        self.statements = []
+        self.copied = ""
+        self.reads = []
+        self.closed = False
+
+    def execute(self, sql):
+        self.statements.append(sql)
+
+    def copy_expert(self, sql, file, size=8192):
+        self.statements.append(sql)
+        while data := file.read(size):
+            self.reads.append(len(data))
+            self.copied += data
+
+    def close(self):
+        self.closed = True
+
+
+class _Psycopg3Cursor:
+    """Fake psycopg 3 cursor recording COPY writes."""
+
+    def __init__(self):
+        self.statements = []
+        self.copied = ""
+        self.closed = False
+
+    def execute(self, sql):
+        self.statements.append(sql)
+
+    @contextmanager
+    def copy(self, sql):
+        self.statements.append(sql)
+        writer = Mock()
+        writer.write.side_effect = lambda data: setattr(
+            self, "copied", self.copied + data
+        )
+        yield writer
+
+    def close(self):
+        self.closed = True
+
+
+def _engine(cursor):
+    """Build a fake engine whose raw connection returns cursor."""
+    engine = MagicMock()
+    engine.dialect = sqlalchemy.dialects.postgresql.dialect()
+    conn = engine.begin.return_value.__enter__.return_value
+    conn.connection.cursor.return_value = cursor
+    return engine
+
+
+@pytest.fixture
+def users():
+    """SQLAlchemy table with a primary key."""
+    return sqlalchemy.Table(
+        "users",
+        sqlalchemy.MetaData(),
+        sqlalchemy.Column("id", sqlalchemy.Integer, primary_key=True),
+        sqlalchemy.Column("name", sqlalchemy.String),
+        sqlalchemy.Column("score", sqlalchemy.Integer),
+    )
+
+
+@pytest.mark.unit
+class TestEncodeValue:
+    """Test COPY text format encoding."""
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            (None, "\\N"),
+            (True, "t"),
+            (False, "f"),
+            (42, "42"),
+            (1.5, "1.5"),
+            ("plain", "plain"),
+            ("a\tb\nc\\d\re", "a\\tb\\nc\\\\d\\re"),
+            (b"\x01\xff", "\\\\x01ff"),
+            (datetime.date(2024, 1, 2), "2024-01-02"),
+            (
+                datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.UTC),
+                "2024-01-02T03:04:05+00:00",
+            ),
+            ({"k": "v\n"}, '{"k": "v\\\\n"}'),
+            ([1, None, 3], '{"1",NULL,"3"}'),
+            ((True, "a b"), '{"t","a b"}'),
+            ([[1, 2], [3, 4]], '{{"1","2"},{"3","4"}}'),
+            (['q"', "b\\s"], '{"q\\\\"","b\\\\\\\\s"}'),
+            ([b"\x01"], '{"\\\\\\\\x01"}'),
+            ([], "{}"),
+        ],
+    )
+    def test_encode(self, value, expected):
+        """Test values are encoded and escaped for COPY text format."""
+        assert bulk.encode_value(value) == expected
+
+    def test_chunks(self):
+        """Test rows are grouped chunk_rows per chunk."""
+        chunks = list(bulk.iter_copy_chunks([(1, "a"), (2, None), (3, "c")], 2))
+        assert chunks == ["1\ta\n2\t\\N\n", "3\tc\n"]
+
+
+@pytest.mark.unit
+class TestNormalizeRows:
+    """Test supported row shapes."""
+
+    def test_dict_rows(self):
+        """Test columns default to the first row's keys."""
+        rows_in = iter([{"a": 1, "b": 2}, {"b": 4, "a": 3}])
+        names, rows = bulk.normalize_rows(rows_in, None)
+        assert names == ["a", "b"]
+        assert list(rows) == [(1, 2), (3, 4)]
+
+    def test_dict_rows_missing_key(self):
+        """Test dict rows missing a column raise KeyError."""
+        names, rows = bulk.normalize_rows([{"a": 1, "b": 2}, {"a": 3}], None)
+        with pytest.raises(KeyError):
+            list(rows)
+
+    def test_tuple_rows_require_columns(self):
+        """Test tuple rows need columns (explicit or default)."""
+        with pytest.raises(ValueError, match="columns are required"):
+            bulk.normalize_rows([(1, 2)], None)
+        names, rows = bulk.normalize_rows([(1, 2)], None, ["a", "b"])
+        assert names == ["a", "b"]
+        assert list(rows) == [(1, 2)]
+
+    def test_column_oriented(self):
+        """Test a mapping of columns is transposed lazily."""
+        names, rows = bulk.normalize_rows({"a": [1, 2], "b": ["x", "y"]}, None)
+        assert names == ["a", "b"]
+        assert list(rows) == [(1, "x"), (2, "y")]
+
+    def test_column_oriented_unequal_lengths(self):
+        """Test columns of different lengths are rejected."""
+        with pytest.raises(ValueError, match="equal-length"):
+            bulk.normalize_rows({"a": [1, 2], "b": [1]}, None)
+
+    def test_to_pydict(self):
+        """Test Arrow-like objects are converted via to_pydict()."""
+        table = Mock(spec=["to_pydict"])
+        table.to_pydict.return_value = {"a": [1], "b": [2]}
+        names, rows = bulk.normalize_rows(table, ["b"])
+        assert names == ["b"]
+        assert list(rows) == [(2,)]
+
+    def test_empty(self):
+        """Test an empty iterable yields no rows."""
+        names, rows = bulk.normalize_rows(iter([]), ["a"])
+        assert names == ["a"]
+        assert list(rows) == []
+
+    def test_rows_consumed_lazily(self):
+        """Test row iterables are not materialized."""
+        consumed = []
+
+        def gen():
+            for i in range(3):
+                consumed.append(i)
+                yield {"a": i}
+
+        _, rows = bulk.normalize_rows(gen(), None)
+        assert consumed == [0]
+        next(rows)
+        assert consumed == [0]
+        next(rows)
+        assert consumed == [0, 1]
+
+
+@pytest.mark.unit
+class TestBuildUpsert:
+    """Test upsert statement construction."""
+
+    def test_update(self):
+        """Test non-key columns are overwritten from EXCLUDED."""
+        sql = bulk.build_upsert("t", "s", ["id", "name"], "update", ["id"])
+        assert sql == (
+            "INSERT INTO t (id, name) SELECT DISTINCT ON (id) id, name FROM s "
+            "ORDER BY id, ctid DESC ON CONFLICT (id) "
+            "DO UPDATE SET name = EXCLUDED.name"
+        )
+
+    def test_update_only_keys_does_nothing(self):
+        """Test update with no non-key columns falls back to DO NOTHING."""
+        sql = bulk.build_upsert("t", "s", ["id"], "update", ["id"])
+        assert sql == "INSERT INTO t (id) SELECT id FROM s ON CONFLICT (id) DO NOTHING"
+
+    def test_nothing_without_target(self):
+        """Test DO NOTHING works without a conflict target."""
+        sql = bulk.build_upsert("t", "s", ["id"], "nothing", [])
+        assert sql.endswith("FROM s ON CONFLICT DO NOTHING")
+
+
+@pytest.mark.unit
+class TestBulkInsert:
+    """Test bulk_insert() against fake drivers."""
+
+    def test_copy_psycopg2(self, users):
+        """Test plain loads stream COPY data through copy_expert()."""
+        cursor = _Psycopg2Cursor()
+        rows = ({"id": i, "name": f"u{i}"} for i in range(5))
+
+        count = bulk.bulk_insert(_engine(cursor), users, rows, chunk_rows=2)
+
+        assert count == 5
+        assert cursor.statements == ["COPY users (id, name) FROM STDIN"]
+        assert cursor.copied.splitlines()[0] == "0\tu0"
+        assert len(cursor.copied.splitlines()) == 5
+        assert cursor.closed
+
+    def test_reader_respects_read_size(self, users, monkeypatch):
+        """Test copy_expert reads never exceed the requested size."""
+        monkeypatch.setattr(bulk, "COPY_READ_SIZE", 16)
+        cursor = _Psycopg2Cursor()
+        rows = [(i, "x" * 10, i) for i in range(20)]
+
+        bulk.bulk_insert(_engine(cursor), users, rows, chunk_rows=7)
+
+        assert max(cursor.reads) <= 16
+        assert len(cursor.copied.splitlines()) == 20
+
+    def test_memory_constant(self, users):
+        """Test streamed loads hold at most about one chunk in memory."""
+
+        class DiscardingCursor(_Psycopg2Cursor):
+            def copy_expert(self, sql, file, size=8192):
+                while file.read(size):
+                    pass
+
+        rows = ((i, f"name{i}", i) for i in range(50_000))
+        tracemalloc.start()
+        try:
+            count = bulk.bulk_insert(
+                _engine(DiscardingCursor()), users, rows, chunk_rows=1_000
+            )
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert count == 50_000
+        # 50k encoded rows are ~1MB; one chunk is ~20KB
+        assert peak < 250_000
+
+    def test_copy_psycopg3(self, users):
+        """Test psycopg 3 cursors are fed through cursor.copy()."""
+        cursor = _Psycopg3Cursor()
+
+        count = bulk.bulk_insert(
+            _engine(cursor), users, {"id": [1, 2], "name": ["a", "b"]}
+        )
+
+        assert count == 2
+        assert cursor.copied == "1\ta\n2\tb\n"
+
+    def test_tuple_rows_default_to_table_columns(self, users):
+        """Test tuple rows use the Table's column order."""
+        cursor = _Psycopg2Cursor()
+        bulk.bulk_insert(_engine(cursor), users, [(1, "a", 10)])
+        assert cursor.statements == ["COPY users (id, name, score) FROM STDIN"]
+
+    def test_upsert_stages_and_merges(self, users):
+        """Test upserts COPY into a temp table and merge on the primary key."""
+        cursor = _Psycopg2Cursor()
+
+        bulk.bulk_insert(
+            _engine(cursor), users, [{"id": 1, "name": "a"}], on_conflict="update"
+        )
+
+        create, copy, merge = cursor.statements
+        stage = create.split()[3]
+        assert create.startswith(f"CREATE TEMP TABLE {stage} (LIKE users")
+        assert create.endswith("ON COMMIT DROP")
+        assert copy == f"COPY {stage} (id, name) FROM STDIN"
+        assert merge == (
+            f"INSERT INTO users (id, name) SELECT DISTINCT ON (id) id, name "
+            f"FROM {stage} ORDER BY id, ctid DESC "
+            "ON CONFLICT (id) DO UPDATE SET name = EXCLUDED.name"
+        )
+
+    def test_string_table_quoting(self):
+        """Test schema-qualified names are quoted per part."""
+        cursor = _Psycopg2Cursor()
+        bulk.bulk_insert(_engine(cursor), "Analytics.events", [{"id": 1, "user": "a"}])
+        assert cursor.statements == ['COPY "Analytics".events (id, "user") FROM STDIN']
+
+    def test_update_requires_conflict_columns_for_names(self):
+        """Test on_conflict='update' on a table name needs conflict_columns."""
+        with pytest.raises(ValueError, match="conflict_columns"):
+            bulk.bulk_insert(
+                _engine(_Psycopg2Cursor()), "t", [{"id": 1}], on_conflict="update"
+            )
+
+    def test_invalid_arguments(self, users):
+        """Test unknown on_conflict and non-positive chunk_rows are rejected."""
+        engine = _engine(_Psycopg2Cursor())
+        with pytest.raises(ValueError, match="Unknown on_conflict"):
+            bulk.bulk_insert(engine, users, [], on_conflict="replace")
+        with pytest.raises(ValueError, match="chunk_rows"):
+            bulk.bulk_insert(engine, users, [], chunk_rows=0)
+
+    def test_empty_rows(self):
+        """Test empty input does not touch the database."""
+        engine = _engine(_Psycopg2Cursor())
+        assert bulk.bulk_insert(engine, "t", []) == 0
+        engine.begin.assert_not_called()
+
+    def test_unsupported_driver(self, users):
+        """Test drivers without COPY support raise DatabaseError."""
+        cursor = Mock(spec=["execute", "close"])
+        with pytest.raises(DatabaseError, match="does not support COPY"):
+            bulk.bulk_insert(_engine(cursor), users, [{"id": 1}])
+        cursor.close.assert_called_once()
+
+
+@pytest.mark.unit
+class TestPGBulkInsert:
+    """Test PG.bulk_insert() wiring."""
+
+    @patch("appinfra.db.pg.pg.LoggerFactory")
+    def test_readonly_rejected(self, mock_logger_factory):
+        """Test readonly PG refuses bulk loads."""
+        mock_logger_factory.derive.return_value = Mock()
+        pg = PG(
+            Mock(), {"url": "postgresql+psycopg2://localhost/test", "readonly": True}
+        )
+
+        with pytest.raises(DatabaseError, match="readonly"):
+            pg.bulk_insert("t", [{"id": 1}])
+        pg.engine.dispose()
+
+    @patch("appinfra.db.pg.pg.bulk.bulk_insert", return_value=3)
+    @patch("appinfra.db.pg.pg.LoggerFactory")
+    def test_delegates(self, mock_logger_factory, mock_bulk_insert):
+        """Test arguments are passed through to the COPY loader."""
+        mock_logger_factory.derive.return_value = Mock()
+        pg = PG(Mock(), {"url": "postgresql+psycopg2://localhost/test"})
+
+        rows = [(1,), (2,), (3,)]
+        assert pg.bulk_insert("t", rows, columns=["id"], on_conflict="nothing") == 3
+        mock_bulk_insert.assert_called_once_with(
+            pg.engine,
+            "t",
+            rows,
+            columns=["id"],
+            chunk_rows=10_000,
+            on_conflict="nothing",
+            conflict_columns=None,
+        )
+        pg.engine.dispose()
@@ -4,6 +4,7 @@ Comprehensive tests for core PG utilities.
 Tests configuration validation, query logging, event listeners, and initialization helpers.
 """
 
+import logging
 from unittest.mock import Mock, patch
 
 import pytest
@@ -22,6 +23,8 @@ from appinfra.db.pg.core import (
     log_query_with_timing,
     validate_init_params,
 )
+from appinfra.log import LogConfig, Logger
+from appinfra.log.lazy import resolve_extra
 
 
 @pytest.mark.unit
@@ -70,9 +73,16 @@ class TestConfigValidator:
         cfg = Mock()
         cfg.url = "mysql://localhost/test"
 
-        with pytest.raises(ValueError, match="must start with"):
+        with pytest.raises(ValueError, match=r"'postgresql\+<driver>://'"):
             ConfigValidator.validate_config(cfg)
 
+    def test_accepts_explicit_driver(self):
+        """Test accepts postgresql+<driver>:// URLs."""
+        cfg = Mock()
+        cfg.url = "postgresql+psycopg://localhost/test"
+
+        ConfigValidator.validate_config(cfg)
+
     def test_get_engine_kwargs_with_defaults(self):
         """Test get_engine_kwargs returns default values when attrs missing."""
         cfg = Mock(spec=[])  # Empty spec = no attributes
@@ -190,6 +200,96 @@ class TestQueryLogger:
             assert mock_listen.call_count >= 1
 
 
+class _ListHandler(logging.Handler):
+    """Collects emitted records."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+def _sqlite_query_logger(logger_level: str, query_level: int | None):
+    """Create a SQLite engine with a QueryLogger attached."""
+    engine = sqlalchemy.create_engine("sqlite://")
+    lg = Logger("/test/db", LogConfig.from_params(logger_level, location=0))
+    handler = _ListHandler()
+    lg.addHandler(handler)
+    lg.propagate = False
+    query_logger = QueryLogger(engine, lg, query_level)
+    query_logger.setup_callbacks({})
+    handler.records.clear()
+    return engine, query_logger, handler
+
+
+@pytest.mark.unit
+class TestQueryLoggerAfterExecute:
+    """Test the after_execute hook on a real SQLite engine."""
+
+    def test_disabled_level_skips_rendering(self):
+        """Test no record and no compilation when the query level is disabled."""
+        engine, query_logger, handler = _sqlite_query_logger("info", logging.DEBUG)
+
+        with patch.object(query_logger, "render_query") as render:
+            with engine.connect() as conn:
+                conn.execute(sqlalchemy.text("SELECT 1"))
+
+        assert handler.records == []
+        render.assert_not_called()
+
+    def test_none_level_skips_logging(self):
+        """Test query logging is off when query_lg_level is None."""
+        engine, _, handler = _sqlite_query_logger("debug", None)
+
+        with engine.connect() as conn:
+            conn.execute(sqlalchemy.text("SELECT 1"))
+
+        assert handler.records == []
+
+    def test_query_rendered_lazily(self):
+        """Test literal SQL is rendered only when the record is formatted."""
+        engine, query_logger, handler = _sqlite_query_logger("debug", logging.DEBUG)
+
+        with patch.object(
+            query_logger, "render_query", wraps=query_logger.render_query
+        ) as render:
+            stmt = sqlalchemy.text("SELECT  :x").bindparams(
+                sqlalchemy.bindparam("x", type_=sqlalchemy.Integer)
+            )
+            with engine.connect() as conn:
+                conn.execute(stmt, {"x": 42})
+
+            [record] = handler.records
+            render.assert_not_called()
+            extra = resolve_extra(record)
+
+        render.assert_called_once()
+        assert extra["query"] == "SELECT 42"
+        assert extra["after"] >= 0
+
+    def test_render_query_literal_binds(self):
+        """Test statements render with literal values and normalized whitespace."""
+        query_logger = QueryLogger(Mock(), Mock(), query_lg_level=10)
+        table = sqlalchemy.table("users", sqlalchemy.column("id"))
+        stmt = sqlalchemy.select(table).where(table.c.id == 7)
+
+        assert query_logger.render_query(stmt) == (
+            "SELECT users.id FROM users WHERE users.id = 7"
+        )
+
+    def test_render_query_keeps_placeholders_when_not_renderable(self):
+        """Test statements without renderable values fall back to placeholders."""
+        query_logger = QueryLogger(Mock(), Mock(), query_lg_level=10)
+
+        rendered = query_logger.render_query(
+            sqlalchemy.text("SELECT :x"), {"x": object()}
+        )
+
+        assert rendered == "SELECT %(x)s"
+
+
 @pytest.mark.unit
 class TestLogQueryWithTiming:
     """Test log_query_with_timing function."""
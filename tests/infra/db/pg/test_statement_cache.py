@@ -0,0 +1,199 @@
+"""
+Tests for the compiled statement cache.
+
+Compiled-cache behavior and per-connection setup are exercised on SQLite (no
+server needed); PG wiring is checked without connecting.
+"""
+
+import sqlite3
+from unittest.mock import Mock, patch
+
+import pytest
+import sqlalchemy
+from sqlalchemy import text
+
+from appinfra.db.pg.pg import PG
+from appinfra.db.pg.statement_cache import StatementCache
+
+
+class _Connection(sqlite3.Connection):
+    """sqlite3 connection that accepts attributes, standing in for psycopg."""
+
+
+@pytest.mark.unit
+class TestStatementCacheInit:
+    """Test StatementCache construction."""
+
+    def test_defaults(self):
+        """Test default options."""
+        cache = StatementCache()
+        assert cache.size == 500
+        assert cache.prepare_threshold == 2
+        assert cache.server_prepare is False
+
+    def test_rejects_invalid_size(self):
+        """Test size must be positive."""
+        with pytest.raises(ValueError, match="size must be positive"):
+            StatementCache(size=0)
+
+    def test_rejects_negative_threshold(self):
+        """Test prepare_threshold cannot be negative."""
+        with pytest.raises(ValueError, match="prepare_threshold"):
+            StatementCache(prepare_threshold=-1)
+
+    @pytest.mark.parametrize("value", [None, False, "yes", Mock()])
+    def test_from_config_disabled(self, value):
+        """Test values other than True or a mapping disable the cache."""
+        assert StatementCache.from_config(value) is None
+
+    def test_from_config_true(self):
+        """Test True enables the cache with defaults."""
+        assert StatementCache.from_config(True).size == 500
+
+    def test_from_config_mapping(self):
+        """Test a mapping passes options through."""
+        cache = StatementCache.from_config({"size": 50, "prepare_threshold": 0})
+        assert cache.size == 50
+        assert cache.prepare_threshold == 0
+
+    def test_from_config_enabled_false(self):
+        """Test enabled: false in a mapping disables the cache."""
+        assert StatementCache.from_config({"enabled": False}) is None
+
+
+@pytest.mark.unit
+class TestStatementCacheEngineKwargs:
+    """Test engine configuration per driver."""
+
+    def test_psycopg2_uses_compiled_cache_only(self):
+        """Test psycopg2 gets the compiled cache but no prepare arguments."""
+        cache = StatementCache()
+        kwargs = cache.engine_kwargs("postgresql+psycopg2://localhost/test")
+
+        assert "compiled_cache" in kwargs["execution_options"]
+        assert "connect_args" not in kwargs
+        assert cache.server_prepare is False
+
+    def test_psycopg_enables_server_prepare(self):
+        """Test psycopg (v3) gets prepared statement connect arguments."""
+        cache = StatementCache(size=64, prepare_threshold=1)
+        kwargs = cache.engine_kwargs("postgresql+psycopg://localhost/test")
+
+        assert kwargs["connect_args"] == {"prepare_threshold": 1}
+        assert cache.server_prepare is True
+        assert cache.stats()["server_prepare"] is True
+
+    def test_install_sets_prepared_max_on_connect(self):
+        """Test install() sets prepared_max on each new DBAPI connection."""
+        cache = StatementCache(size=64, prepare_threshold=1)
+        kwargs = cache.engine_kwargs("postgresql+psycopg://localhost/test")
+        kwargs.pop("connect_args")
+        engine = sqlalchemy.create_engine(
+            "sqlite://",
+            creator=lambda: sqlite3.connect(":memory:", factory=_Connection),
+            **kwargs,
+        )
+        cache.install(engine)
+
+        with engine.connect() as conn:
+            assert conn.connection.dbapi_connection.prepared_max == 64
+        engine.dispose()
+
+    def test_install_without_server_prepare(self):
+        """Test install() leaves psycopg2 connections untouched."""
+        cache = StatementCache()
+        engine = sqlalchemy.create_engine(
+            "sqlite://",
+            creator=lambda: sqlite3.connect(":memory:", factory=_Connection),
+            **cache.engine_kwargs("postgresql+psycopg2://localhost/test"),
+        )
+        cache.install(engine)
+
+        with engine.connect() as conn:
+            assert not hasattr(conn.connection.dbapi_connection, "prepared_max")
+        engine.dispose()
+
+
+@pytest.mark.unit
+class TestStatementCacheStats:
+    """Test hit/miss accounting through SQLAlchemy execution."""
+
+    def test_hits_and_misses(self):
+        """Test repeated statements hit the cache after the first compile."""
+        cache = StatementCache(size=10)
+        engine = sqlalchemy.create_engine(
+            "sqlite://", **cache.engine_kwargs("sqlite://")
+        )
+        with sqlalchemy.orm.Session(engine) as session:
+            for i in range(5):
+                session.execute(text("SELECT :x"), {"x": i})
+
+        stats = cache.stats()
+        assert stats["entries"] == 1
+        assert stats["misses"] == 1
+        assert stats["hits"] == 4
+        assert stats["hit_rate"] == pytest.approx(0.8)
+        engine.dispose()
+
+    def test_size_bounds_entries(self):
+        """Test the cache does not grow far beyond its size."""
+        cache = StatementCache(size=4)
+        engine = sqlalchemy.create_engine(
+            "sqlite://", **cache.engine_kwargs("sqlite://")
+        )
+        with engine.connect() as conn:
+            for i in range(50):
+                conn.execute(text(f"SELECT {i}"))
+
+        # LRUCache prunes back to size once it exceeds size * (1 + threshold)
+        assert cache.stats()["entries"] <= 6
+        engine.dispose()
+
+    def test_clear(self):
+        """Test clear() empties the cache and resets counters."""
+        cache = StatementCache()
+        engine = sqlalchemy.create_engine(
+            "sqlite://", **cache.engine_kwargs("sqlite://")
+        )
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        cache.clear()
+
+        stats = cache.stats()
+        assert (stats["entries"], stats["hits"], stats["misses"]) == (0, 0, 0)
+        assert stats["hit_rate"] == 0.0
+        engine.dispose()
+
+
+@pytest.mark.unit
+class TestPGStatementCache:
+    """Test PG wiring (engines are created but never connected)."""
+
+    @patch("appinfra.db.pg.pg.LoggerFactory")
+    def test_disabled_by_default(self, mock_logger_factory):
+        """Test get_pool_status has no cache section unless configured."""
+        mock_logger_factory.derive.return_value = Mock()
+        pg = PG(Mock(), {"url": "postgresql+psycopg2://localhost/test"})
+
+        assert pg._statement_cache is None
+        assert "statement_cache" not in pg.get_pool_status()
+        pg.engine.dispose()
+
+    @patch("appinfra.db.pg.pg.LoggerFactory")
+    def test_enabled_reports_in_pool_status(self, mock_logger_factory):
+        """Test the cache is installed on the engine and reported."""
+        mock_logger_factory.derive.return_value = Mock()
+        pg = PG(
+            Mock(),
+            {
+                "url": "postgresql+psycopg2://localhost/test",
+                "statement_cache": {"size": 32},
+            },
+        )
+
+        compiled_cache = pg.engine.get_execution_options()["compiled_cache"]
+        assert compiled_cache is pg._statement_cache._cache
+        status = pg.get_pool_status()
+        assert status["statement_cache"]["size"] == 32
+        assert status["statement_cache"]["hits"] == 0
+        pg.engine.dispose()
@@ -0,0 +1,182 @@
+"""
+Tests for server-side cursor streaming.
+
+Streaming behavior is exercised on SQLite (stream_results is a no-op there but
+the batching, conversion and cleanup paths are the same); server-side cursors
+against PostgreSQL are covered in tests/performance/db/test_stream.py.
+"""
+
+import sys
+import tracemalloc
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+import sqlalchemy
+
+from appinfra.db.pg.pg import PG
+from appinfra.db.pg.scoped import ScopedPG
+from appinfra.db.pg.stream import stream_query
+from appinfra.errors import DependencyError
+
+COUNT_QUERY = (
+    "WITH RECURSIVE c(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM c WHERE x < :n) "
+    "SELECT x, x * 2 AS y FROM c"
+)
+
+
+@pytest.fixture
+def engine():
+    """SQLite engine tracking connection checkouts."""
+    engine = sqlalchemy.create_engine("sqlite://", poolclass=sqlalchemy.pool.StaticPool)
+    engine.checked_out = 0
+
+    @sqlalchemy.event.listens_for(engine, "checkout")
+    def _checkout(*args):
+        engine.checked_out += 1
+
+    @sqlalchemy.event.listens_for(engine, "checkin")
+    def _checkin(*args):
+        engine.checked_out -= 1
+
+    yield engine
+    engine.dispose()
+
+
+@pytest.mark.unit
+class TestStreamQuery:
+    """Test batching and conversion."""
+
+    def test_batches(self, engine):
+        """Test rows are yielded batch_size at a time."""
+        batches = list(stream_query(engine, COUNT_QUERY, {"n": 25}, batch_size=10))
+
+        assert [len(b) for b in batches] == [10, 10, 5]
+        assert tuple(batches[0][0]) == (1, 2)
+        assert batches[2][-1].y == 50
+
+    def test_columns_list(self, engine):
+        """Test as_columns='list' yields column-oriented dicts."""
+        batches = list(
+            stream_query(engine, COUNT_QUERY, {"n": 3}, batch_size=2, as_columns="list")
+        )
+        assert batches == [{"x": [1, 2], "y": [2, 4]}, {"x": [3], "y": [6]}]
+
+    def test_columns_numpy(self, engine):
+        """Test as_columns='numpy' yields arrays."""
+        numpy = pytest.importorskip("numpy")
+        (batch,) = stream_query(engine, COUNT_QUERY, {"n": 3}, as_columns="numpy")
+        assert isinstance(batch["x"], numpy.ndarray)
+        assert batch["y"].tolist() == [2, 4, 6]
+
+    def test_numpy_missing(self, engine, monkeypatch):
+        """Test a missing numpy raises DependencyError before connecting."""
+        monkeypatch.setitem(sys.modules, "numpy", None)
+        with pytest.raises(DependencyError, match="numpy"):
+            stream_query(engine, COUNT_QUERY, as_columns="numpy")
+        assert engine.checked_out == 0
+
+    def test_invalid_arguments(self, engine):
+        """Test invalid arguments raise when stream_query() is called."""
+        with pytest.raises(ValueError, match="batch_size"):
+            stream_query(engine, COUNT_QUERY, batch_size=0)
+        with pytest.raises(ValueError, match="Unknown as_columns"):
+            stream_query(engine, COUNT_QUERY, as_columns="arrow")
+
+    def test_sqlalchemy_executable(self, engine):
+        """Test Core selects are accepted."""
+        stmt = sqlalchemy.select(sqlalchemy.literal(7).label("v"))
+        (batch,) = stream_query(engine, stmt)
+        assert batch[0].v == 7
+
+
+@pytest.mark.unit
+class TestStreamConnection:
+    """Test connection lifetime."""
+
+    def test_connection_taken_lazily(self, engine):
+        """Test no connection is held until the first batch is requested."""
+        gen = stream_query(engine, COUNT_QUERY, {"n": 5})
+        assert engine.checked_out == 0
+        next(gen)
+        assert engine.checked_out == 1
+        gen.close()
+
+    def test_single_connection_until_exhausted(self, engine):
+        """Test one connection is held for the whole scan and then released."""
+        held = []
+        for _ in stream_query(engine, COUNT_QUERY, {"n": 100}, batch_size=10):
+            held.append(engine.checked_out)
+        assert held == [1] * 10
+        assert engine.checked_out == 0
+
+    def test_early_break_releases_connection(self, engine):
+        """Test breaking out of the loop closes the cursor and connection."""
+        gen = stream_query(engine, COUNT_QUERY, {"n": 1000}, batch_size=10)
+        for _ in gen:
+            break
+        gen.close()
+        assert engine.checked_out == 0
+
+    def test_garbage_collected_generator_releases_connection(self, engine):
+        """Test an abandoned generator releases its connection."""
+        gen = stream_query(engine, COUNT_QUERY, {"n": 1000}, batch_size=10)
+        next(gen)
+        del gen
+        assert engine.checked_out == 0
+
+    def test_memory_flat(self, engine):
+        """Test peak memory depends on batch_size, not on the number of rows."""
+
+        def peak(n):
+            tracemalloc.start()
+            try:
+                for _ in stream_query(engine, COUNT_QUERY, {"n": n}, batch_size=500):
+                    pass
+                return tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+        small, large = peak(5_000), peak(100_000)
+        # 20x the rows; a materialized result would grow peak memory ~20x
+        assert large < small * 2
+
+
+@pytest.mark.unit
+class TestPGStream:
+    """Test PG.stream() and ScopedPG.stream() wiring."""
+
+    @patch("appinfra.db.pg.pg.stream_query")
+    @patch("appinfra.db.pg.pg.LoggerFactory")
+    def test_pg_delegates(self, mock_logger_factory, mock_stream_query):
+        """Test PG.stream() streams from its engine."""
+        mock_logger_factory.derive.return_value = Mock()
+        pg = PG(Mock(), {"url": "postgresql+psycopg2://localhost/test"})
+
+        result = pg.stream("SELECT 1", {"a": 1}, batch_size=5, as_columns="list")
+
+        assert result is mock_stream_query.return_value
+        mock_stream_query.assert_called_once_with(
+            pg.engine, "SELECT 1", {"a": 1}, 5, "list"
+        )
+        pg.engine.dispose()
+
+    def test_scoped_sets_search_path(self):
+        """Test ScopedPG.stream() sets search_path on the streaming connection."""
+        conn = MagicMock()
+        result = conn.execution_options.return_value.execute.return_value
+        result.keys.return_value = ["x"]
+        result.partitions.return_value = iter([[(1,)]])
+        mock_pg = MagicMock()
+        mock_pg.engine.connect.return_value.__enter__.return_value = conn
+
+        scoped = ScopedPG(MagicMock(), mock_pg, "tenant_a")
+        batches = list(scoped.stream("SELECT x FROM t", batch_size=50))
+
+        assert batches == [[(1,)]]
+        assert 'SET LOCAL search_path TO "tenant_a", public' in str(
+            conn.execute.call_args[0][0]
+        )
+        conn.execution_options.assert_called_once_with(
+            stream_results=True, yield_per=50
+        )
+        result.close.assert_called_once()
@@ -217,3 +217,32 @@ class TestSQLiteEngineKwargs:
         ):
             db = SQLite(mock_logger, config)
             assert db.engine is not None
+
+
+class TestSQLiteQueryStats:
+    """Test statement statistics on SQLite."""
+
+    def test_disabled_by_default(self, sqlite_db):
+        """Test query stats are off unless configured."""
+        assert sqlite_db.query_stats is None
+        assert sqlite_db.get_query_stats() == {}
+
+    def test_enabled_records_fingerprints(self, mock_logger):
+        """Test query_stats: true groups statements by fingerprint."""
+        config = Mock(spec=["url", "query_stats"])
+        config.url = "sqlite:///:memory:"
+        config.query_stats = True
+
+        with patch(
+            "appinfra.db.sqlite.sqlite.LoggerFactory.derive", return_value=mock_logger
+        ):
+            db = SQLite(mock_logger, config)
+
+        with db.connect() as conn:
+            conn.execute(text("CREATE TABLE t (id INTEGER)"))
+            for i in range(3):
+                conn.execute(text(f"SELECT id FROM t WHERE id = {i}"))
+
+        stats = db.get_query_stats()
+        assert stats["SELECT id FROM t WHERE id = ?"]["count"] == 3
+        db.dispose()
@@ -0,0 +1,222 @@
+"""
+Tests for client-side statement statistics.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+import sqlalchemy
+from sqlalchemy import text
+
+from appinfra.db.query_stats import (
+    OTHER_FINGERPRINT,
+    SUMMARY_MESSAGE,
+    QueryStats,
+    fingerprint,
+)
+
+
+@pytest.fixture
+def engine():
+    """Create an in-memory SQLite engine with a small table."""
+    engine = sqlalchemy.create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE t (id INTEGER, name TEXT)"))
+    yield engine
+    engine.dispose()
+
+
+class TestFingerprint:
+    """Test statement normalization."""
+
+    def test_literals_replaced(self):
+        """Test numeric and string literals become placeholders."""
+        assert (
+            fingerprint("SELECT * FROM t WHERE id = 42 AND name = 'o''brien'")
+            == "SELECT * FROM t WHERE id = ? AND name = ?"
+        )
+
+    def test_bind_styles_replaced(self):
+        """Test pyformat, format, numeric and named binds normalize alike."""
+        expected = "SELECT * FROM t WHERE id = ?"
+        assert fingerprint("SELECT * FROM t WHERE id = %(id_1)s") == expected
+        assert fingerprint("SELECT * FROM t WHERE id = %s") == expected
+        assert fingerprint("SELECT * FROM t WHERE id = $1") == expected
+        assert fingerprint("SELECT * FROM t WHERE id = :id") == expected
+
+    def test_casts_preserved(self):
+        """Test PostgreSQL :: casts are not treated as named binds."""
+        assert fingerprint("SELECT x::int FROM t") == "SELECT x::int FROM t"
+
+    def test_identifiers_with_digits_preserved(self):
+        """Test digits inside identifiers are kept."""
+        assert fingerprint("SELECT col1 FROM t2") == "SELECT col1 FROM t2"
+
+    def test_in_lists_collapsed(self):
+        """Test IN lists of any length share a fingerprint."""
+        short = fingerprint("SELECT * FROM t WHERE id IN (1, 2)")
+        long = fingerprint("SELECT * FROM t WHERE id IN (%(a)s, %(b)s, %(c)s)")
+        assert short == long == "SELECT * FROM t WHERE id IN (...)"
+
+    def test_values_rows_collapsed(self):
+        """Test multi-row VALUES collapse to a single row."""
+        assert (
+            fingerprint("INSERT INTO t (id, name) VALUES (1, 'a'), (2, 'b')")
+            == "INSERT INTO t (id, name) VALUES (?, ?)"
+        )
+
+    def test_comments_and_whitespace_normalized(self):
+        """Test comments are stripped and whitespace collapsed."""
+        assert (
+            fingerprint("SELECT /* hint */ id\n  FROM t -- trailing\n")
+            == "SELECT id FROM t"
+        )
+
+
+class TestQueryStats:
+    """Test the statistics table."""
+
+    def test_invalid_options(self):
+        """Test non-positive limits are rejected."""
+        with pytest.raises(ValueError):
+            QueryStats(top_n=0)
+        with pytest.raises(ValueError):
+            QueryStats(max_statements=0)
+
+    def test_record_aggregates_by_fingerprint(self):
+        """Test executions of the same shape share one entry."""
+        stats = QueryStats()
+        stats.record("SELECT * FROM t WHERE id = 1", 0.001, rows=1)
+        stats.record("SELECT * FROM t WHERE id = 2", 0.003, rows=1)
+        stats.record("SELECT * FROM t WHERE id = 3", 0.002, error=True)
+
+        entry = stats.snapshot()["SELECT * FROM t WHERE id = ?"]
+        assert entry["count"] == 3
+        assert entry["errors"] == 1
+        assert entry["rows"] == 2
+        assert entry["total"] == pytest.approx(0.006)
+        assert entry["mean"] == pytest.approx(0.002)
+        assert entry["max"] == pytest.approx(0.003)
+        assert entry["p50"] <= entry["p95"] <= entry["p99"]
+
+    def test_max_statements_overflow(self):
+        """Test fingerprints beyond the limit are grouped under <other>."""
+        stats = QueryStats(max_statements=1)
+        stats.record("SELECT a FROM t", 0.001)
+        stats.record("SELECT b FROM t", 0.001)
+        stats.record("SELECT c FROM t", 0.001)
+
+        snapshot = stats.snapshot()
+        assert set(snapshot) == {"SELECT a FROM t", OTHER_FINGERPRINT}
+        assert snapshot[OTHER_FINGERPRINT]["count"] == 2
+
+    def test_top_orders_descending(self):
+        """Test top() sorts by the requested key."""
+        stats = QueryStats()
+        stats.record("SELECT a FROM t", 0.010)
+        for _ in range(3):
+            stats.record("SELECT b FROM t", 0.001)
+
+        assert [e["query"] for e in stats.top(by="total")] == [
+            "SELECT a FROM t",
+            "SELECT b FROM t",
+        ]
+        assert stats.top(1, by="count")[0]["query"] == "SELECT b FROM t"
+
+    def test_top_unknown_key(self):
+        """Test top() rejects unknown orderings."""
+        with pytest.raises(ValueError, match="Unknown ordering"):
+            QueryStats().top(by="latency")
+
+    def test_reset(self):
+        """Test reset() discards statistics."""
+        stats = QueryStats()
+        stats.record("SELECT 1", 0.001)
+        stats.reset()
+        assert stats.snapshot() == {}
+
+    def test_summary_logged_once_per_interval(self):
+        """Test the top-N summary is logged when the interval elapses."""
+        lg = Mock()
+        stats = QueryStats(lg, summary_interval=3600, top_n=1)
+        stats._last_summary -= 3600
+        stats.record("SELECT a FROM t", 0.001)
+        stats.record("SELECT b FROM t", 0.002)
+
+        lg.info.assert_called_once()
+        args, kwargs = lg.info.call_args
+        assert args == (SUMMARY_MESSAGE,)
+        assert len(kwargs["extra"]["top"]) == 1
+
+    def test_no_summary_without_interval(self):
+        """Test no summary is logged when summary_interval is 0."""
+        lg = Mock()
+        stats = QueryStats(lg)
+        stats.record("SELECT 1", 0.001)
+        lg.info.assert_not_called()
+
+
+class TestQueryStatsFromConfig:
+    """Test construction from database configuration."""
+
+    @pytest.mark.parametrize("value", [None, False, "yes", Mock()])
+    def test_disabled_values(self, value):
+        """Test values other than True or a mapping disable statistics."""
+        assert QueryStats.from_config(value) is None
+
+    def test_true_uses_defaults(self):
+        """Test True enables statistics with default options."""
+        stats = QueryStats.from_config(True)
+        assert stats is not None
+        assert stats.top_n == 10
+
+    def test_mapping_options(self):
+        """Test a mapping passes options through."""
+        stats = QueryStats.from_config({"top_n": 3, "summary_interval": 60})
+        assert stats.top_n == 3
+        assert stats.summary_interval == 60
+
+    def test_mapping_enabled_false(self):
+        """Test enabled: false in a mapping disables statistics."""
+        assert QueryStats.from_config({"enabled": False, "top_n": 3}) is None
+
+
+class TestQueryStatsEngine:
+    """Test collection from SQLAlchemy engine events."""
+
+    def test_executions_recorded(self, engine):
+        """Test cursor executions are timed and grouped."""
+        stats = QueryStats()
+        stats.attach(engine)
+        with engine.begin() as conn:
+            conn.execute(text("INSERT INTO t VALUES (1, 'a')"))
+            conn.execute(text("INSERT INTO t VALUES (2, 'b')"))
+            conn.execute(text("SELECT id FROM t WHERE id = :id"), {"id": 1})
+
+        snapshot = stats.snapshot()
+        inserts = snapshot["INSERT INTO t VALUES (?, ?)"]
+        assert inserts["count"] == 2
+        assert inserts["rows"] == 2
+        assert inserts["total"] > 0
+        assert snapshot["SELECT id FROM t WHERE id = ?"]["count"] == 1
+
+    def test_errors_recorded(self, engine):
+        """Test failed executions count as errors."""
+        stats = QueryStats()
+        stats.attach(engine)
+        with engine.connect() as conn:
+            with pytest.raises(sqlalchemy.exc.OperationalError):
+                conn.execute(text("SELECT missing FROM t"))
+
+        entry = stats.snapshot()["SELECT missing FROM t"]
+        assert entry["count"] == 1
+        assert entry["errors"] == 1
+
+    def test_detach(self, engine):
+        """Test detach() stops collection."""
+        stats = QueryStats()
+        stats.attach(engine)
+        stats.detach()
+        with engine.connect() as conn:
+            conn.execute(text("SELECT id FROM t"))
+        assert stats.snapshot() == {}
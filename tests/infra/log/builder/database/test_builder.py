@@ -15,6 +15,7 @@ from appinfra.log.builder.database import (
     load_database_logging_config,
 )
 from appinfra.log.builder.database.config import DatabaseHandlerConfig
+from appinfra.log.errors import LogConfigError
 
 
 @pytest.fixture
@@ -177,6 +178,23 @@ class TestWithCriticalErrorFlush:
             assert "fatal" in handler_config.critical_trigger_fields
             assert handler_config.critical_flush_timeout == 3.0
 
+    def test_sets_mode(self, mock_db_interface):
+        """Test the critical flush mode is applied to database handlers."""
+        builder = (
+            DatabaseLoggingBuilder("test")
+            .with_database_table("logs", mock_db_interface)
+            .with_critical_error_flush(mode="signal")
+        )
+
+        assert builder._handlers[0].critical_flush_mode == "signal"
+
+    def test_rejects_unknown_mode(self, mock_db_interface):
+        """Test an unknown mode raises LogConfigError."""
+        builder = DatabaseLoggingBuilder("test")
+
+        with pytest.raises(LogConfigError):
+            builder.with_critical_error_flush(mode="alarm")
+
 
 @pytest.mark.unit
 class TestBuild:
@@ -12,6 +12,7 @@ import pytest
 
 from appinfra.log.builder.database.config import DatabaseHandlerConfig
 from appinfra.log.config import LogConfig
+from appinfra.log.errors import LogConfigError
 
 
 @pytest.fixture
@@ -91,6 +92,19 @@ class TestDatabaseHandlerConfigInit:
 
         assert config.data_mapper == config._default_data_mapper
 
+    def test_critical_flush_mode_defaults_to_writer(self, mock_db_interface):
+        """Test critical rows go through the background writer by default."""
+        config = DatabaseHandlerConfig("test_logs", mock_db_interface)
+
+        assert config.critical_flush_mode == "writer"
+
+    def test_rejects_unknown_critical_flush_mode(self, mock_db_interface):
+        """Test an unknown critical flush mode is a configuration error."""
+        with pytest.raises(LogConfigError, match="critical_flush_mode"):
+            DatabaseHandlerConfig(
+                "test_logs", mock_db_interface, critical_flush_mode="alarm"
+            )
+
 
 @pytest.mark.unit
 class TestDefaultDataMapper:
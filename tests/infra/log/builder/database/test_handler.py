@@ -6,6 +6,7 @@ Tests batching, critical flush, SQL caching, error handling, and performance opt
 
 import logging
 import signal
+import threading
 import time
 from datetime import datetime
 from unittest.mock import Mock, patch
@@ -55,7 +56,17 @@ def log_config():
 @pytest.fixture
 def handler(mock_logger, handler_config, log_config):
     """Create DatabaseHandler instance for testing."""
-    return DatabaseHandler(mock_logger, handler_config, log_config)
+    handler = DatabaseHandler(mock_logger, handler_config, log_config)
+    yield handler
+    handler.close()
+
+
+def _wait_until(predicate, timeout=2.0):
+    """Wait for the background flusher to reach a state."""
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    return predicate()
 
 
 @pytest.mark.unit
@@ -70,9 +81,9 @@ class TestDatabaseHandlerInit:
         assert handler.handler_config == handler_config
         assert handler.log_config == log_config
         assert handler.batch == []
-        assert isinstance(handler.last_flush, datetime)
+        assert isinstance(handler.last_flush, float)
         assert handler._sql_cache == {}
-        assert handler._table_metadata is None
+        assert handler._flusher is None
 
     def test_sets_handler_level_from_config(
         self, mock_logger, handler_config, log_config
@@ -150,9 +161,9 @@ class TestDatabaseHandlerEmit:
             )
             handler.emit(record)
 
-        # Batch should be flushed and empty
+        # Background flusher writes and empties the batch
+        assert _wait_until(lambda: mock_db_interface.session.called)
         assert len(handler.batch) == 0
-        assert mock_db_interface.session.called
 
     def test_handles_emit_exceptions_gracefully(self, handler):
         """Test emit handles exceptions without crashing."""
@@ -173,6 +184,81 @@ class TestDatabaseHandlerEmit:
         handler.emit(record)  # Should not raise
 
 
+@pytest.mark.unit
+class TestDatabaseHandlerHandleBatch:
+    """Test DatabaseHandler.handle_batch() method."""
+
+    def _records(self, count):
+        return [
+            logging.LogRecord("test", logging.INFO, "test.py", 10, f"m{i}", (), None)
+            for i in range(count)
+        ]
+
+    def test_queues_rows_and_flushes_once(self, handler, mock_db_interface):
+        """Test a batch larger than batch_size is written in one flush."""
+        handler.handler_config.batch_size = 3
+
+        handler.handle_batch(self._records(5))
+
+        assert _wait_until(lambda: mock_db_interface.session.called)
+        assert handler.batch == []
+        assert mock_db_interface.session.call_count == 1
+
+    def test_below_batch_size_stays_queued(self, handler, mock_db_interface):
+        """Test rows stay batched when the trigger is not reached."""
+        handler.handle_batch(self._records(2))
+
+        assert [row["message"] for row in handler.batch] == ["m0", "m1"]
+        assert not mock_db_interface.session.called
+
+    def test_applies_filters(self, handler):
+        """Test handler filters are applied per record."""
+        handler.addFilter(lambda record: record.getMessage() != "m1")
+
+        handler.handle_batch(self._records(3))
+
+        assert [row["message"] for row in handler.batch] == ["m0", "m2"]
+
+    def test_maps_and_flushes_critical_without_lock(self, handler):
+        """Test data_mapper and signal-mode critical flushes run unlocked."""
+        handler.handler_config.critical_flush_enabled = True
+        handler.handler_config.critical_flush_mode = "signal"
+        mapper = handler.handler_config.data_mapper
+        unlocked = []
+
+        def mapped(record):
+            unlocked.append(_lock_is_free(handler))
+            return mapper(record)
+
+        handler.handler_config.data_mapper = mapped
+        records = self._records(2)
+        records[1].extra = {"exception": "boom"}
+
+        with patch.object(handler, "_critical_flush_signal") as flush:
+            flush.side_effect = lambda row: unlocked.append(_lock_is_free(handler))
+            handler.handle_batch(records)
+
+        flush.assert_called_once()
+        assert unlocked == [True, True, True]
+        assert [row["message"] for row in handler.batch] == ["m0"]
+
+
+def _lock_is_free(handler):
+    """Check from another thread whether the handler lock can be taken."""
+    result = []
+
+    def attempt():
+        acquired = handler.lock.acquire(timeout=1)
+        if acquired:
+            handler.lock.release()
+        result.append(acquired)
+
+    thread = threading.Thread(target=attempt)
+    thread.start()
+    thread.join()
+    return result[0]
+
+
 @pytest.mark.unit
 class TestShouldFlushBatch:
     """Test _should_flush_batch logic."""
@@ -197,7 +283,7 @@ class TestShouldFlushBatch:
         handler.handler_config.batch_size = 100  # Large batch
         handler.handler_config.flush_interval = 0.1  # 100ms
         handler.batch = [{"msg": "test"}]
-        handler.last_flush = datetime.now()
+        handler.last_flush = time.monotonic()
 
         # Wait for interval to pass
         time.sleep(0.15)
@@ -409,9 +495,10 @@ class TestCriticalFlush:
         not hasattr(signal, "SIGALRM"), reason="Requires SIGALRM (Unix only)"
     )
     def test_critical_flush_with_timeout(self, handler, mock_db_interface):
-        """Test critical flush uses signal timeout."""
+        """Test signal mode critical flush uses signal timeout."""
         import signal
 
+        handler.handler_config.critical_flush_mode = "signal"
         row_data = {"timestamp": datetime.now(), "message": "CRITICAL ERROR"}
 
         with patch.object(signal, "alarm") as mock_alarm:
@@ -445,68 +532,200 @@ class TestCriticalFlush:
 
 
 @pytest.mark.unit
-class TestGetTableMetadata:
-    """Test table metadata caching."""
+class TestWriterCriticalFlush:
+    """Test critical rows handed to the background writer."""
 
-    def test_caches_table_metadata(self, handler):
-        """Test metadata is cached after first load."""
-        session = Mock()
-        session.bind = Mock()
+    def _critical_record(self):
+        record = logging.LogRecord("t", logging.ERROR, "t.py", 1, "boom", (), None)
+        record.extra = {"exception": "boom"}
+        return record
 
-        with patch("sqlalchemy.Table") as mock_table:
-            mock_table.return_value = "table_obj"
+    @pytest.fixture
+    def critical_handler(self, handler):
+        handler.handler_config.critical_flush_enabled = True
+        handler.handler_config.critical_flush_timeout = 0.5
+        return handler
 
-            meta1 = handler._get_table_metadata(session)
-            meta2 = handler._get_table_metadata(session)
+    def test_commits_before_returning(self, critical_handler, mock_db_interface):
+        """Test emit returns once the critical row is committed."""
+        session = mock_db_interface.session.return_value
 
-            assert meta1 == meta2  # Same cached object
-            mock_table.assert_called_once()  # Only called once
+        critical_handler.handle(self._critical_record())
 
-    def test_handles_metadata_load_failure(self, handler):
-        """Test gracefully handles metadata load failure."""
-        session = Mock()
-        session.bind = Mock()
+        session.commit.assert_called_once()
+        assert critical_handler._flusher is not None
+        assert critical_handler.batch == []
 
-        with patch("sqlalchemy.Table", side_effect=Exception("Table not found")):
-            meta = handler._get_table_metadata(session)
+    def test_works_from_worker_thread(self, critical_handler, mock_db_interface):
+        """Test critical flush works off the main thread (no SIGALRM)."""
+        errors = []
+        critical_handler.handleError = lambda record: errors.append(record)
 
-            assert meta is False  # Marker for fallback
+        worker = threading.Thread(
+            target=critical_handler.handle, args=(self._critical_record(),)
+        )
+        worker.start()
+        worker.join(2)
+
+        assert errors == []
+        mock_db_interface.session.return_value.commit.assert_called_once()
+
+    def test_coalesces_burst_into_one_transaction(
+        self, critical_handler, mock_db_interface
+    ):
+        """Test critical rows queued during a write share the next commit."""
+        release = threading.Event()
+        session = mock_db_interface.session.return_value
+        session.commit.side_effect = lambda: release.wait(2)
+        records = [self._critical_record() for _ in range(6)]
+        threads = [
+            threading.Thread(target=critical_handler.handle, args=(r,)) for r in records
+        ]
+
+        threads[0].start()
+        assert _wait_until(lambda: session.commit.called)
+        for thread in threads[1:]:
+            thread.start()
+        assert _wait_until(lambda: len(critical_handler._critical) == 5)
+        release.set()
+        for thread in threads:
+            thread.join(2)
+
+        assert session.commit.call_count == 2
+
+    def test_timeout_falls_back_to_console(
+        self, critical_handler, mock_logger, mock_db_interface
+    ):
+        """Test a sub-second timeout withdraws the row and falls back."""
+        critical_handler.handler_config.critical_flush_timeout = 0.05
+        release = threading.Event()
+        session = mock_db_interface.session.return_value
+        session.commit.side_effect = lambda: release.wait(2)
+        critical_handler.emit(self._critical_record())  # Times out in commit
+
+        start = time.monotonic()
+        with pytest.raises(TimeoutError):
+            critical_handler._critical_flush({"message": "second"})
+        release.set()
+
+        assert time.monotonic() - start < 0.5
+        assert critical_handler._critical == []
+        assert "DB flush failed" in str(mock_logger.critical.call_args)
+
+    def test_does_not_block_other_threads(self, critical_handler, mock_db_interface):
+        """Test normal records are queued while a critical write is pending."""
+        release = threading.Event()
+        session = mock_db_interface.session.return_value
+        session.commit.side_effect = lambda: release.wait(2)
+        worker = threading.Thread(
+            target=critical_handler.handle, args=(self._critical_record(),)
+        )
+        worker.start()
+        assert _wait_until(lambda: session.commit.called)
+
+        critical_handler.handle(
+            logging.LogRecord("t", logging.INFO, "t.py", 1, "m", (), None)
+        )
+
+        assert len(critical_handler.batch) == 1
+        release.set()
+        worker.join(2)
+
+    def test_handle_batch_waits_outside_lock(self, critical_handler, mock_db_interface):
+        """Test critical records in a drained batch are written and awaited."""
+        records = [self._critical_record(), self._critical_record()]
+
+        critical_handler.handle_batch(records)
+
+        mock_db_interface.session.return_value.commit.assert_called_once()
+        assert critical_handler.batch == []
 
 
 @pytest.mark.unit
 class TestInsertBatch:
     """Test batch insertion with optimization strategies."""
 
-    def test_uses_bulk_operations_when_metadata_available(self, handler):
-        """Test uses bulk_insert_mappings for performance."""
+    def _pg_session(self, cursor):
         session = Mock()
+        session.get_bind.return_value.dialect.name = "postgresql"
+        dbapi_conn = session.connection.return_value.connection.dbapi_connection
+        dbapi_conn.cursor.return_value = cursor
+        return session
+
+    def test_uses_copy_for_postgresql(self, handler):
+        """Test psycopg2 sessions write the batch with COPY FROM STDIN."""
+        cursor = Mock(spec=["copy_expert", "close"])
+        session = self._pg_session(cursor)
         batch_data = [
-            {"timestamp": datetime.now(), "message": "Test 1"},
-            {"timestamp": datetime.now(), "message": "Test 2"},
+            {"level": "INFO", "message": "tab\there"},
+            {"level": "WARNING", "message": None},
         ]
 
-        # Mock successful metadata retrieval
-        handler._table_metadata = Mock()
-        handler._table_metadata.__class__ = Mock()
-
         handler._insert_batch(session, batch_data)
 
-        session.bulk_insert_mappings.assert_called_once()
+        sql, data = cursor.copy_expert.call_args[0]
+        assert sql == "COPY test_logs (level, message) FROM STDIN"
+        assert data.getvalue() == "INFO\ttab\\there\nWARNING\t\\N\n"
+        session.execute.assert_not_called()
+        cursor.close.assert_called_once()
 
-    def test_falls_back_to_executemany(self, handler):
-        """Test falls back to executemany when bulk operations fail."""
-        session = Mock()
-        batch_data = [
-            {"timestamp": datetime.now(), "message": "Test 1"},
-            {"timestamp": datetime.now(), "message": "Test 2"},
-        ]
+    def test_copy_renders_values(self, handler):
+        """Test COPY text rendering of timestamps, booleans and escapes."""
+        cursor = Mock(spec=["copy_expert", "close"])
+        session = self._pg_session(cursor)
+        ts = datetime(2024, 1, 2, 3, 4, 5, 600000)
+
+        handler._insert_batch(
+            session, [{"timestamp": ts, "ok": True, "message": "a\\b\nc"}]
+        )
 
-        # Simulate bulk operations unavailable
-        handler._table_metadata = False
+        data = cursor.copy_expert.call_args[0][1].getvalue()
+        assert data == "2024-01-02T03:04:05.600000\tt\ta\\\\b\\nc\n"
+
+    def test_copy_renders_json_and_bytea(self, handler):
+        """Test COPY encodes dicts as JSON and bytes as bytea hex."""
+        cursor = Mock(spec=["copy_expert", "close"])
+        session = self._pg_session(cursor)
+
+        handler._insert_batch(
+            session, [{"extra": {"user": "a\tb"}, "payload": b"\x01\xff"}]
+        )
+
+        data = cursor.copy_expert.call_args[0][1].getvalue()
+        assert data == '{"user": "a\\\\tb"}\t\\\\x01ff\n'
+
+    def test_multi_row_insert_for_other_dialects(self, handler):
+        """Test non-PostgreSQL sessions use one multi-row INSERT."""
+        session = Mock()
+        session.get_bind.return_value.dialect.name = "sqlite"
+        batch_data = [{"level": "INFO", "message": f"m{i}"} for i in range(3)]
 
         handler._insert_batch(session, batch_data)
 
         session.execute.assert_called_once()
+        statement, params = session.execute.call_args[0]
+        assert "VALUES (:p0_0, :p0_1), (:p1_0, :p1_1), (:p2_0, :p2_1)" in str(statement)
+        assert params["p2_1"] == "m2"
+
+    def test_multi_row_insert_respects_bind_limit(self, handler):
+        """Test large batches are split to stay within the bind budget."""
+        session = Mock()
+        session.get_bind.return_value.dialect.name = "sqlite"
+        columns = {f"c{i}": i for i in range(100)}
+
+        handler._insert_batch(session, [columns] * 25)
+
+        # 999 // 100 = 9 rows per statement
+        assert session.execute.call_count == 3
+
+    def test_groups_rows_by_columns(self, handler):
+        """Test rows with different column sets are written separately."""
+        session = Mock()
+        session.get_bind.return_value.dialect.name = "sqlite"
+
+        handler._insert_batch(session, [{"a": 1}, {"a": 2, "b": 3}, {"a": 4}])
+
+        assert session.execute.call_count == 2
 
     def test_handles_empty_batch(self, handler):
         """Test does nothing for empty batch."""
@@ -514,10 +733,56 @@ class TestInsertBatch:
 
         handler._insert_batch(session, [])
 
-        session.bulk_insert_mappings.assert_not_called()
         session.execute.assert_not_called()
 
 
+@pytest.mark.unit
+class TestFlusherThread:
+    """Test the background flusher thread."""
+
+    def test_flushes_after_interval(self, handler, mock_db_interface):
+        """Test a partial batch is written once flush_interval elapses."""
+        handler.handler_config.flush_interval = 0.05
+        handler.last_flush = time.monotonic()
+
+        handler.emit(logging.LogRecord("t", logging.INFO, "t.py", 1, "m", (), None))
+
+        assert handler.batch != []
+        assert _wait_until(lambda: mock_db_interface.session.called)
+        assert handler.batch == []
+
+    def test_close_stops_flusher_and_writes_rows(self, handler, mock_db_interface):
+        """Test close() joins the flusher and writes pending rows."""
+        handler.emit(logging.LogRecord("t", logging.INFO, "t.py", 1, "m", (), None))
+        flusher = handler._flusher
+
+        handler.close()
+
+        assert not flusher.is_alive()
+        assert mock_db_interface.session.called
+        assert handler.batch == []
+
+    def test_emit_does_not_wait_for_database(self, handler, mock_db_interface):
+        """Test emit returns while a batch write is in progress."""
+        handler.handler_config.batch_size = 1
+        started, release = threading.Event(), threading.Event()
+
+        def slow_session():
+            started.set()
+            release.wait(2)
+            return mock_db_interface.session.return_value
+
+        handler.handler_config.db_interface = Mock(session=slow_session)
+        record = logging.LogRecord("t", logging.INFO, "t.py", 1, "m", (), None)
+        handler.emit(record)
+        assert started.wait(2)
+
+        handler.emit(record)  # Flusher is blocked in the first write
+
+        assert len(handler.batch) == 1
+        release.set()
+
+
 @pytest.mark.unit
 class TestIntegration:
     """Integration tests for complete workflows."""
@@ -540,8 +805,8 @@ class TestIntegration:
             handler.emit(record)
 
         # Verify batch was flushed
+        assert _wait_until(lambda: mock_db_interface.session.called)
         assert len(handler.batch) == 0
-        assert mock_db_interface.session.called
 
     def test_critical_error_bypasses_batch(self, handler, mock_db_interface):
         """Test critical errors bypass batching."""
@@ -590,16 +855,3 @@ class TestPerformanceOptimizations:
 
         # Only one entry in cache
         assert len(handler._sql_cache) == 1
-
-    def test_metadata_caching_reduces_queries(self, handler):
-        """Test table metadata caching reduces database queries."""
-        session = Mock()
-        session.bind = Mock()
-
-        with patch("sqlalchemy.Table", return_value="cached_table") as mock_table:
-            # Call multiple times
-            for _ in range(10):
-                handler._get_table_metadata(session)
-
-            # Metadata should only be loaded once
-            mock_table.assert_called_once()
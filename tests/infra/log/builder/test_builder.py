@@ -415,6 +415,71 @@ class TestHandlerMethods:
         assert len(builder._handlers) == 1
 
 
+# =============================================================================
+# Test Async Dispatch
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestAsyncDispatch:
+    """Test with_async_dispatch builder option."""
+
+    def test_wraps_handlers_in_dispatcher(self, temp_log_dir):
+        """Test build wraps all configured handlers in one dispatcher."""
+        from appinfra.log.async_handler import AsyncDispatchHandler
+
+        log_file = temp_log_dir / "async.log"
+        logger = (
+            LoggingBuilder("async_wrap")
+            .with_console_handler()
+            .with_file_handler(log_file)
+            .with_async_dispatch(max_queue=100, overflow="drop_new")
+            .build()
+        )
+
+        assert len(logger.handlers) == 1
+        dispatcher = logger.handlers[0]
+        assert isinstance(dispatcher, AsyncDispatchHandler)
+        assert len(dispatcher.handlers) == 2
+        assert dispatcher.max_queue == 100
+        assert dispatcher.overflow == "drop_new"
+        dispatcher.close()
+
+    def test_records_reach_file(self, temp_log_dir):
+        """Test records logged through the dispatcher are written on flush."""
+        log_file = temp_log_dir / "async.log"
+        logger = (
+            LoggingBuilder("async_file")
+            .with_file_handler(log_file)
+            .with_async_dispatch()
+            .build()
+        )
+
+        logger.info("hello %s", "async")
+        assert logger.handlers[0].drain(timeout=5.0)
+        assert "hello async" in log_file.read_text()
+        logger.handlers[0].close()
+
+    def test_invalid_overflow_raises(self):
+        """Test unknown overflow policy raises LogConfigError."""
+        with pytest.raises(LogConfigError, match="overflow"):
+            LoggingBuilder("test").with_async_dispatch(overflow="spill")
+
+    def test_round_trips_through_dict(self):
+        """Test async dispatch options survive to_dict/from_dict."""
+        builder = LoggingBuilder("test").with_async_dispatch(
+            max_queue=50, overflow="block"
+        )
+
+        restored = LoggingBuilder.from_dict(builder.to_dict())
+
+        assert restored._async_dispatch == {
+            "max_queue": 50,
+            "overflow": "block",
+            "batch_size": 256,
+        }
+
+
 # =============================================================================
 # Test Integration Scenarios
 # =============================================================================
@@ -15,6 +15,11 @@ from pathlib import Path
 
 import pytest
 
+from appinfra.log.buffered_file import (
+    BufferedFileHandler,
+    BufferedRotatingFileHandler,
+    BufferedTimedRotatingFileHandler,
+)
 from appinfra.log.builder.file import (
     FileHandlerConfig,
     FileLoggingBuilder,
@@ -297,6 +302,73 @@ class TestTimedRotatingFileHandlerConfig:
         handler.close()
 
 
+# =============================================================================
+# Test Buffered Mode
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestBufferedMode:
+    """Test buffer_bytes/flush_interval/fsync on file handler configs."""
+
+    @pytest.mark.parametrize(
+        "config_class,handler_class",
+        [
+            (FileHandlerConfig, BufferedFileHandler),
+            (RotatingFileHandlerConfig, BufferedRotatingFileHandler),
+            (TimedRotatingFileHandlerConfig, BufferedTimedRotatingFileHandler),
+        ],
+    )
+    def test_creates_buffered_handler(
+        self, temp_log_dir, log_config, config_class, handler_class
+    ):
+        """Test buffer_bytes selects the buffered handler variant."""
+        config = config_class(
+            temp_log_dir / "test.log", buffer_bytes=8192, flush_interval=0.5
+        )
+
+        handler = config.create_handler(log_config)
+
+        assert isinstance(handler, handler_class)
+        assert handler.buffer_bytes == 8192
+        assert handler.flush_interval == 0.5
+        handler.close()
+
+    def test_unbuffered_by_default(self, temp_log_dir, log_config):
+        """Test the stdlib handler is used without buffering options."""
+        handler = FileHandlerConfig(temp_log_dir / "test.log").create_handler(
+            log_config
+        )
+
+        assert type(handler) is logging.FileHandler
+        handler.close()
+
+    def test_to_dict_round_trip(self, temp_log_dir):
+        """Test buffering options are serialized only when enabled."""
+        plain = FileHandlerConfig(temp_log_dir / "test.log")
+        buffered = FileHandlerConfig(
+            temp_log_dir / "test.log", buffer_bytes=4096, fsync="error"
+        )
+
+        assert "buffer_bytes" not in plain.to_dict()
+        d = buffered.to_dict()
+        assert d["buffer_bytes"] == 4096
+        assert d["flush_interval"] == 1.0
+        assert d["fsync"] == "error"
+
+    def test_with_buffering_survives_rotation_switch(self, temp_log_dir):
+        """Test with_buffering applies to handlers added by with_rotation."""
+        builder = FileLoggingBuilder("test_logger", temp_log_dir / "test.log")
+
+        builder.with_buffering(buffer_bytes=1024, fsync="always")
+        builder.with_rotation(max_bytes=4096, backup_count=2)
+
+        handler_config = builder._handlers[0]
+        assert isinstance(handler_config, RotatingFileHandlerConfig)
+        assert handler_config.buffer_bytes == 1024
+        assert handler_config.fsync == "always"
+
+
 # =============================================================================
 # Test FileLoggingBuilder
 # =============================================================================
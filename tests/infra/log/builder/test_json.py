@@ -11,6 +11,8 @@ Tests JSON logging functionality including:
 - Handler setup and output
 """
 
+import dataclasses
+import datetime
 import json
 import logging
 import os
@@ -19,19 +21,14 @@ from unittest.mock import patch
 
 import pytest
 
+from appinfra.errors import DependencyError
 from appinfra.log.builder.json import (
     JSONFormatter,
     JSONLoggingBuilder,
-    _add_basic_fields,
-    _add_custom_fields,
-    _add_exception_fields,
-    _add_extra_fields,
-    _add_location_fields,
-    _add_module_fields,
-    _add_process_fields,
-    _add_timestamp,
     create_json_logger,
 )
+from appinfra.log.builder.json_encoders import ORJSON_AVAILABLE, resolve_encoder_name
+from appinfra.log.errors import LogConfigError
 from appinfra.log.logger import Logger
 
 # =============================================================================
@@ -231,6 +228,39 @@ class TestTimestampFormatting:
         # Should default to ISO format
         assert "T" in timestamp
 
+    @pytest.mark.parametrize(
+        "created",
+        [
+            1700000000.123456,
+            1700000000.0,  # isoformat omits zero microseconds
+            1700000000.9999996,  # rounds up into the next second
+            1700000001.0000004,
+        ],
+    )
+    def test_iso_cache_matches_datetime(self, created):
+        """Test the per-second cache renders exactly like datetime.isoformat()."""
+        from datetime import datetime
+
+        formatter = JSONFormatter(timestamp_format="iso")
+        # Prime the cache with the neighbouring seconds first
+        formatter._format_timestamp(create_mock_record(created=created - 1))
+        formatter._format_timestamp(create_mock_record(created=created))
+
+        timestamp = formatter._format_timestamp(create_mock_record(created=created))
+        assert timestamp == datetime.fromtimestamp(created).isoformat()
+
+    def test_iso_prefix_rendered_once_per_second(self):
+        """Test records within one second reuse the rendered prefix."""
+        formatter = JSONFormatter(timestamp_format="iso")
+
+        with patch("appinfra.log.builder.json.datetime") as mock_datetime:
+            mock_datetime.fromtimestamp.return_value.isoformat.return_value = "T"
+            for i in range(5):
+                record = create_mock_record(created=1700000000.1 + i / 10)
+                assert formatter._format_timestamp(record).startswith("T.")
+
+        assert mock_datetime.fromtimestamp.call_count == 1
+
 
 # =============================================================================
 # Test extra field sanitization
@@ -238,10 +268,10 @@ class TestTimestampFormatting:
 
 
 @pytest.mark.unit
-class TestSanitizeExtraFields:
-    """Test extra field sanitization for JSON serialization."""
+class TestExtraFieldSerialization:
+    """Test extra fields are made JSON serializable by format()."""
 
-    def test_sanitize_serializable_fields(self):
+    def test_serializable_fields(self):
         """Test that serializable fields pass through unchanged."""
         formatter = JSONFormatter()
         extra = {
@@ -253,16 +283,11 @@ class TestSanitizeExtraFields:
             "dict": {"nested": "value"},
         }
 
-        sanitized = formatter._sanitize_extra_fields(extra)
+        data = json.loads(formatter.format(create_mock_record(extra=extra)))
 
-        assert sanitized["string"] == "value"
-        assert sanitized["number"] == 42
-        assert sanitized["float"] == 3.14
-        assert sanitized["bool"] is True
-        assert sanitized["list"] == [1, 2, 3]
-        assert sanitized["dict"] == {"nested": "value"}
+        assert data["extra"] == extra
 
-    def test_sanitize_non_serializable_fields(self):
+    def test_non_serializable_fields(self):
         """Test that non-serializable fields are converted to strings."""
         formatter = JSONFormatter()
 
@@ -275,11 +300,11 @@ class TestSanitizeExtraFields:
             "set": {1, 2, 3},
         }
 
-        sanitized = formatter._sanitize_extra_fields(extra)
+        data = json.loads(formatter.format(create_mock_record(extra=extra)))
 
-        assert sanitized["custom"] == "CustomObject()"
+        assert data["extra"]["custom"] == "CustomObject()"
         # Sets are converted to string representation
-        assert isinstance(sanitized["set"], str)
+        assert isinstance(data["extra"]["set"], str)
 
 
 # =============================================================================
@@ -513,99 +538,70 @@ class TestFormat:
 
 
 @pytest.mark.unit
-class TestHelperFunctions:
-    """Test helper functions for record conversion."""
+class TestRecordToDict:
+    """Test record conversion through the precomputed field plan."""
 
-    def test_add_timestamp(self):
-        """Test _add_timestamp helper."""
-        formatter = JSONFormatter()
-        record = create_mock_record()
-        data = {}
-
-        _add_timestamp(data, formatter, record)
+    def test_timestamp(self):
+        """Test timestamp field is included."""
+        data = JSONFormatter()._record_to_dict(create_mock_record())
 
         assert "timestamp" in data
 
-    def test_add_basic_fields(self):
-        """Test _add_basic_fields helper."""
-        formatter = JSONFormatter()
-        record = create_mock_record()
-        data = {}
-
-        _add_basic_fields(data, formatter, record)
+    def test_basic_fields(self):
+        """Test level, logger and message fields."""
+        data = JSONFormatter()._record_to_dict(create_mock_record())
 
         assert data["level"] == "INFO"
         assert data["logger"] == "test.logger"
         assert data["message"] == "Test message"
 
-    def test_add_module_fields(self):
-        """Test _add_module_fields helper."""
-        formatter = JSONFormatter()
-        record = create_mock_record()
-        data = {}
-
-        _add_module_fields(data, formatter, record)
+    def test_module_fields(self):
+        """Test module, function and line fields."""
+        data = JSONFormatter()._record_to_dict(create_mock_record())
 
         assert data["module"] == "test_module"
         assert data["function"] == "test_function"
         assert data["line"] == 42
 
-    def test_add_process_fields(self):
-        """Test _add_process_fields helper."""
+    def test_process_fields(self):
+        """Test process and thread fields."""
         formatter = JSONFormatter(include_process_info=True)
-        record = create_mock_record()
-        data = {}
-
-        _add_process_fields(data, formatter, record)
+        data = formatter._record_to_dict(create_mock_record())
 
         assert data["process_id"] == 12345
         assert data["thread_id"] == 67890
 
-    def test_add_process_fields_disabled(self):
-        """Test _add_process_fields when disabled."""
+    def test_process_fields_disabled(self):
+        """Test process fields are omitted when disabled."""
         formatter = JSONFormatter(include_process_info=False)
-        record = create_mock_record()
-        data = {}
-
-        _add_process_fields(data, formatter, record)
+        data = formatter._record_to_dict(create_mock_record())
 
         assert "process_id" not in data
         assert "thread_id" not in data
 
-    def test_add_extra_fields(self):
-        """Test _add_extra_fields helper."""
+    def test_extra_fields(self):
+        """Test extra fields are nested under "extra"."""
         formatter = JSONFormatter(include_extra=True)
-        record = create_mock_record(extra={"key": "value"})
-        data = {}
-
-        _add_extra_fields(data, formatter, record)
+        data = formatter._record_to_dict(create_mock_record(extra={"key": "value"}))
 
-        assert "extra" in data
         assert data["extra"]["key"] == "value"
 
-    def test_add_extra_fields_no_extra(self):
-        """Test _add_extra_fields when record has no extra."""
+    def test_no_extra_fields(self):
+        """Test "extra" is omitted when the record has no extra."""
         formatter = JSONFormatter(include_extra=True)
-        record = create_mock_record()  # No extra
-        data = {}
-
-        _add_extra_fields(data, formatter, record)
+        data = formatter._record_to_dict(create_mock_record())
 
         assert "extra" not in data
 
-    def test_add_location_fields(self):
-        """Test _add_location_fields helper."""
+    def test_location_fields(self):
+        """Test location field."""
         formatter = JSONFormatter(include_location=True)
-        record = create_mock_record()
-        data = {}
-
-        _add_location_fields(data, formatter, record)
+        data = formatter._record_to_dict(create_mock_record())
 
-        assert "location" in data
         assert data["location"] == ["/path/to/test.py:42"]
 
-    def test_add_exception_fields(self):
-        """Test _add_exception_fields helper."""
+    def test_exception_fields(self):
+        """Test exception field is rendered from exc_info."""
         formatter = JSONFormatter(include_exception=True)
         try:
             raise ValueError("Test error")
@@ -614,46 +610,141 @@ class TestHelperFunctions:
 
             record = create_mock_record(exc_info=sys.exc_info())
 
-        data = {}
-        _add_exception_fields(data, formatter, record)
+        data = formatter._record_to_dict(record)
 
-        assert "exception" in data
         assert "ValueError" in data["exception"]
 
-    def test_add_exception_fields_no_exception(self):
-        """Test _add_exception_fields when no exception."""
+    def test_no_exception_fields(self):
+        """Test exception field is omitted without exc_info."""
         formatter = JSONFormatter(include_exception=True)
-        record = create_mock_record()
-        data = {}
-
-        _add_exception_fields(data, formatter, record)
+        data = formatter._record_to_dict(create_mock_record())
 
         assert "exception" not in data
 
-    def test_add_custom_fields(self):
-        """Test _add_custom_fields helper."""
+    def test_custom_fields(self):
+        """Test custom fields are added to the output."""
         formatter = JSONFormatter(custom_fields={"app": "test", "env": "dev"})
-        data = {}
-
-        _add_custom_fields(data, formatter)
+        data = json.loads(formatter.format(create_mock_record()))
 
         assert data["app"] == "test"
         assert data["env"] == "dev"
 
-    def test_add_custom_fields_with_exclusion(self):
-        """Test _add_custom_fields respects field exclusion."""
+    def test_custom_fields_with_exclusion(self):
+        """Test custom fields respect field exclusion."""
         formatter = JSONFormatter(
             custom_fields={"app": "test", "env": "dev"},
             exclude_fields=["env"],
         )
-        data = {}
-
-        _add_custom_fields(data, formatter)
+        data = json.loads(formatter.format(create_mock_record()))
 
         assert data["app"] == "test"
         assert "env" not in data
 
 
+# =============================================================================
+# Test encoders and field plan
+# =============================================================================
+
+ENCODERS = ["json"] + (["orjson"] if ORJSON_AVAILABLE else [])
+
+
+@pytest.mark.unit
+class TestEncoders:
+    """Test pluggable encoders and the precomputed field plan."""
+
+    @pytest.mark.parametrize("encoder", ENCODERS)
+    def test_encoders_agree(self, encoder):
+        """Test every encoder produces the same document."""
+        record = create_mock_record(extra={"user_id": 1, "tags": ["a", "\u4e16"]})
+        reference = JSONFormatter(encoder="json", custom_fields={"app": "x"})
+        formatter = JSONFormatter(encoder=encoder, custom_fields={"app": "x"})
+
+        assert json.loads(formatter.format(record)) == json.loads(
+            reference.format(record)
+        )
+
+    @pytest.mark.parametrize("encoder", ENCODERS)
+    def test_non_serializable_extra(self, encoder):
+        """Test values the encoder cannot serialize are converted with str()."""
+
+        class CustomObject:
+            def __str__(self):
+                return "CustomObject()"
+
+        formatter = JSONFormatter(encoder=encoder)
+        record = create_mock_record(extra={"obj": CustomObject(), "big": 2**70})
+
+        data = json.loads(formatter.format(record))
+
+        assert data["extra"]["obj"] == "CustomObject()"
+        assert data["extra"]["big"] == 2**70
+
+    @pytest.mark.parametrize("encoder", ENCODERS)
+    def test_datetime_and_dataclass_use_str(self, encoder):
+        """Test datetimes and dataclasses render with str() like stdlib json."""
+
+        @dataclasses.dataclass
+        class Point:
+            x: int
+
+        when = datetime.datetime(2024, 1, 2, 3, 4, 5)
+        formatter = JSONFormatter(encoder=encoder)
+        record = create_mock_record(extra={"when": when, "point": Point(1)})
+
+        data = json.loads(formatter.format(record))
+
+        assert data["extra"]["when"] == "2024-01-02 03:04:05"
+        assert data["extra"]["point"] == str(Point(1))
+
+    @pytest.mark.parametrize("encoder", ENCODERS)
+    def test_custom_fields_suffix(self, encoder):
+        """Test pre-serialized custom fields are spliced after record fields."""
+        formatter = JSONFormatter(
+            encoder=encoder, custom_fields={"app": "myapp", "env": "prod"}
+        )
+
+        data = json.loads(formatter.format(create_mock_record()))
+
+        assert list(data)[-2:] == ["app", "env"]
+        assert data["message"] == "Test message"
+
+    def test_custom_fields_suffix_with_no_record_fields(self):
+        """Test the suffix forms a valid object when no record field is emitted."""
+        formatter = JSONFormatter(
+            include_fields=["app"], custom_fields={"app": "myapp"}
+        )
+
+        assert json.loads(formatter.format(create_mock_record())) == {"app": "myapp"}
+
+    def test_custom_field_overriding_standard_field(self):
+        """Test custom fields named like standard fields replace them once."""
+        formatter = JSONFormatter(custom_fields={"level": "CUSTOM"})
+
+        result = formatter.format(create_mock_record())
+
+        assert result.count('"level"') == 1
+        assert json.loads(result)["level"] == "CUSTOM"
+
+    def test_unknown_encoder_raises(self):
+        """Test unknown encoder names raise LogConfigError."""
+        with pytest.raises(LogConfigError, match="encoder"):
+            JSONFormatter(encoder="yaml")
+
+    def test_missing_encoder_raises_dependency_error(self):
+        """Test requesting an uninstalled encoder raises DependencyError."""
+        with patch("appinfra.log.builder.json_encoders.MSGSPEC_AVAILABLE", False):
+            with pytest.raises(DependencyError, match="msgspec"):
+                JSONFormatter(encoder="msgspec")
+
+    def test_auto_falls_back_to_stdlib(self):
+        """Test auto picks stdlib json when no fast encoder is installed."""
+        with (
+            patch("appinfra.log.builder.json_encoders.ORJSON_AVAILABLE", False),
+            patch("appinfra.log.builder.json_encoders.MSGSPEC_AVAILABLE", False),
+        ):
+            assert resolve_encoder_name("auto") == "json"
+
+
 # =============================================================================
 # Test JSONLoggingBuilder
 # =============================================================================
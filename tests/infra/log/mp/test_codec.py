@@ -0,0 +1,83 @@
+"""Tests for the compact cross-process record encoding."""
+
+import logging
+import pickle
+
+import pytest
+
+from appinfra.log.mp.codec import RECORD_FIELDS, decode_record, encode_record
+
+pytestmark = pytest.mark.unit
+
+
+def _record(**attrs) -> logging.LogRecord:
+    record = logging.LogRecord(
+        "app.worker", logging.WARNING, "/src/app/worker.py", 42, "hello", None, None
+    )
+    record.funcName = "run"
+    for key, value in attrs.items():
+        setattr(record, key, value)
+    return record
+
+
+class TestRoundTrip:
+    """Test encode_record/decode_record round-trips."""
+
+    def test_core_fields(self):
+        """Test fields formatters read survive a pickled round-trip."""
+        original = _record(exc_text="Traceback: boom")
+        decoded = decode_record(pickle.loads(pickle.dumps(encode_record(original))))
+
+        for attr in RECORD_FIELDS[:13]:
+            assert getattr(decoded, attr) == getattr(original, attr), attr
+        assert decoded.getMessage() == "hello"
+
+    def test_derived_fields(self):
+        """Test levelname, filename, module and msecs are recomputed."""
+        original = _record()
+        decoded = decode_record(encode_record(original))
+
+        assert decoded.levelname == "WARNING"
+        assert decoded.filename == "worker.py"
+        assert decoded.module == "worker"
+        assert decoded.msecs == original.msecs
+        assert decoded.args is None
+        assert decoded.exc_info is None
+
+    def test_infra_attributes(self):
+        """Test appinfra extra and location attributes are carried."""
+        original = _record()
+        setattr(original, "__infra__extra", {"user": "alice", "n": 3})
+        setattr(original, "__infra__pathnames", ["/src/a.py", "/src/b.py"])
+        setattr(original, "__infra__linenos", [1, 2])
+
+        decoded = decode_record(encode_record(original))
+
+        assert getattr(decoded, "__infra__extra") == {"user": "alice", "n": 3}
+        assert getattr(decoded, "__infra__pathnames") == ["/src/a.py", "/src/b.py"]
+        assert getattr(decoded, "__infra__linenos") == [1, 2]
+
+    def test_absent_infra_attributes_stay_absent(self):
+        """Test records without appinfra attributes decode without them."""
+        decoded = decode_record(encode_record(_record()))
+
+        assert not hasattr(decoded, "__infra__extra")
+        assert not hasattr(decoded, "__infra__pathnames")
+
+    def test_formats_like_original(self):
+        """Test a stdlib formatter renders the decoded record identically."""
+        fmt = logging.Formatter(
+            "%(asctime)s %(levelname)s %(name)s %(module)s:%(lineno)d "
+            "%(funcName)s %(process)d %(threadName)s %(message)s"
+        )
+        original = _record()
+
+        assert fmt.format(decode_record(encode_record(original))) == fmt.format(
+            original
+        )
+
+    def test_encoding_is_smaller_than_record(self):
+        """Test the encoded form pickles smaller than the full record."""
+        record = _record()
+
+        assert len(pickle.dumps(encode_record(record))) < len(pickle.dumps(record))
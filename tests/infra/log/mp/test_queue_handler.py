@@ -144,6 +144,29 @@ class TestMPQueueHandlerPrepare:
         assert getattr(prepared, "__infra__pathnames") == ["/a.py", "/b.py"]
         assert getattr(prepared, "__infra__linenos") == [10, 20]
 
+    def test_prepare_resolves_lazy_extra(self, handler, log_record):
+        """Test prepare evaluates deferred extra values before pickling."""
+        import pickle
+
+        from appinfra.log.lazy import LAZY_ATTR, lazy
+
+        setattr(
+            log_record,
+            "__infra__extra",
+            {"rows": lambda: 3, "total": lazy(sum, [1, 2]), "key": "value"},
+        )
+        setattr(log_record, LAZY_ATTR, True)
+
+        prepared = handler._prepare(log_record)
+        unpickled = pickle.loads(pickle.dumps(prepared))
+
+        assert getattr(unpickled, "__infra__extra") == {
+            "rows": 3,
+            "total": 3,
+            "key": "value",
+        }
+        assert not hasattr(unpickled, LAZY_ATTR)
+
     def test_prepare_handles_getMessage_failure(self, handler, log_record):
         """Test prepare handles getMessage failure gracefully."""
         log_record.msg = "Format: %s %s"
@@ -313,6 +336,71 @@ class TestMPQueueHandlerClose:
         # Should not raise
 
 
+@pytest.mark.unit
+class TestMPQueueHandlerBatching:
+    """Test batched sending with batch_size > 1."""
+
+    def _handle(self, handler, msg, level=logging.INFO):
+        handler.handle(
+            logging.LogRecord("test", level, "/test/file.py", 1, msg, (), None)
+        )
+
+    def test_sends_list_when_batch_full(self, queue):
+        """Test records are sent as one list once batch_size is reached."""
+        handler = MPQueueHandler(queue, batch_size=3, flush_interval=0)
+
+        for i in range(3):
+            self._handle(handler, f"msg {i}")
+
+        batch = queue.get(timeout=1)
+        assert isinstance(batch, list)
+        assert [fields[2] for fields in batch] == ["msg 0", "msg 1", "msg 2"]
+
+    def test_partial_batch_waits_for_flush(self, queue):
+        """Test a partial batch is held until flush()."""
+        handler = MPQueueHandler(queue, batch_size=10, flush_interval=0)
+
+        self._handle(handler, "pending")
+        assert handler._batch
+
+        handler.flush()
+        assert len(queue.get(timeout=1)) == 1
+        assert not handler._batch
+
+    def test_flush_interval_sends_partial_batch(self, queue):
+        """Test the flush timer sends a partial batch."""
+        handler = MPQueueHandler(queue, batch_size=10, flush_interval=0.05)
+
+        self._handle(handler, "late")
+
+        assert len(queue.get(timeout=2)) == 1
+
+    def test_error_sends_immediately(self, queue):
+        """Test an ERROR record sends the batch at once."""
+        handler = MPQueueHandler(queue, batch_size=10, flush_interval=0)
+
+        self._handle(handler, "info")
+        self._handle(handler, "boom", logging.ERROR)
+
+        assert len(queue.get(timeout=1)) == 2
+
+    def test_close_sends_pending(self, queue):
+        """Test close sends the pending batch."""
+        handler = MPQueueHandler(queue, batch_size=10, flush_interval=0)
+
+        self._handle(handler, "last")
+        handler.close()
+
+        assert len(queue.get(timeout=1)) == 1
+
+    def test_invalid_batch_size(self, queue):
+        """Test batch_size below 1 raises LogConfigError."""
+        from appinfra.log.errors import LogConfigError
+
+        with pytest.raises(LogConfigError):
+            MPQueueHandler(queue, batch_size=0)
+
+
 @pytest.mark.unit
 class TestLoggerWithQueue:
     """Test Logger.with_queue() class method."""
@@ -425,6 +513,17 @@ class TestLoggerQueueConfig:
 
         assert config["level"] == logging.WARNING
 
+    def test_queue_config_batching_round_trip(self, queue):
+        """Test batching options pass through to the worker handler."""
+        from appinfra.log import Logger
+
+        parent = Logger.with_queue(queue, name="parent")
+        config = parent.queue_config(queue, batch_size=64, flush_interval=0.2)
+        worker = Logger.from_queue_config(config, name="worker")
+
+        assert worker.handlers[0].batch_size == 64
+        assert worker.handlers[0].flush_interval == 0.2
+
     def test_from_queue_config_creates_logger(self, queue):
         """Test from_queue_config creates a logger with queue handler."""
         from appinfra.log import Logger
@@ -200,6 +200,122 @@ class TestLogQueueListenerHandleRecord:
         handler.handleError.assert_called_once_with(log_record)
 
 
+class _BatchHandler(logging.Handler):
+    """Records handle_batch calls."""
+
+    def __init__(self, level=logging.NOTSET):
+        super().__init__(level)
+        self.batches = []
+
+    def handle_batch(self, records):
+        self.batches.append([r.getMessage() for r in records])
+
+    def emit(self, record):
+        self.batches.append([record.getMessage()])
+
+
+def _put(queue, *messages, level=logging.INFO):
+    for msg in messages:
+        queue.put(logging.LogRecord("test", level, "test.py", 1, msg, (), None))
+
+
+def _wait_until(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+@pytest.mark.unit
+class TestLogQueueListenerDrain:
+    """Test drain mode, handle_batch dispatch and handler caching."""
+
+    def test_drains_available_records_into_one_batch(self, queue, mock_logger):
+        """Test records queued before a wakeup reach handle_batch together."""
+        batch_handler = _BatchHandler()
+        mock_logger.handlers = [batch_handler]
+        _put(queue, "a", "b", "c")
+        time.sleep(0.1)  # Let the queue feeder thread flush
+
+        listener = LogQueueListener(queue, mock_logger)
+        listener.start()
+        _wait_until(lambda: batch_handler.batches)
+        listener.stop()
+
+        assert batch_handler.batches == [["a", "b", "c"]]
+
+    def test_batch_respects_handler_level(self, queue, mock_logger):
+        """Test handle_batch only receives records at the handler's level."""
+        batch_handler = _BatchHandler(logging.WARNING)
+        mock_logger.handlers = [batch_handler]
+        listener = LogQueueListener(queue, mock_logger)
+        records = [
+            logging.LogRecord("t", level, "t.py", 1, name, (), None)
+            for level, name in ((logging.INFO, "info"), (logging.ERROR, "error"))
+        ]
+
+        listener._dispatch(records)
+
+        assert batch_handler.batches == [["error"]]
+
+    def test_drain_disabled_dispatches_one_at_a_time(self, queue, mock_logger):
+        """Test drain=False keeps one record per wakeup."""
+        batch_handler = _BatchHandler()
+        mock_logger.handlers = [batch_handler]
+        _put(queue, "a", "b")
+        time.sleep(0.1)
+
+        listener = LogQueueListener(queue, mock_logger, drain=False)
+        listener.start()
+        _wait_until(lambda: len(batch_handler.batches) == 2)
+        listener.stop()
+
+        assert batch_handler.batches == [["a"], ["b"]]
+
+    def test_stop_drains_pending_records(self, queue, mock_logger):
+        """Test stop() dispatches records queued before the sentinel."""
+        batch_handler = _BatchHandler()
+        mock_logger.handlers = [batch_handler]
+        listener = LogQueueListener(queue, mock_logger, max_batch=10)
+        _put(queue, *[f"m{i}" for i in range(50)])
+
+        listener.start()
+        listener.stop()
+
+        assert sum(len(b) for b in batch_handler.batches) == 50
+
+    def test_handler_list_cached_until_changed(self, queue):
+        """Test the handler tuple is reused until a handler is added."""
+        from appinfra.log import LoggingBuilder
+
+        lg = LoggingBuilder("listener.cache").build()
+        listener = LogQueueListener(queue, lg)
+
+        first = listener._get_handlers()
+        assert listener._get_handlers() is first
+
+        added = logging.NullHandler()
+        lg.addHandler(added)
+        assert added in listener._get_handlers()
+
+        lg.removeHandler(added)
+        assert added not in listener._get_handlers()
+
+    def test_stats_report_throughput_and_lag(self, queue, mock_logger):
+        """Test stats() reports counts, queue depth and lag."""
+        listener = LogQueueListener(queue, mock_logger)
+        old = logging.LogRecord("t", logging.INFO, "t.py", 1, "old", (), None)
+        old.created -= 2.0
+
+        listener._dispatch([old])
+        stats = listener.stats()
+
+        assert stats["records"] == 1
+        assert stats["batches"] == 1
+        assert stats["lag_last"] >= 2.0
+        assert stats["lag_max"] >= stats["lag_last"]
+        assert stats["queue_depth"] in (0, None)
+
+
 @pytest.mark.unit
 class TestLogQueueListenerErrorHandling:
     """Test error handling in LogQueueListener."""
@@ -297,6 +413,39 @@ class TestLogQueueListenerIntegration:
         finally:
             listener.stop()
 
+    def test_batched_records(self, queue):
+        """Test encoded batches from MPQueueHandler are decoded and dispatched."""
+        from appinfra.log.mp import MPQueueHandler
+
+        captured = []
+
+        class CaptureHandler(logging.Handler):
+            def emit(self, record):
+                captured.append(record)
+
+        logger = MagicMock(spec=Logger)
+        logger.handlers = [CaptureHandler()]
+        logger._root_logger = None
+
+        sender = MPQueueHandler(queue, batch_size=2, flush_interval=0)
+        for i in range(3):
+            sender.handle(
+                logging.LogRecord("w", logging.INFO, "w.py", i, f"m{i}", (), None)
+            )
+        sender.flush()
+
+        listener = LogQueueListener(queue, logger)
+        listener.start()
+        try:
+            deadline = time.monotonic() + 2.0
+            while len(captured) < 3 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            listener.stop()
+
+        assert [r.getMessage() for r in captured] == ["m0", "m1", "m2"]
+        assert captured[2].lineno == 2
+
     def test_stop_with_pending_records(self, queue):
         """Test stop processes remaining records before stopping."""
         captured = []
@@ -0,0 +1,216 @@
+"""Tests for the SharedMemoryRing cross-process transport."""
+
+import logging
+import multiprocessing as mp
+import queue
+import threading
+import time
+from multiprocessing import shared_memory
+from unittest.mock import MagicMock
+
+import pytest
+
+from appinfra.log import Logger
+from appinfra.log.errors import LogConfigError
+from appinfra.log.mp import LogQueueListener, SharedMemoryRing
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def ring():
+    """Create a small ring and release it after the test."""
+    r = SharedMemoryRing(capacity=1024)
+    yield r
+    r.release()
+
+
+def _produce(ring: SharedMemoryRing, worker_id: int, count: int) -> None:
+    for i in range(count):
+        ring.put_nowait((worker_id, i))
+
+
+# =============================================================================
+# Put/Get
+# =============================================================================
+
+
+class TestPutGet:
+    """Test items round-trip in order."""
+
+    def test_round_trip(self, ring):
+        """Test items come back in write order."""
+        for item in ("a", {"b": 1}, None, [1, 2]):
+            ring.put_nowait(item)
+        assert ring.qsize() == 4
+
+        assert [ring.get(timeout=1) for _ in range(4)] == ["a", {"b": 1}, None, [1, 2]]
+        assert ring.qsize() == 0
+
+    def test_get_empty_raises(self, ring):
+        """Test get raises queue.Empty when nothing arrives in time."""
+        with pytest.raises(queue.Empty):
+            ring.get(timeout=0.01)
+        with pytest.raises(queue.Empty):
+            ring.get(block=False)
+
+    def test_wrap_around(self, ring):
+        """Test messages straddling the end of the buffer are intact."""
+        payload = "x" * 300
+        for i in range(20):
+            ring.put_nowait((i, payload))
+            assert ring.get(timeout=1) == (i, payload)
+
+        assert ring.stats()["used"] == 0
+
+    def test_get_wakes_on_put(self, ring):
+        """Test a blocked get returns as soon as an item is written."""
+        threading.Timer(0.05, ring.put_nowait, args=("late",)).start()
+
+        assert ring.get(timeout=5) == "late"
+
+    def test_invalid_options(self):
+        """Test invalid options raise LogConfigError."""
+        with pytest.raises(LogConfigError):
+            SharedMemoryRing(overflow="drop_oldest")
+        with pytest.raises(LogConfigError):
+            SharedMemoryRing(capacity=16)
+
+
+# =============================================================================
+# Back-pressure
+# =============================================================================
+
+
+class TestBackPressure:
+    """Test full-ring overflow policies."""
+
+    def test_drop_new_counts_drops(self, ring):
+        """Test items that do not fit are dropped and counted."""
+        for i in range(10):
+            ring.put_nowait("y" * 200)
+
+        stats = ring.stats()
+        assert stats["dropped"] > 0
+        assert stats["used"] <= stats["capacity"]
+
+    def test_oversized_item_dropped(self, ring):
+        """Test an item larger than the ring is dropped, even when blocking."""
+        ring.overflow = "block"
+        ring.put_nowait("z" * 4096)
+
+        assert ring.stats()["dropped"] == 1
+
+    def test_block_waits_for_consumer(self):
+        """Test block delivers every item once the consumer catches up."""
+        ring = SharedMemoryRing(capacity=1024, overflow="block")
+        received = []
+
+        def consume():
+            while len(received) < 50:
+                received.append(ring.get(timeout=5))
+
+        consumer = threading.Thread(target=consume)
+        consumer.start()
+        _produce(ring, 0, 50)
+        consumer.join(5)
+
+        assert received == [(0, i) for i in range(50)]
+        assert ring.stats()["dropped"] == 0
+        ring.release()
+
+
+# =============================================================================
+# Processes and Lifecycle
+# =============================================================================
+
+
+class TestProcessesAndLifecycle:
+    """Test multi-process producers and cleanup."""
+
+    @pytest.mark.parametrize("method", ["fork", "spawn"])
+    def test_multiple_producer_processes(self, method):
+        """Test items from several processes all arrive, in order per process."""
+        ctx = mp.get_context(method)
+        ring = SharedMemoryRing(capacity=4096, overflow="block", ctx=ctx)
+        procs = [ctx.Process(target=_produce, args=(ring, w, 200)) for w in range(4)]
+        for proc in procs:
+            proc.start()
+
+        received = [ring.get(timeout=10) for _ in range(800)]
+        for proc in procs:
+            proc.join(10)
+        ring.release()
+
+        for w in range(4):
+            assert [i for wid, i in received if wid == w] == list(range(200))
+
+    def test_release_unlinks_and_drops(self):
+        """Test release frees the block and later puts are ignored."""
+        ring = SharedMemoryRing(capacity=1024)
+        name = ring._shm.name
+
+        ring.release()
+        ring.put_nowait("ignored")
+
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=name)
+        with pytest.raises(queue.Empty):
+            ring.get(timeout=0.01)
+
+    def test_listener_stop_releases_ring(self):
+        """Test records flow through Logger.with_queue and stop() cleans up."""
+        captured = []
+
+        class CaptureHandler(logging.Handler):
+            def emit(self, record):
+                captured.append(record.getMessage())
+
+        parent = MagicMock()
+        parent.handlers = [CaptureHandler()]
+        parent._root_logger = None
+        ring = SharedMemoryRing()
+        listener = LogQueueListener(ring, parent)
+        listener.start()
+
+        lg = Logger.with_queue(ring, name="worker", batch_size=4)
+        for i in range(10):
+            lg.info("msg %d", i)
+        lg.handlers[0].flush()
+
+        deadline = time.monotonic() + 5
+        while len(captured) < 10 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        listener.stop()
+
+        assert captured == [f"msg {i}" for i in range(10)]
+        assert ring._released
+
+    def test_listener_stop_keeps_ring_while_thread_runs(self, capsys):
+        """Test stop() does not release the ring under a stuck consumer."""
+        gate = threading.Event()
+        started = threading.Event()
+
+        class BlockingHandler(logging.Handler):
+            def emit(self, record):
+                started.set()
+                gate.wait(10)
+
+        parent = MagicMock()
+        parent.handlers = [BlockingHandler()]
+        parent._root_logger = None
+        ring = SharedMemoryRing(capacity=1024)
+        listener = LogQueueListener(ring, parent)
+        listener.start()
+        ring.put_nowait(
+            logging.LogRecord("t", logging.INFO, __file__, 1, "stuck", None, None)
+        )
+        assert started.wait(5)
+
+        listener.stop(timeout=0.05)
+        assert not ring._released
+        assert "ring not released" in capsys.readouterr().err
+
+        gate.set()
+        listener.stop()
+        assert ring._released
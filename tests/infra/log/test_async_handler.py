@@ -0,0 +1,243 @@
+"""
+Unit tests for AsyncDispatchHandler.
+
+Tests queued dispatch to wrapped handlers, overflow policies, counters,
+flush/close draining, and caller-info delegation.
+"""
+
+import logging
+import threading
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+from appinfra.log.async_handler import AsyncDispatchHandler
+from appinfra.log.errors import LogConfigError
+
+
+class _ListHandler(logging.Handler):
+    """Collects formatted messages; optionally blocks until released."""
+
+    def __init__(self, gate: threading.Event | None = None) -> None:
+        super().__init__()
+        self.messages: list[str] = []
+        self.gate = gate
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self.gate is not None:
+            self.gate.wait(5.0)
+        self.messages.append(record.getMessage())
+
+
+def _record(msg: str, *args, level: int = logging.INFO) -> logging.LogRecord:
+    return logging.LogRecord("test", level, __file__, 1, msg, args, None)
+
+
+# =============================================================================
+# Dispatch
+# =============================================================================
+
+
+class TestDispatch:
+    """Test records are delivered to wrapped handlers."""
+
+    def test_delivers_in_order(self):
+        """Test records reach the wrapped handler in emit order."""
+        target = _ListHandler()
+        handler = AsyncDispatchHandler([target])
+
+        for i in range(100):
+            handler.handle(_record("msg %d", i))
+
+        assert handler.drain(timeout=5.0)
+        assert target.messages == [f"msg {i}" for i in range(100)]
+        handler.close()
+
+    def test_flush_waits_for_queue(self):
+        """Test the Handler.flush() override drains queued records."""
+        target = _ListHandler()
+        handler = AsyncDispatchHandler([target])
+
+        handler.handle(_record("queued"))
+        assert handler.flush() is None
+        assert target.messages == ["queued"]
+        handler.close()
+
+    def test_freezes_message_on_caller_thread(self):
+        """Test mutable args are rendered before the record is queued."""
+        gate = threading.Event()
+        target = _ListHandler(gate)
+        handler = AsyncDispatchHandler([target])
+
+        items = ["a"]
+        handler.handle(_record("items=%s", items))
+        items.append("b")
+        gate.set()
+
+        handler.drain(timeout=5.0)
+        assert target.messages == ["items=['a']"]
+        handler.close()
+
+    def test_respects_target_levels(self):
+        """Test each wrapped handler only receives records at its level."""
+        info = _ListHandler()
+        error = _ListHandler()
+        error.setLevel(logging.ERROR)
+        handler = AsyncDispatchHandler([info, error])
+
+        handler.handle(_record("info"))
+        handler.handle(_record("error", level=logging.ERROR))
+        handler.drain(timeout=5.0)
+
+        assert info.messages == ["info", "error"]
+        assert error.messages == ["error"]
+        handler.close()
+
+    def test_set_level_propagates_to_targets(self):
+        """Test setLevel updates wrapped handlers (hot-reload path)."""
+        target = _ListHandler()
+        handler = AsyncDispatchHandler([target])
+
+        handler.setLevel(logging.WARNING)
+
+        assert target.level == logging.WARNING
+        handler.close()
+
+
+# =============================================================================
+# Overflow Policies
+# =============================================================================
+
+
+class TestOverflow:
+    """Test bounded queue overflow policies."""
+
+    def _fill(self, overflow: str) -> tuple[AsyncDispatchHandler, _ListHandler]:
+        """Block the writer on the first record, then overflow the queue."""
+        gate = threading.Event()
+        target = _ListHandler(gate)
+        handler = AsyncDispatchHandler([target], max_queue=2, overflow=overflow)
+        handler.handle(_record("first"))
+        # Wait until the writer holds "first" so the queue is empty
+        while handler.stats()["pending"] != 1 or handler._queue:
+            pass
+        for name in ("a", "b", "c", "d"):
+            handler.handle(_record(name))
+        gate.set()
+        handler.drain(timeout=5.0)
+        return handler, target
+
+    def test_drop_oldest(self):
+        """Test drop_oldest keeps the newest records."""
+        handler, target = self._fill("drop_oldest")
+        assert target.messages == ["first", "c", "d"]
+        assert handler.stats()["dropped"] == 2
+        handler.close()
+
+    def test_drop_new(self):
+        """Test drop_new keeps the oldest records."""
+        handler, target = self._fill("drop_new")
+        assert target.messages == ["first", "a", "b"]
+        assert handler.stats()["dropped"] == 2
+        handler.close()
+
+    def test_block_waits_for_space(self):
+        """Test block delivers every record once the writer catches up."""
+        gate = threading.Event()
+        target = _ListHandler(gate)
+        handler = AsyncDispatchHandler([target], max_queue=2, overflow="block")
+
+        producer = threading.Thread(
+            target=lambda: [handler.handle(_record(f"m{i}")) for i in range(10)]
+        )
+        producer.start()
+        gate.set()
+        producer.join(5.0)
+        handler.drain(timeout=5.0)
+
+        assert target.messages == [f"m{i}" for i in range(10)]
+        assert handler.stats()["dropped"] == 0
+        handler.close()
+
+    def test_invalid_options(self):
+        """Test invalid options raise LogConfigError."""
+        with pytest.raises(LogConfigError):
+            AsyncDispatchHandler([], overflow="spill")
+        with pytest.raises(LogConfigError):
+            AsyncDispatchHandler([], max_queue=0)
+
+
+# =============================================================================
+# Counters and Shutdown
+# =============================================================================
+
+
+class TestStatsAndShutdown:
+    """Test counters, flush_all and close."""
+
+    def test_stats_counts(self):
+        """Test queued and dispatched counters and latency tracking."""
+        handler = AsyncDispatchHandler([_ListHandler()])
+        for _ in range(10):
+            handler.handle(_record("x"))
+        handler.drain(timeout=5.0)
+
+        stats = handler.stats()
+        assert stats["queued"] == 10
+        assert stats["dispatched"] == 10
+        assert stats["pending"] == 0
+        assert stats["latency_max"] >= stats["latency_avg"] >= 0.0
+        handler.close()
+
+    def test_flush_all_drains_every_instance(self):
+        """Test flush_all drains all live dispatchers."""
+        targets = [_ListHandler(), _ListHandler()]
+        handlers = [AsyncDispatchHandler([t]) for t in targets]
+        for handler in handlers:
+            handler.handle(_record("bye"))
+
+        assert AsyncDispatchHandler.flush_all(timeout=5.0)
+        assert all(t.messages == ["bye"] for t in targets)
+        for handler in handlers:
+            handler.close()
+
+    def test_close_drains_and_stops_thread(self):
+        """Test close writes pending records and stops the writer."""
+        target = _ListHandler()
+        handler = AsyncDispatchHandler([target])
+        handler.handle(_record("last"))
+
+        handler.close()
+
+        assert target.messages == ["last"]
+        assert not handler._thread.is_alive()
+        handler.handle(_record("late"))
+        assert handler.stats()["dropped"] == 1
+
+    def test_close_timeout_leaves_handlers_open(self, capsys):
+        """Test handlers are not closed under a writer that is still running."""
+        gate = threading.Event()
+        target = _ListHandler(gate)
+        closed = []
+        target.close = lambda: closed.append(True)  # type: ignore[method-assign]
+        handler = AsyncDispatchHandler([target])
+        handler.handle(_record("slow"))
+
+        handler.close(timeout=0.05)
+
+        assert closed == []
+        assert "wrapped handlers left open" in capsys.readouterr().err
+        gate.set()
+        handler._thread.join(5.0)
+        assert target.messages == ["slow"]
+
+    def test_needs_caller_delegates_to_targets(self):
+        """Test caller-info need is taken from wrapped formatters."""
+        target = _ListHandler()
+        target.setFormatter(logging.Formatter("%(message)s"))
+        target.formatter.needs_caller = False  # type: ignore[attr-defined]
+        handler = AsyncDispatchHandler([target])
+
+        assert handler.needs_caller is False
+        handler.close()
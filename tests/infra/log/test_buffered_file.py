@@ -0,0 +1,209 @@
+"""
+Unit tests for buffered file handlers.
+
+Tests byte-threshold, ERROR+ and timer flushes, rotation with buffered data,
+and fsync policies.
+"""
+
+import logging
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+from appinfra.log.buffered_file import (
+    BufferedFileHandler,
+    BufferedRotatingFileHandler,
+    BufferedTimedRotatingFileHandler,
+)
+from appinfra.log.errors import LogConfigError
+
+
+def _record(msg: str, level: int = logging.INFO) -> logging.LogRecord:
+    return logging.LogRecord("test", level, __file__, 1, msg, None, None)
+
+
+def _wait_for(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+# =============================================================================
+# Flush Triggers
+# =============================================================================
+
+
+class TestFlushTriggers:
+    """Test when buffered records reach the file."""
+
+    def test_buffers_below_threshold(self, tmp_path: Path):
+        """Test records stay buffered until the byte threshold."""
+        path = tmp_path / "app.log"
+        handler = BufferedFileHandler(path, buffer_bytes=4096, flush_interval=0)
+
+        handler.handle(_record("buffered"))
+        assert path.read_text() == ""
+
+        handler.flush()
+        assert path.read_text() == "buffered\n"
+        handler.close()
+
+    def test_flushes_at_threshold(self, tmp_path: Path):
+        """Test reaching buffer_bytes flushes the buffer."""
+        path = tmp_path / "app.log"
+        handler = BufferedFileHandler(path, buffer_bytes=20, flush_interval=0)
+
+        handler.handle(_record("a" * 9))
+        assert path.read_text() == ""
+        handler.handle(_record("b" * 9))
+
+        assert path.read_text() == "a" * 9 + "\n" + "b" * 9 + "\n"
+        handler.close()
+
+    def test_error_flushes_immediately(self, tmp_path: Path):
+        """Test ERROR+ records flush everything buffered before them."""
+        path = tmp_path / "app.log"
+        handler = BufferedFileHandler(path, buffer_bytes=4096, flush_interval=0)
+
+        handler.handle(_record("info"))
+        handler.handle(_record("boom", logging.ERROR))
+
+        assert path.read_text() == "info\nboom\n"
+        handler.close()
+
+    def test_flush_interval_bounds_latency(self, tmp_path: Path):
+        """Test the timer flushes records older than flush_interval."""
+        path = tmp_path / "app.log"
+        handler = BufferedFileHandler(path, buffer_bytes=4096, flush_interval=0.05)
+
+        handler.handle(_record("late"))
+
+        assert _wait_for(lambda: path.read_text() == "late\n")
+        handler.close()
+
+    def test_close_flushes(self, tmp_path: Path):
+        """Test close writes buffered records."""
+        path = tmp_path / "app.log"
+        handler = BufferedFileHandler(path, buffer_bytes=4096, flush_interval=0)
+
+        handler.handle(_record("last"))
+        handler.close()
+
+        assert path.read_text() == "last\n"
+
+    def test_handle_batch_writes_all_records(self, tmp_path: Path):
+        """Test handle_batch writes every record and applies the triggers once."""
+        path = tmp_path / "app.log"
+        handler = BufferedFileHandler(path, buffer_bytes=4096, flush_interval=0)
+        handler.addFilter(lambda record: record.getMessage() != "skip")
+
+        handler.handle_batch([_record("a"), _record("skip"), _record("b")])
+        assert path.read_text() == ""
+
+        handler.handle_batch([_record("c"), _record("boom", logging.ERROR)])
+        assert path.read_text() == "a\nb\nc\nboom\n"
+        handler.close()
+
+    def test_invalid_fsync_policy(self, tmp_path: Path):
+        """Test unknown fsync policy raises LogConfigError."""
+        with pytest.raises(LogConfigError, match="fsync"):
+            BufferedFileHandler(tmp_path / "app.log", fsync="sometimes")
+
+
+# =============================================================================
+# fsync Policy
+# =============================================================================
+
+
+class TestFsyncPolicy:
+    """Test fsync is issued according to policy."""
+
+    @pytest.mark.parametrize(
+        "policy,expected", [("never", 0), ("error", 1), ("always", 2)]
+    )
+    def test_fsync_calls(self, tmp_path: Path, policy, expected):
+        """Test threshold and ERROR flushes fsync per policy."""
+        handler = BufferedFileHandler(
+            tmp_path / "app.log", buffer_bytes=1, flush_interval=0, fsync=policy
+        )
+
+        with patch("appinfra.log.buffered_file.os.fsync") as fsync:
+            handler.handle(_record("threshold"))
+            handler.handle(_record("boom", logging.ERROR))
+
+        assert fsync.call_count == expected
+        handler.close()
+
+
+# =============================================================================
+# Rotation
+# =============================================================================
+
+
+class TestRotation:
+    """Test rotation keeps records in the right files."""
+
+    def test_size_rotation(self, tmp_path: Path):
+        """Test buffered records land in the file they were written to."""
+        path = tmp_path / "app.log"
+        handler = BufferedRotatingFileHandler(
+            path, max_bytes=25, backup_count=2, buffer_bytes=4096, flush_interval=0
+        )
+
+        for i in range(4):
+            handler.handle(_record(f"record-{i:04d}"))  # 12 chars each
+        handler.close()
+
+        assert (tmp_path / "app.log.1").read_text() == "record-0000\nrecord-0001\n"
+        assert path.read_text() == "record-0002\nrecord-0003\n"
+
+    def test_size_rotation_in_batch(self, tmp_path: Path):
+        """Test rollover is checked per record within handle_batch."""
+        path = tmp_path / "app.log"
+        handler = BufferedRotatingFileHandler(
+            path, max_bytes=25, backup_count=2, buffer_bytes=4096, flush_interval=0
+        )
+
+        handler.handle_batch([_record(f"record-{i:04d}") for i in range(4)])
+        handler.close()
+
+        assert (tmp_path / "app.log.1").read_text() == "record-0000\nrecord-0001\n"
+        assert path.read_text() == "record-0002\nrecord-0003\n"
+
+    def test_size_rotation_counts_existing_file(self, tmp_path: Path):
+        """Test the size of an existing file counts toward max_bytes."""
+        path = tmp_path / "app.log"
+        path.write_text("x" * 20 + "\n")
+        handler = BufferedRotatingFileHandler(
+            path, max_bytes=25, backup_count=1, buffer_bytes=4096, flush_interval=0
+        )
+
+        handler.handle(_record("record-0000"))
+        handler.close()
+
+        assert (tmp_path / "app.log.1").read_text() == "x" * 20 + "\n"
+        assert path.read_text() == "record-0000\n"
+
+    def test_timed_rotation_flushes_old_file(self, tmp_path: Path):
+        """Test buffered data is written to the old file before rollover."""
+        path = tmp_path / "app.log"
+        handler = BufferedTimedRotatingFileHandler(
+            path, when="s", backup_count=1, buffer_bytes=4096, flush_interval=0
+        )
+
+        handler.handle(_record("before"))
+        handler.rolloverAt = 0  # Force rollover on the next record
+        handler.handle(_record("after"))
+        handler.close()
+
+        rotated = [p for p in tmp_path.iterdir() if p.name != "app.log"]
+        assert len(rotated) == 1
+        assert rotated[0].read_text() == "before\n"
+        assert path.read_text() == "after\n"
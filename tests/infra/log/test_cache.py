@@ -0,0 +1,106 @@
+"""Tests for ClockCache - bounded cache with CLOCK eviction."""
+
+import threading
+
+import pytest
+
+from appinfra.log.cache import ClockCache
+
+
+@pytest.mark.unit
+class TestClockCache:
+    """Unit tests for ClockCache."""
+
+    def test_get_returns_stored_value(self):
+        """Test a stored value is returned by get()."""
+        cache = ClockCache(maxsize=4)
+        cache.put("a", "1")
+
+        assert cache.get("a") == "1"
+        assert "a" in cache
+        assert len(cache) == 1
+
+    def test_get_miss_returns_none(self):
+        """Test a missing key returns None."""
+        assert ClockCache(maxsize=4).get("missing") is None
+
+    def test_put_existing_key_replaces_value(self):
+        """Test putting an existing key updates it without growing."""
+        cache = ClockCache(maxsize=4)
+        cache.put("a", "1")
+        cache.put("a", "2")
+
+        assert cache.get("a") == "2"
+        assert len(cache) == 1
+
+    def test_evicts_oldest_unreferenced(self):
+        """Test the first unreferenced entry is evicted when full."""
+        cache = ClockCache(maxsize=3)
+        for key in ("a", "b", "c"):
+            cache.put(key, key)
+
+        cache.put("d", "d")
+
+        assert "a" not in cache
+        assert len(cache) == 3
+
+    def test_referenced_entry_gets_second_chance(self):
+        """Test an entry hit since the last sweep survives eviction."""
+        cache = ClockCache(maxsize=3)
+        for key in ("a", "b", "c"):
+            cache.put(key, key)
+        cache.get("a")
+
+        cache.put("d", "d")
+
+        assert "a" in cache
+        assert "b" not in cache
+
+    def test_all_referenced_evicts_after_full_sweep(self):
+        """Test eviction terminates when every entry is referenced."""
+        cache = ClockCache(maxsize=3)
+        for key in ("a", "b", "c"):
+            cache.put(key, key)
+            cache.get(key)
+
+        cache.put("d", "d")
+
+        assert "a" not in cache
+        assert cache.get("d") == "d"
+        assert len(cache) == 3
+
+    def test_clear(self):
+        """Test clear() removes every entry."""
+        cache = ClockCache(maxsize=2)
+        cache.put("a", "1")
+        cache.put("b", "2")
+
+        cache.clear()
+        cache.put("c", "3")
+
+        assert len(cache) == 1
+        assert cache.get("a") is None
+
+    def test_invalid_maxsize(self):
+        """Test maxsize must be positive."""
+        with pytest.raises(ValueError, match="maxsize"):
+            ClockCache(maxsize=0)
+
+    def test_concurrent_access_stays_bounded(self):
+        """Test concurrent hits and inserts never exceed maxsize."""
+        cache = ClockCache(maxsize=50)
+
+        def worker(offset: int) -> None:
+            for i in range(2000):
+                key = (offset + i) % 200
+                if cache.get(key) is None:
+                    cache.put(key, str(key))
+
+        threads = [threading.Thread(target=worker, args=(n * 7,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(cache) <= 50
+        assert all(cache.get(key) in (None, str(key)) for key in range(200))
@@ -0,0 +1,59 @@
+"""
+Unit tests for the shared deferred flush timer.
+"""
+
+import gc
+import logging
+import threading
+import weakref
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+from appinfra.log.flush_timer import FlushTimer, schedule_flush
+
+
+class _FlushRecorder(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.flushed = threading.Event()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        pass
+
+    def flush(self) -> None:
+        self.flushed.set()
+
+
+class TestFlushTimer:
+    """Test deferred flushes."""
+
+    def test_flushes_after_delay(self):
+        """Test the handler is flushed once the delay passes."""
+        handler = _FlushRecorder()
+        schedule_flush(handler, 0.01)
+
+        assert handler.flushed.wait(5.0)
+
+    def test_flushes_in_deadline_order(self):
+        """Test a shorter delay scheduled later still fires first."""
+        timer = FlushTimer()
+        slow, fast = _FlushRecorder(), _FlushRecorder()
+        timer.schedule(slow, 5.0)
+        timer.schedule(fast, 0.01)
+
+        assert fast.flushed.wait(5.0)
+        assert not slow.flushed.is_set()
+
+    def test_does_not_keep_handler_alive(self):
+        """Test a pending flush holds the handler by weak reference."""
+        timer = FlushTimer()
+        handler = _FlushRecorder()
+        ref = weakref.ref(handler)
+        timer.schedule(handler, 60.0)
+
+        del handler
+        gc.collect()
+
+        assert ref() is None
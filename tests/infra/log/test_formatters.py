@@ -14,8 +14,10 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+from appinfra.log.cache import ClockCache
 from appinfra.log.colors import ColorManager
 from appinfra.log.config import LogConfig
+from appinfra.log.config_holder import LogConfigHolder
 from appinfra.log.formatters import (
     FieldFormatter,
     LocationRenderer,
@@ -152,39 +154,33 @@ class TestHelperFunctions:
     def test_cache_result_caches_when_key_provided(self):
         """Test cache result caches when key is provided."""
         formatter = Mock()
-        formatter._format_cache = {}
-        formatter._max_cache_size = 100
+        formatter._format_cache = ClockCache(maxsize=100)
 
         _cache_result(formatter, ("key",), "result")
 
-        assert formatter._format_cache[("key",)] == "result"
+        assert formatter._format_cache.get(("key",)) == "result"
 
     def test_cache_result_does_not_cache_when_key_none(self):
         """Test cache result doesn't cache when key is None."""
         formatter = Mock()
-        formatter._format_cache = {}
-        formatter._max_cache_size = 100
+        formatter._format_cache = ClockCache(maxsize=100)
 
         _cache_result(formatter, None, "result")
 
         assert len(formatter._format_cache) == 0
 
     def test_cache_result_respects_max_size(self):
-        """Test cache result respects maximum cache size with LRU eviction."""
-        import collections
-
+        """Test cache result respects maximum cache size with CLOCK eviction."""
         formatter = Mock()
-        # Use OrderedDict because _cache_result uses LRU eviction with move_to_end/popitem
-        formatter._format_cache = collections.OrderedDict(
-            (i, f"val{i}") for i in range(100)
-        )
-        formatter._max_cache_size = 100
+        formatter._format_cache = ClockCache(maxsize=100)
+        for i in range(100):
+            formatter._format_cache.put(i, f"val{i}")
 
         _cache_result(formatter, ("new_key",), "new_result")
 
-        # Should add new key after evicting oldest (key 0)
+        # Should add new key after evicting the oldest unreferenced (key 0)
         assert ("new_key",) in formatter._format_cache
-        assert 0 not in formatter._format_cache  # Oldest was evicted
+        assert 0 not in formatter._format_cache
         assert len(formatter._format_cache) == 100  # Size maintained
 
 
@@ -219,6 +215,59 @@ class TestPreFormatter:
         parts = result.split(".")
         assert len(parts[-1]) == 3
 
+    def test_format_time_matches_logging_formatter(self, log_record):
+        """Test cached rendering matches logging.Formatter across seconds."""
+        formatter = PreFormatter("%(asctime)s", micros=False)
+        reference = logging.Formatter()
+
+        for created in (1234567890.5, 1234567890.999, 1234567891.001, 1234567890.2):
+            log_record.created = created
+            log_record.msecs = int((created - int(created)) * 1000) + 0.0
+            assert formatter.formatTime(log_record) == reference.formatTime(log_record)
+
+    def test_format_time_without_msec_format(self, log_record):
+        """Test a None default_msec_format omits milliseconds like logging."""
+        formatter = PreFormatter("%(asctime)s", micros=False)
+        formatter.default_msec_format = None
+        reference = logging.Formatter()
+        reference.default_msec_format = None
+
+        assert formatter.formatTime(log_record) == reference.formatTime(log_record)
+
+    def test_format_time_renders_date_once_per_second(self, log_record):
+        """Test records within one second reuse the rendered date and time."""
+        formatter = PreFormatter("%(asctime)s", micros=True)
+
+        with patch("appinfra.log.formatters.time.strftime", return_value="D") as fmt:
+            results = []
+            for msecs in (100, 200, 300):
+                log_record.created = 1234567890 + msecs / 1000
+                log_record.msecs = float(msecs)
+                results.append(formatter.formatTime(log_record))
+
+        assert fmt.call_count == 1
+        assert results[0].startswith("D,100.")
+
+    def test_format_time_cache_is_per_thread(self, log_record):
+        """Test each thread renders into its own cache."""
+        import threading
+
+        formatter = PreFormatter("%(asctime)s", micros=False)
+        formatter.formatTime(log_record)
+        other = logging.makeLogRecord({"created": log_record.created + 60})
+        seen = []
+
+        def render() -> None:
+            formatter.formatTime(other)
+            seen.append(formatter._time_cache.second)
+
+        thread = threading.Thread(target=render)
+        thread.start()
+        thread.join()
+
+        assert seen == [int(other.created)]
+        assert formatter._time_cache.second == int(log_record.created)
+
     def test_format_complete_record(self, log_record):
         """Test formatting complete log record."""
         formatter = PreFormatter("%(asctime)s %(levelname)s %(message)s", micros=False)
@@ -240,7 +289,7 @@ class TestFieldFormatter:
         """Test FieldFormatter initialization."""
         formatter = FieldFormatter(formatter_config)
         assert formatter._config == formatter_config
-        assert isinstance(formatter._format_cache, dict)
+        assert isinstance(formatter._format_cache, ClockCache)
 
     def test_format_field_with_string_value(self, formatter_config):
         """Test format_field with string value."""
@@ -458,6 +507,53 @@ class TestLogFormatter:
         assert "ValueError" in result or "test error" in result
 
 
+@pytest.mark.unit
+class TestFormatPlan:
+    """Test the per-config format plan used by LogFormatter."""
+
+    def test_plan_reused_while_config_unchanged(self, formatter_config, log_record):
+        """Test the plan is built once and reused across records."""
+        formatter = LogFormatter(formatter_config)
+        plan = formatter._get_plan()
+
+        formatter.format(log_record)
+        formatter.format(log_record)
+
+        assert formatter._get_plan() is plan
+
+    def test_plan_rebuilt_on_holder_update(self, log_record):
+        """Test hot-reload replaces the plan and takes effect."""
+        holder = LogConfigHolder(LogConfig(location=0, micros=False, colors=True))
+        formatter = LogFormatter(holder)
+        plan = formatter._get_plan()
+        assert "\x1b[" in formatter.format(log_record)
+
+        holder.update(LogConfig(location=0, micros=True, colors=False))
+
+        assert formatter._get_plan() is not plan
+        result = formatter.format(log_record)
+        assert "\x1b[" not in result
+        assert ".456] " in result
+
+    def test_level_head_cached_per_level(self, formatter_config):
+        """Test the colored header is rendered once per level."""
+        plan = LogFormatter(formatter_config)._get_plan()
+
+        info = plan.level_head(logging.INFO)
+
+        assert plan.level_head(logging.INFO) is info
+        assert plan.level_head(logging.ERROR)[0] == ColorManager.RED + "m"
+
+    def test_unknown_level_uses_default_color(self, formatter_config):
+        """Test levels without a color fall back to the default color."""
+        plan = LogFormatter(formatter_config)._get_plan()
+
+        col, _, head = plan.level_head(logging.INFO + 1)
+
+        assert col == ColorManager.DEFAULT + "m"
+        assert head.startswith(col)
+
+
 # =============================================================================
 # Test Integration Scenarios
 # =============================================================================
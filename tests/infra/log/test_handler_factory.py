@@ -430,6 +430,22 @@ class TestHandlerFactoryCreateHandlerConfig:
             # File handler requires filename
             HandlerFactory.create_handler_config("file", {})
 
+    def test_passes_buffering_options(self):
+        """Test YAML buffer_bytes/flush_interval/fsync reach file configs."""
+        result = HandlerFactory.create_handler_config(
+            "rotating_file",
+            {
+                "filename": "/tmp/app.log",
+                "buffer_bytes": 65536,
+                "flush_interval": 2.0,
+                "fsync": "error",
+            },
+        )
+
+        assert result.buffer_bytes == 65536
+        assert result.flush_interval == 2.0
+        assert result.fsync == "error"
+
 
 # =============================================================================
 # Test HandlerRegistry
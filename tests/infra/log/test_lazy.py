@@ -0,0 +1,235 @@
+"""
+Unit tests for deferred (lazy) extra field values.
+"""
+
+import io
+import json
+import logging
+import pickle
+import threading
+import time
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+from appinfra.log import LogConfig, Logger, lazy  # noqa: E402
+from appinfra.log.builder.json import JSONFormatter  # noqa: E402
+from appinfra.log.formatters import LogFormatter  # noqa: E402
+from appinfra.log.lazy import (  # noqa: E402
+    LAZY_ATTR,
+    LazyValue,
+    has_lazy,
+    resolve_extra,
+)
+
+
+class _Counter:
+    """Zero-argument callable source that counts evaluations."""
+
+    def __init__(self, value="computed") -> None:
+        self.calls = 0
+        self.value = value
+
+    def get(self):
+        self.calls += 1
+        return self.value
+
+
+def _logger(extra=None, level="debug") -> Logger:
+    lg = Logger("/test/lazy", LogConfig.from_params(level, location=0), extra=extra)
+    lg.propagate = False
+    return lg
+
+
+def _stream_handler(formatter: logging.Formatter, level=logging.NOTSET):
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(formatter)
+    handler.setLevel(level)
+    return handler, stream
+
+
+def _plain_formatter() -> LogFormatter:
+    return LogFormatter(LogConfig.from_params("debug", location=0, colors=False))
+
+
+class TestLazyValue:
+    """Test the lazy() wrapper and detection helpers."""
+
+    def test_lazy_binds_arguments(self):
+        """Test lazy() calls the function with the given arguments."""
+        value = lazy(max, 1, 5, key=abs)
+
+        assert isinstance(value, LazyValue)
+        assert value() == 5
+
+    def test_has_lazy(self):
+        """Test functions, methods and LazyValue are deferred, others not."""
+        counter = _Counter()
+
+        assert has_lazy({"a": lambda: 1})
+        assert has_lazy({"a": counter.get})
+        assert has_lazy({"a": lazy(len, [])})
+        assert not has_lazy({"a": 1, "b": "text", "c": dict, "d": len})
+        assert not has_lazy({})
+
+    def test_resolve_without_lazy_returns_extra(self):
+        """Test records without deferred values are returned untouched."""
+        record = logging.makeLogRecord({"msg": "m"})
+        extra = {"a": 1}
+        setattr(record, "__infra__extra", extra)
+
+        assert resolve_extra(record) is extra
+
+    def test_resolve_error_is_rendered(self):
+        """Test a failing deferred value does not break formatting."""
+        record = logging.makeLogRecord({"msg": "m"})
+        setattr(record, "__infra__extra", {"bad": lambda: 1 / 0})
+        setattr(record, LAZY_ATTR, True)
+
+        assert resolve_extra(record)["bad"] == (
+            "<lazy value failed: ZeroDivisionError: division by zero>"
+        )
+
+
+class TestLoggerLazyExtra:
+    """Test deferred extra values through Logger and handlers."""
+
+    def test_not_evaluated_when_handler_filters_record(self):
+        """Test values are not computed for records no handler formats."""
+        counter = _Counter()
+        lg = _logger()
+        handler, stream = _stream_handler(_plain_formatter(), logging.WARNING)
+        lg.addHandler(handler)
+
+        lg.debug("dropped", extra={"value": counter.get})
+
+        assert counter.calls == 0
+        assert stream.getvalue() == ""
+
+    def test_not_evaluated_when_level_disabled(self):
+        """Test disabled levels never evaluate deferred values."""
+        counter = _Counter()
+        lg = _logger(level="info")
+        lg.addHandler(_stream_handler(_plain_formatter())[0])
+
+        lg.debug("disabled", extra={"value": counter.get})
+
+        assert counter.calls == 0
+
+    def test_evaluated_once_for_multiple_handlers(self):
+        """Test each value is computed once and shared by all handlers."""
+        counter = _Counter()
+        lg = _logger()
+        text_handler, text = _stream_handler(_plain_formatter())
+        json_handler, js = _stream_handler(JSONFormatter())
+        lg.addHandler(text_handler)
+        lg.addHandler(json_handler)
+
+        lg.info("loaded", extra={"rows": counter.get, "total": lazy(sum, [1, 2])})
+
+        assert counter.calls == 1
+        assert "[rows:computed]" in text.getvalue()
+        assert "[total:3]" in text.getvalue()
+        assert json.loads(js.getvalue())["extra"] == {"rows": "computed", "total": 3}
+
+    def test_concurrent_resolution_evaluates_once(self):
+        """Test concurrent first formats evaluate once and share the result."""
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return object()
+
+        record = logging.LogRecord("t", logging.INFO, __file__, 1, "m", None, None)
+        setattr(record, "__infra__extra", {"value": slow})
+        setattr(record, LAZY_ATTR, True)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(resolve_extra(record)))
+            for _ in range(2)
+        ]
+        threads[0].start()
+        assert started.wait(5)
+        threads[1].start()
+        time.sleep(0.05)  # Let the second thread reach the record lock
+        release.set()
+        for t in threads:
+            t.join(5)
+
+        assert calls == [1]
+        assert results[0] is results[1]
+        assert record.value is results[0]["value"]
+        assert getattr(record, "__infra__extra") is results[0]
+        assert LAZY_ATTR not in record.__dict__
+        assert "__infra__lazy_lock" not in record.__dict__
+
+    def test_resolved_record_is_picklable(self):
+        """Test no lock is left on a resolved record."""
+        record = logging.LogRecord("t", logging.INFO, __file__, 1, "m", None, None)
+        setattr(record, "__infra__extra", {"n": lambda: 3})
+        setattr(record, LAZY_ATTR, True)
+        resolve_extra(record)
+
+        assert pickle.loads(pickle.dumps(record)).n == 3
+
+    def test_deferred_function_may_log(self):
+        """Test a deferred function can log through the same logger."""
+        lg = _logger()
+        handler, stream = _stream_handler(_plain_formatter())
+        lg.addHandler(handler)
+
+        def nested():
+            lg.info("inner", extra={"n": lambda: 1})
+            return "outer-value"
+
+        lg.info("outer", extra={"v": nested})
+
+        assert "[n:1]" in stream.getvalue()
+        assert "[v:outer-value]" in stream.getvalue()
+
+    def test_prepopulated_lazy_extra(self):
+        """Test logger-level deferred values are evaluated per record."""
+        counter = _Counter()
+        lg = _logger(extra={"value": counter.get})
+        handler, stream = _stream_handler(_plain_formatter())
+        lg.addHandler(handler)
+
+        lg.info("first")
+        lg.info("second", extra={"other": 1})
+
+        assert counter.calls == 2
+        assert stream.getvalue().count("[value:computed]") == 2
+        # The logger's shared mapping keeps the callable
+        assert lg._extra["value"] == counter.get
+
+    def test_record_attributes_updated(self):
+        """Test resolved values replace the callables set as record attributes."""
+        records = []
+
+        class Capture(logging.Handler):
+            def emit(self, record):
+                resolve_extra(record)
+                records.append(record)
+
+        lg = _logger()
+        lg.addHandler(Capture())
+        lg.info("m", extra={"rows": lambda: 7})
+
+        assert records[0].rows == 7
+        assert getattr(records[0], "__infra__extra") == {"rows": 7}
+
+    def test_other_callables_logged_as_is(self):
+        """Test classes and builtins are not called."""
+        lg = _logger()
+        handler, stream = _stream_handler(_plain_formatter())
+        lg.addHandler(handler)
+
+        lg.info("m", extra={"kind": dict})
+
+        assert "[kind:<class 'dict'>]" in stream.getvalue()
@@ -268,6 +268,42 @@ class TestPrecedence:
         assert level == "debug"
 
 
+# =============================================================================
+# Test Lookup Cache
+# =============================================================================
+
+
+class TestLookupCache:
+    """Test cached effective level resolution."""
+
+    def test_add_rule_invalidates_cached_lookup(self, manager):
+        """Test a new rule applies to names already resolved."""
+        assert manager.get_effective_level("/infra/db/queries") is None
+        manager.add_rule("/infra/db/*", "debug", source="yaml", priority=1)
+        assert manager.get_effective_level("/infra/db/queries") == "debug"
+
+    def test_clear_rules_invalidates_cached_lookup(self, manager):
+        """Test cleared rules no longer apply to names already resolved."""
+        manager.add_rule("/infra/db/*", "debug", source="yaml", priority=1)
+        assert manager.get_effective_level("/infra/db/queries") == "debug"
+        manager.clear_rules(source="yaml")
+        assert manager.get_effective_level("/infra/db/queries") is None
+
+    def test_from_dict_invalidates_cached_lookup(self, manager):
+        """Test restored rules replace previously resolved levels."""
+        manager.add_rule("/infra/db/*", "debug", source="yaml", priority=1)
+        assert manager.get_effective_level("/infra/db/queries") == "debug"
+        manager.from_dict({"rules": []})
+        assert manager.get_effective_level("/infra/db/queries") is None
+
+    def test_cache_is_bounded(self, manager, monkeypatch):
+        """Test the per-name cache is dropped once full."""
+        monkeypatch.setattr(LogLevelManager, "MAX_CACHED_NAMES", 3)
+        for i in range(10):
+            manager.get_effective_level(f"/topic/{i}")
+        assert len(manager._level_cache) <= 3
+
+
 # =============================================================================
 # Test Runtime Updates
 # =============================================================================
@@ -13,15 +13,17 @@ Tests Logger, LogConfig, and CallbackRegistry functionality including:
 
 import collections
 import logging
+import pickle
 from unittest.mock import Mock, patch
 
 import pytest
 
-from appinfra.log.callback import CallbackRegistry, listens_for
+from appinfra.log.callback import CallbackRegistry, CallbackWorkerPool, listens_for
 from appinfra.log.config import LogConfig
 from appinfra.log.errors import (
     CallbackError,
     InvalidLogLevelError,
+    LogConfigError,
     ReservedKeyError,
 )
 from appinfra.log.logger import Logger
@@ -400,6 +402,136 @@ class TestCallbackRegistry:
 
         assert not registry.has_callbacks(logging.INFO)
 
+    def test_active_tracks_registrations(self):
+        """Test active flag lets loggers skip trigger() for empty registries."""
+        registry = CallbackRegistry()
+        callback = Mock()
+        assert registry.active is False
+
+        registry.register(logging.INFO, callback)
+        assert registry.active is True
+
+        registry.remove_callback(logging.INFO, callback)
+        assert registry.active is False
+
+    def test_trigger_preserves_registration_order(self):
+        """Test the flattened table calls callbacks in registration order."""
+        registry = CallbackRegistry()
+        calls = []
+        registry.register(logging.INFO, lambda *a, **k: calls.append(1))
+        registry.register(logging.INFO, lambda *a, **k: calls.append(2))
+        registry.register(logging.WARNING, lambda *a, **k: calls.append(3))
+
+        registry.trigger(logging.INFO, Mock(), "msg", (), {})
+
+        assert calls == [1, 2]
+
+    def test_inherit_to_preserves_run_async(self):
+        """Test inherited callbacks keep their async setting."""
+        pool = CallbackWorkerPool()
+        source = CallbackRegistry()
+        target = CallbackRegistry(pool=pool)
+        callback = Mock()
+        source.register(logging.ERROR, callback, inherit=True, run_async=True)
+
+        source.inherit_to(target)
+        target.trigger(logging.ERROR, Mock(), "msg", (), {})
+
+        assert pool.flush(timeout=5.0)
+        assert pool.stats()["completed"] == 1
+        callback.assert_called_once()
+        pool.close()
+
+    def test_async_callback_runs_off_logging_thread(self):
+        """Test run_async callbacks execute on the worker pool."""
+        import threading
+
+        pool = CallbackWorkerPool(workers=1)
+        registry = CallbackRegistry(pool=pool)
+        threads = []
+
+        def callback(logger, level, msg, args, **kwargs):
+            threads.append((threading.current_thread().name, msg, kwargs))
+
+        registry.register(logging.ERROR, callback, run_async=True)
+        registry.trigger(logging.ERROR, Mock(), "boom", (), {"extra": {"a": 1}})
+
+        assert pool.flush(timeout=5.0)
+        assert threads == [("log-callback-0", "boom", {"extra": {"a": 1}})]
+        pool.close()
+
+    def test_logger_skips_trigger_without_callbacks(self, basic_logger):
+        """Test loggers bail out before trigger() when nothing is registered."""
+        with patch.object(basic_logger._callbacks, "trigger") as trigger:
+            basic_logger.info("no callbacks")
+
+        trigger.assert_not_called()
+
+
+@pytest.mark.unit
+class TestCallbackWorkerPool:
+    """Test the worker pool used by asynchronous callbacks."""
+
+    def test_invalid_options_raise(self):
+        """Test workers and max_queue must be positive."""
+        with pytest.raises(LogConfigError):
+            CallbackWorkerPool(workers=0)
+        with pytest.raises(LogConfigError):
+            CallbackWorkerPool(max_queue=0)
+
+    def test_drops_when_queue_full(self):
+        """Test a full queue drops new jobs instead of blocking."""
+        import threading
+
+        started = threading.Event()
+        release = threading.Event()
+
+        def blocking_job():
+            started.set()
+            release.wait(5.0)
+
+        pool = CallbackWorkerPool(workers=1, max_queue=1)
+        assert pool.submit(blocking_job, (), {})
+        assert started.wait(5.0)
+
+        assert pool.submit(Mock(), (), {})
+        assert not pool.submit(Mock(), (), {})
+        release.set()
+
+        assert pool.flush(timeout=5.0)
+        assert pool.stats() == {
+            "submitted": 2,
+            "completed": 2,
+            "dropped": 1,
+            "errors": 0,
+            "pending": 0,
+        }
+        pool.close()
+
+    def test_errors_are_counted(self, capsys):
+        """Test failing callbacks are reported without killing the worker."""
+        pool = CallbackWorkerPool(workers=1)
+        pool.submit(Mock(side_effect=RuntimeError("alert failed")), (), {})
+        pool.submit(Mock(), (), {})
+
+        assert pool.flush(timeout=5.0)
+        assert pool.stats()["errors"] == 1
+        assert pool.stats()["completed"] == 2
+        assert "alert failed" in capsys.readouterr().err
+        pool.close()
+
+    def test_closed_pool_drops_jobs(self):
+        """Test jobs submitted after close() are dropped."""
+        pool = CallbackWorkerPool()
+        pool.close()
+
+        assert not pool.submit(Mock(), (), {})
+        assert pool.stats()["dropped"] == 1
+
+    def test_default_pool_is_shared(self):
+        """Test registries without a pool share the default one."""
+        assert CallbackWorkerPool.default() is CallbackWorkerPool.default()
+
 
 # =============================================================================
 # Test listens_for decorator
@@ -583,6 +715,32 @@ class TestLoggerMakeRecord:
 
         assert isinstance(getattr(record, "__infra__extra"), collections.OrderedDict)
 
+    def test_makerecord_shared_extra_is_read_only(self):
+        """Test records without per-call extra cannot modify logger extra."""
+        logger = Logger("test", extra={"request_id": "12345"})
+
+        record = logger.makeRecord(
+            name="test",
+            level=logging.INFO,
+            fn="test.py",
+            lno=10,
+            msg="test message",
+            args=(),
+            exc_info=None,
+        )
+        extra = getattr(record, "__infra__extra")
+
+        with pytest.raises(TypeError):
+            extra["request_id"] = "changed"
+        with pytest.raises(TypeError):
+            extra.update(user="alice")
+
+        copied = extra.copy()
+        copied["user"] = "alice"
+        assert type(copied) is dict
+        assert pickle.loads(pickle.dumps(extra)) == {"request_id": "12345"}
+        assert logger._extra == {"request_id": "12345"}
+
 
 # =============================================================================
 # Test Reserved Key Validation
@@ -798,6 +956,28 @@ class TestLoggerFindCaller:
         # Clean up for other tests
         logger._pending_traces.pop(tid, None)
 
+    def test_findcaller_skips_frame_walk_when_location_not_rendered(self, basic_logger):
+        """Test no caller lookup when location is 0 and formatters opt out."""
+        from appinfra.log.formatters import LogFormatter
+
+        handler = logging.NullHandler()
+        handler.setFormatter(LogFormatter(basic_logger.config))
+        basic_logger.addHandler(handler)
+
+        pathname, lineno, func, sinfo = basic_logger.findCaller()
+        assert (pathname, lineno, func) == ("(unknown file)", 0, "(unknown function)")
+        assert not basic_logger._pending_traces
+
+    def test_findcaller_captures_caller_for_other_formatters(self, basic_logger):
+        """Test caller is captured when a formatter may render it."""
+        handler = logging.NullHandler()
+        handler.setFormatter(logging.Formatter("%(filename)s:%(lineno)d"))
+        basic_logger.addHandler(handler)
+
+        pathname, lineno, func, sinfo = basic_logger.findCaller()
+        assert pathname == __file__
+        assert func == "test_findcaller_captures_caller_for_other_formatters"
+
 
 # =============================================================================
 # Test Integration Scenarios
@@ -1031,6 +1211,50 @@ class TestLevelInheritance:
         root.setLevel(logging.DEBUG)
         assert len(root._cache) == 0
 
+    def test_cached_decision_invalidated_for_unregistered_loggers(self):
+        """Test ancestor level changes reach cached children outside loggerDict."""
+        from appinfra.log.factory import LoggerFactory
+
+        config = LogConfig.from_params("info")
+        root = LoggerFactory.create_root(config)
+        child = LoggerFactory.create_child(root, "unregistered")
+        child.setLevel(logging.DEBUG)
+        del logging.root.manager.loggerDict[child.name]
+
+        # Populate child's cache with a decision that depends on root
+        assert not child.isEnabledFor(logging.DEBUG)
+        assert child.isEnabledFor(logging.DEBUG) is False
+
+        root.setLevel(logging.DEBUG)
+        assert child.isEnabledFor(logging.DEBUG)
+
+    def test_reparenting_invalidates_cached_decision(self):
+        """Test changing a logger's parent re-resolves its effective level."""
+        from appinfra.log.factory import LoggerFactory
+
+        root = LoggerFactory.create_root(LogConfig.from_params("info"))
+        child = LoggerFactory.create_child(root, "reparented")
+        child.setLevel(logging.DEBUG)
+        assert not child.isEnabledFor(logging.DEBUG)
+
+        child.parent = logging.root
+        assert child.isEnabledFor(logging.DEBUG)
+
+    def test_unchanged_disabled_and_parent_do_not_invalidate(self):
+        """Test assigning the current disabled/parent value keeps caches valid."""
+        from appinfra.log.level_manager import LevelGeneration
+
+        logger = Logger("unchanged")
+        parent = logger.parent
+        generation = LevelGeneration.current
+
+        logger.disabled = logger.disabled
+        logger.parent = parent
+        assert LevelGeneration.current == generation
+
+        logger.disabled = not logger.disabled
+        assert LevelGeneration.current != generation
+
     def test_deep_nesting_inherits_level(self):
         """Test level inheritance works with deeply nested loggers."""
         from appinfra.log.factory import LoggerFactory
@@ -0,0 +1,317 @@
+"""
+Unit tests for logging subsystem metrics.
+
+Tests LogMetrics collection (handler and formatter latency, per-topic
+counts), pulled source stats, snapshots and publishing through
+ObservabilityHooks.
+"""
+
+import gc
+import io
+import logging
+import queue
+import weakref
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+from appinfra.log import LogConfig, Logger, LogSamplingManager  # noqa: E402
+from appinfra.log.builder.json import JSONFormatter  # noqa: E402
+from appinfra.log.formatters import LogFormatter  # noqa: E402
+from appinfra.log.metrics import LogMetrics, metric_name  # noqa: E402
+from appinfra.log.mp import LogQueueListener, MPQueueHandler  # noqa: E402
+from appinfra.observability import HookEvent, ObservabilityHooks  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    """Reset LogMetrics and LogSamplingManager around each test."""
+    LogMetrics.reset_instance()
+    LogSamplingManager.reset_instance()
+    yield
+    LogMetrics.reset_instance()
+    LogSamplingManager.reset_instance()
+
+
+class _ListHandler(logging.Handler):
+    """Collects emitted records."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+def _logger(name: str = "/myapp/api") -> tuple[Logger, _ListHandler]:
+    lg = Logger(name, LogConfig.from_params("debug", location=0))
+    handler = _ListHandler()
+    lg.addHandler(handler)
+    lg.propagate = False
+    return lg, handler
+
+
+class TestDisabled:
+    """Metrics are off unless enabled."""
+
+    def test_disabled_by_default(self):
+        assert LogMetrics.enabled is False
+
+    def test_nothing_collected_when_disabled(self):
+        lg, handler = _logger()
+        lg.info("hello")
+
+        snapshot = LogMetrics.get_instance().snapshot()
+        assert len(handler.records) == 1
+        assert snapshot["enabled"] is False
+        assert snapshot["handlers"] == {}
+        assert snapshot["topics"] == {}
+
+    def test_disable_keeps_collected_values(self):
+        lg, _ = _logger()
+        LogMetrics.enable()
+        lg.info("counted")
+        LogMetrics.disable()
+        lg.info("not counted")
+
+        topics = LogMetrics.get_instance().snapshot()["topics"]
+        assert topics["/myapp/api"]["records"] == 1
+
+
+class TestCollection:
+    """Handler, formatter and topic metrics."""
+
+    def test_counts_records_per_topic(self):
+        api, _ = _logger("/myapp/api")
+        db, _ = _logger("/myapp/db")
+        LogMetrics.enable()
+        for _ in range(3):
+            api.info("request")
+        db.debug("query")
+
+        topics = LogMetrics.get_instance().snapshot()["topics"]
+        assert topics["/myapp/api"]["records"] == 3
+        assert topics["/myapp/db"]["records"] == 1
+        assert topics["/myapp/api"]["per_second"] > 0
+
+    def test_filtered_levels_not_counted(self):
+        lg = Logger("/myapp/quiet", LogConfig.from_params("warning", location=0))
+        LogMetrics.enable()
+        lg.info("filtered")
+
+        assert LogMetrics.get_instance().snapshot()["topics"] == {}
+
+    def test_times_each_handler(self):
+        lg, handler = _logger()
+        named = _ListHandler()
+        named.set_name("audit")
+        lg.addHandler(named)
+        LogMetrics.enable()
+        lg.info("one")
+        lg.info("two")
+
+        handlers = LogMetrics.get_instance().snapshot()["handlers"]
+        assert handlers["_ListHandler"]["count"] == 2
+        assert handlers["audit"]["count"] == 2
+        assert len(handler.records) == 2 and len(named.records) == 2
+
+    def test_respects_handler_level(self):
+        lg, handler = _logger()
+        handler.setLevel(logging.ERROR)
+        LogMetrics.enable()
+        lg.info("below handler level")
+
+        assert handler.records == []
+        assert LogMetrics.get_instance().snapshot()["handlers"] == {}
+
+    def test_timed_path_propagates_to_parent(self):
+        parent = Logger("/timed", LogConfig.from_params("debug", location=0))
+        handler = _ListHandler()
+        parent.addHandler(handler)
+        parent.propagate = False
+        child = Logger("/timed/child", LogConfig.from_params("debug", location=0))
+        child.parent = parent
+        LogMetrics.enable()
+        child.info("propagated")
+
+        assert len(handler.records) == 1
+        handlers = LogMetrics.get_instance().snapshot()["handlers"]
+        assert handlers["_ListHandler"]["count"] == 1
+
+    def test_derived_logger_uses_root_handlers(self):
+        root, handler = _logger("/root")
+        view = Logger("/root/view", LogConfig.from_params("debug", location=0))
+        view._root_logger = root
+        LogMetrics.enable()
+        view.info("via root")
+
+        assert len(handler.records) == 1
+        assert "_ListHandler" in LogMetrics.get_instance().snapshot()["handlers"]
+
+    @pytest.mark.parametrize(
+        "formatter",
+        [
+            LogFormatter(LogConfig.from_params("info", location=0, colors=False)),
+            JSONFormatter(),
+        ],
+        ids=["text", "json"],
+    )
+    def test_times_formatter(self, formatter):
+        lg = Logger("/fmt", LogConfig.from_params("debug", location=0))
+        handler = logging.StreamHandler(io.StringIO())
+        handler.setFormatter(formatter)
+        lg.addHandler(handler)
+        lg.propagate = False
+        LogMetrics.enable()
+        lg.info("formatted")
+
+        formatters = LogMetrics.get_instance().snapshot()["formatters"]
+        assert formatters[type(formatter).__name__]["count"] == 1
+        assert "formatted" in handler.stream.getvalue()
+
+    def test_handler_latency_recorded_on_error(self):
+        class FailingHandler(logging.Handler):
+            def handle(self, record):
+                raise RuntimeError("boom")
+
+        metrics = LogMetrics.get_instance()
+        record = logging.makeLogRecord({"msg": "x"})
+        with pytest.raises(RuntimeError):
+            metrics.handle(FailingHandler(), record)
+
+        assert metrics.snapshot()["handlers"]["FailingHandler"]["count"] == 1
+
+    def test_enable_resets_collected_values(self):
+        lg, _ = _logger()
+        LogMetrics.enable()
+        lg.info("before")
+        LogMetrics.enable()
+
+        assert LogMetrics.get_instance().snapshot()["topics"] == {}
+
+
+class TestSources:
+    """Pulled stats from queue and batching components."""
+
+    def test_mp_queue_handler_stats(self):
+        q: queue.Queue = queue.Queue(maxsize=1)
+        handler = MPQueueHandler(q)
+        handler.handleError = lambda record: None  # type: ignore[method-assign]
+        lg = Logger("/mp", LogConfig.from_params("debug", location=0))
+        lg.addHandler(handler)
+        lg.propagate = False
+        lg.info("queued")
+        lg.info("dropped")
+
+        snapshot = LogMetrics.get_instance().snapshot()
+        expected = {"pending": 0, "dropped": 1, "queue_depth": 1}
+        assert expected in snapshot["queues"]["mp_queue_handler"]
+        assert snapshot["dropped"]["mp_queue_handler"] >= 1
+
+    def test_batched_mp_queue_handler_counts_dropped_batch(self):
+        q: queue.Queue = queue.Queue(maxsize=1)
+        q.put("occupied")
+        handler = MPQueueHandler(q, batch_size=3, flush_interval=0)
+        for i in range(2):
+            record = logging.makeLogRecord({"msg": f"r{i}", "levelno": logging.INFO})
+            handler._add_to_batch(record)
+
+        assert handler.stats()["pending"] == 2
+        handler.flush()
+        assert handler.stats() == {"pending": 0, "dropped": 2, "queue_depth": 1}
+
+    def test_queue_listener_registered(self):
+        lg, _ = _logger()
+        listener = LogQueueListener(queue.Queue(), lg)
+
+        stats = LogMetrics.get_instance().snapshot()["queues"]["queue_listener"]
+        assert listener.stats() in stats
+
+    def test_queue_listener_times_handlers(self):
+        lg, handler = _logger()
+        listener = LogQueueListener(queue.Queue(), lg, drain=False)
+        LogMetrics.enable()
+        record = logging.makeLogRecord({"msg": "from worker", "levelno": logging.INFO})
+        listener._handle_record(record)
+
+        assert len(handler.records) == 1
+        handlers = LogMetrics.get_instance().snapshot()["handlers"]
+        assert handlers["_ListHandler"]["count"] == 1
+
+    def test_queue_listener_times_batch_handlers(self):
+        lg, handler = _logger()
+        batches: list[int] = []
+        handler.handle_batch = lambda records: batches.append(len(records))
+        listener = LogQueueListener(queue.Queue(), lg, drain=False)
+        LogMetrics.enable()
+        records = [
+            logging.makeLogRecord({"msg": "from worker", "levelno": logging.INFO})
+            for _ in range(3)
+        ]
+        listener._handle_batch(handler, records)
+
+        assert batches == [3]
+        handlers = LogMetrics.get_instance().snapshot()["handlers"]
+        assert handlers["_ListHandler"]["count"] == 3
+
+    def test_sources_held_weakly(self):
+        handler = MPQueueHandler(queue.Queue())
+        assert handler in LogMetrics._sources["mp_queue_handler"]
+        ref = weakref.ref(handler)
+        del handler
+        gc.collect()
+
+        assert ref() is None
+
+    def test_suppressed_counts_from_sampling(self):
+        lg, _ = _logger("/infra/db/queries")
+        LogSamplingManager.get_instance().add_rule(
+            "/infra/db/**", rate=0.0, summary_interval=0
+        )
+        LogMetrics.enable()
+        for _ in range(5):
+            lg.info("query")
+
+        snapshot = LogMetrics.get_instance().snapshot()
+        assert snapshot["suppressed"]["/infra/db/**"]["sampled"] == 5
+        assert "/infra/db/queries" not in snapshot["topics"]
+
+
+class TestPublish:
+    """Publishing snapshots through ObservabilityHooks."""
+
+    def test_publish_triggers_log_metrics_event(self):
+        hooks = ObservabilityHooks()
+        contexts = []
+        hooks.register(HookEvent.LOG_METRICS, contexts.append)
+        lg, _ = _logger()
+        LogMetrics.enable()
+        lg.info("published")
+
+        LogMetrics.get_instance().publish(hooks)
+
+        assert len(contexts) == 1
+        data = contexts[0].data
+        assert data["topics"]["/myapp/api"]["records"] == 1
+        assert set(data) >= {"handlers", "formatters", "queues", "dropped"}
+        assert contexts[0].duration is None
+
+    def test_publish_skipped_when_hooks_disabled(self):
+        hooks = ObservabilityHooks()
+        contexts = []
+        hooks.register(HookEvent.LOG_METRICS, contexts.append)
+        hooks.disable()
+
+        LogMetrics.get_instance().publish(hooks)
+
+        assert contexts == []
+
+
+def test_metric_name_prefers_name():
+    handler = logging.NullHandler()
+    assert metric_name(handler) == "NullHandler"
+    handler.set_name("sink")
+    assert metric_name(handler) == "sink"
+    assert metric_name(JSONFormatter()) == "JSONFormatter"
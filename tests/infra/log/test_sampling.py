@@ -0,0 +1,414 @@
+"""
+Unit tests for per-topic sampling and rate limiting.
+
+Tests LogSamplingManager rule handling, TopicSampler decisions and
+summaries, and the Logger integration (including hot-reload).
+"""
+
+import logging
+from unittest.mock import patch
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+from appinfra.log import LogConfig, LogConfigReloader, Logger  # noqa: E402
+from appinfra.log.sampling import (  # noqa: E402
+    SUMMARY_MESSAGE,
+    LogSamplingManager,
+    SamplingRule,
+    TopicSampler,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_manager():
+    """Reset LogSamplingManager before each test."""
+    LogSamplingManager.reset_instance()
+    yield
+    LogSamplingManager.reset_instance()
+
+
+@pytest.fixture
+def manager():
+    """Get fresh LogSamplingManager instance."""
+    return LogSamplingManager.get_instance()
+
+
+class _ListHandler(logging.Handler):
+    """Collects emitted records."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+def _logger(name: str = "/infra/db/queries") -> tuple[Logger, _ListHandler]:
+    lg = Logger(name, LogConfig.from_params("debug", location=0))
+    handler = _ListHandler()
+    lg.addHandler(handler)
+    lg.propagate = False
+    return lg, handler
+
+
+class _Clock:
+    """Controllable time.monotonic() replacement."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+# =============================================================================
+# Test Rule Management
+# =============================================================================
+
+
+class TestRules:
+    """Test adding, resolving and serializing rules."""
+
+    def test_no_rules_returns_no_sampler(self, manager):
+        """Test loggers without a matching rule get no sampler."""
+        assert manager.get_sampler("/infra/db/queries") is None
+
+    def test_pattern_match(self, manager):
+        """Test rules match topics like level rules."""
+        manager.add_rule("/infra/db/**", rate=0.5)
+
+        assert manager.get_sampler("/infra/db/pg/queries").rule.rate == 0.5
+        assert manager.get_sampler("/infra/api") is None
+
+    def test_more_specific_rule_wins(self, manager):
+        """Test specificity resolves overlapping rules of equal priority."""
+        manager.add_rule("/infra/**", rate=0.5, source="yaml", priority=1)
+        manager.add_rule("/infra/db/queries", rate=0.1, source="yaml", priority=1)
+
+        assert manager.get_sampler("/infra/db/queries").rule.rate == 0.1
+        assert manager.get_sampler("/infra/db/other").rule.rate == 0.5
+
+    def test_higher_priority_wins(self, manager):
+        """Test API rules override YAML rules for the same topic."""
+        manager.add_rule("/infra/db/queries", rate=0.1, source="yaml", priority=1)
+        manager.add_rule("/infra/**", rate=1.0, per_second=10, source="api")
+
+        assert manager.get_sampler("/infra/db/queries").rule.per_second == 10
+
+    def test_samplers_shared_per_rule(self, manager):
+        """Test all topics matching a rule share one sampler (one bucket)."""
+        manager.add_rule("/infra/db/**", per_second=10)
+
+        assert manager.get_sampler("/infra/db/a") is manager.get_sampler("/infra/db/b")
+
+    def test_same_key_replaces_rule(self, manager):
+        """Test re-adding a pattern for the same source replaces it."""
+        manager.add_rule("/infra/db/**", rate=0.5)
+        manager.add_rule("/infra/db/**", rate=0.2)
+
+        assert [r.rate for r in manager.get_rules()] == [0.2]
+
+    def test_rule_change_bumps_generation(self, manager):
+        """Test loggers are told to refresh after a rule change."""
+        before = LogSamplingManager.generation
+        manager.add_rule("/infra/db/**", rate=0.5)
+
+        assert LogSamplingManager.generation != before
+
+    def test_add_rules_from_dict(self, manager):
+        """Test mapping and numeric shorthand policies."""
+        manager.add_rules_from_dict(
+            {
+                "/infra/db/**": {"rate": 0.5, "per_second": 20, "burst": 40},
+                "/myapp/poller": 0.01,
+            },
+            source="yaml",
+            priority=1,
+        )
+
+        rule = manager.get_sampler("/infra/db/x").rule
+        assert (rule.rate, rule.per_second, rule.burst) == (0.5, 20.0, 40.0)
+        assert manager.get_sampler("/myapp/poller").rule.rate == 0.01
+
+    @pytest.mark.parametrize(
+        "policy",
+        [
+            {"rate": 1.5},
+            {"per_second": 0},
+            {"burst": 0.5},
+            {"summary_interval": -1},
+            {"rat": 0.5},
+            "often",
+        ],
+    )
+    def test_invalid_policy_rejected(self, manager, policy):
+        """Test invalid policies raise ValueError and add nothing."""
+        with pytest.raises(ValueError):
+            manager.add_rules_from_dict(
+                {"/ok/**": 0.5, "/infra/db/**": policy}, source="yaml", priority=1
+            )
+
+        assert manager.get_rules() == []
+
+    def test_pattern_must_start_with_slash(self, manager):
+        """Test patterns are validated like level rules."""
+        with pytest.raises(ValueError, match="must start with '/'"):
+            manager.add_rule("infra/db", rate=0.5)
+
+    def test_replace_rules_keeps_other_sources(self, manager):
+        """Test replace_rules() swaps only the given source's rules."""
+        manager.add_rule("/api/**", rate=0.5, source="api")
+        manager.add_rule("/old/**", rate=0.5, source="yaml", priority=1)
+
+        manager.replace_rules({"/new/**": 0.2}, source="yaml", priority=1)
+
+        assert {r.pattern for r in manager.get_rules()} == {"/api/**", "/new/**"}
+
+    def test_replace_rules_invalid_keeps_existing(self, manager):
+        """Test a bad reload leaves the previous rules in place."""
+        manager.add_rule("/old/**", rate=0.5, source="yaml", priority=1)
+
+        with pytest.raises(ValueError):
+            manager.replace_rules({"/new/**": 2.0}, source="yaml", priority=1)
+
+        assert [r.pattern for r in manager.get_rules()] == ["/old/**"]
+
+    def test_to_dict_from_dict_roundtrip(self, manager):
+        """Test rules survive serialization for subprocesses."""
+        manager.add_rule("/infra/db/**", rate=0.5, per_second=20, source="yaml")
+        config = manager.to_dict()
+
+        LogSamplingManager.reset_instance()
+        restored = LogSamplingManager.get_instance()
+        restored.from_dict(config)
+
+        rule = restored.get_rules()[0]
+        assert isinstance(rule, SamplingRule)
+        assert (rule.pattern, rule.rate, rule.per_second, rule.source) == (
+            "/infra/db/**",
+            0.5,
+            20,
+            "yaml",
+        )
+
+
+# =============================================================================
+# Test TopicSampler
+# =============================================================================
+
+
+class TestTopicSampler:
+    """Test sampling, token bucket and summary decisions."""
+
+    def test_rate_one_keeps_everything(self):
+        """Test the default policy admits every record."""
+        sampler = TopicSampler(SamplingRule("/t"))
+
+        assert all(sampler.admit() for _ in range(100))
+
+    def test_rate_zero_drops_everything(self):
+        """Test rate 0 suppresses every record."""
+        sampler = TopicSampler(SamplingRule("/t", rate=0.0))
+
+        assert not any(sampler.admit() for _ in range(100))
+        assert sampler.stats() == {"sampled": 100, "rate_limited": 0}
+
+    def test_sampling_uses_random_draw(self):
+        """Test records are kept when the draw is below the rate."""
+        sampler = TopicSampler(SamplingRule("/t", rate=0.25))
+
+        with patch("appinfra.log.sampling.random", side_effect=[0.1, 0.3, 0.2]):
+            assert [sampler.admit() for _ in range(3)] == [True, False, True]
+
+    def test_token_bucket_burst_then_refill(self):
+        """Test the bucket allows a burst, then refills at per_second."""
+        clock = _Clock()
+        with patch("appinfra.log.sampling.time.monotonic", clock):
+            sampler = TopicSampler(SamplingRule("/t", per_second=2, burst=3))
+
+            assert [sampler.admit() for _ in range(4)] == [True, True, True, False]
+            clock.now += 1.0
+            assert [sampler.admit() for _ in range(3)] == [True, True, False]
+
+        assert sampler.stats() == {"sampled": 0, "rate_limited": 2}
+
+    def test_summary_after_interval(self):
+        """Test suppressed counts are reported once per interval."""
+        clock = _Clock()
+        with patch("appinfra.log.sampling.time.monotonic", clock):
+            sampler = TopicSampler(
+                SamplingRule("/t", per_second=1, summary_interval=10)
+            )
+            for _ in range(5):
+                sampler.admit()
+
+            assert sampler.take_summary() is None
+            clock.now += 10
+            summary = sampler.take_summary()
+            assert sampler.take_summary() is None
+
+        assert summary == {"topic": "/t", "sampled": 0, "rate_limited": 4}
+
+    def test_no_summary_without_suppression(self):
+        """Test nothing is reported when no record was suppressed."""
+        clock = _Clock()
+        with patch("appinfra.log.sampling.time.monotonic", clock):
+            sampler = TopicSampler(SamplingRule("/t", summary_interval=1))
+            clock.now += 5
+
+            assert sampler.take_summary() is None
+
+    def test_summary_disabled(self):
+        """Test summary_interval=0 disables summaries."""
+        sampler = TopicSampler(SamplingRule("/t", rate=0.0, summary_interval=0))
+        sampler.admit()
+
+        assert sampler.take_summary() is None
+
+
+# =============================================================================
+# Test Logger Integration
+# =============================================================================
+
+
+class TestLoggerSampling:
+    """Test that loggers apply sampling before creating records."""
+
+    def test_unmatched_logger_unaffected(self, manager):
+        """Test loggers outside sampled topics log normally."""
+        manager.add_rule("/infra/db/**", rate=0.0)
+        lg, handler = _logger("/myapp/main")
+
+        for i in range(5):
+            lg.debug("message %d", i)
+
+        assert len(handler.records) == 5
+
+    def test_suppressed_record_never_created(self, manager):
+        """Test suppression happens before findCaller and makeRecord."""
+        manager.add_rule("/infra/db/**", rate=0.0, summary_interval=0)
+        lg, handler = _logger()
+
+        with (
+            patch.object(lg, "findCaller") as find_caller,
+            patch.object(lg, "makeRecord") as make_record,
+        ):
+            lg.debug("query", extra={"sql": "SELECT 1"})
+
+        find_caller.assert_not_called()
+        make_record.assert_not_called()
+        assert handler.records == []
+
+    def test_rate_limited_logger(self, manager):
+        """Test a bucket shared by the topic caps emitted records."""
+        manager.add_rule("/infra/db/**", per_second=0.001, burst=3)
+        lg, handler = _logger()
+
+        for i in range(10):
+            lg.debug("query %d", i)
+
+        assert [r.getMessage() for r in handler.records] == [
+            "query 0",
+            "query 1",
+            "query 2",
+        ]
+
+    def test_summary_record_logged(self, manager):
+        """Test the periodic summary is logged through the same logger."""
+        clock = _Clock()
+        with patch("appinfra.log.sampling.time.monotonic", clock):
+            manager.add_rule("/infra/db/**", rate=0.0, summary_interval=5)
+            lg, handler = _logger()
+            for _ in range(7):
+                lg.debug("query")
+            clock.now += 5
+            lg.info("query")
+
+        assert len(handler.records) == 1
+        record = handler.records[0]
+        assert record.getMessage() == SUMMARY_MESSAGE
+        assert record.levelno == logging.INFO
+        assert getattr(record, "__infra__extra") == {
+            "topic": "/infra/db/**",
+            "sampled": 7,
+            "rate_limited": 0,
+        }
+
+    def test_summary_level_independent_of_trigger(self, manager):
+        """Test the summary is logged at INFO whatever call triggers it."""
+        clock = _Clock()
+        with patch("appinfra.log.sampling.time.monotonic", clock):
+            manager.add_rule("/infra/db/**", rate=0.0, summary_interval=5)
+            lg, handler = _logger()
+            lg.debug("query")
+            clock.now += 5
+            lg.warning("query")
+
+        assert [r.levelno for r in handler.records] == [logging.INFO]
+
+    def test_rule_added_after_logger_creation(self, manager):
+        """Test existing loggers pick up new rules on their next call."""
+        lg, handler = _logger()
+        lg.debug("before")
+
+        manager.add_rule("/infra/db/**", rate=0.0)
+        lg.debug("after")
+
+        assert [r.getMessage() for r in handler.records] == ["before"]
+
+    def test_hot_reload_via_config_reloader(self, manager):
+        """Test LogConfigReloader replaces yaml sampling rules."""
+        lg, handler = _logger()
+        reloader = LogConfigReloader(lg)
+
+        reloader({"logging": {"level": "debug", "sampling": {"/infra/db/**": 0.0}}})
+        lg.debug("dropped")
+        reloader({"logging": {"level": "debug"}})
+        lg.debug("kept")
+
+        assert [r.getMessage() for r in handler.records] == ["kept"]
+        assert manager.get_rules(source="yaml") == []
+
+    def test_unchanged_sampling_not_replaced(self, manager):
+        """Test reloads with the same sampling section keep sampler state."""
+        lg, _ = _logger()
+        reloader = LogConfigReloader(lg)
+        config = {"logging": {"level": "debug", "sampling": {"/infra/db/**": 0.5}}}
+
+        reloader(config)
+        generation = LogSamplingManager.generation
+        reloader(config)
+
+        assert LogSamplingManager.generation == generation
+
+    def test_first_reload_keeps_startup_rules(self, manager):
+        """Test the first reload does not reset rules loaded at startup."""
+        manager.add_rules_from_dict({"/infra/db/**": 0.5}, source="yaml", priority=1)
+        sampler = manager.get_sampler("/infra/db/pool")
+        generation = LogSamplingManager.generation
+        lg, _ = _logger()
+
+        LogConfigReloader(lg)(
+            {"logging": {"level": "debug", "sampling": {"/infra/db/**": 0.5}}}
+        )
+
+        assert LogSamplingManager.generation == generation
+        assert manager.get_sampler("/infra/db/pool") is sampler
+
+    def test_replace_rules_reports_change(self, manager):
+        """Test replace_rules() only replaces rules that differ."""
+        assert manager.replace_rules({"/a/**": 0.5}, source="yaml", priority=1)
+        assert not manager.replace_rules({"/a/**": 0.5}, source="yaml", priority=1)
+        assert manager.replace_rules({"/a/**": 0.2}, source="yaml", priority=1)
+
+    def test_queue_config_carries_rules(self, manager):
+        """Test subprocess loggers receive the parent's sampling rules."""
+        manager.add_rule("/infra/db/**", rate=0.5, source="yaml", priority=1)
+        lg, _ = _logger("/main")
+
+        config = lg.queue_config(queue=None)
+
+        assert config["sampling_rules"] == manager.to_dict()
@@ -0,0 +1,108 @@
+"""
+Unit tests for TopicTrie and segment matching.
+
+Tests exact, glob and recursive segment matching, rank resolution, and
+agreement between the compiled trie and linear pattern matching.
+"""
+
+import random
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+from appinfra.log.topic_trie import TopicTrie, match_segments, split_topic
+
+
+class TestSplitTopic:
+    """Test topic splitting."""
+
+    def test_ignores_surrounding_slashes(self):
+        """Test leading and trailing slashes are ignored."""
+        assert split_topic("/infra/db/") == ["infra", "db"]
+
+    def test_root_topic(self):
+        """Test root topic yields a single empty segment."""
+        assert split_topic("/") == [""]
+
+
+class TestMatchSegments:
+    """Test linear segment matching."""
+
+    @pytest.mark.parametrize(
+        "name,pattern,expected",
+        [
+            ("/infra/db", "/infra/db", True),
+            ("/infra/db", "/infra/api", False),
+            ("/infra/db", "/infra/*", True),
+            ("/infra/db/pg", "/infra/*", False),
+            ("/infra/queries", "/infra/q*", True),
+            ("/infra", "/infra/**", True),
+            ("/infra/db/pg/queries", "/infra/**", True),
+            ("/infrastructure", "/infra/**", False),
+            ("/infra/db/pg/queries", "/infra/**/queries", True),
+            ("/infra/queries", "/infra/**/queries", True),
+            ("/infra/db/pg", "/infra/**/queries", False),
+            ("/a/x/b/y/c", "/a/**/b/**/c", True),
+        ],
+    )
+    def test_matching(self, name, pattern, expected):
+        """Test segment matching for exact, glob and recursive patterns."""
+        assert match_segments(split_topic(name), split_topic(pattern)) is expected
+
+
+class TestTopicTrie:
+    """Test compiled trie lookups."""
+
+    def test_no_match_returns_none(self):
+        """Test names without a matching pattern return None."""
+        trie = TopicTrie()
+        trie.insert("/infra/db/*", "debug", rank=0)
+        assert trie.best_match("/infra/api/handler") is None
+
+    def test_lowest_rank_wins(self):
+        """Test the lowest-ranked matching pattern wins."""
+        trie = TopicTrie()
+        trie.insert("/infra/db/queries", "trace", rank=2)
+        trie.insert("/infra/db/*", "debug", rank=1)
+        trie.insert("/infra/**", "info", rank=0)
+        assert trie.best_match("/infra/db/queries") == "info"
+
+    def test_duplicate_pattern_keeps_lowest_rank(self):
+        """Test re-inserting a pattern keeps the better-ranked value."""
+        trie = TopicTrie()
+        trie.insert("/infra/db/*", "debug", rank=0)
+        trie.insert("/infra/db/*", "info", rank=5)
+        assert trie.best_match("/infra/db/pg") == "debug"
+
+    def test_recursive_wildcard_matches_root(self):
+        """Test /** matches every topic including the root."""
+        trie = TopicTrie()
+        trie.insert("/**", "info", rank=0)
+        assert trie.best_match("/") == "info"
+        assert trie.best_match("/infra/db/pg/queries") == "info"
+
+    def test_agrees_with_linear_matching(self):
+        """Test trie resolution matches a linear first-match scan."""
+        rng = random.Random(1234)
+        segments = ["infra", "db", "pg", "api", "queries", "*", "q*", "**"]
+        patterns = [
+            "/" + "/".join(rng.choice(segments) for _ in range(rng.randint(1, 4)))
+            for _ in range(200)
+        ]
+        trie = TopicTrie()
+        for rank, pattern in enumerate(patterns):
+            trie.insert(pattern, rank, rank)
+
+        words = ["infra", "db", "pg", "api", "queries", "query"]
+        for _ in range(500):
+            name = "/" + "/".join(rng.choice(words) for _ in range(rng.randint(1, 5)))
+            expected = next(
+                (
+                    rank
+                    for rank, pattern in enumerate(patterns)
+                    if match_segments(split_topic(name), split_topic(pattern))
+                ),
+                None,
+            )
+            assert trie.best_match(name) == expected, name
@@ -0,0 +1,100 @@
+"""
+Tests for the streaming latency histogram.
+"""
+
+import threading
+
+import pytest
+
+from appinfra.observability.histogram import BUCKET_BOUNDS, LatencyHistogram
+
+
+@pytest.mark.unit
+class TestLatencyHistogram:
+    """Test LatencyHistogram."""
+
+    def test_bucket_bounds(self):
+        """Test bounds run 1-2-5 from 1us to 10s."""
+        assert BUCKET_BOUNDS[:3] == pytest.approx((1e-6, 2e-6, 5e-6))
+        assert BUCKET_BOUNDS[-1] == pytest.approx(10.0)
+        assert list(BUCKET_BOUNDS) == sorted(BUCKET_BOUNDS)
+
+    def test_empty_snapshot(self):
+        """Test an empty histogram reports zeros."""
+        snapshot = LatencyHistogram().snapshot()
+
+        assert snapshot["count"] == 0
+        assert snapshot["avg"] == 0.0
+        assert snapshot["p99"] == 0.0
+
+    def test_observe_summary(self):
+        """Test count, total, average and maximum."""
+        hist = LatencyHistogram()
+        for seconds in (0.001, 0.002, 0.003):
+            hist.observe(seconds)
+
+        snapshot = hist.snapshot()
+        assert snapshot["count"] == 3
+        assert snapshot["total"] == pytest.approx(0.006)
+        assert snapshot["avg"] == pytest.approx(0.002)
+        assert snapshot["max"] == pytest.approx(0.003)
+
+    def test_observe_count(self):
+        """Test one call can record several equal durations."""
+        hist = LatencyHistogram()
+        hist.observe(0.002, 4)
+
+        snapshot = hist.snapshot()
+        assert snapshot["count"] == 4
+        assert snapshot["total"] == pytest.approx(0.008)
+        assert snapshot["avg"] == pytest.approx(0.002)
+
+    def test_percentile_is_bucket_upper_bound(self):
+        """Test percentiles resolve to the containing bucket's bound."""
+        hist = LatencyHistogram()
+        for _ in range(99):
+            hist.observe(0.0015)  # 2ms bucket
+        hist.observe(0.3)  # 500ms bucket, capped at max
+
+        assert hist.percentile(0.50) == pytest.approx(0.002)
+        assert hist.percentile(0.99) == pytest.approx(0.002)
+        assert hist.percentile(1.0) == pytest.approx(0.3)
+
+    def test_percentile_capped_at_max(self):
+        """Test estimates never exceed the largest observed value."""
+        hist = LatencyHistogram()
+        hist.observe(0.0011)
+
+        assert hist.percentile(0.5) == pytest.approx(0.0011)
+
+    def test_overflow_bucket(self):
+        """Test values beyond the last bound report the maximum."""
+        hist = LatencyHistogram()
+        hist.observe(42.0)
+
+        assert hist.percentile(0.99) == 42.0
+
+    def test_reset(self):
+        """Test reset discards observations."""
+        hist = LatencyHistogram()
+        hist.observe(0.01)
+        hist.reset()
+
+        assert hist.count == 0
+        assert hist.snapshot()["max"] == 0.0
+
+    def test_concurrent_observe(self):
+        """Test observations from several threads are all counted."""
+        hist = LatencyHistogram()
+
+        def worker():
+            for _ in range(1000):
+                hist.observe(0.0001)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert hist.count == 4000
@@ -53,6 +53,10 @@ class TestHookEvent:
         assert HookEvent.STARTUP.value == "startup"
         assert HookEvent.SHUTDOWN.value == "shutdown"
 
+    def test_log_metrics_event_exists(self):
+        """Test logging subsystem metrics event."""
+        assert HookEvent.LOG_METRICS.value == "log_metrics"
+
 
 # =============================================================================
 # Test HookContext Dataclass
@@ -295,6 +299,18 @@ class TestObservabilityHooksTrigger:
         # Data dict should contain all kwargs
         assert context.data["query"] == "SELECT 1"
 
+    def test_trigger_accepts_data_only_kwargs(self):
+        """Test kwargs that are not HookContext fields only go to data."""
+        hooks = ObservabilityHooks()
+        callback = Mock()
+        hooks.register(HookEvent.LOG_METRICS, callback)
+
+        hooks.trigger(HookEvent.LOG_METRICS, topics={"/app": 1}, duration=0.5)
+
+        context = callback.call_args[0][0]
+        assert context.data == {"topics": {"/app": 1}, "duration": 0.5}
+        assert context.duration == 0.5
+
     def test_trigger_calls_all_callbacks(self):
         """Test trigger calls all registered callbacks."""
         hooks = ObservabilityHooks()
@@ -1,6 +1,8 @@
 """Tests for appinfra.security.filter module."""
 
 import logging
+import threading
+from unittest.mock import Mock
 
 import pytest
 
@@ -148,6 +150,118 @@ class TestSecretMaskingFilter:
         assert "secret123456789" not in record.exc_text
 
 
+def _record(msg, args=()):
+    return logging.LogRecord("test", logging.INFO, "test.py", 1, msg, args, None)
+
+
+class TestMaskingCache:
+    """Tests for the masked-string cache in SecretMaskingFilter."""
+
+    def test_repeated_template_hits(self):
+        """Test a repeated message template is masked once."""
+        masker = SecretMasker()
+        masker.mask = Mock(wraps=masker.mask)
+        filter_instance = SecretMaskingFilter(masker=masker)
+        template = "GET %s"
+
+        for path in ("/a", "/b", "/a"):
+            filter_instance.filter(_record(template, (path,)))
+
+        stats = filter_instance.cache_stats()
+        assert masker.mask.call_count == 3  # template, "/a", "/b"
+        assert stats["misses"] == 3
+        assert stats["hits"] == 3
+        assert stats["size"] == 3
+
+    def test_cached_result_is_masked(self):
+        """Test cache hits return the masked string."""
+        filter_instance = SecretMaskingFilter(masker=SecretMasker())
+
+        for _ in range(2):
+            record = _record("password=secret123456789")
+            filter_instance.filter(record)
+            assert record.msg == "password=[MASKED]"
+
+    def test_invalidated_when_pattern_added(self):
+        """Test adding a pattern clears previously cached results."""
+        masker = SecretMasker(patterns=[])
+        filter_instance = SecretMaskingFilter(masker=masker)
+        record = _record("MY_TOKEN_ABC123")
+        filter_instance.filter(record)
+        assert record.msg == "MY_TOKEN_ABC123"
+
+        masker.add_pattern(r"MY_TOKEN_([A-Z0-9]+)")
+        record = _record("MY_TOKEN_ABC123")
+        filter_instance.filter(record)
+
+        assert record.msg == "MY_TOKEN_[MASKED]"
+
+    def test_invalidated_when_known_secret_added(self):
+        """Test adding a known secret clears previously cached results."""
+        masker = SecretMasker()
+        filter_instance = SecretMaskingFilter(masker=masker)
+        filter_instance.filter(_record("user hunter2x"))
+
+        masker.add_known_secret("hunter2x")
+        record = _record("user hunter2x")
+        filter_instance.filter(record)
+
+        assert record.msg == "user [MASKED]"
+
+    def test_bounded(self):
+        """Test the cache evicts least recently used entries."""
+        filter_instance = SecretMaskingFilter(masker=SecretMasker(), cache_size=2)
+
+        for msg in ("one", "two", "three"):
+            filter_instance.filter(_record(msg))
+
+        assert filter_instance.cache_stats()["size"] == 2
+
+    def test_long_strings_not_cached(self):
+        """Test long strings such as tracebacks bypass the cache."""
+        filter_instance = SecretMaskingFilter(masker=SecretMasker())
+
+        filter_instance.filter(_record("x" * 5000))
+
+        assert filter_instance.cache_stats()["size"] == 0
+
+    def test_disabled(self):
+        """Test cache_size=0 disables caching."""
+        filter_instance = SecretMaskingFilter(masker=SecretMasker(), cache_size=0)
+        record = _record("password=secret123456789")
+
+        filter_instance.filter(record)
+
+        assert record.msg == "password=[MASKED]"
+        assert filter_instance.cache_stats() == {
+            "hits": 0,
+            "misses": 0,
+            "size": 0,
+            "maxsize": 0,
+        }
+
+    def test_concurrent_filtering(self):
+        """Test concurrent threads get correct results from a shared cache."""
+        filter_instance = SecretMaskingFilter(masker=SecretMasker(), cache_size=8)
+        errors = []
+
+        def work(worker):
+            for i in range(500):
+                record = _record(f"password=secret{i % 16:04d}xyz", (worker,))
+                filter_instance.filter(record)
+                if record.msg != "password=[MASKED]":
+                    errors.append(record.msg)
+
+        threads = [threading.Thread(target=work, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert filter_instance.cache_stats()["size"] <= 8
+
+
 class TestAddMaskingFilterToLogger:
     """Tests for add_masking_filter_to_logger function."""
 
@@ -1,10 +1,18 @@
 """Tests for appinfra.security.masking module."""
 
+import threading
+from unittest.mock import patch
+
 import pytest
 
 pytestmark = pytest.mark.unit
 
-from appinfra.security.masking import SecretMasker, get_masker, reset_masker
+from appinfra.security import masking  # noqa: E402
+from appinfra.security.masking import (  # noqa: E402
+    SecretMasker,
+    get_masker,
+    reset_masker,
+)
 
 
 @pytest.fixture(autouse=True)
@@ -188,6 +196,106 @@ class TestSecretMasker:
         assert "[MASKED]" in masker.mask(text)
 
 
+class TestCompiledScanner:
+    """Tests for the compiled scanner behind SecretMasker.mask()."""
+
+    def test_pattern_added_after_masking_is_used(self):
+        """Test the scanner is rebuilt when a pattern is added."""
+        masker = SecretMasker(patterns=[])
+        assert masker.mask("MY_TOKEN_ABC123") == "MY_TOKEN_ABC123"
+
+        masker.add_pattern(r"MY_TOKEN_([A-Z0-9]+)", literals=["my_token_"])
+
+        assert masker.mask("MY_TOKEN_ABC123") == "MY_TOKEN_[MASKED]"
+
+    def test_literals_skip_text_without_them(self):
+        """Test a pattern is not run when none of its literals occur."""
+        masker = SecretMasker(patterns=[])
+        # Literal deliberately absent from the match to observe the skip
+        masker.add_pattern(r"id=(\d+)", literals=["user"])
+
+        assert masker.mask("id=42") == "id=42"
+        assert masker.mask("user id=42") == "user id=[MASKED]"
+
+    def test_overlapping_matches_all_masked(self):
+        """Test every pattern's secret is masked when matches overlap."""
+        masker = SecretMasker()
+        text = "secret=AKIAYP14Fghp_P89Bearerxpassword=T/wJT9bpZAn:z5Ng"
+
+        result = masker.mask(text)
+
+        assert "T/wJT9bpZAn" not in result
+        assert "AKIAYP14F" not in result
+
+    def test_case_folded_keywords(self):
+        """Test characters IGNORECASE treats as ASCII letters pass the prefilter."""
+        masker = SecretMasker()
+
+        assert masker.mask("pa\u017fsword=hunter2hunter2") == "pa\u017fsword=[MASKED]"
+        assert masker.mask("PASSWORD=hunter2hunter2") == "PASSWORD=[MASKED]"
+
+    def test_known_secrets_longest_first(self):
+        """Test overlapping known secrets mask the longest match."""
+        masker = SecretMasker(patterns=[])
+        masker.add_known_secret("abcd")
+        masker.add_known_secret("abcdefgh")
+
+        assert masker.mask("x abcdefgh y abcd") == "x [MASKED] y [MASKED]"
+
+    def test_known_secret_removal_takes_effect(self):
+        """Test removed known secrets are no longer masked."""
+        masker = SecretMasker(patterns=[])
+        masker.add_known_secret("s3cr3t-value")
+        assert masker.mask("s3cr3t-value") == "[MASKED]"
+
+        masker.remove_known_secret("s3cr3t-value")
+
+        assert masker.mask("s3cr3t-value") == "s3cr3t-value"
+
+    def test_known_secret_mask_is_literal(self):
+        """Test a mask containing backslashes is not read as a template."""
+        masker = SecretMasker(patterns=[], mask=r"\1[X]\g<0>")
+        masker.add_known_secret("s3cr3t-value")
+
+        assert masker.mask("use s3cr3t-value") == r"use \1[X]\g<0>"
+
+    def test_concurrent_mask_waits_for_rebuild(self):
+        """Test mask() never uses the old matcher while a rebuild runs."""
+        masker = SecretMasker(patterns=[])
+        masker.add_known_secret("s3cr3t-value")
+        building = threading.Event()
+        release = threading.Event()
+        compile_literals = masking.compile_literals
+
+        def slow_compile(values):
+            building.set()
+            release.wait(5)
+            return compile_literals(values)
+
+        results = []
+        with patch.object(masking, "compile_literals", slow_compile):
+            rebuild = threading.Thread(target=masker.mask, args=("x",))
+            rebuild.start()
+            assert building.wait(5)
+            reader = threading.Thread(
+                target=lambda: results.append(masker.mask("s3cr3t-value"))
+            )
+            reader.start()
+            release.set()
+            rebuild.join(5)
+            reader.join(5)
+
+        assert results == ["[MASKED]"]
+
+    def test_uncombinable_pattern(self):
+        """Test patterns with backreferences still match on their own."""
+        masker = SecretMasker(patterns=[])
+        masker.add_pattern(r"(['\"])(\w{8,})\1")
+
+        assert masker.is_secret("'abcdefghij'")
+        assert masker.mask("key 'abcdefghij'") == "key '[MASKED]'"
+
+
 class TestGetMasker:
     """Tests for get_masker function."""
 
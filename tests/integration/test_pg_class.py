@@ -520,3 +520,71 @@ class TestPGComplexQueries:
         # Cleanup orders table
         pg_session.execute(text(f"DROP TABLE {orders_table} CASCADE"))
         pg_session.commit()
+
+
+@pytest.mark.integration
+class TestPGBulkInsert:
+    """Test COPY-based bulk loading."""
+
+    def _create_table(self, pg_session, table):
+        pg_session.execute(
+            text(f"CREATE TABLE {table} (id INT PRIMARY KEY, name TEXT, tags JSONB)")
+        )
+        pg_session.commit()
+
+    def test_bulk_insert_row_shapes(self, pg_connection, pg_session, pg_debug_table):
+        """Test dict, tuple and column-oriented rows are loaded."""
+        self._create_table(pg_session, pg_debug_table)
+
+        dicts = ({"id": i, "name": f"n{i}"} for i in range(3))
+        tuples = [(3, "tab\there", None)]
+        columnar = {"id": [4], "name": [None], "tags": [{"a": [1]}]}
+
+        assert pg_connection.bulk_insert(pg_debug_table, dicts) == 3
+        names = ["id", "name", "tags"]
+        assert pg_connection.bulk_insert(pg_debug_table, tuples, columns=names) == 1
+        assert pg_connection.bulk_insert(pg_debug_table, columnar) == 1
+
+        rows = pg_session.execute(
+            text(f"SELECT id, name, tags FROM {pg_debug_table} ORDER BY id")
+        ).fetchall()
+        assert [r[0] for r in rows] == [0, 1, 2, 3, 4]
+        assert rows[3][1] == "tab\there"
+        assert rows[4][1] is None
+        assert rows[4][2] == {"a": [1]}
+
+    def test_bulk_upsert(self, pg_connection, pg_session, pg_debug_table):
+        """Test on_conflict skips or updates existing rows."""
+        self._create_table(pg_session, pg_debug_table)
+        pg_connection.bulk_insert(pg_debug_table, [{"id": 1, "name": "old"}])
+
+        pg_connection.bulk_insert(
+            pg_debug_table,
+            [{"id": 1, "name": "skipped"}, {"id": 2, "name": "new"}],
+            on_conflict="nothing",
+        )
+        pg_connection.bulk_insert(
+            pg_debug_table,
+            [{"id": 2, "name": "updated"}],
+            on_conflict="update",
+            conflict_columns=["id"],
+        )
+
+        rows = pg_session.execute(
+            text(f"SELECT id, name FROM {pg_debug_table} ORDER BY id")
+        ).fetchall()
+        assert [tuple(r) for r in rows] == [(1, "old"), (2, "updated")]
+
+    def test_bulk_insert_conflict_rolls_back(
+        self, pg_connection, pg_session, pg_debug_table
+    ):
+        """Test a failing COPY leaves the table unchanged."""
+        self._create_table(pg_session, pg_debug_table)
+
+        with pytest.raises(sqlalchemy.exc.DBAPIError):
+            pg_connection.bulk_insert(pg_debug_table, [{"id": 1}, {"id": 1}])
+
+        count = pg_session.execute(
+            text(f"SELECT count(*) FROM {pg_debug_table}")
+        ).scalar()
+        assert count == 0
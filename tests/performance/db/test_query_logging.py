@@ -0,0 +1,72 @@
+"""Performance tests for QueryLogger overhead on trivial statements."""
+
+import logging
+import os
+import time
+
+import pytest
+import sqlalchemy
+
+from appinfra.db.pg.core import QueryLogger
+from appinfra.log import LoggingBuilder
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+class TestQueryLoggingOverhead:
+    def test_trivial_selects_by_query_log_level(self):
+        """Measure 100k SELECTs on SQLite with query logging off, disabled and enabled."""
+        iterations = 100_000
+        table = sqlalchemy.table("t", sqlalchemy.column("id", sqlalchemy.Integer))
+        stmt = sqlalchemy.select(table.c.id).where(table.c.id == 1)
+
+        def measure(name, query_lg_level=None, logger_level="info", attach=True):
+            engine = sqlalchemy.create_engine("sqlite://")
+            with open(os.devnull, "w") as sink:
+                lg = (
+                    LoggingBuilder(f"/perf/db/{name}")
+                    .with_level(logger_level)
+                    .with_console_handler(stream=sink)
+                    .build()
+                )
+                if attach:
+                    QueryLogger(engine, lg, query_lg_level).setup_callbacks({})
+                with engine.connect() as conn:
+                    conn.execute(sqlalchemy.text("CREATE TABLE t (id INTEGER)"))
+                    start = time.monotonic()
+                    for _ in range(iterations):
+                        conn.execute(stmt)
+                    elapsed = time.monotonic() - start
+            engine.dispose()
+            return elapsed / iterations
+
+        # Keep SQLAlchemy's own statement logging out of the measurement
+        logging.getLogger("sqlalchemy.engine.Engine").setLevel(logging.WARNING)
+
+        baseline = measure("baseline", attach=False)
+        disabled = measure("disabled", query_lg_level=logging.DEBUG)
+        enabled = measure("enabled", query_lg_level=logging.DEBUG, logger_level="debug")
+
+        # Cost of the literal-bind render that used to run on every statement
+        query_logger = QueryLogger(None, None, logging.DEBUG)
+        renders = 2_000
+        start = time.monotonic()
+        for _ in range(renders):
+            stmt.compile(
+                dialect=query_logger._dialect, compile_kwargs={"literal_binds": True}
+            )
+        render = (time.monotonic() - start) / renders
+
+        # A disabled query topic skips the compile entirely
+        overhead = disabled - baseline
+        assert overhead < render, (
+            f"Disabled query logging costs {overhead * 1e6:.1f}us per query, "
+            f"more than a literal render ({render * 1e6:.1f}us)"
+        )
+        assert enabled > disabled
+
+        print(
+            f"\n100k trivial SELECTs (us/query): no listeners {baseline * 1e6:.1f}, "
+            f"query topic disabled {disabled * 1e6:.1f}, "
+            f"enabled {enabled * 1e6:.1f} (literal render {render * 1e6:.1f})"
+        )
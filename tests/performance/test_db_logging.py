@@ -0,0 +1,65 @@
+"""Performance tests for the batched database logging handler."""
+
+import logging
+import time
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+sqlalchemy = pytest.importorskip("sqlalchemy")
+
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from appinfra.log.builder.database.config import DatabaseHandlerConfig  # noqa: E402
+from appinfra.log.builder.database.handler import DatabaseHandler  # noqa: E402
+from appinfra.log.config import LogConfig  # noqa: E402
+
+_COLUMNS = (
+    "timestamp, level, logger_name, message, module, function, "
+    "line_number, process_id, thread_id, extra_data, exception_info"
+)
+
+
+def _handler(tmp_path):
+    """Create a handler writing to a file-backed SQLite stand-in for PG."""
+    engine = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'logs.db'}")
+    with engine.begin() as conn:
+        conn.exec_driver_sql(f"CREATE TABLE logs ({_COLUMNS})")
+    config = DatabaseHandlerConfig(
+        "logs",
+        SimpleNamespace(session=sessionmaker(engine)),
+        batch_size=1000,
+        flush_interval=0.5,
+    )
+    log_config = LogConfig.from_params(level="info", location=0, micros=False)
+    return DatabaseHandler(Mock(), config, log_config), engine
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+class TestDatabaseHandlerThroughput:
+    @pytest.mark.parametrize("count", [10_000, 50_000, 100_000])
+    def test_emit_throughput(self, tmp_path, count):
+        """Measure caller-side and end-to-end rows/sec into SQLite."""
+        handler, engine = _handler(tmp_path)
+        records = [
+            logging.LogRecord("app", logging.INFO, __file__, 1, f"row {i}", (), None)
+            for i in range(count)
+        ]
+
+        start = time.perf_counter()
+        for record in records:
+            handler.emit(record)
+        emitted = time.perf_counter() - start
+        handler.close()
+        total = time.perf_counter() - start
+
+        with engine.connect() as conn:
+            written = conn.exec_driver_sql("SELECT COUNT(*) FROM logs").scalar()
+        engine.dispose()
+
+        print(f"\n  {count:,} rows")
+        print(f"  caller:     {count / emitted:,.0f} rows/sec")
+        print(f"  end-to-end: {count / total:,.0f} rows/sec")
+        assert written == count
@@ -6,7 +6,7 @@ import time
 
 import pytest
 
-from appinfra.log import LoggingBuilder
+from appinfra.log import LoggerFactory, LoggingBuilder, LogSamplingManager
 from appinfra.time import delta_str
 
 
@@ -142,3 +142,316 @@ class TestLoggingThroughput:
             f"\nJSON logging (to string): {throughput:,.0f} messages/sec "
             f"({delta_str(time_per_msg)} per message)"
         )
+
+    def test_bare_message_fast_path(self):
+        """Compare bare lg.info("msg") calls against calls carrying extra fields."""
+        logger = LoggingBuilder("perf_test").with_level("info").build()
+        logger.addHandler(logging.NullHandler())
+
+        def measure(extra):
+            iterations = 20_000
+            start = time.monotonic()
+            for _ in range(iterations):
+                logger.info("Request processed", extra=extra)
+            return iterations / (time.monotonic() - start)
+
+        # Warm up before measuring
+        measure(None)
+        bare = measure(None)
+        with_extra = measure({"request_id": "req-1"})
+
+        # Bare calls skip validation and the extra copy; the merge path is the
+        # pre-fast-path baseline. Generous margin keeps CI noise from flaking.
+        assert bare > 25_000, f"Bare logging too slow: {bare:,.0f} records/sec"
+        assert bare > with_extra * 0.75, (
+            f"Fast path slower than merge path: {bare:,.0f} < {with_extra:,.0f}"
+        )
+
+        print(
+            f"\nBare lg.info(): {bare:,.0f} records/sec "
+            f"(with extra: {with_extra:,.0f} records/sec)"
+        )
+
+    @pytest.mark.parametrize("depth", [1, 4, 8])
+    def test_disabled_level_calls_by_depth(self, depth):
+        """Measure trace() calls disabled by an ancestor of a nested topic logger."""
+        root = LoggingBuilder("/").with_level("info").build()
+        lg = root
+        for i in range(depth):
+            lg = LoggerFactory.create_child(lg, f"depth{depth}_{i}")
+        # Leaf allows trace (e.g. a topic rule), but root at INFO disables it
+        lg.setLevel(logging.DEBUG)
+
+        iterations = 100_000
+        lg.debug("warm up")
+        start = time.monotonic()
+        for _ in range(iterations):
+            lg.debug("disabled")
+        elapsed = time.monotonic() - start
+
+        # Cached effective level makes the cost independent of depth
+        calls_per_sec = iterations / elapsed
+        assert calls_per_sec > 500_000, (
+            f"Disabled calls too slow at depth {depth}: {calls_per_sec:,.0f} calls/sec"
+        )
+
+        print(
+            f"\nDisabled debug() at depth {depth}: {calls_per_sec:,.0f} calls/sec "
+            f"({elapsed / iterations * 1e9:.0f}ns per call)"
+        )
+
+    def test_sampled_out_call_cost(self):
+        """Compare suppressed (rate 0) calls against calls that emit a record."""
+        logger = LoggingBuilder("/perf/sampled").with_level("info").build()
+        logger.addHandler(logging.NullHandler())
+        manager = LogSamplingManager.get_instance()
+
+        def measure():
+            iterations = 50_000
+            start = time.monotonic()
+            for _ in range(iterations):
+                logger.info("query", extra={"sql": "SELECT 1"})
+            return iterations / (time.monotonic() - start)
+
+        try:
+            emitted = measure()
+            manager.add_rule("/perf/sampled", rate=0.0, summary_interval=0)
+            suppressed = measure()
+        finally:
+            LogSamplingManager.reset_instance()
+
+        # Suppressed calls skip findCaller, makeRecord and handlers
+        assert suppressed > emitted * 2, (
+            f"Sampling too slow: {suppressed:,.0f} <= 2 x {emitted:,.0f} calls/sec"
+        )
+
+        print(
+            f"\nSampled-out info(): {suppressed:,.0f} calls/sec "
+            f"(emitted: {emitted:,.0f} records/sec)"
+        )
+
+    @pytest.mark.parametrize("location", [0, 1, 3])
+    def test_location_capture_overhead(self, location):
+        """Measure formatted logging throughput by location display depth."""
+        stream = io.StringIO()
+        logger = (
+            LoggingBuilder(f"/perf_location_{location}")
+            .with_level("info")
+            .with_location(location)
+            .with_colors(False)
+            .with_console_handler(stream=stream)
+            .build()
+        )
+
+        iterations = 5_000
+        start = time.monotonic()
+        for _ in range(iterations):
+            logger.info("Request processed")
+        elapsed = time.monotonic() - start
+
+        # location=0 skips the caller frame walk entirely
+        throughput = iterations / elapsed
+        assert throughput > 5_000, (
+            f"Logging with location={location} too slow: {throughput:,.0f} records/sec"
+        )
+
+        print(
+            f"\nLocation={location}: {throughput:,.0f} records/sec "
+            f"({delta_str(elapsed / iterations)} per record)"
+        )
+
+    def test_async_dispatch_caller_latency(self):
+        """Compare caller-side p99 latency with a slow stream, sync vs async."""
+
+        class SlowStream(io.StringIO):
+            def write(self, s):
+                time.sleep(0.0002)  # Simulate a slow disk or blocked pipe
+                return super().write(s)
+
+        def measure(async_dispatch):
+            builder = (
+                LoggingBuilder(f"/perf_async_{async_dispatch}")
+                .with_level("info")
+                .with_colors(False)
+                .with_console_handler(stream=SlowStream())
+            )
+            if async_dispatch:
+                builder.with_async_dispatch(max_queue=10_000)
+            logger = builder.build()
+
+            latencies = []
+            for _ in range(2_000):
+                start = time.perf_counter()
+                logger.info("Request processed")
+                latencies.append(time.perf_counter() - start)
+            for handler in logger.handlers:
+                handler.close()
+            latencies.sort()
+            return latencies[int(len(latencies) * 0.99)]
+
+        sync_p99 = measure(False)
+        async_p99 = measure(True)
+
+        assert async_p99 < sync_p99 / 2, (
+            f"Async dispatch did not cut caller latency: "
+            f"{delta_str(async_p99)} vs {delta_str(sync_p99)}"
+        )
+
+        print(
+            f"\nCaller p99 with slow stream: sync {delta_str(sync_p99)}, "
+            f"async {delta_str(async_p99)}"
+        )
+
+    def test_buffered_file_throughput(self, tmp_path):
+        """Compare file handler write-path throughput with and without buffering."""
+        from appinfra.log.buffered_file import BufferedFileHandler
+
+        record = logging.LogRecord(
+            "perf", logging.INFO, __file__, 1, "Batch item processed", None, None
+        )
+
+        def measure(handler):
+            # Minimal formatter isolates the write/flush path from formatting
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            iterations = 100_000
+            start = time.monotonic()
+            for _ in range(iterations):
+                handler.handle(record)
+            handler.close()
+            return iterations / (time.monotonic() - start)
+
+        unbuffered = measure(logging.FileHandler(tmp_path / "unbuffered.log"))
+        buffered = measure(BufferedFileHandler(tmp_path / "buffered.log"))
+
+        # One write syscall per record vs one per 64KB; margin keeps CI stable
+        assert buffered > unbuffered * 1.2, (
+            f"Buffering gained too little: {buffered:,.0f} vs {unbuffered:,.0f}"
+        )
+
+        print(
+            f"\nFile handler: unbuffered {unbuffered:,.0f} records/sec, "
+            f"buffered {buffered:,.0f} records/sec"
+        )
+
+    @pytest.mark.parametrize("field_set", ["minimal", "default", "custom"])
+    def test_json_encoder_throughput(self, field_set):
+        """Compare JSONFormatter records/sec across encoders and field sets."""
+        from appinfra.log.builder.json import JSONFormatter
+        from appinfra.log.builder.json_encoders import (
+            MSGSPEC_AVAILABLE,
+            ORJSON_AVAILABLE,
+        )
+
+        options = {
+            "minimal": {"include_fields": ["timestamp", "level", "message"]},
+            "default": {},
+            "custom": {"custom_fields": {"service": "api", "region": "eu-west-1"}},
+        }[field_set]
+        encoders = ["json"]
+        encoders += ["orjson"] if ORJSON_AVAILABLE else []
+        encoders += ["msgspec"] if MSGSPEC_AVAILABLE else []
+
+        record = logging.LogRecord(
+            "perf", logging.INFO, __file__, 1, "Request processed", None, None
+        )
+        setattr(record, "__infra__extra", {"request_id": "req-1", "status": 200})
+
+        results = {}
+        for encoder in encoders:
+            formatter = JSONFormatter(encoder=encoder, **options)
+            iterations = 20_000
+            start = time.monotonic()
+            for _ in range(iterations):
+                formatter.format(record)
+            results[encoder] = iterations / (time.monotonic() - start)
+
+        assert results["json"] > 10_000, (
+            f"JSON formatting too slow: {results['json']:,.0f} records/sec"
+        )
+
+        summary = ", ".join(f"{k} {v:,.0f}" for k, v in results.items())
+        print(f"\nJSON {field_set} fields (records/sec): {summary}")
+
+    @pytest.mark.parametrize("colors", [True, False], ids=["colored", "plain"])
+    def test_log_formatter_throughput(self, colors):
+        """Measure LogFormatter records/sec on the colored and plain paths."""
+        from appinfra.log.config import LogConfig
+        from appinfra.log.formatters import LogFormatter
+
+        formatter = LogFormatter(LogConfig(location=0, micros=True, colors=colors))
+        records = []
+        for i in range(1000):
+            record = logging.LogRecord(
+                "perf.api",
+                logging.INFO if i % 10 else logging.WARNING,
+                __file__,
+                1,
+                "Request processed",
+                None,
+                None,
+            )
+            setattr(
+                record,
+                "__infra__extra",
+                {"status": 200, "endpoint": f"/api/v1/resource/{i % 10}"},
+            )
+            records.append(record)
+
+        rounds = 20
+        start = time.monotonic()
+        for _ in range(rounds):
+            for record in records:
+                formatter.format(record)
+        throughput = rounds * len(records) / (time.monotonic() - start)
+
+        assert throughput > 10_000, f"LogFormatter too slow: {throughput:,.0f}/sec"
+
+        path = "colored" if colors else "plain"
+        print(f"\nLogFormatter ({path}): {throughput:,.0f} records/sec")
+
+    def test_disabled_metrics_overhead(self):
+        """Measure the cost of LogMetrics guards against a formatted record."""
+        import timeit
+
+        from appinfra.log import LogMetrics
+
+        stream = io.StringIO()
+        logger = (
+            LoggingBuilder("/perf/metrics")
+            .with_level("info")
+            .with_console_handler(stream=stream)
+            .build()
+        )
+
+        def measure():
+            stream.seek(0)
+            stream.truncate()
+            iterations = 10_000
+            start = time.monotonic()
+            for _ in range(iterations):
+                logger.info("Request processed", extra={"status": 200})
+            return (time.monotonic() - start) / iterations
+
+        measure()  # Warm up
+        disabled = measure()
+        try:
+            LogMetrics.enable()
+            enabled = measure()
+        finally:
+            LogMetrics.reset_instance()
+
+        # Disabled metrics cost one class attribute check per call site:
+        # topic count, handler dispatch and formatter (3 per record here)
+        guards = 1_000_000
+        guard = timeit.timeit("LogMetrics.enabled", globals=locals(), number=guards)
+        guard_cost = 3 * guard / guards
+        assert guard_cost < disabled * 0.02, (
+            f"Disabled metrics guards cost {guard_cost * 1e9:.0f}ns of "
+            f"{disabled * 1e9:.0f}ns per record"
+        )
+
+        print(
+            f"\nLogMetrics disabled: {1 / disabled:,.0f} records/sec, guards "
+            f"{guard_cost * 1e9:.0f}ns/record ({guard_cost / disabled:.2%}); "
+            f"enabled: {1 / enabled:,.0f} records/sec"
+        )
@@ -0,0 +1,137 @@
+"""Performance tests for cross-process queue logging."""
+
+import logging
+import multiprocessing as mp
+import os
+import queue
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from appinfra.log import Logger
+from appinfra.log.buffered_file import BufferedFileHandler
+from appinfra.log.mp import LogQueueListener, SharedMemoryRing
+
+WORKERS = 16
+RECORDS_PER_WORKER = 5_000
+
+# Below this, producers time-slice with the listener and lock handoffs on the
+# ring dominate, so transport comparisons measure the scheduler
+MIN_CPUS_FOR_COMPARISON = 4
+
+
+class _CountingHandler(logging.Handler):
+    """Counts records delivered by the listener."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.count = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.count += 1
+
+
+def _worker(log_queue, worker_id: int, batch_size: int) -> None:
+    lg = Logger.with_queue(log_queue, name=f"worker-{worker_id}", batch_size=batch_size)
+    for i in range(RECORDS_PER_WORKER):
+        lg.info("processed item", extra={"item": i, "worker": worker_id})
+
+
+def _run(batch_size: int, transport: str = "queue") -> float:
+    """Log from WORKERS processes and return parent-side records/sec."""
+    ctx = mp.get_context("fork")
+    if transport == "ring":
+        log_queue = SharedMemoryRing(overflow="block", ctx=ctx)
+    else:
+        log_queue = ctx.Queue()
+    counter = _CountingHandler()
+    parent = MagicMock()
+    parent.handlers = [counter]
+    parent._root_logger = None
+    listener = LogQueueListener(log_queue, parent)
+    listener.start()
+
+    expected = WORKERS * RECORDS_PER_WORKER
+    start = time.monotonic()
+    procs = [
+        ctx.Process(target=_worker, args=(log_queue, i, batch_size))
+        for i in range(WORKERS)
+    ]
+    for proc in procs:
+        proc.start()
+    deadline = start + 120
+    while counter.count < expected and time.monotonic() < deadline:
+        time.sleep(0.01)
+    elapsed = time.monotonic() - start
+
+    for proc in procs:
+        proc.join(10)
+    listener.stop()
+    assert counter.count == expected
+    return expected / elapsed
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+class TestMPQueueThroughput:
+    def test_batched_vs_per_record(self):
+        """Compare per-record pickling with compact batches, 16 workers."""
+        per_record = _run(batch_size=1)
+        batched = _run(batch_size=256)
+
+        print(f"\n  {WORKERS} workers x {RECORDS_PER_WORKER:,} records")
+        print(f"  per-record: {per_record:,.0f} records/sec")
+        print(f"  batched:    {batched:,.0f} records/sec")
+        print(f"  speedup:    {batched / per_record:.1f}x")
+
+        # The listener thread is the bottleneck without batching
+        assert batched > per_record
+
+    @pytest.mark.skipif(
+        (os.cpu_count() or 1) < MIN_CPUS_FOR_COMPARISON,
+        reason=f"needs at least {MIN_CPUS_FOR_COMPARISON} CPUs",
+    )
+    def test_shared_memory_ring_vs_queue(self):
+        """Compare the shared-memory ring with multiprocessing.Queue, 16 workers."""
+        results = {
+            (transport, batch_size): _run(batch_size, transport)
+            for transport in ("queue", "ring")
+            for batch_size in (1, 256)
+        }
+
+        print(f"\n  {WORKERS} workers x {RECORDS_PER_WORKER:,} records")
+        for (transport, batch_size), rate in results.items():
+            print(f"  {transport:5} batch={batch_size:<3}: {rate:,.0f} records/sec")
+
+        # Per-record puts pay the pickle-and-pipe cost the ring avoids
+        assert results[("ring", 1)] > results[("queue", 1)]
+
+    @pytest.mark.parametrize("drain", [False, True])
+    def test_listener_drain_throughput(self, tmp_path, drain):
+        """Measure listener dispatch into a batch-capable file handler."""
+        count = 50_000
+        records = [
+            logging.LogRecord("w", logging.INFO, __file__, 1, f"item {i}", None, None)
+            for i in range(count)
+        ]
+        handler = BufferedFileHandler(tmp_path / "out.log", flush_interval=0)
+        handler.setFormatter(logging.Formatter("%(name)s %(message)s"))
+        parent = MagicMock()
+        parent.handlers = [handler]
+        parent._root_logger = None
+        # In-process queue isolates the listener loop from pipe transfer
+        local_queue: queue.Queue = queue.Queue()
+        for record in records:
+            local_queue.put(record)
+        local_queue.put(None)
+
+        listener = LogQueueListener(local_queue, parent, drain=drain)
+        start = time.monotonic()
+        listener.start()
+        listener._thread.join(60)
+        elapsed = time.monotonic() - start
+        handler.close()
+
+        print(f"\n  drain={drain}: {count / elapsed:,.0f} records/sec")
+        assert listener.stats()["records"] == count